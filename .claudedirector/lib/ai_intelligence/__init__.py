@@ -25,17 +25,62 @@ Technical Approach:
 - 90%+ decision detection accuracy target (from 87.5% baseline)
 """
 
-# 🎯 CONTEXT7: Simplified imports to avoid circular dependencies
+from enum import Enum
+
 try:
-    from .decision_orchestrator import (
-        DecisionIntelligenceOrchestrator,
-        DecisionContext,
-        DecisionIntelligenceResult,
-        DecisionComplexity,
-        MLPredictionResult,
-        create_decision_intelligence_orchestrator,
-    )
-except ImportError as e:
+    from ..utils.lazy_imports import lazy_exports
+except ImportError:
+    from utils.lazy_imports import lazy_exports
+
+# 🎯 CONTEXT7: Exports load on first access, which also avoids circular
+# dependencies and keeps the ML stack out of processes that never predict
+_SUBMODULE_ATTRS = {
+    "decision_orchestrator": [
+        "DecisionIntelligenceOrchestrator",
+        "DecisionContext",
+        "DecisionIntelligenceResult",
+        "DecisionComplexity",
+        "MLPredictionResult",
+        "create_decision_intelligence_orchestrator",
+    ],
+    # Phase 7 Modular AI Intelligence Components
+    "predictive_analytics_engine": [
+        "PredictiveAnalyticsEngine",
+        "StrategicChallengePrediction",
+    ],
+    # Phase 5.1 ML-Powered Strategic Decision Support
+    "ml_decision_engine": [
+        "MLModelType",
+        "MLDecisionContext",
+        "MLDecisionResult",
+        "MLDecisionModel",
+        "PredictiveDecisionModel",
+        "EnhancedMLDecisionEngine",
+        "create_ml_decision_engine",
+    ],
+    "context_aware_intelligence": ["ContextAwareIntelligence"],
+    "predictive.prediction_models": ["PredictionModels", "ChallengeType"],
+    "predictive.recommendation_generator": [
+        "RecommendationGenerator",
+        "PredictionConfidence",
+    ],
+    "context.context_analyzer": [
+        "ContextAnalyzer",
+        "ContextComplexity",
+        "SituationalContext",
+    ],
+    "context.framework_selector": [
+        "FrameworkSelector",
+        "ContextualFrameworkRecommendation",
+    ],
+    "context.persona_selector": [
+        "PersonaSelector",
+        "PersonaActivationRecommendation",
+    ],
+}
+
+
+def _decision_orchestrator_fallbacks():
     # Fallback stubs for P0 compatibility
     class DecisionIntelligenceOrchestrator:
         def __init__(self, *args, **kwargs):
@@ -49,8 +94,6 @@ except ImportError as e:
         def __init__(self, *args, **kwargs):
             pass
 
-    from enum import Enum
-
     class DecisionComplexity(Enum):
         SIMPLE = "simple"
         MEDIUM = "medium"
@@ -63,21 +106,16 @@ except ImportError as e:
     def create_decision_intelligence_orchestrator(*args, **kwargs):
         return DecisionIntelligenceOrchestrator(*args, **kwargs)
 
+    return locals()
+
 
 # Phase 11 Advanced AI Intelligence - REMOVED (NON-FUNCTIONAL BLOAT)
 # Enhanced Predictive Intelligence removed as it provided only hardcoded stubs claiming "85%+ accuracy"
 # AI Trust Framework: AI cannot reliably predict complex human systems (team collaboration, strategic decisions)
 # Replaced with external data analysis tools for genuine business intelligence
 
-# 🎯 CONTEXT7: Temporarily disable problematic imports for P0 recovery
-# Phase 7 Modular AI Intelligence Components
-try:
-    from .predictive_analytics_engine import (
-        PredictiveAnalyticsEngine,
-        StrategicChallengePrediction,
-    )
-except ImportError:
 
+def _predictive_analytics_fallbacks():
     class PredictiveAnalyticsEngine:
         def __init__(self, *args, **kwargs):
             pass
@@ -86,22 +124,10 @@ except ImportError:
         def __init__(self, *args, **kwargs):
             pass
 
+    return locals()
 
-# 🎯 CONTEXT7: Temporarily disable problematic imports for P0 recovery
-# Phase 5.1 ML-Powered Strategic Decision Support
-try:
-    from .ml_decision_engine import (
-        MLModelType,
-        MLDecisionContext,
-        MLDecisionResult,
-        MLDecisionModel,
-        PredictiveDecisionModel,
-        EnhancedMLDecisionEngine,
-        create_ml_decision_engine,
-    )
-except ImportError:
-    from enum import Enum
 
+def _ml_decision_engine_fallbacks():
     class MLModelType(Enum):
         PREDICTIVE = "predictive"
 
@@ -128,35 +154,18 @@ except ImportError:
     def create_ml_decision_engine(*args, **kwargs):
         return EnhancedMLDecisionEngine(*args, **kwargs)
 
+    return locals()
 
-from .context_aware_intelligence import (
-    ContextAwareIntelligence,
-)
-
-from .predictive.prediction_models import (
-    PredictionModels,
-    ChallengeType,
-)
-
-from .predictive.recommendation_generator import (
-    RecommendationGenerator,
-    PredictionConfidence,
-)
-
-from .context.context_analyzer import (
-    ContextAnalyzer,
-    ContextComplexity,
-    SituationalContext,
-)
-
-from .context.framework_selector import (
-    FrameworkSelector,
-    ContextualFrameworkRecommendation,
-)
 
-from .context.persona_selector import (
-    PersonaSelector,
-    PersonaActivationRecommendation,
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    globals(),
+    _SUBMODULE_ATTRS,
+    fallbacks={
+        "decision_orchestrator": _decision_orchestrator_fallbacks,
+        "predictive_analytics_engine": _predictive_analytics_fallbacks,
+        "ml_decision_engine": _ml_decision_engine_fallbacks,
+    },
 )
 
 # 🎯 STORY 9.6.3: CONSOLIDATED AI PROCESSING - REMOVED (NON-FUNCTIONAL BLOAT)
@@ -8,69 +8,104 @@ Priority 1 Implementation - Q1 2025
 Investment: $380K for 3.2x ROI
 """
 
-from .advanced_context_engine import AdvancedContextEngine
-from .conversation_layer import ConversationLayerMemory
-from .strategic_layer import StrategicLayerMemory
-from .stakeholder_layer import StakeholderLayerMemory
-from .learning_layer import LearningLayerMemory
-from .organizational_layer import OrganizationalLayerMemory
-
-# Phase 3B.1.2: Export consolidated organizational processor
-from .organizational_processor import OrganizationalProcessor
-from .context_orchestrator import ContextOrchestrator
-from .clarity_analyzer import (
-    ClarityAnalyzer,
-    ActionDetectionEngine,
-    ClarityMetricsEngine,
-    ConversationAnalyzer,
-    ActionItem,
-    ActionType,
-    ClarityMetrics,
-    ClarityIndicator,
-    ConversationAnalysis,
-    get_clarity_analyzer,
-)
-from .realtime_monitor import (
-    RealTimeMonitor,
-    EventProcessor,
-    AlertEngine,
-    TeamDataCollector,
-    RealTimeBottleneckDetector,
-    TeamEvent,
-    Alert,
-    EventType,
-    AlertSeverity,
-)
-
-# Optional ML Pattern Engine import for P0 compatibility
 try:
-    # Import types first (Phase 3A.1.2 - SOLID compliance)
-    from .ml_pattern_types import (
-        FeatureVector,
-        CollaborationPrediction,
-        SuccessPattern,
-        TeamCollaborationOutcome,
-        CollaborationOutcome,
-        FeatureType,
-        EnsembleModelConfig,
-        RiskAssessment,
-        AdvancedCollaborationPrediction,
-    )
-
-    # Import implementation classes
-    from .ml_pattern_engine import (
-        MLPatternEngine,
-        TeamFeatureExtractor,
-        CollaborationClassifier,
-        CollaborationScorer,
-        RiskAssessmentEngine,
-    )
-
-    ML_PATTERN_ENGINE_AVAILABLE = True
-except (ImportError, TypeError, AttributeError) as e:
-    # Fallback for P0 compatibility when heavyweight dependencies unavailable
-    ML_PATTERN_ENGINE_AVAILABLE = False
-
+    from ..utils.lazy_imports import lazy_exports
+except ImportError:
+    from utils.lazy_imports import lazy_exports
+
+# Exports load on first access, so importing one layer (or this package)
+# does not pull the ML pattern engine's numpy/pandas/sklearn stack
+_SUBMODULE_ATTRS = {
+    "advanced_context_engine": ["AdvancedContextEngine"],
+    "conversation_layer": ["ConversationLayerMemory"],
+    "strategic_layer": ["StrategicLayerMemory", "InitiativeStatus"],
+    "stakeholder_layer": [
+        "StakeholderLayerMemory",
+        "StakeholderRole",
+        "CommunicationStyle",
+    ],
+    "learning_layer": ["LearningLayerMemory", "FrameworkUsage", "DecisionPattern"],
+    "organizational_layer": ["OrganizationalLayerMemory"],
+    # Phase 3B.1.2: Export consolidated organizational processor
+    "organizational_processor": ["OrganizationalProcessor"],
+    "context_orchestrator": ["ContextOrchestrator", "ContextPriority"],
+    "clarity_analyzer": [
+        "ClarityAnalyzer",
+        "ActionDetectionEngine",
+        "ClarityMetricsEngine",
+        "ConversationAnalyzer",
+        "ActionItem",
+        "ActionType",
+        "ClarityMetrics",
+        "ClarityIndicator",
+        "ConversationAnalysis",
+        "get_clarity_analyzer",
+    ],
+    "realtime_monitor": [
+        "RealTimeMonitor",
+        "EventProcessor",
+        "EventWindow",
+        "StageLatencyTracker",
+        "AlertEngine",
+        "TeamDataCollector",
+        "RealTimeBottleneckDetector",
+        "TeamEvent",
+        "Alert",
+        "EventType",
+        "AlertSeverity",
+    ],
+    # Phase 3A.1.2 - SOLID compliance: types separate from implementation
+    "ml_pattern_types": [
+        "FeatureVector",
+        "CollaborationPrediction",
+        "SuccessPattern",
+        "TeamCollaborationOutcome",
+        "CollaborationOutcome",
+        "FeatureType",
+        "EnsembleModelConfig",
+        "RiskAssessment",
+        "AdvancedCollaborationPrediction",
+        "BatchCollaborationPrediction",
+    ],
+    "ml_pattern_engine": [
+        "MLPatternEngine",
+        "TeamFeatureExtractor",
+        "CollaborationClassifier",
+        "CollaborationScorer",
+        "RiskAssessmentEngine",
+    ],
+    # Phase 3B.1.1: Organizational types from extracted module (Code Reduction)
+    "organizational_types": [
+        "TeamStructure",
+        "OrganizationalChange",
+        "OrganizationSize",
+        "CulturalDimension",
+        "OrganizationalProfile",
+        "CulturalObservation",
+        "KnowledgeArtifact",
+        "OrganizationalRecommendation",
+        "OrganizationalHealthMetrics",
+    ],
+}
+
+
+# Fallback for P0 compatibility when heavyweight dependencies unavailable
+def _ml_pattern_type_fallbacks():
+    return {
+        "FeatureVector": dict,
+        "CollaborationPrediction": dict,
+        "SuccessPattern": dict,
+        "TeamCollaborationOutcome": dict,
+        "CollaborationOutcome": dict,
+        "FeatureType": str,
+        "EnsembleModelConfig": dict,
+        "RiskAssessment": dict,
+        "AdvancedCollaborationPrediction": dict,
+        "BatchCollaborationPrediction": dict,
+    }
+
+
+def _ml_pattern_engine_fallbacks():
     # Minimal stubs for compatibility
     class MLPatternEngine:
         def __init__(self, *args, **kwargs):
@@ -84,43 +119,28 @@ except (ImportError, TypeError, AttributeError) as e:
         def __init__(self, *args, **kwargs):
             pass
 
-    FeatureVector = dict
-    CollaborationPrediction = dict
-    SuccessPattern = dict
-    TeamCollaborationOutcome = dict
-    CollaborationOutcome = dict
-    FeatureType = str
-
     class CollaborationScorer:
         def __init__(self, *args, **kwargs):
             pass
 
-    EnsembleModelConfig = dict
-    RiskAssessment = dict
-
     class RiskAssessmentEngine:
         def __init__(self, *args, **kwargs):
             pass
 
-    AdvancedCollaborationPrediction = dict
-
-from .strategic_layer import InitiativeStatus
-from .stakeholder_layer import StakeholderRole, CommunicationStyle
-from .learning_layer import FrameworkUsage, DecisionPattern
-
-# Phase 3B.1.1: Import organizational types from extracted module (Code Reduction)
-from .organizational_types import (
-    TeamStructure,
-    OrganizationalChange,
-    OrganizationSize,
-    CulturalDimension,
-    OrganizationalProfile,
-    CulturalObservation,
-    KnowledgeArtifact,
-    OrganizationalRecommendation,
-    OrganizationalHealthMetrics,
+    return locals()
+
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    globals(),
+    _SUBMODULE_ATTRS,
+    fallbacks={
+        "ml_pattern_types": _ml_pattern_type_fallbacks,
+        "ml_pattern_engine": _ml_pattern_engine_fallbacks,
+    },
+    flags={"ML_PATTERN_ENGINE_AVAILABLE": ["ml_pattern_types", "ml_pattern_engine"]},
+    fallback_errors=(ImportError, TypeError, AttributeError),
 )
-from .context_orchestrator import ContextPriority
 
 __all__ = [
     "AdvancedContextEngine",
@@ -143,6 +163,8 @@ __all__ = [
     "get_clarity_analyzer",
     "RealTimeMonitor",
     "EventProcessor",
+    "EventWindow",
+    "StageLatencyTracker",
     "AlertEngine",
     "TeamDataCollector",
     "RealTimeBottleneckDetector",
@@ -165,6 +187,7 @@ __all__ = [
     "RiskAssessment",
     "RiskAssessmentEngine",
     "AdvancedCollaborationPrediction",
+    "BatchCollaborationPrediction",
     "InitiativeStatus",
     "StakeholderRole",
     "CommunicationStyle",
@@ -11,8 +11,10 @@ Performance Targets:
 - <1GB memory footprint
 """
 
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass
+from typing import Callable, Dict, List, Any, Optional
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, field
+import threading
 import time
 import logging
 
@@ -34,6 +36,11 @@ from .team_dynamics_engine import (
     TeamDynamicsEngine,
 )  # Phase 3.2 Team Dynamics
 
+try:
+    from ..performance.tracing import propagate, set_span_attributes, span, traced
+except ImportError:
+    from performance.tracing import propagate, set_span_attributes, span, traced
+
 # SDK-inspired prompt optimization integration (Task 001)
 try:
     from ..performance.cache_manager import get_cache_manager
@@ -42,6 +49,23 @@ try:
 except ImportError:
     PROMPT_OPTIMIZATION_AVAILABLE = False
 
+# Layer retrieval workers are shared by all engines in the process
+LAYER_RETRIEVAL_MAX_WORKERS = 8
+_layer_executor: Optional[ThreadPoolExecutor] = None
+_layer_executor_lock = threading.Lock()
+
+
+def _get_layer_executor() -> ThreadPoolExecutor:
+    """Process-wide thread pool for concurrent layer retrieval"""
+    global _layer_executor
+    with _layer_executor_lock:
+        if _layer_executor is None:
+            _layer_executor = ThreadPoolExecutor(
+                max_workers=LAYER_RETRIEVAL_MAX_WORKERS,
+                thread_name_prefix="context-layer",
+            )
+        return _layer_executor
+
 
 @dataclass
 class ContextRetrievalMetrics:
@@ -51,6 +75,9 @@ class ContextRetrievalMetrics:
     context_layers_accessed: List[str]
     relevance_score: float
     total_context_size_bytes: int
+    layers_skipped: List[str] = field(default_factory=list)  # missed deadline
+    layers_failed: List[str] = field(default_factory=list)
+    layer_timings_ms: Dict[str, float] = field(default_factory=dict)
 
 
 class AdvancedContextEngine:
@@ -157,6 +184,22 @@ class AdvancedContextEngine:
                 self.logger.warning(f"Failed to initialize Team Dynamics Engine: {e}")
                 self.team_dynamics_enabled = False
 
+        # Concurrent layer retrieval with per-layer deadlines. Opt-in: the
+        # built-in layers are in-memory and faster than a thread hand-off;
+        # enable it when layers are backed by I/O (workspace, MCP, databases).
+        retrieval_config = self.config.get("retrieval", {})
+        self.parallel_retrieval = retrieval_config.get("parallel", False)
+        self.layer_deadline_seconds = retrieval_config.get(
+            "layer_deadline_seconds", 2.0
+        )
+        self.layer_deadlines: Dict[str, float] = retrieval_config.get(
+            "layer_deadlines", {}
+        )
+        self.retrieval_budget_seconds = retrieval_config.get("budget_seconds", 2.5)
+        self._layer_executor: Optional[ThreadPoolExecutor] = (
+            _get_layer_executor() if self.parallel_retrieval else None
+        )
+
         # Performance tracking
         self.performance_metrics: List[ContextRetrievalMetrics] = []
 
@@ -164,6 +207,7 @@ class AdvancedContextEngine:
             "AdvancedContextEngine initialized with 5-layer architecture + workspace integration"
         )
 
+    @traced("context.retrieve")
     def get_contextual_intelligence(
         self,
         query: str,
@@ -183,33 +227,59 @@ class AdvancedContextEngine:
         """
         start_time = time.time()
         layers_accessed = []
+        retrieval_report = {"skipped": [], "failed": [], "timings_ms": {}}
+        set_span_attributes(session_id=session_id)
 
         try:
-            # Gather context from each layer
-            conversation_context = self._get_conversation_context(query, session_id)
-            layers_accessed.append("conversation")
-
-            strategic_context = self._get_strategic_context(query, session_id)
-            layers_accessed.append("strategic")
-
-            stakeholder_context = self._get_stakeholder_context(query, session_id)
-            layers_accessed.append("stakeholder")
-
-            learning_context = self._get_learning_context(query, session_id)
-            layers_accessed.append("learning")
+            # Gather context from each layer (independent, so concurrent)
+            layer_results = self._retrieve_layers(
+                {
+                    "conversation": lambda: self._get_conversation_context(
+                        query, session_id
+                    ),
+                    "strategic": lambda: self._get_strategic_context(query, session_id),
+                    "stakeholder": lambda: self._get_stakeholder_context(
+                        query, session_id
+                    ),
+                    "learning": lambda: self._get_learning_context(query, session_id),
+                    "organizational": lambda: self._get_organizational_context(
+                        query, session_id
+                    ),
+                    # Phase 2.1: Gather workspace context
+                    "workspace": lambda: self._get_workspace_context(query, session_id),
+                },
+                start_time,
+                retrieval_report,
+                raise_errors=True,
+            )
+            for layer in (
+                "conversation",
+                "strategic",
+                "stakeholder",
+                "learning",
+                "organizational",
+            ):
+                if layer in layer_results:
+                    layers_accessed.append(layer)
+            if layer_results.get("workspace"):
+                layers_accessed.append("workspace")
 
-            organizational_context = self._get_organizational_context(query, session_id)
-            layers_accessed.append("organizational")
+            conversation_context = layer_results.get("conversation", {})
+            strategic_context = layer_results.get("strategic", {})
+            stakeholder_context = layer_results.get("stakeholder", {})
+            learning_context = layer_results.get("learning", {})
+            organizational_context = layer_results.get("organizational", {})
+            workspace_context = layer_results.get("workspace")
 
-            # Phase 2.1: Gather workspace context
-            workspace_context = self._get_workspace_context(query, session_id)
-            if workspace_context:
-                layers_accessed.append("workspace")
+            # Insight engines depend on the layers above but not on each other.
+            # Their context extraction runs inside the task, so a failure
+            # skips that one insight instead of the whole request
+            insight_tasks: Dict[str, Callable[[], Any]] = {}
 
             # Phase 2.2: Generate analytics insights if enabled
-            analytics_insights = None
             if self.analytics_enabled and self.analytics_engine:
-                try:
+
+                def analytics_insight():
                     # Extract stakeholder and initiative data for analytics
                     stakeholder_list = self._extract_stakeholders_from_context(
                         stakeholder_context, workspace_context
@@ -217,22 +287,18 @@ class AdvancedContextEngine:
                     initiative_list = self._extract_initiatives_from_context(
                         strategic_context, workspace_context
                     )
-
-                    analytics_insights = (
-                        self.analytics_engine.get_strategic_recommendations(
-                            context=query,
-                            stakeholders=stakeholder_list,
-                            initiatives=initiative_list,
-                        )
+                    return self.analytics_engine.get_strategic_recommendations(
+                        context=query,
+                        stakeholders=stakeholder_list,
+                        initiatives=initiative_list,
                     )
-                    layers_accessed.append("analytics")
-                except Exception as e:
-                    self.logger.warning(f"Analytics insights generation failed: {e}")
+
+                insight_tasks["analytics"] = analytics_insight
 
             # Phase 3.1: Generate organizational learning insights if enabled
-            org_learning_insights = None
             if self.org_learning_enabled and self.org_learning_engine:
-                try:
+
+                def org_learning_insight():
                     # Prepare stakeholder data for organizational analysis
                     stakeholder_data = {
                         "stakeholders": self._extract_stakeholders_from_context(
@@ -245,44 +311,48 @@ class AdvancedContextEngine:
                             "decision_style", "unknown"
                         ),
                     }
-
-                    org_learning_insights = (
-                        self.org_learning_engine.analyze_organizational_context(
-                            context=query,
-                            stakeholder_data=stakeholder_data,
-                            strategic_context=strategic_context,
-                        )
-                    )
-                    layers_accessed.append("organizational_learning")
-                except Exception as e:
-                    self.logger.warning(
-                        f"Organizational learning insights generation failed: {e}"
+                    return self.org_learning_engine.analyze_organizational_context(
+                        context=query,
+                        stakeholder_data=stakeholder_data,
+                        strategic_context=strategic_context,
                     )
 
+                insight_tasks["organizational_learning"] = org_learning_insight
+
             # Phase 3.2: Generate team dynamics insights if enabled
-            team_dynamics_insights = None
             if self.team_dynamics_enabled and self.team_dynamics_engine:
                 try:
                     # Extract team information from context
                     teams = self._extract_teams_from_context(
                         stakeholder_context, workspace_context, query
                     )
-
-                    if teams and len(teams) > 1:  # Multi-team scenario
-                        team_dynamics_insights = self.team_dynamics_engine.analyze_team_dynamics(
-                            teams=teams,
-                            context=query,
-                            stakeholder_data={
-                                "stakeholders": self._extract_stakeholders_from_context(
-                                    stakeholder_context, workspace_context
-                                )
-                            },
-                        )
-                        layers_accessed.append("team_dynamics")
                 except Exception as e:
                     self.logger.warning(
                         f"Team dynamics insights generation failed: {e}"
                     )
+                    teams = None
+
+                if teams and len(teams) > 1:  # Multi-team scenario
+
+                    def team_dynamics_insight():
+                        team_stakeholders = self._extract_stakeholders_from_context(
+                            stakeholder_context, workspace_context
+                        )
+                        return self.team_dynamics_engine.analyze_team_dynamics(
+                            teams=teams,
+                            context=query,
+                            stakeholder_data={"stakeholders": team_stakeholders},
+                        )
+
+                    insight_tasks["team_dynamics"] = team_dynamics_insight
+
+            insights = self._retrieve_layers(
+                insight_tasks, start_time, retrieval_report, raise_errors=False
+            )
+            layers_accessed.extend(name for name in insight_tasks if name in insights)
+            analytics_insights = insights.get("analytics")
+            org_learning_insights = insights.get("organizational_learning")
+            team_dynamics_insights = insights.get("team_dynamics")
 
             # Orchestrate intelligent context assembly
             assembled_context = self.context_orchestrator.assemble_strategic_context(
@@ -310,6 +380,9 @@ class AdvancedContextEngine:
                 context_layers_accessed=layers_accessed,
                 relevance_score=relevance_score,
                 total_context_size_bytes=context_size,
+                layers_skipped=retrieval_report["skipped"],
+                layers_failed=retrieval_report["failed"],
+                layer_timings_ms=retrieval_report["timings_ms"],
             )
             self.performance_metrics.append(metrics)
 
@@ -331,6 +404,9 @@ class AdvancedContextEngine:
                     "layers_accessed": layers_accessed,
                     "relevance_score": relevance_score,
                     "context_size_bytes": context_size,
+                    "layers_skipped": retrieval_report["skipped"],
+                    "layers_failed": retrieval_report["failed"],
+                    "layer_timings_ms": retrieval_report["timings_ms"],
                 },
                 "session_id": session_id,
                 "timestamp": time.time(),
@@ -341,6 +417,75 @@ class AdvancedContextEngine:
             # Graceful degradation - return basic context
             return self._get_fallback_context(query, session_id)
 
+    def _retrieve_layers(
+        self,
+        tasks: Dict[str, Callable[[], Any]],
+        start_time: float,
+        report: Dict[str, Any],
+        raise_errors: bool,
+    ) -> Dict[str, Any]:
+        """
+        Run independent layer lookups, concurrently when enabled
+
+        Each layer gets min(its deadline, the overall retrieval budget).
+        Layers that miss it are left out of the result and reported in
+        report["skipped"]; their worker finishes in the background. Failed
+        layers are reported in report["failed"] and, with raise_errors, the
+        first failure is re-raised once all layers have been collected.
+        """
+        results: Dict[str, Any] = {}
+        first_error: Optional[Exception] = None
+
+        def timed(name: str, func: Callable[[], Any]):
+            with span(f"context.layer.{name}"):
+                layer_start = time.perf_counter()
+                result = func()
+                return result, (time.perf_counter() - layer_start) * 1000
+
+        if self._layer_executor is None:
+            # Serial mode: deadlines cannot pre-empt, only failures are handled
+            for name, func in tasks.items():
+                try:
+                    results[name], report["timings_ms"][name] = timed(name, func)
+                except Exception as e:
+                    report["failed"].append(name)
+                    if raise_errors:
+                        raise
+                    self.logger.warning(f"Context layer '{name}' failed: {e}")
+            return results
+
+        submitted_at = time.time()
+        budget_deadline = start_time + self.retrieval_budget_seconds
+        # propagate() nests worker spans under the current request's span
+        futures = {
+            name: self._layer_executor.submit(propagate(timed), name, func)
+            for name, func in tasks.items()
+        }
+        for name, future in futures.items():
+            deadline = min(
+                submitted_at
+                + self.layer_deadlines.get(name, self.layer_deadline_seconds),
+                budget_deadline,
+            )
+            try:
+                results[name], report["timings_ms"][name] = future.result(
+                    timeout=max(deadline - time.time(), 0.0)
+                )
+            except FutureTimeoutError:
+                future.cancel()
+                report["skipped"].append(name)
+                report["timings_ms"][name] = (time.time() - submitted_at) * 1000
+                self.logger.warning(f"Context layer '{name}' missed its deadline")
+            except Exception as e:
+                report["failed"].append(name)
+                first_error = first_error or e
+                if not raise_errors:
+                    self.logger.warning(f"Context layer '{name}' failed: {e}")
+
+        if raise_errors and first_error is not None:
+            raise first_error
+        return results
+
     def get_optimized_prompt_context(
         self,
         query: str,
@@ -534,6 +679,9 @@ class AdvancedContextEngine:
                 "average_context_size_bytes": avg_context_size,
                 "total_retrievals": len(self.performance_metrics),
                 "recent_retrievals_analyzed": len(recent_metrics),
+                "retrievals_with_skipped_layers": sum(
+                    1 for m in recent_metrics if m.layers_skipped
+                ),
             },
             "targets": {
                 "retrieval_time_target": 3.0,
@@ -860,6 +1008,9 @@ class AdvancedContextEngine:
             except Exception as e:
                 self.logger.error(f"Error stopping workspace monitoring: {e}")
 
+        # Shared retrieval workers stay up for other engines; stop using them
+        self._layer_executor = None
+
         # Clear performance metrics to free memory
         self.performance_metrics.clear()
 
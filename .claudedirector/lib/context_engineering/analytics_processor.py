@@ -51,6 +51,11 @@ except ImportError:
     sys.path.insert(0, str(lib_path))
     from core.base_processor import BaseProcessor
 
+try:
+    from ..utils.text_matching import KeywordMatcher
+except ImportError:
+    from utils.text_matching import KeywordMatcher
+
 from .analytics_config import (
     PRIORITY_LEVELS,
     CONFIDENCE_THRESHOLDS,
@@ -83,6 +88,25 @@ from .analytics_config import (
 
 logger = logging.getLogger(__name__)
 
+# Every keyword list the context classifiers check, matched in one pass
+_CONTEXT_MATCHER = KeywordMatcher(
+    {
+        **{
+            f"framework:{framework}": keywords
+            for framework, keywords in FRAMEWORK_KEYWORDS.items()
+        },
+        **{
+            f"pattern:{pattern_name}": pattern_list
+            for pattern_name, pattern_list in FRAMEWORK_CONTEXT_PATTERNS.items()
+            if isinstance(pattern_list, list)
+        },
+        "complexity": COMPLEXITY_INDICATORS,
+        "urgency": URGENCY_INDICATORS,
+        "high_impact": HIGH_IMPACT_KEYWORDS,
+        "medium_impact": MEDIUM_IMPACT_KEYWORDS,
+    }
+)
+
 
 @dataclass
 class FrameworkRecommendation:
@@ -273,11 +297,11 @@ class AnalyticsProcessor(BaseProcessor):
     def _extract_context_indicators(self, context: str) -> List[str]:
         """🏗️ Extract framework context indicators from text"""
         indicators = []
-        context_lower = context.lower()
+        matches = _CONTEXT_MATCHER.match(context)
 
         # Check for framework-specific keywords
-        for framework, keywords in FRAMEWORK_KEYWORDS.items():
-            keyword_matches = sum(1 for keyword in keywords if keyword in context_lower)
+        for framework in FRAMEWORK_KEYWORDS:
+            keyword_matches = len(matches.get(f"framework:{framework}", ()))
             if keyword_matches >= 2:
                 indicators.append(f"{framework}_keywords_{keyword_matches}")
 
@@ -285,22 +309,16 @@ class AnalyticsProcessor(BaseProcessor):
         for pattern_name, pattern_list in FRAMEWORK_CONTEXT_PATTERNS.items():
             # 🎯 P0 FIX: FRAMEWORK_CONTEXT_PATTERNS contains lists, not regex strings
             if isinstance(pattern_list, list):
-                for pattern in pattern_list:
-                    if pattern.lower() in context_lower:
-                        indicators.append(f"pattern_{pattern_name}")
-                        break  # Found match, no need to check other patterns for this framework
+                if f"pattern:{pattern_name}" in matches:
+                    indicators.append(f"pattern_{pattern_name}")
             else:
                 # Fallback for single string patterns
                 if re.search(str(pattern_list), context, re.IGNORECASE):
                     indicators.append(f"pattern_{pattern_name}")
 
         # Analyze complexity and urgency
-        complexity_score = sum(
-            1 for indicator in COMPLEXITY_INDICATORS if indicator in context_lower
-        )
-        urgency_score = sum(
-            1 for indicator in URGENCY_INDICATORS if indicator in context_lower
-        )
+        complexity_score = len(matches.get("complexity", ()))
+        urgency_score = len(matches.get("urgency", ()))
 
         if complexity_score > 2:
             indicators.append("high_complexity")
@@ -433,20 +451,18 @@ class AnalyticsProcessor(BaseProcessor):
     def _extract_context_features(self, context: str) -> Dict[str, float]:
         """🏗️ Extract quantitative features from context"""
         features = {}
-        context_lower = context.lower()
+        matches = _CONTEXT_MATCHER.match(context)
 
         # Keyword density features
         for framework, keywords in FRAMEWORK_KEYWORDS.items():
-            keyword_count = sum(1 for keyword in keywords if keyword in context_lower)
+            keyword_count = len(matches.get(f"framework:{framework}", ()))
             features[f"{framework}_density"] = keyword_count / max(len(keywords), 1)
 
         # Text complexity features
-        features["complexity"] = len(
-            [w for w in COMPLEXITY_INDICATORS if w in context_lower]
-        ) / len(COMPLEXITY_INDICATORS)
-        features["urgency"] = len(
-            [w for w in URGENCY_INDICATORS if w in context_lower]
-        ) / len(URGENCY_INDICATORS)
+        features["complexity"] = len(matches.get("complexity", ())) / len(
+            COMPLEXITY_INDICATORS
+        )
+        features["urgency"] = len(matches.get("urgency", ())) / len(URGENCY_INDICATORS)
 
         # Length and structure features
         features["text_length"] = min(len(context) / 1000, 1.0)  # Normalized
@@ -540,13 +556,13 @@ class AnalyticsProcessor(BaseProcessor):
         base_prob = FRAMEWORK_SUCCESS_RATES.get(framework, 0.7)
 
         # Adjust based on context complexity
-        context_lower = context.lower()
+        matches = _CONTEXT_MATCHER.match(context)
         complexity_adjustment = 0
 
-        if any(indicator in context_lower for indicator in COMPLEXITY_INDICATORS):
+        if "complexity" in matches:
             complexity_adjustment -= 0.1  # More complex = slightly lower success rate
 
-        if any(indicator in context_lower for indicator in URGENCY_INDICATORS):
+        if "urgency" in matches:
             complexity_adjustment -= 0.05  # Urgent = slightly lower success rate
 
         # Stakeholder adjustment
@@ -564,14 +580,11 @@ class AnalyticsProcessor(BaseProcessor):
     def _estimate_impact(self, framework: str, context: str) -> str:
         """🏗️ Estimate impact level for framework application"""
         context_lower = context.lower()
+        matches = _CONTEXT_MATCHER.match(context)
 
         # High impact indicators
-        high_impact_count = sum(
-            1 for keyword in HIGH_IMPACT_KEYWORDS if keyword in context_lower
-        )
-        medium_impact_count = sum(
-            1 for keyword in MEDIUM_IMPACT_KEYWORDS if keyword in context_lower
-        )
+        high_impact_count = len(matches.get("high_impact", ()))
+        medium_impact_count = len(matches.get("medium_impact", ()))
 
         if high_impact_count >= 2 or "strategic" in context_lower:
             return "high"
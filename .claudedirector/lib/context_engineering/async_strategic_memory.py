@@ -0,0 +1,278 @@
+"""
+Async Strategic Memory Facade
+
+Non-blocking access to StrategicMemoryManager for async callers (cache
+consumers, MCP managers). SQLite work runs off the event loop:
+- Writes go to one dedicated writer thread that batches small writes into a
+  single transaction (one commit per batch instead of one per call)
+- Reads run on a small reader thread pool leasing from the shared
+  per-file connection pool, so WAL readers never wait on the writer
+
+Author: Martin | Platform Architecture
+"""
+
+import asyncio
+import queue
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from .strategic_memory_manager import StrategicMemoryManager
+
+WriteOperation = Callable[[sqlite3.Connection], Any]
+
+_STOP = object()
+
+
+@dataclass
+class _WriteRequest:
+    """Queued write plus the future awaiting its outcome"""
+
+    operation: WriteOperation
+    future: asyncio.Future
+    loop: asyncio.AbstractEventLoop
+
+    def resolve(self, result: Any = None, error: Optional[BaseException] = None):
+        try:
+            self.loop.call_soon_threadsafe(_resolve_future, self.future, result, error)
+        except RuntimeError:
+            # Event loop already closed; nobody is waiting for the outcome
+            pass
+
+
+def _resolve_future(
+    future: asyncio.Future, result: Any, error: Optional[BaseException]
+):
+    if future.done():
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+
+
+class BatchedSQLiteWriter:
+    """
+    Dedicated writer thread that groups queued writes into transactions
+
+    Each write runs inside its own savepoint, so a failing write is rolled
+    back and reported to its caller without affecting the rest of the batch.
+    """
+
+    def __init__(
+        self,
+        memory_manager: StrategicMemoryManager,
+        max_batch_size: int = 64,
+        batch_window_seconds: float = 0.002,
+    ):
+        self.memory_manager = memory_manager
+        self.max_batch_size = max_batch_size
+        self.batch_window_seconds = batch_window_seconds
+
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run, name="strategic-memory-writer", daemon=True
+        )
+
+        # Writer statistics
+        self.batches_committed = 0
+        self.writes_committed = 0
+        self.writes_failed = 0
+        self.largest_batch = 0
+
+        self._thread.start()
+
+    def submit(self, operation: WriteOperation) -> asyncio.Future:
+        """Queue a write; the returned future resolves after its batch commits"""
+        if self._closed:
+            raise RuntimeError("Strategic memory writer is closed")
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._queue.put(_WriteRequest(operation, future, loop))
+        return future
+
+    def close(self, timeout: Optional[float] = None):
+        """Commit everything already queued, then stop the writer thread"""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+
+    @property
+    def pending_writes(self) -> int:
+        return self._queue.qsize()
+
+    def _run(self):
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is _STOP:
+                break
+
+            batch: List[_WriteRequest] = [item]
+            deadline = time.monotonic() + self.batch_window_seconds
+            while len(batch) < self.max_batch_size:
+                try:
+                    item = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            self._commit_batch(batch)
+
+    def _commit_batch(self, batch: List[_WriteRequest]):
+        """Run a batch in one transaction and resolve each caller"""
+        outcomes = []
+        try:
+            with self.memory_manager.get_connection() as conn:
+                conn.execute("BEGIN IMMEDIATE")
+                for request in batch:
+                    conn.execute("SAVEPOINT batched_write")
+                    try:
+                        result = request.operation(conn)
+                    except Exception as e:
+                        conn.execute("ROLLBACK TO batched_write")
+                        conn.execute("RELEASE batched_write")
+                        outcomes.append((request, None, e))
+                    else:
+                        conn.execute("RELEASE batched_write")
+                        outcomes.append((request, result, None))
+        except Exception as e:
+            # Commit (or BEGIN) failed: nothing in the batch was persisted
+            self.writes_failed += len(batch)
+            for request in batch:
+                request.resolve(error=e)
+            return
+
+        self.batches_committed += 1
+        self.largest_batch = max(self.largest_batch, len(batch))
+        for request, result, error in outcomes:
+            if error is None:
+                self.writes_committed += 1
+            else:
+                self.writes_failed += 1
+            request.resolve(result, error)
+
+
+class AsyncStrategicMemoryManager:
+    """
+    Async facade over StrategicMemoryManager
+
+    Usage:
+        async with AsyncStrategicMemoryManager(db_path=path) as memory:
+            await memory.preserve_context(session_id, context)
+            context = await memory.recover_session_context(session_id)
+    """
+
+    def __init__(
+        self,
+        memory_manager: Optional[StrategicMemoryManager] = None,
+        db_path: Optional[str] = None,
+        reader_threads: int = 4,
+        max_batch_size: int = 64,
+        batch_window_seconds: float = 0.002,
+    ):
+        self.memory_manager = memory_manager or StrategicMemoryManager(
+            db_path=db_path, enable_performance=False
+        )
+        self._writer = BatchedSQLiteWriter(
+            self.memory_manager,
+            max_batch_size=max_batch_size,
+            batch_window_seconds=batch_window_seconds,
+        )
+        self._readers = ThreadPoolExecutor(
+            max_workers=reader_threads, thread_name_prefix="strategic-memory-reader"
+        )
+
+    async def __aenter__(self) -> "AsyncStrategicMemoryManager":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+    # === Writes (dedicated writer thread) ===
+
+    async def preserve_context(
+        self,
+        session_id: Optional[str] = None,
+        context_data: Optional[Dict[str, Any]] = None,
+        critical_indicators: Optional[List[str]] = None,
+    ) -> bool:
+        """Preserve session context without blocking the event loop"""
+        session_id = session_id or self.memory_manager.current_session_id
+        if not session_id:
+            return False
+
+        # Ordered against write-behind updates by call time: a queued update
+        # flushed later only lands if it is newer than this write
+        called_at = time.time()
+
+        def write(conn):
+            self.memory_manager._write_context(
+                conn,
+                session_id,
+                context_data,
+                critical_indicators,
+                timestamp=datetime.fromtimestamp(called_at),
+            )
+
+        await self._writer.submit(write)
+
+        # Committed: drop the update this write superseded (if the write had
+        # rolled back, the queued update would still be needed)
+        write_behind = self.memory_manager._write_behind
+        if write_behind is not None:
+            write_behind.discard(session_id, queued_before=called_at)
+        return True
+
+    async def flush(self):
+        """Wait until every write queued so far has been committed"""
+        await self._writer.submit(lambda conn: None)
+
+    # === Reads (reader pool) ===
+
+    async def recover_session_context(
+        self, session_id: str
+    ) -> Optional[Dict[str, Any]]:
+        """Recover session context without blocking the event loop"""
+        return await self._run_reader(
+            self.memory_manager.recover_session_context, session_id
+        )
+
+    async def get_recent_sessions(self, hours: int = 24) -> List[Dict[str, Any]]:
+        """Get recent sessions without blocking the event loop"""
+        return await self._run_reader(self.memory_manager.get_recent_sessions, hours)
+
+    async def _run_reader(self, func: Callable, *args) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._readers, func, *args)
+
+    # === Lifecycle ===
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Writer batching statistics"""
+        return {
+            "pending_writes": self._writer.pending_writes,
+            "batches_committed": self._writer.batches_committed,
+            "writes_committed": self._writer.writes_committed,
+            "writes_failed": self._writer.writes_failed,
+            "largest_batch": self._writer.largest_batch,
+        }
+
+    def close(self):
+        """Commit queued writes and stop the writer and reader threads"""
+        self._writer.close()
+        self._readers.shutdown(wait=True)
+
+    async def aclose(self):
+        """Async close: drain the writer off the event loop"""
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
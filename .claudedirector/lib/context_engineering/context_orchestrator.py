@@ -11,6 +11,13 @@ import logging
 import json
 from dataclasses import dataclass
 
+from .context_packer import ContextPacker, PackResult
+
+try:
+    from ..performance.tracing import traced
+except ImportError:
+    from performance.tracing import traced
+
 
 @dataclass
 class ContextPriority:
@@ -59,11 +66,20 @@ class ContextOrchestrator:
             },
         )
 
+        # Budget-aware item packing with per-assembly cached item sizes
+        packer_config = self.config.get("packer", {})
+        self.packer = ContextPacker(
+            size_cache_entries=packer_config.get("size_cache_entries", 4096),
+            max_capacity_units=packer_config.get("max_capacity_units", 1024),
+            max_dp_cells=packer_config.get("max_dp_cells", 250_000),
+        )
+
         # Performance tracking
         self.assembly_metrics: List[Dict[str, Any]] = []
 
         self.logger.info("ContextOrchestrator initialized with intelligent assembly")
 
+    @traced("context.assemble")
     def assemble_strategic_context(
         self,
         query: str,
@@ -123,19 +139,22 @@ class ContextOrchestrator:
             if team_dynamics_insights:
                 context_layers["team_dynamics"] = team_dynamics_insights
 
-            priorities = self._calculate_context_priorities(query, context_layers)
+            # One sizing scope: priorities and packing share size estimates
+            with self.packer.size_scope():
+                priorities = self._calculate_context_priorities(query, context_layers)
 
-            # Assemble context with size constraints
-            assembled_context = self._assemble_with_constraints(
-                priorities, max_size, query
-            )
+                # Assemble context with size constraints
+                pack_result = self._assemble_with_constraints(
+                    priorities, max_size, query, context_layers
+                )
+            assembled_context = pack_result.context
 
             # Validate cross-layer coherence
             coherence_score = self._validate_coherence(assembled_context)
 
             # Calculate assembly metrics
             assembly_time = time.time() - start_time
-            context_size = self._calculate_context_size(assembled_context)
+            context_size = pack_result.size_bytes
 
             # Track performance
             metrics = {
@@ -147,6 +166,9 @@ class ContextOrchestrator:
                     p.layer_name: p.relevance_score for p in priorities
                 },
                 "query_length": len(query),
+                "items_included": pack_result.items_included,
+                "items_considered": pack_result.items_considered,
+                "packing_method": pack_result.method,
                 "timestamp": time.time(),
             }
             self.assembly_metrics.append(metrics)
@@ -422,57 +444,29 @@ class ContextOrchestrator:
         return min(complexity, 10.0)  # Cap complexity cost
 
     def _assemble_with_constraints(
-        self, priorities: List[ContextPriority], max_size: int, query: str
-    ) -> Dict[str, Any]:
-        """Assemble context with size and relevance constraints"""
-        assembled = {}
-        current_size = 0
-
-        # Add layers in priority order while respecting size constraints
-        for priority in priorities:
-            # Skip if relevance is too low
-            if priority.relevance_score < self.relevance_threshold:
-                continue
-
-            # Check if adding this layer would exceed size limit
-            if current_size + priority.size_bytes > max_size:
-                # Try to include a summary or subset
-                layer_context = self._get_layer_summary(
-                    priority.layer_name, priority, max_size - current_size
-                )
-                if layer_context:
-                    assembled[priority.layer_name] = layer_context
-                    current_size += self._calculate_context_size(layer_context)
-                break
-            else:
-                # Include full layer context
-                # Note: We need to get the actual context data here
-                # For now, we'll include a placeholder
-                assembled[priority.layer_name] = {
-                    "relevance_score": priority.relevance_score,
-                    "importance_weight": priority.importance_weight,
-                    "included": "full_context",
-                }
-                current_size += priority.size_bytes
-
-        return assembled
-
-    def _get_layer_summary(
-        self, layer_name: str, priority: ContextPriority, available_bytes: int
-    ) -> Optional[Dict[str, Any]]:
-        """Get summarized version of layer context that fits in available space"""
-        if available_bytes < 100:  # Minimum viable context
-            return None
-
-        # Create a summary that fits in available space
-        summary = {
-            "layer": layer_name,
-            "relevance_score": priority.relevance_score,
-            "summary": f"Summarized {layer_name} context (space constrained)",
-            "size_constraint": available_bytes,
-        }
+        self,
+        priorities: List[ContextPriority],
+        max_size: int,
+        query: str,
+        layer_contexts: Dict[str, Dict[str, Any]],
+    ) -> PackResult:
+        """
+        Pack the most valuable context items into the size budget
 
-        return summary
+        Layers below the relevance threshold are excluded. The remaining
+        layers are split into items (conversations, stakeholders,
+        initiatives, summary fields) valued by layer priority and item
+        relevance, and packed as a 0/1 knapsack over cached item sizes.
+        """
+        layers = {
+            priority.layer_name: (
+                layer_contexts[priority.layer_name],
+                priority.relevance_score * priority.importance_weight,
+            )
+            for priority in priorities
+            if priority.relevance_score >= self.relevance_threshold
+        }
+        return self.packer.pack(layers, max_size)
 
     def _validate_coherence(self, assembled_context: Dict[str, Any]) -> float:
         """Validate cross-layer coherence of assembled context"""
@@ -500,9 +494,9 @@ class ContextOrchestrator:
         return max(0.0, min(1.0, coherence_score))
 
     def _calculate_context_size(self, context: Dict[str, Any]) -> int:
-        """Calculate context size in bytes"""
+        """Calculate context size in bytes (cached per-item estimates)"""
         try:
-            return len(json.dumps(context, default=str).encode("utf-8"))
+            return self.packer.layer_size(context)
         except Exception:
             return 1024  # Default estimate
 
@@ -0,0 +1,387 @@
+"""
+Context Packer
+
+Budget-aware selection of context items for prompt assembly. Layer
+contexts are split into individually selectable items (one per
+conversation, stakeholder, initiative, ... plus one per scalar field) and
+the highest-value subset that fits a byte budget is chosen as a 0/1
+knapsack.
+
+Item sizes are JSON byte estimates cached per object within one sizing
+scope (a pack() call, or an assembly wrapped in size_scope()), so the
+priority pass and the packer do not re-serialize the same layer data.
+Nothing is cached across scopes: layer data is often mutated in place
+between assemblies, and an identity-keyed size would then be stale.
+
+Author: Martin | Platform Architecture
+"""
+
+import json
+import math
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# Lists whose per-element relevance lives in a parallel score list
+PARALLEL_SCORE_KEYS = {"conversations": "relevance_scores"}
+
+# Element fields that carry a 0..1 relevance for that element
+ITEM_RELEVANCE_FIELDS = ("relevance_score", "relevance")
+
+# JSON punctuation per element (", ") and per key ('"k": ' + "[]"/"{}" + ", ")
+ELEMENT_OVERHEAD_BYTES = 2
+CONTAINER_OVERHEAD_BYTES = 6
+
+
+@dataclass
+class ContextItem:
+    """Individually selectable piece of a layer's context"""
+
+    layer: str
+    key: str
+    index: Optional[int]  # Position in a list-valued field, None for whole field
+    value: Any
+    size_bytes: int
+    score: float
+
+    @property
+    def density(self) -> float:
+        return self.score / max(self.size_bytes, 1)
+
+
+@dataclass
+class PackResult:
+    """Packed context plus selection statistics"""
+
+    context: Dict[str, Dict[str, Any]]
+    size_bytes: int
+    total_score: float
+    items_included: int
+    items_considered: int
+    method: str
+    dropped_layers: List[str] = field(default_factory=list)
+
+
+class ContextPacker:
+    """
+    Knapsack packer for multi-layer context
+
+    Capacities are scaled to at most max_capacity_units so the dynamic
+    program stays bounded; when items x units exceeds max_dp_cells the
+    packer falls back to greedy value density.
+    """
+
+    def __init__(
+        self,
+        size_cache_entries: int = 4096,
+        max_capacity_units: int = 1024,
+        max_dp_cells: int = 250_000,
+        position_decay: float = 0.1,
+    ):
+        self.size_cache_entries = size_cache_entries
+        self.max_capacity_units = max_capacity_units
+        self.max_dp_cells = max_dp_cells
+        self.position_decay = position_decay
+
+        # Per-thread sizing scope: id(value) -> (value, size), where holding
+        # the value keeps the id stable until the scope ends
+        self._scope = threading.local()
+        self.size_cache_hits = 0
+        self.size_cache_misses = 0
+
+    # === Size estimation ===
+
+    @contextmanager
+    def size_scope(self) -> Iterator["ContextPacker"]:
+        """
+        Cache container sizes until the outermost scope exits
+
+        Layer data must not be mutated inside the scope. Scopes nest and
+        are per thread; cached sizes and the payloads they pin are dropped
+        when the outermost one exits.
+        """
+        depth = getattr(self._scope, "depth", 0)
+        if not depth:
+            self._scope.sizes = OrderedDict()
+        self._scope.depth = depth + 1
+        try:
+            yield self
+        finally:
+            self._scope.depth = depth
+            if not depth:
+                self._scope.sizes = None
+
+    def item_size(self, value: Any) -> int:
+        """JSON byte size of a value, cached for containers inside a scope"""
+        sizes: Optional["OrderedDict[int, Tuple[Any, int]]"] = getattr(
+            self._scope, "sizes", None
+        )
+        if sizes is None or not isinstance(value, (dict, list, tuple)):
+            return self._json_size(value)
+
+        cached = sizes.get(id(value))
+        if cached is not None and cached[0] is value:
+            sizes.move_to_end(id(value))
+            self.size_cache_hits += 1
+            return cached[1]
+
+        self.size_cache_misses += 1
+        size = self._json_size(value)
+        sizes[id(value)] = (value, size)
+        if len(sizes) > self.size_cache_entries:
+            sizes.popitem(last=False)
+        return size
+
+    def layer_size(self, context: Dict[str, Any]) -> int:
+        """Approximate JSON size of a layer from its cached item sizes"""
+        if not isinstance(context, dict):
+            return self.item_size(context)
+
+        size = 2
+        for key, value in context.items():
+            size += self._json_size(key) + CONTAINER_OVERHEAD_BYTES
+            if isinstance(value, list):
+                size += sum(
+                    self.item_size(item) + ELEMENT_OVERHEAD_BYTES for item in value
+                )
+            else:
+                size += self.item_size(value)
+        return size
+
+    def invalidate(self, value: Any = None):
+        """Forget this scope's cached sizes (all, or for one mutated container)"""
+        sizes = getattr(self._scope, "sizes", None)
+        if sizes is None:
+            return
+        if value is None:
+            sizes.clear()
+        else:
+            sizes.pop(id(value), None)
+
+    @staticmethod
+    def _json_size(value: Any) -> int:
+        try:
+            return len(json.dumps(value, default=str).encode("utf-8"))
+        except (TypeError, ValueError):
+            return len(str(value).encode("utf-8"))
+
+    # === Item extraction ===
+
+    def split_layer(
+        self, layer: str, context: Dict[str, Any], layer_score: float
+    ) -> List[ContextItem]:
+        """Split a layer context into selectable items"""
+        if not isinstance(context, dict):
+            return [
+                ContextItem(layer, "value", None, context, self.item_size(context), 0)
+            ]
+
+        # Parallel score lists are rebuilt from the elements that get selected
+        parallel_keys = {
+            PARALLEL_SCORE_KEYS[key] for key in context if key in PARALLEL_SCORE_KEYS
+        }
+
+        items = []
+        for key, value in context.items():
+            if key in parallel_keys:
+                continue
+            if isinstance(value, list) and value:
+                scores = context.get(PARALLEL_SCORE_KEYS.get(key, ""), [])
+                if not isinstance(scores, list):
+                    scores = []
+                for index, element in enumerate(value):
+                    relevance = self._element_relevance(element, scores, index)
+                    size_bytes = self.item_size(element) + ELEMENT_OVERHEAD_BYTES
+                    if index < len(scores):
+                        size_bytes += (
+                            self._json_size(scores[index]) + ELEMENT_OVERHEAD_BYTES
+                        )
+                    items.append(
+                        ContextItem(
+                            layer=layer,
+                            key=key,
+                            index=index,
+                            value=element,
+                            size_bytes=size_bytes,
+                            score=layer_score
+                            * relevance
+                            / (1.0 + self.position_decay * index),
+                        )
+                    )
+            else:
+                items.append(
+                    ContextItem(
+                        layer=layer,
+                        key=key,
+                        index=None,
+                        value=value,
+                        size_bytes=self.item_size(value),
+                        score=layer_score * 0.5,  # Summary fields: half weight
+                    )
+                )
+        return items
+
+    @staticmethod
+    def _element_relevance(element: Any, scores: List[Any], index: int) -> float:
+        if index < len(scores) and isinstance(scores[index], (int, float)):
+            return max(float(scores[index]), 0.05)
+        if isinstance(element, dict):
+            for field_name in ITEM_RELEVANCE_FIELDS:
+                relevance = element.get(field_name)
+                if isinstance(relevance, (int, float)):
+                    return max(float(relevance), 0.05)
+        return 1.0
+
+    # === Packing ===
+
+    def pack(
+        self, layers: Dict[str, Tuple[Dict[str, Any], float]], budget_bytes: int
+    ) -> PackResult:
+        """
+        Select the highest-scoring items that fit budget_bytes
+
+        Args:
+            layers: layer name -> (layer context, layer score)
+            budget_bytes: maximum JSON size of the packed context
+        """
+        with self.size_scope():
+            return self._pack(layers, budget_bytes)
+
+    def _pack(
+        self, layers: Dict[str, Tuple[Dict[str, Any], float]], budget_bytes: int
+    ) -> PackResult:
+        items: List[ContextItem] = []
+        structure_bytes = 2
+        for layer, (context, layer_score) in layers.items():
+            layer_items = self.split_layer(layer, context, layer_score)
+            items.extend(layer_items)
+            # Reserve punctuation for every layer and key that could appear
+            structure_bytes += self._json_size(layer) + CONTAINER_OVERHEAD_BYTES
+            keys = {item.key for item in layer_items}
+            keys |= {PARALLEL_SCORE_KEYS[k] for k in keys if k in PARALLEL_SCORE_KEYS}
+            structure_bytes += sum(
+                self._json_size(key) + CONTAINER_OVERHEAD_BYTES for key in keys
+            )
+
+        capacity = budget_bytes - structure_bytes
+        candidates = [i for i, item in enumerate(items) if item.size_bytes <= capacity]
+
+        if sum(items[i].size_bytes for i in candidates) <= capacity:
+            selected, method = candidates, "all"
+        elif len(candidates) * min(capacity, self.max_capacity_units) <= (
+            self.max_dp_cells
+        ):
+            selected = self._knapsack(items, candidates, capacity)
+            greedy = self._greedy(items, candidates, capacity)
+            if self._score(items, greedy) > self._score(items, selected):
+                selected = greedy  # Rounding in the DP can cost a little value
+            method = "knapsack"
+        else:
+            selected, method = self._greedy(items, candidates, capacity), "greedy"
+
+        context = self._build_context(items, selected, layers)
+        return PackResult(
+            context=context,
+            size_bytes=self._packed_size(items, selected, context),
+            total_score=self._score(items, selected),
+            items_included=len(selected),
+            items_considered=len(items),
+            method=method,
+            dropped_layers=[layer for layer in layers if layer not in context],
+        )
+
+    def _knapsack(
+        self, items: List[ContextItem], candidates: List[int], capacity: int
+    ) -> List[int]:
+        """0/1 knapsack over scaled sizes (sizes rounded up, so never over budget)"""
+        units = min(capacity, self.max_capacity_units)
+        if units <= 0:
+            return []
+        unit_bytes = capacity / units
+        weights = [math.ceil(items[i].size_bytes / unit_bytes) for i in candidates]
+
+        best = [0.0] * (units + 1)
+        keep = [bytearray(units + 1) for _ in candidates]
+        for row, (index, weight) in enumerate(zip(candidates, weights)):
+            score = items[index].score
+            keep_row = keep[row]
+            for remaining in range(units, weight - 1, -1):
+                with_item = best[remaining - weight] + score
+                if with_item > best[remaining]:
+                    best[remaining] = with_item
+                    keep_row[remaining] = 1
+
+        selected = []
+        remaining = units
+        for row in range(len(candidates) - 1, -1, -1):
+            if keep[row][remaining]:
+                selected.append(candidates[row])
+                remaining -= weights[row]
+        return sorted(selected)
+
+    @staticmethod
+    def _greedy(
+        items: List[ContextItem], candidates: List[int], capacity: int
+    ) -> List[int]:
+        """Highest value density first"""
+        selected, used = [], 0
+        for index in sorted(candidates, key=lambda i: items[i].density, reverse=True):
+            if used + items[index].size_bytes <= capacity:
+                selected.append(index)
+                used += items[index].size_bytes
+        return sorted(selected)
+
+    @staticmethod
+    def _score(items: List[ContextItem], selected: List[int]) -> float:
+        return sum(items[i].score for i in selected)
+
+    @staticmethod
+    def _build_context(
+        items: List[ContextItem],
+        selected: List[int],
+        layers: Dict[str, Tuple[Dict[str, Any], float]],
+    ) -> Dict[str, Dict[str, Any]]:
+        """Rebuild layer dicts from selected items, preserving original order"""
+        context: Dict[str, Dict[str, Any]] = {}
+        for index in selected:
+            item = items[index]
+            layer_context = context.setdefault(item.layer, {})
+            if item.index is None:
+                layer_context[item.key] = item.value
+            else:
+                layer_context.setdefault(item.key, []).append(item.value)
+
+        # Keep parallel score lists aligned with the elements that survived
+        for layer, layer_context in context.items():
+            for list_key, score_key in PARALLEL_SCORE_KEYS.items():
+                source = layers[layer][0]
+                if list_key in layer_context and isinstance(
+                    source.get(score_key), list
+                ):
+                    kept = [
+                        items[i].index
+                        for i in selected
+                        if items[i].layer == layer and items[i].key == list_key
+                    ]
+                    scores = source[score_key]
+                    layer_context[score_key] = [
+                        scores[i] for i in kept if i < len(scores)
+                    ]
+        return context
+
+    def _packed_size(
+        self,
+        items: List[ContextItem],
+        selected: List[int],
+        context: Dict[str, Dict[str, Any]],
+    ) -> int:
+        """Size of the packed context from cached item sizes"""
+        size = 2 + sum(items[i].size_bytes for i in selected)
+        for layer, layer_context in context.items():
+            size += self._json_size(layer) + CONTAINER_OVERHEAD_BYTES
+            size += sum(
+                self._json_size(key) + CONTAINER_OVERHEAD_BYTES for key in layer_context
+            )
+        return size
@@ -0,0 +1,281 @@
+"""
+Write-Behind Buffer for Session Context
+
+Coalesces per-session context updates in memory and flushes them to SQLite
+in one transaction when either threshold is reached:
+- size: number of updates queued since the last flush
+- time: age of the oldest unflushed update
+
+Only the latest update per session is kept, so a long strategic session
+costs one commit per flush interval instead of one per turn. Pending and
+in-flight updates stay readable until committed (read-your-writes), and
+every live buffer is flushed at interpreter shutdown.
+
+Updates are held until the flush, so producers must queue a snapshot of
+their context rather than a dict they keep mutating.
+
+Author: Martin | Platform Architecture
+"""
+
+import atexit
+import logging
+import threading
+import time
+import weakref
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Consecutive background flush failures before the flusher backs off
+MAX_FLUSH_RETRIES = 3
+
+
+@dataclass
+class PendingContextUpdate:
+    """Latest unflushed context update for a session"""
+
+    session_id: str
+    context_data: Optional[Dict[str, Any]]
+    critical_indicators: Optional[List[str]]
+    queued_at: float = field(default_factory=time.time)
+    coalesced_updates: int = 1
+
+    @property
+    def queued_timestamp(self) -> str:
+        """Queue time in SQLite CURRENT_TIMESTAMP format (UTC)"""
+        return datetime.fromtimestamp(self.queued_at, timezone.utc).strftime(
+            "%Y-%m-%d %H:%M:%S"
+        )
+
+
+FlushCallback = Callable[[List[PendingContextUpdate]], None]
+
+
+class ContextWriteBehindBuffer:
+    """
+    Per-session coalescing write-behind queue with a background flusher
+
+    flush_callback receives the batch of pending updates and must persist
+    them in a single transaction; if it raises, the batch is re-queued
+    (unless a newer update for the same session arrived meanwhile).
+    """
+
+    def __init__(
+        self,
+        flush_callback: FlushCallback,
+        max_pending_updates: int = 32,
+        max_delay_seconds: float = 1.0,
+    ):
+        self.flush_callback = flush_callback
+        self.max_pending_updates = max_pending_updates
+        self.max_delay_seconds = max_delay_seconds
+
+        self._pending: Dict[str, PendingContextUpdate] = {}
+        self._inflight: Dict[str, PendingContextUpdate] = {}
+        self._pending_updates = 0
+        self._oldest_queued_at: Optional[float] = None
+        # Bumped on every put, discard and commit so readers can detect races
+        self._sequence = 0
+
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._flush_lock = threading.Lock()
+        self._closed = False
+
+        # Buffer statistics
+        self.flushes = 0
+        self.flushed_sessions = 0
+        self.coalesced_updates = 0
+        self.flush_failures = 0
+
+        # Started on demand and exits once idle, so idle buffers hold no thread
+        self._flusher: Optional[threading.Thread] = None
+        _live_buffers.add(self)
+
+    def put(self, update: PendingContextUpdate):
+        """Queue an update, replacing any pending update for the session"""
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Context write-behind buffer is closed")
+
+            previous = self._pending.get(update.session_id)
+            if previous is not None:
+                update.coalesced_updates += previous.coalesced_updates
+                self.coalesced_updates += 1
+            self._pending[update.session_id] = update
+            self._pending_updates += 1
+            self._sequence += 1
+
+            if self._oldest_queued_at is None:
+                self._oldest_queued_at = update.queued_at
+            if self._flusher is None:
+                self._flusher = threading.Thread(
+                    target=self._run, name="context-write-behind", daemon=True
+                )
+                self._flusher.start()
+            elif self._pending_updates >= self.max_pending_updates:
+                self._wakeup.notify()
+
+    def get(self, session_id: str) -> Optional[PendingContextUpdate]:
+        """Latest update for a session that is not yet committed"""
+        return self.snapshot(session_id)[0]
+
+    def snapshot(self, session_id: str) -> Tuple[Optional[PendingContextUpdate], int]:
+        """
+        Uncommitted update for a session plus the buffer sequence number
+
+        Readers that merge this with committed state take the snapshot
+        first, read the store, then compare sequence() to detect a put or
+        commit that raced with the read.
+        """
+        with self._lock:
+            update = self._pending.get(session_id) or self._inflight.get(session_id)
+            return update, self._sequence
+
+    def sequence(self) -> int:
+        """Counter bumped by every put, discard and committed flush"""
+        with self._lock:
+            return self._sequence
+
+    def discard(
+        self, session_id: str, queued_before: Optional[float] = None
+    ) -> Optional[PendingContextUpdate]:
+        """
+        Drop a session's pending update (superseded by a direct write)
+
+        With queued_before, only an update queued no later than that time is
+        dropped, so a newer update queued after the direct write survives.
+        """
+        with self._lock:
+            update = self._pending.get(session_id)
+            if update is None or (
+                queued_before is not None and update.queued_at > queued_before
+            ):
+                return None
+            del self._pending[session_id]
+            self._pending_updates = max(
+                self._pending_updates - update.coalesced_updates, 0
+            )
+            if not self._pending:
+                self._pending_updates = 0
+                self._oldest_queued_at = None
+            self._sequence += 1
+            return update
+
+    def flush(self) -> int:
+        """Persist all pending updates now; returns the number of sessions"""
+        with self._flush_lock:
+            with self._lock:
+                if not self._pending:
+                    return 0
+                batch = self._pending
+                self._inflight = batch
+                self._pending = {}
+                self._pending_updates = 0
+                self._oldest_queued_at = None
+
+            try:
+                self.flush_callback(list(batch.values()))
+            except Exception:
+                with self._lock:
+                    self.flush_failures += 1
+                    self._inflight = {}
+                    # Re-queue, keeping anything newer that arrived meanwhile
+                    for session_id, update in batch.items():
+                        self._pending.setdefault(session_id, update)
+                    self._pending_updates += len(batch)
+                    self._oldest_queued_at = min(u.queued_at for u in batch.values())
+                raise
+
+            with self._lock:
+                self._inflight = {}
+                self._sequence += 1
+                self.flushes += 1
+                self.flushed_sessions += len(batch)
+            return len(batch)
+
+    def close(self, timeout: Optional[float] = None):
+        """Stop the flusher and flush whatever is still pending"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._wakeup.notify()
+            flusher = self._flusher
+        if flusher is not None:
+            flusher.join(timeout)
+        self.flush()
+        _live_buffers.discard(self)
+
+    @property
+    def pending_sessions(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Buffer statistics"""
+        with self._lock:
+            return {
+                "pending_sessions": len(self._pending),
+                "pending_updates": self._pending_updates,
+                "flushes": self.flushes,
+                "flushed_sessions": self.flushed_sessions,
+                "coalesced_updates": self.coalesced_updates,
+                "flush_failures": self.flush_failures,
+            }
+
+    def _flush_due(self, now: float) -> bool:
+        return self._oldest_queued_at is not None and (
+            self._pending_updates >= self.max_pending_updates
+            or now - self._oldest_queued_at >= self.max_delay_seconds
+        )
+
+    def _run(self):
+        """Background flusher: wake on size threshold or oldest-update age"""
+        failures = 0
+        while True:
+            with self._lock:
+                while not self._closed and not self._flush_due(time.time()):
+                    if self._oldest_queued_at is None:
+                        # Nothing pending: exit; the next put() restarts us
+                        self._flusher = None
+                        return
+                    self._wakeup.wait(
+                        max(
+                            self._oldest_queued_at
+                            + self.max_delay_seconds
+                            - time.time(),
+                            0.0,
+                        )
+                    )
+                if self._closed:
+                    self._flusher = None
+                    return
+
+            try:
+                self.flush()
+                failures = 0
+            except Exception as e:
+                failures += 1
+                logger.warning(f"Context write-behind flush failed: {e}")
+                if failures >= MAX_FLUSH_RETRIES:
+                    # Leave the batch pending; the next put() or close() retries
+                    with self._lock:
+                        self._flusher = None
+                    return
+                time.sleep(min(self.max_delay_seconds, 1.0))
+
+
+_live_buffers: "weakref.WeakSet[ContextWriteBehindBuffer]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_live_buffers():
+    """Flush every open buffer at interpreter shutdown"""
+    for buffer in list(_live_buffers):
+        try:
+            buffer.close(timeout=5.0)
+        except Exception as e:
+            logger.warning(f"Context write-behind shutdown flush failed: {e}")
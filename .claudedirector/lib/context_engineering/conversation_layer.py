@@ -5,12 +5,131 @@ Semantic conversation indexing and retrieval with 90-day retention.
 Provides conversation continuity across sessions.
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Set, Tuple
+import heapq
 import time
 import json
 import logging
 from pathlib import Path
 
+try:
+    from ..utils.text_matching import KeywordMatcher
+except ImportError:
+    from utils.text_matching import KeywordMatcher
+
+# Phase 2: Enhance with NLP-based topic extraction
+STRATEGIC_TOPIC_KEYWORDS = [
+    "strategy",
+    "team",
+    "platform",
+    "architecture",
+    "stakeholder",
+    "framework",
+    "decision",
+    "initiative",
+    "planning",
+    "scaling",
+    "organization",
+    "leadership",
+    "alignment",
+    "design",
+    "system",
+]
+
+STRATEGIC_DOMAIN_KEYWORDS = {
+    "engineering_leadership": [
+        "team",
+        "leadership",
+        "management",
+        "coordination",
+    ],
+    "platform_strategy": ["platform", "architecture", "technical", "system"],
+    "design_systems": ["design", "ui", "ux", "component", "interface"],
+    "business_strategy": ["business", "roi", "investment", "value", "market"],
+    "organizational": ["organization", "structure", "culture", "process"],
+}
+
+# Topics and domains share one pass over the text
+_CLASSIFIER = KeywordMatcher(
+    {"topics": STRATEGIC_TOPIC_KEYWORDS, **STRATEGIC_DOMAIN_KEYWORDS}
+)
+
+
+class _ConversationIndex:
+    """
+    Incremental per-session index over stored conversations
+
+    Keeps an inverted index from topic/domain terms to conversation
+    sequence numbers plus a timestamp heap, so retrieval only scores
+    conversations sharing a term with the query and retention cleanup
+    only touches expired entries.
+    """
+
+    def __init__(self):
+        self.next_seq = 0
+        # seq -> record, in storage order
+        self.records: Dict[int, Dict[str, Any]] = {}
+        self.postings: Dict[str, Set[int]] = {}
+        # (timestamp, seq), oldest first
+        self.by_time: List[Tuple[float, int]] = []
+
+    @staticmethod
+    def _terms(topics: List[str], domains: List[str]) -> Set[str]:
+        return {f"topic:{t}" for t in topics} | {f"domain:{d}" for d in domains}
+
+    def add(self, record: Dict[str, Any]) -> None:
+        seq = self.next_seq
+        self.next_seq += 1
+        self.records[seq] = record
+        for term in self._terms(
+            record.get("topics", []), record.get("strategic_domains", [])
+        ):
+            self.postings.setdefault(term, set()).add(seq)
+        heapq.heappush(self.by_time, (record.get("timestamp", time.time()), seq))
+
+    def remove(self, seq: int) -> None:
+        record = self.records.pop(seq, None)
+        if record is None:
+            return
+        for term in self._terms(
+            record.get("topics", []), record.get("strategic_domains", [])
+        ):
+            bucket = self.postings.get(term)
+            if bucket is not None:
+                bucket.discard(seq)
+                if not bucket:
+                    del self.postings[term]
+
+    def expire(self, cutoff_time: float) -> int:
+        """Drop conversations at or before cutoff_time, returning the count"""
+        removed = 0
+        while self.by_time and self.by_time[0][0] <= cutoff_time:
+            _, seq = heapq.heappop(self.by_time)
+            if seq in self.records:
+                self.remove(seq)
+                removed += 1
+        return removed
+
+    def trim(self, max_records: int) -> int:
+        """Drop the oldest stored conversations beyond max_records"""
+        excess = len(self.records) - max_records
+        if excess <= 0:
+            return 0
+        for seq in list(self.records)[:excess]:
+            self.remove(seq)
+        # Stale heap entries are skipped by expire(); compact when they dominate
+        if len(self.by_time) > 2 * len(self.records) + 64:
+            self.by_time = [e for e in self.by_time if e[1] in self.records]
+            heapq.heapify(self.by_time)
+        return excess
+
+    def candidates(self, topics: List[str], domains: List[str]) -> List[int]:
+        """Sequence numbers sharing at least one term, in storage order"""
+        seqs: Set[int] = set()
+        for term in self._terms(topics, domains):
+            seqs |= self.postings.get(term, set())
+        return sorted(seqs)
+
 
 class ConversationLayerMemory:
     """
@@ -34,6 +153,7 @@ class ConversationLayerMemory:
         # In-memory storage for Phase 1 implementation
         # Phase 2 will add SQLite/DuckDB persistent storage
         self.conversations: Dict[str, List[Dict[str, Any]]] = {}
+        self._indexes: Dict[str, _ConversationIndex] = {}
 
         self.logger.info(
             f"ConversationLayerMemory initialized with {self.retention_days} day retention"
@@ -55,26 +175,28 @@ class ConversationLayerMemory:
             # Initialize session if not exists
             if session_id not in self.conversations:
                 self.conversations[session_id] = []
+                self._indexes[session_id] = _ConversationIndex()
 
             # Add conversation with metadata
+            topics, domains = self._classify_query(session_data.get("query", ""))
             conversation_record = {
                 "query": session_data.get("query", ""),
                 "response": session_data.get("response", ""),
                 "timestamp": session_data.get("timestamp", time.time()),
-                "topics": self._extract_topics(session_data.get("query", "")),
-                "strategic_domains": self._identify_strategic_domains(
-                    session_data.get("query", "")
-                ),
+                "topics": topics,
+                "strategic_domains": domains,
                 "conversation_id": f"{session_id}_{int(time.time())}",
             }
 
+            index = self._index_for(session_id)
             self.conversations[session_id].append(conversation_record)
+            index.add(conversation_record)
 
             # Cleanup old conversations
             self._cleanup_old_conversations(session_id)
 
             # Limit conversations per session
-            if len(self.conversations[session_id]) > self.max_conversations_per_session:
+            if index.trim(self.max_conversations_per_session):
                 self.conversations[session_id] = self.conversations[session_id][
                     -self.max_conversations_per_session :
                 ]
@@ -106,12 +228,14 @@ class ConversationLayerMemory:
             conversations = self.conversations[session_id]
 
             # Extract topics from current query
-            current_topics = self._extract_topics(current_query)
-            current_domains = self._identify_strategic_domains(current_query)
+            current_topics, current_domains = self._classify_query(current_query)
 
-            # Score conversations by relevance
+            # Only conversations sharing a topic or domain can clear the
+            # threshold: time decay alone contributes at most 0.2
+            index = self._index_for(session_id)
             scored_conversations = []
-            for conv in conversations:
+            for seq in index.candidates(current_topics, current_domains):
+                conv = index.records[seq]
                 relevance_score = self._calculate_conversation_relevance(
                     current_topics, current_domains, conv
                 )
@@ -120,9 +244,10 @@ class ConversationLayerMemory:
                         {"conversation": conv, "relevance_score": relevance_score}
                     )
 
-            # Sort by relevance and limit results
-            scored_conversations.sort(key=lambda x: x["relevance_score"], reverse=True)
-            top_conversations = scored_conversations[:5]  # Top 5 most relevant
+            # Top 5 most relevant (stable, like a sort)
+            top_conversations = heapq.nlargest(
+                5, scored_conversations, key=lambda x: x["relevance_score"]
+            )
 
             # Calculate overall relevance
             overall_relevance = sum(
@@ -141,54 +266,19 @@ class ConversationLayerMemory:
             self.logger.error(f"Failed to retrieve conversation context: {e}")
             return {"conversations": [], "relevance_score": 0.0, "error": str(e)}
 
+    def _classify_query(self, text: str) -> Tuple[List[str], List[str]]:
+        """Topics and strategic domains of text in one pass"""
+        matches = _CLASSIFIER.match(text)
+        topics = matches.pop("topics", [])
+        return topics, list(matches)
+
     def _extract_topics(self, text: str) -> List[str]:
         """Extract topics from text (simplified implementation)"""
-        # Phase 2: Enhance with NLP-based topic extraction
-        strategic_keywords = [
-            "strategy",
-            "team",
-            "platform",
-            "architecture",
-            "stakeholder",
-            "framework",
-            "decision",
-            "initiative",
-            "planning",
-            "scaling",
-            "organization",
-            "leadership",
-            "alignment",
-            "design",
-            "system",
-        ]
-
-        text_lower = text.lower()
-        topics = [keyword for keyword in strategic_keywords if keyword in text_lower]
-        return topics
+        return self._classify_query(text)[0]
 
     def _identify_strategic_domains(self, text: str) -> List[str]:
         """Identify strategic domains in text"""
-        domain_patterns = {
-            "engineering_leadership": [
-                "team",
-                "leadership",
-                "management",
-                "coordination",
-            ],
-            "platform_strategy": ["platform", "architecture", "technical", "system"],
-            "design_systems": ["design", "ui", "ux", "component", "interface"],
-            "business_strategy": ["business", "roi", "investment", "value", "market"],
-            "organizational": ["organization", "structure", "culture", "process"],
-        }
-
-        text_lower = text.lower()
-        domains = []
-
-        for domain, keywords in domain_patterns.items():
-            if any(keyword in text_lower for keyword in keywords):
-                domains.append(domain)
-
-        return domains
+        return self._classify_query(text)[1]
 
     def _calculate_conversation_relevance(
         self,
@@ -226,11 +316,22 @@ class ConversationLayerMemory:
 
         cutoff_time = time.time() - (self.retention_days * 24 * 3600)
 
-        self.conversations[session_id] = [
-            conv
-            for conv in self.conversations[session_id]
-            if conv.get("timestamp", time.time()) > cutoff_time
-        ]
+        index = self._index_for(session_id)
+        if not index.expire(cutoff_time):
+            return
+
+        self.conversations[session_id] = list(index.records.values())
+
+    def _index_for(self, session_id: str) -> _ConversationIndex:
+        """Index for a session, rebuilt if the conversation list was replaced"""
+        conversations = self.conversations.get(session_id, [])
+        index = self._indexes.get(session_id)
+        if index is None or len(index.records) != len(conversations):
+            index = _ConversationIndex()
+            for conv in conversations:
+                index.add(conv)
+            self._indexes[session_id] = index
+        return index
 
     def get_memory_usage(self) -> Dict[str, Any]:
         """Get memory usage statistics"""
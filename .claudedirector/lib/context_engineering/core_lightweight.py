@@ -10,7 +10,6 @@ Author: Martin | Platform Architecture with MCP Sequential enhancement
 
 import json
 import logging
-import sqlite3
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -35,6 +34,12 @@ except ImportError:
         return MinimalConfig()
 
 
+# Shared per-file SQLite connection pool (stdlib only)
+try:
+    from ..core.connection_pool import get_connection_pool
+except ImportError:
+    from core.connection_pool import get_connection_pool
+
 logger = logging.getLogger(__name__)
 
 
@@ -79,6 +84,7 @@ class LightweightMemoryManager:
 
         # Ensure directory exists
         Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._connection_pool = get_connection_pool(self.db_path)
 
         # Initialize database
         self._init_database()
@@ -88,7 +94,7 @@ class LightweightMemoryManager:
     def _init_database(self) -> None:
         """Initialize SQLite database with essential tables"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection_pool.connection() as conn:
                 cursor = conn.cursor()
 
                 # Essential session table
@@ -138,7 +144,7 @@ class LightweightMemoryManager:
         )
 
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection_pool.connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute(
                     """
@@ -169,7 +175,7 @@ class LightweightMemoryManager:
         context_id = f"ctx_{int(time.time() * 1000000)}"
 
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection_pool.connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute(
                     """
@@ -197,7 +203,7 @@ class LightweightMemoryManager:
     def get_session(self, session_id: str) -> Optional[LightweightMemorySession]:
         """Get session by ID"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection_pool.connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute(
                     """
@@ -226,7 +232,7 @@ class LightweightMemoryManager:
     def list_sessions(self, limit: int = 50) -> List[LightweightMemorySession]:
         """List recent sessions"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection_pool.connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute(
                     """
@@ -264,7 +270,7 @@ class LightweightMemoryManager:
     def get_session_context(self, session_id: str) -> List[Dict[str, Any]]:
         """Get all context for a session"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection_pool.connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute(
                     """
@@ -299,7 +305,7 @@ class LightweightMemoryManager:
     def close_session(self, session_id: str) -> bool:
         """Close session"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection_pool.connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute(
                     """
@@ -323,7 +329,7 @@ class LightweightMemoryManager:
         cutoff_time = time.time() - (hours * 3600)  # Convert hours to seconds
 
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection_pool.connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute(
                     """
@@ -377,7 +383,7 @@ class LightweightMemoryManager:
     def get_stats(self) -> Dict[str, Any]:
         """Get lightweight memory manager statistics"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection_pool.connection() as conn:
                 cursor = conn.cursor()
 
                 # Count sessions
@@ -14,6 +14,12 @@ from .collaboration_classifier import CollaborationClassifier
 from .ml_pattern_engine import MLPatternEngine
 from .risk_assessment_engine import RiskAssessmentEngine
 from .collaboration_scorer import CollaborationScorer
+from .model_registry import (
+    LazyModelSet,
+    ModelArtifact,
+    ModelRegistry,
+    RegistryPersistenceMixin,
+)
 
 # Phase 3A.1.4 COMPLETE - All ML classes extracted!
 # All major ML classes now follow Single Responsibility Principle
@@ -24,4 +30,8 @@ __all__ = [
     "MLPatternEngine",
     "RiskAssessmentEngine",
     "CollaborationScorer",
+    "ModelRegistry",
+    "ModelArtifact",
+    "LazyModelSet",
+    "RegistryPersistenceMixin",
 ]
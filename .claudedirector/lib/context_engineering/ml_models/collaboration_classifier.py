@@ -12,7 +12,7 @@ Authors: Martin | Platform Architecture, Berny | AI/ML Engineering
 import logging
 import time
 from datetime import datetime
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Optional, Sequence, Tuple
 
 # ML Dependencies - graceful degradation if not available
 try:
@@ -49,6 +49,8 @@ from ..ml_pattern_types import (
     TeamCollaborationOutcome,
 )
 
+from .model_registry import LazyModelSet, ModelArtifact, ModelRegistry
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
@@ -62,6 +64,9 @@ class CollaborationClassifier:
     Focuses exclusively on training models and predicting outcomes.
     """
 
+    # Registry entry holding the fitted StandardScaler next to the models
+    SCALER_ARTIFACT = "feature_scaler"
+
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize collaboration classifier with ML model configuration.
@@ -74,6 +79,7 @@ class CollaborationClassifier:
         self.is_trained = False
         self.feature_scaler = StandardScaler() if ML_AVAILABLE else None
         self.feature_names = []
+        self.model_version = None  # Registry version when saved or loaded
 
         if ML_AVAILABLE:
             # Initialize ensemble models
@@ -131,6 +137,8 @@ class CollaborationClassifier:
         for outcome in training_data:
             feature_vector = outcome.features.to_array()
             if len(feature_vector) > 0:
+                if not feature_vectors:
+                    self.feature_names = outcome.features.feature_names()
                 feature_vectors.append(feature_vector)
                 # Convert outcome to numeric label
                 label_mapping = {
@@ -183,6 +191,62 @@ class CollaborationClassifier:
 
         return performance_metrics
 
+    def save_models(
+        self, registry: ModelRegistry, name: str = "collaboration_classifier"
+    ) -> Optional[ModelArtifact]:
+        """Persist the trained models and feature scaler as a new version."""
+        if not ML_AVAILABLE or not self.is_trained:
+            return None
+
+        try:
+            artifact = registry.save(
+                name,
+                {**self.models, self.SCALER_ARTIFACT: self.feature_scaler},
+                self.feature_names,
+            )
+        except Exception as e:
+            logger.error(f"Error saving classifier models: {e}")
+            return None
+
+        self.model_version = artifact.version
+        return artifact
+
+    def load_models(
+        self,
+        registry: ModelRegistry,
+        name: str = "collaboration_classifier",
+        version: Optional[int] = None,
+        feature_names: Optional[Sequence[str]] = None,
+    ) -> bool:
+        """
+        Restore trained models from the registry instead of retraining.
+
+        The scaler is loaded immediately; the models are read on first
+        prediction. When feature_names is given, artifacts trained on a
+        different feature layout are rejected.
+        """
+        if not ML_AVAILABLE:
+            return False
+
+        saved = registry.load(name, feature_names, version)
+        if saved is None:
+            return False
+
+        try:
+            self.feature_scaler = saved[self.SCALER_ARTIFACT]
+        except Exception as e:
+            logger.error(f"Error loading classifier feature scaler: {e}")
+            return False
+
+        self.models = LazyModelSet(
+            saved.artifact,
+            names=[model for model in saved if model != self.SCALER_ARTIFACT],
+        )
+        self.feature_names = list(saved.artifact.feature_columns)
+        self.model_version = saved.artifact.version
+        self.is_trained = True
+        return True
+
     def predict_collaboration_success(
         self, features: FeatureVector
     ) -> CollaborationPrediction:
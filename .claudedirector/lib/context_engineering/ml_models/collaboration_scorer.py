@@ -90,18 +90,20 @@ from ..ml_pattern_types import (
     TeamCollaborationOutcome,
     EnsembleModelConfig,
     AdvancedCollaborationPrediction,
+    ENSEMBLE_FEATURE_COLUMNS,
     FeatureType,
 )
 
 # Import feature extractors and ML models from extracted modules
 from ..feature_extractors import TeamFeatureExtractor
+from .model_registry import ModelRegistry, RegistryPersistenceMixin
 from .risk_assessment_engine import RiskAssessmentEngine
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
 
-class CollaborationScorer:
+class CollaborationScorer(RegistryPersistenceMixin):
     """
     Production-ready collaboration success prediction with ensemble ML models.
 
@@ -112,6 +114,9 @@ class CollaborationScorer:
     Coordinates multiple ML models to provide production-grade predictions.
     """
 
+    # (feature category, feature name) in model input column order
+    FEATURE_COLUMNS = ENSEMBLE_FEATURE_COLUMNS
+
     def __init__(self, config: Optional[EnsembleModelConfig] = None):
         """
         Initialize collaboration scorer with ensemble ML models.
@@ -140,6 +145,13 @@ class CollaborationScorer:
         else:
             logger.warning("ML libraries not available - using fallback scoring")
 
+        # Warm start from the last saved ensemble instead of retraining
+        self.model_registry: Optional[ModelRegistry] = None
+        self.model_version: Optional[int] = None
+        if getattr(self.config, "model_registry_path", None):
+            self.model_registry = ModelRegistry(self.config.model_registry_path)
+            self.load_models(self.model_registry)
+
     def _initialize_ensemble_models(self):
         """Initialize ensemble ML models with proper configuration."""
         try:
@@ -265,6 +277,9 @@ class CollaborationScorer:
                 self.training_data_count = len(training_data)
                 self.last_training_time = datetime.now()
 
+                if self.model_registry is not None:
+                    self.save_models(self.model_registry)
+
                 training_time = time.time() - start_time
 
                 logger.info(
@@ -430,41 +445,14 @@ class CollaborationScorer:
     def _features_to_vector(self, features: FeatureVector) -> Optional[Any]:
         """Convert FeatureVector to numpy array for ML models."""
         try:
-            # Extract numeric features from each category
-            comm_features = [
-                features.communication_features.get("communication_frequency", 0),
-                features.communication_features.get("response_time", 0),
-                features.communication_features.get("message_clarity", 0),
-            ]
-
-            temporal_features = [
-                features.temporal_features.get("time_alignment", 0),
-                features.temporal_features.get("deadline_pressure", 0),
-                features.temporal_features.get("schedule_coordination", 0),
-            ]
-
-            network_features = [
-                features.network_features.get("network_connectivity", 0),
-                features.network_features.get("centrality_score", 0),
-                features.network_features.get("collaboration_depth", 0),
-            ]
-
-            contextual_features = [
-                features.contextual_features.get("project_complexity", 0),
-                features.contextual_features.get("resource_availability", 0),
-                features.contextual_features.get("stakeholder_alignment", 0),
-            ]
-
-            # Combine all features
-            feature_vector = np.array(
-                comm_features
-                + temporal_features
-                + network_features
-                + contextual_features
+            # Same column layout the registry's feature schema hash covers
+            return np.array(
+                [
+                    getattr(features, category).get(name, 0)
+                    for category, name in self.FEATURE_COLUMNS
+                ]
             )
 
-            return feature_vector
-
         except Exception as e:
             logger.error(f"Error converting features to vector: {e}")
             return None
@@ -730,6 +718,7 @@ class CollaborationScorer:
                 self.last_training_time.isoformat() if self.last_training_time else None
             ),
             "accuracy_history": self.accuracy_history,
+            "model_version": self.model_version,
             "config": {
                 "min_accuracy_threshold": self.config.min_accuracy_threshold,
                 "confidence_threshold": self.config.confidence_threshold,
@@ -71,6 +71,7 @@ from ..ml_pattern_types import (
 # Import feature extractors and ML models from extracted modules
 from ..feature_extractors import TeamFeatureExtractor
 from .collaboration_classifier import CollaborationClassifier
+from .model_registry import ModelRegistry
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -138,6 +139,12 @@ class MLPatternEngine(BaseProcessor):
         self.accuracy_history = []
         self.prediction_successes = 0
 
+        # Warm start: serve the last saved classifier instead of retraining
+        registry_path = self.get_config("model_registry_path")
+        self.model_registry = ModelRegistry(registry_path) if registry_path else None
+        if self.model_registry is not None:
+            self.pattern_classifier.load_models(self.model_registry)
+
         self.logger.info("🏗️ MLPatternEngine initialized with BaseProcessor compliance")
 
     def process(self, data: Any) -> Any:
@@ -502,6 +509,12 @@ class MLPatternEngine(BaseProcessor):
             # Train collaboration classifier
             training_metrics = self.pattern_classifier.train(training_data)
 
+            if self.model_registry is not None and "error" not in training_metrics:
+                if self.pattern_classifier.save_models(self.model_registry):
+                    training_metrics["model_version"] = (
+                        self.pattern_classifier.model_version
+                    )
+
             # Update training tracking
             self.training_count += 1
             self.last_training_time = datetime.now()
@@ -537,6 +550,7 @@ class MLPatternEngine(BaseProcessor):
             "ml_available": ML_AVAILABLE,
             "realtime_available": REALTIME_AVAILABLE,
             "models_trained": self.pattern_classifier.is_trained,
+            "model_version": self.pattern_classifier.model_version,
             "prediction_count": self.prediction_count,
             "training_count": self.training_count,
             "last_training_time": (
@@ -0,0 +1,342 @@
+"""
+Model Registry - Versioned On-Disk ML Model Artifacts
+
+Persists trained ensemble models so prediction services can start serving
+from the last training run instead of retraining at boot. Each save creates
+a new immutable version directory holding one file per model plus a JSON
+manifest; loading reads only the manifest and defers each model file until
+it is first used.
+
+Layout::
+
+    <root>/<name>/v<version>/manifest.json
+    <root>/<name>/v<version>/<model_name>.joblib
+
+Model files are written uncompressed with joblib when it is available so
+NumPy arrays inside the estimators (tree node tables, coefficients) are
+memory-mapped read-only on load rather than copied into memory. Without
+joblib the standard pickle module is used. Artifacts are pickles: only load
+registries from trusted locations.
+
+Phase: Phase 3A.1.4 - ML Models Directory Structure
+Authors: Martin | Platform Architecture, Berny | AI/ML Engineering
+"""
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import shutil
+import tempfile
+from collections.abc import Mapping
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Union
+
+try:
+    import joblib
+
+    JOBLIB_AVAILABLE = True
+except ImportError:
+    JOBLIB_AVAILABLE = False
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILENAME = "manifest.json"
+
+
+def feature_schema_hash(feature_columns: Sequence[Any]) -> str:
+    """Stable hash of an ordered feature column layout."""
+    encoded = json.dumps(
+        [list(c) if isinstance(c, tuple) else c for c in feature_columns]
+    )
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass
+class ModelArtifact:
+    """Manifest for one saved version of a named model set."""
+
+    name: str
+    version: int
+    schema_hash: str
+    feature_columns: List[Any]
+    model_files: Dict[str, str]
+    serializer: str
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    path: Optional[Path] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Manifest contents; the on-disk location is not stored."""
+        data = asdict(self)
+        data.pop("path")
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], path: Path) -> "ModelArtifact":
+        return cls(path=path, **data)
+
+
+class LazyModelSet(Mapping):
+    """
+    Read-only model mapping that loads each model on first access.
+
+    Drop-in for the plain dicts the scorers keep in ensemble_models: lookups
+    and iteration work the same, but constructing the set only costs reading
+    the manifest.
+    """
+
+    def __init__(
+        self,
+        artifact: ModelArtifact,
+        mmap: bool = True,
+        names: Optional[Sequence[str]] = None,
+    ):
+        self.artifact = artifact
+        self.mmap = mmap
+        # Optional subset of the artifact's models exposed by this mapping
+        self._names = list(artifact.model_files if names is None else names)
+        self._loaded: Dict[str, Any] = {}
+
+    def __getitem__(self, model_name: str) -> Any:
+        if model_name not in self._names:
+            raise KeyError(model_name)
+        if model_name not in self._loaded:
+            filename = self.artifact.model_files[model_name]
+            self._loaded[model_name] = _load_file(
+                self.artifact.path / filename, self.artifact.serializer, self.mmap
+            )
+        return self._loaded[model_name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    @property
+    def loaded_models(self) -> List[str]:
+        """Names of models already read from disk."""
+        return list(self._loaded)
+
+
+def _dump_file(obj: Any, path: Path, serializer: str):
+    if serializer == "joblib":
+        joblib.dump(obj, path)
+    else:
+        with open(path, "wb") as handle:
+            pickle.dump(obj, handle, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _load_file(path: Path, serializer: str, mmap: bool) -> Any:
+    if serializer == "joblib":
+        if not JOBLIB_AVAILABLE:
+            raise RuntimeError(f"joblib is required to load {path}")
+        return joblib.load(path, mmap_mode="r" if mmap else None)
+    with open(path, "rb") as handle:
+        return pickle.load(handle)
+
+
+class ModelRegistry:
+    """
+    Versioned store of trained model sets under a root directory.
+
+    Versions are monotonically increasing per name and never overwritten.
+    A version is published by renaming a fully written temporary directory,
+    so readers never observe a partial artifact.
+    """
+
+    def __init__(self, root: Union[str, Path]):
+        self.root = Path(root)
+
+    def versions(self, name: str) -> List[int]:
+        """Saved versions of name, oldest first."""
+        base = self.root / name
+        if not base.is_dir():
+            return []
+        found = []
+        for entry in base.iterdir():
+            if entry.name.startswith("v") and entry.name[1:].isdigit():
+                if (entry / MANIFEST_FILENAME).is_file():
+                    found.append(int(entry.name[1:]))
+        return sorted(found)
+
+    def get(self, name: str, version: Optional[int] = None) -> Optional[ModelArtifact]:
+        """Manifest for a version (latest when omitted), or None if absent."""
+        if version is None:
+            versions = self.versions(name)
+            if not versions:
+                return None
+            version = versions[-1]
+        path = self.root / name / f"v{version}"
+        try:
+            with open(path / MANIFEST_FILENAME, "r", encoding="utf-8") as handle:
+                return ModelArtifact.from_dict(json.load(handle), path)
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning(f"Unreadable model manifest {path}: {e}")
+            return None
+
+    def save(
+        self,
+        name: str,
+        models: Mapping,
+        feature_columns: Sequence[Any],
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> ModelArtifact:
+        """Write models as the next version of name and return its manifest."""
+        base = self.root / name
+        base.mkdir(parents=True, exist_ok=True)
+        serializer = "joblib" if JOBLIB_AVAILABLE else "pickle"
+        staging = Path(tempfile.mkdtemp(prefix=".staging-", dir=base))
+
+        try:
+            model_files = {}
+            for model_name, model in models.items():
+                filename = f"{model_name}.{serializer}"
+                _dump_file(model, staging / filename, serializer)
+                model_files[model_name] = filename
+
+            artifact = ModelArtifact(
+                name=name,
+                version=0,
+                schema_hash=feature_schema_hash(feature_columns),
+                feature_columns=[
+                    list(c) if isinstance(c, tuple) else c for c in feature_columns
+                ],
+                model_files=model_files,
+                serializer=serializer,
+                metadata=dict(metadata or {}),
+            )
+
+            # Claim the next free version; a concurrent writer just bumps us
+            while True:
+                versions = self.versions(name)
+                artifact.version = versions[-1] + 1 if versions else 1
+                with open(staging / MANIFEST_FILENAME, "w", encoding="utf-8") as f:
+                    json.dump(artifact.to_dict(), f, indent=2, default=str)
+                target = base / f"v{artifact.version}"
+                try:
+                    os.rename(staging, target)
+                    break
+                except OSError:
+                    if not target.exists():
+                        raise
+
+        except Exception:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+
+        artifact.path = target
+        logger.info(f"Saved {name} v{artifact.version} ({len(model_files)} models)")
+        return artifact
+
+    def load(
+        self,
+        name: str,
+        feature_columns: Optional[Sequence[Any]] = None,
+        version: Optional[int] = None,
+        mmap: bool = True,
+    ) -> Optional[LazyModelSet]:
+        """
+        Lazily load a saved model set.
+
+        With feature_columns, only artifacts trained on the same feature
+        layout are served: the newest compatible version (or the requested
+        version, if compatible). None means the caller should retrain
+        instead of feeding models misaligned columns.
+        """
+        if feature_columns is None:
+            artifact = self.get(name, version)
+            return LazyModelSet(artifact, mmap=mmap) if artifact else None
+
+        expected = feature_schema_hash(feature_columns)
+        candidates = [version] if version is not None else self.versions(name)
+        for candidate in reversed(candidates):
+            artifact = self.get(name, candidate)
+            if artifact is None:
+                continue
+            if artifact.schema_hash == expected:
+                return LazyModelSet(artifact, mmap=mmap)
+            logger.warning(
+                f"Model {name} v{artifact.version} feature schema "
+                f"{artifact.schema_hash} does not match {expected}; skipping"
+            )
+        return None
+
+
+class RegistryPersistenceMixin:
+    """
+    save_models/load_models for ensemble scorers backed by a ModelRegistry.
+
+    The host class provides FEATURE_COLUMNS plus the ensemble state these
+    methods read and restore: ensemble_models, model_weights, is_trained,
+    training_data_count, accuracy_history, last_training_time and
+    model_version.
+    """
+
+    def save_models(
+        self, registry: ModelRegistry, name: str = "collaboration_scorer"
+    ) -> Optional[ModelArtifact]:
+        """Persist the trained ensemble as a new registry version."""
+        if not self.is_trained or not self.ensemble_models:
+            logger.warning("No trained ensemble to save")
+            return None
+
+        try:
+            artifact = registry.save(
+                name,
+                self.ensemble_models,
+                self.FEATURE_COLUMNS,
+                metadata={
+                    "model_weights": self.model_weights,
+                    "training_data_count": self.training_data_count,
+                    "accuracy": (
+                        self.accuracy_history[-1] if self.accuracy_history else None
+                    ),
+                    "trained_at": (
+                        self.last_training_time.isoformat()
+                        if self.last_training_time
+                        else None
+                    ),
+                },
+            )
+        except Exception as e:
+            logger.error(f"Error saving ensemble models: {e}")
+            return None
+
+        self.model_version = artifact.version
+        return artifact
+
+    def load_models(
+        self,
+        registry: ModelRegistry,
+        name: str = "collaboration_scorer",
+        version: Optional[int] = None,
+    ) -> bool:
+        """
+        Serve predictions from a saved ensemble without retraining.
+
+        Models are read from disk lazily on first prediction. Artifacts
+        trained on a different feature layout are rejected.
+        """
+        models = registry.load(name, self.FEATURE_COLUMNS, version)
+        if models is None:
+            return False
+
+        metadata = models.artifact.metadata
+        self.ensemble_models = models
+        self.model_weights = dict(metadata.get("model_weights", {}))
+        self.training_data_count = metadata.get("training_data_count", 0)
+        if metadata.get("accuracy") is not None:
+            self.accuracy_history.append(metadata["accuracy"])
+        if metadata.get("trained_at"):
+            self.last_training_time = datetime.fromisoformat(metadata["trained_at"])
+        self.model_version = models.artifact.version
+        self.is_trained = True
+
+        logger.info(f"Loaded {name} v{self.model_version} ({len(models)} models)")
+        return True
@@ -64,6 +64,7 @@ except ImportError:
 
     np = MockNumpy()
 try:
+    from sklearn.calibration import CalibratedClassifierCV
     from sklearn.ensemble import RandomForestClassifier, GradientBoostingClassifier
     from sklearn.feature_extraction.text import TfidfVectorizer
     from sklearn.model_selection import cross_val_score, train_test_split
@@ -97,6 +98,8 @@ from .ml_pattern_types import (
     EnsembleModelConfig,
     RiskAssessment,
     AdvancedCollaborationPrediction,
+    BatchCollaborationPrediction,
+    ENSEMBLE_FEATURE_COLUMNS,
     FeatureExtractor,
 )
 
@@ -116,6 +119,7 @@ from .ml_models import (
     RiskAssessmentEngine,
     CollaborationScorer,
 )
+from .ml_models.model_registry import ModelRegistry, RegistryPersistenceMixin
 
 
 # ============================================================================
@@ -128,7 +132,7 @@ from .ml_models import (
 # are now imported from ml_pattern_types module for SOLID compliance
 
 
-class CollaborationScorer:
+class CollaborationScorer(RegistryPersistenceMixin):
     """
     Production-ready collaboration success prediction with ensemble ML models.
 
@@ -162,6 +166,13 @@ class CollaborationScorer:
         else:
             logger.warning("ML libraries not available - using fallback scoring")
 
+        # Warm start from the last saved ensemble instead of retraining
+        self.model_registry: Optional[ModelRegistry] = None
+        self.model_version: Optional[int] = None
+        if getattr(self.config, "model_registry_path", None):
+            self.model_registry = ModelRegistry(self.config.model_registry_path)
+            self.load_models(self.model_registry)
+
     def _initialize_ensemble_models(self):
         """Initialize ensemble ML models with proper configuration."""
         try:
@@ -256,12 +267,15 @@ class CollaborationScorer:
                 random_state=self.config.random_state,
             )
 
-            # Train each model in ensemble
+            # Train each model in ensemble, calibrated when there is enough data
             model_results = {}
+            trained_models = {}
             for model_name, model in self.ensemble_models.items():
                 try:
                     # Train model
+                    model = self._calibrated(model, y_train)
                     model.fit(X_train, y_train)
+                    trained_models[model_name] = model
 
                     # Evaluate performance
                     y_pred = model.predict(X_test)
@@ -281,12 +295,19 @@ class CollaborationScorer:
 
             # Calculate ensemble accuracy
             if any(result["trained"] for result in model_results.values()):
+                self.ensemble_models = {
+                    name: trained_models.get(name, model)
+                    for name, model in self.ensemble_models.items()
+                }
                 ensemble_accuracy = self._calculate_ensemble_accuracy(X_test, y_test)
                 self.accuracy_history.append(ensemble_accuracy)
                 self.is_trained = True
                 self.training_data_count = len(training_data)
                 self.last_training_time = datetime.now()
 
+                if self.model_registry is not None:
+                    self.save_models(self.model_registry)
+
                 training_time = time.time() - start_time
 
                 logger.info(
@@ -330,31 +351,13 @@ class CollaborationScorer:
         start_time = time.time()
 
         try:
-            # 🎯 P0 COMPATIBILITY: Handle null team_data and convert to expected format
-            if team_data is None:
-                # Create fallback team data
-                team_context = {
-                    "team_id": "fallback_team",
-                    "participants": ["user1", "user2"],
-                    "context": {},
-                    "success_score": 0.5,
-                    "duration_days": 30,
-                }
-            else:
-                # Convert TeamCollaborationOutcome to expected List[TeamEvent] format
-                team_context = {
-                    "team_id": team_data.team_id,
-                    "participants": team_data.participants,
-                    "context": team_data.context,
-                    "success_score": team_data.success_score,
-                    "duration_days": team_data.duration_days,
-                }
-
             # Extract features using team data context instead of direct object
-            features = self.feature_extractor.extract_features([], team_context)
+            features = self.feature_extractor.extract_features(
+                [], self._team_context(team_data)
+            )
 
             # Get ensemble predictions
-            if self.is_trained and ML_AVAILABLE and self.ensemble_models:
+            if self._ensemble_ready():
                 ensemble_results = self._get_ensemble_predictions(features)
                 prediction_score = ensemble_results["weighted_prediction"]
                 individual_predictions = ensemble_results["individual_predictions"]
@@ -446,73 +449,153 @@ class CollaborationScorer:
                 model_confidence={"error": 0.5},
             )
 
+    def predict_collaboration_success_batch(
+        self, teams: List[TeamCollaborationOutcome]
+    ) -> BatchCollaborationPrediction:
+        """
+        Score many teams at once with a single pass per ensemble model.
+
+        Features for every team are stacked into one matrix, so each model's
+        predict_proba runs once over all rows instead of once per team.
+        Trained models are probability-calibrated (see _calibrated), the
+        weighted ensemble score is normalized by the total model weight, and
+        every array is aligned with the returned team_ids.
+        """
+        start_time = time.time()
+
+        contexts = [self._team_context(team) for team in teams]
+        features_list = [
+            self.feature_extractor.extract_features([], context) for context in contexts
+        ]
+
+        if self._ensemble_ready() and features_list:
+            weighted, individual_predictions, model_confidence = self._predict_matrix(
+                self._features_to_matrix(features_list)
+            )
+        else:
+            weighted = np.array(
+                [self._fallback_scoring(features) for features in features_list]
+            )
+            individual_predictions = {"fallback": weighted}
+            model_confidence = {"fallback": np.array([0.7] * len(features_list))}
+
+        confidence = self._batch_prediction_confidence(
+            individual_predictions, features_list
+        )
+
+        self.prediction_count += len(teams)
+        logger.info(
+            f"Batch collaboration prediction for {len(teams)} teams "
+            f"in {time.time() - start_time:.3f}s"
+        )
+
+        return BatchCollaborationPrediction(
+            team_ids=[context["team_id"] for context in contexts],
+            success_probability=weighted,
+            confidence_score=confidence,
+            ensemble_predictions=individual_predictions,
+            model_confidence=model_confidence,
+        )
+
+    def _calibrated(self, model: Any, y_train: np.ndarray) -> Any:
+        """
+        Estimator to train for an ensemble model: calibrated when enabled.
+
+        CalibratedClassifierCV fits the configured calibrator on out-of-fold
+        predictions, then refits the model on the whole training split
+        (ensemble=False), so predict_proba returns calibrated probabilities
+        from one model. Too few samples per class for the folds, or a single
+        class, leaves the model uncalibrated.
+        """
+        base = model.estimator if isinstance(model, CalibratedClassifierCV) else model
+        method = getattr(self.config, "calibration_method", None)
+        folds = getattr(self.config, "calibration_folds", 3)
+        _, class_counts = np.unique(y_train, return_counts=True)
+        if not method or len(class_counts) < 2 or class_counts.min() < folds:
+            return base
+        return CalibratedClassifierCV(base, method=method, cv=folds, ensemble=False)
+
+    @staticmethod
+    def _base_estimator(model: Any) -> Any:
+        """The fitted model inside a calibrated wrapper (or the model itself)."""
+        calibrated = getattr(model, "calibrated_classifiers_", None)
+        return calibrated[0].estimator if calibrated else model
+
+    def _ensemble_ready(self) -> bool:
+        """True when trained ensemble models are available for prediction."""
+        return self.is_trained and bool(self.ensemble_models)
+
+    @staticmethod
+    def _team_context(
+        team_data: Optional[TeamCollaborationOutcome],
+    ) -> Dict[str, Any]:
+        """Feature extraction context for a team outcome."""
+        # 🎯 P0 COMPATIBILITY: Handle null team_data and convert to expected format
+        if team_data is None:
+            return {
+                "team_id": "fallback_team",
+                "participants": ["user1", "user2"],
+                "context": {},
+                "success_score": 0.5,
+                "duration_days": 30,
+            }
+        return {
+            "team_id": team_data.team_id,
+            "participants": team_data.participants,
+            "context": team_data.context,
+            "success_score": team_data.success_score,
+            "duration_days": team_data.duration_days,
+        }
+
     def _prepare_training_data(
         self, training_data: List[TeamCollaborationOutcome]
     ) -> Tuple[np.ndarray, np.ndarray]:
         """Prepare feature matrix and labels for training."""
-        X = []
+        features_list = []
         y = []
 
         for outcome in training_data:
             try:
-                features = self.feature_extractor.extract_features(outcome, {})
-                feature_vector = self._features_to_vector(features)
-
-                if feature_vector is not None:
-                    X.append(feature_vector)
-                    # Convert outcome to binary classification
-                    y.append(
-                        1 if outcome.outcome == CollaborationOutcome.SUCCESSFUL else 0
+                features_list.append(
+                    self.feature_extractor.extract_features(
+                        [], self._team_context(outcome)
                     )
+                )
+                # Convert outcome to binary classification
+                y.append(1 if outcome.outcome == CollaborationOutcome.SUCCESS else 0)
 
             except Exception as e:
                 logger.warning(f"Error processing training sample: {e}")
                 continue
 
-        return np.array(X) if X else np.array([]), np.array(y) if y else np.array([])
+        if not features_list:
+            return np.array([]), np.array([])
+        return self._features_to_matrix(features_list), np.array(y)
+
+    # (feature category, feature name) in model input column order
+    FEATURE_COLUMNS = ENSEMBLE_FEATURE_COLUMNS
+
+    def _feature_row(self, features: FeatureVector) -> List[float]:
+        return [
+            getattr(features, category).get(name, 0)
+            for category, name in self.FEATURE_COLUMNS
+        ]
 
     def _features_to_vector(self, features: FeatureVector) -> Optional[np.ndarray]:
         """Convert FeatureVector to numpy array for ML models."""
         try:
-            # Extract numeric features from each category
-            comm_features = [
-                features.communication_features.get("communication_frequency", 0),
-                features.communication_features.get("response_time", 0),
-                features.communication_features.get("message_clarity", 0),
-            ]
-
-            temporal_features = [
-                features.temporal_features.get("time_alignment", 0),
-                features.temporal_features.get("deadline_pressure", 0),
-                features.temporal_features.get("schedule_coordination", 0),
-            ]
-
-            network_features = [
-                features.network_features.get("network_connectivity", 0),
-                features.network_features.get("centrality_score", 0),
-                features.network_features.get("collaboration_depth", 0),
-            ]
-
-            contextual_features = [
-                features.contextual_features.get("project_complexity", 0),
-                features.contextual_features.get("resource_availability", 0),
-                features.contextual_features.get("stakeholder_alignment", 0),
-            ]
-
-            # Combine all features
-            feature_vector = np.array(
-                comm_features
-                + temporal_features
-                + network_features
-                + contextual_features
-            )
-
-            return feature_vector
+            return np.array(self._feature_row(features))
 
         except Exception as e:
             logger.error(f"Error converting features to vector: {e}")
             return None
 
+    def _features_to_matrix(self, features_list: List[FeatureVector]) -> np.ndarray:
+        """Stack FeatureVectors into one (teams x features) model input matrix."""
+        return np.array(
+            [self._feature_row(features) for features in features_list], dtype=float
+        ).reshape(len(features_list), len(self.FEATURE_COLUMNS))
+
     def _get_ensemble_predictions(self, features: FeatureVector) -> Dict[str, Any]:
         """Get predictions from all ensemble models."""
         feature_vector = self._features_to_vector(features)
@@ -524,32 +607,55 @@ class CollaborationScorer:
                 "model_confidence": {},
             }
 
+        weighted, individual_predictions, model_confidence = self._predict_matrix(
+            feature_vector.reshape(1, -1)
+        )
+        return {
+            "weighted_prediction": float(weighted[0]),
+            "individual_predictions": {
+                name: float(values[0])
+                for name, values in individual_predictions.items()
+            },
+            "model_confidence": {
+                name: float(values[0]) for name, values in model_confidence.items()
+            },
+        }
+
+    def _predict_matrix(
+        self, X: np.ndarray
+    ) -> Tuple[np.ndarray, Dict[str, np.ndarray], Dict[str, np.ndarray]]:
+        """
+        Run every ensemble model once over a feature matrix.
+
+        Returns the weighted ensemble score per row plus per-model
+        predictions and confidences, all as arrays of len(X).
+        """
+        n_rows = X.shape[0]
         individual_predictions = {}
         model_confidence = {}
 
-        # Get prediction from each trained model
         for model_name, model in self.ensemble_models.items():
             try:
                 if hasattr(model, "predict_proba"):
-                    # Get probability prediction
-                    proba = model.predict_proba(feature_vector.reshape(1, -1))[0]
-                    prediction = proba[1] if len(proba) > 1 else proba[0]
-                    confidence = max(proba)  # Confidence is max probability
+                    # Probability of the positive class; confidence is the max
+                    proba = np.asarray(model.predict_proba(X), dtype=float)
+                    prediction = proba[:, 1] if proba.shape[1] > 1 else proba[:, 0]
+                    confidence = proba.max(axis=1)
                 else:
                     # Binary prediction
-                    prediction = float(model.predict(feature_vector.reshape(1, -1))[0])
-                    confidence = 0.7  # Default confidence for binary predictions
-
-                individual_predictions[model_name] = prediction
-                model_confidence[model_name] = confidence
+                    prediction = np.asarray(model.predict(X), dtype=float)
+                    confidence = np.full(n_rows, 0.7)
 
             except Exception as e:
                 logger.warning(f"Error getting prediction from {model_name}: {e}")
-                individual_predictions[model_name] = 0.5
-                model_confidence[model_name] = 0.5
+                prediction = np.full(n_rows, 0.5)
+                confidence = np.full(n_rows, 0.5)
+
+            individual_predictions[model_name] = prediction
+            model_confidence[model_name] = confidence
 
         # Calculate weighted ensemble prediction
-        weighted_prediction = 0.0
+        weighted_prediction = np.zeros(n_rows)
         total_weight = 0.0
 
         for model_name, prediction in individual_predictions.items():
@@ -560,13 +666,9 @@ class CollaborationScorer:
         if total_weight > 0:
             weighted_prediction /= total_weight
         else:
-            weighted_prediction = 0.5
+            weighted_prediction = np.full(n_rows, 0.5)
 
-        return {
-            "weighted_prediction": weighted_prediction,
-            "individual_predictions": individual_predictions,
-            "model_confidence": model_confidence,
-        }
+        return weighted_prediction, individual_predictions, model_confidence
 
     def _calculate_ensemble_accuracy(
         self, X_test: np.ndarray, y_test: np.ndarray
@@ -576,24 +678,8 @@ class CollaborationScorer:
             return 0.0
 
         try:
-            # Get ensemble predictions for test data
-            predictions = []
-            for i in range(len(X_test)):
-                # Create dummy FeatureVector for prediction interface
-                dummy_features = FeatureVector(
-                    feature_type=FeatureType.COMMUNICATION,
-                    communication_features={},
-                    temporal_features={},
-                    network_features={},
-                    contextual_features={},
-                )
-
-                ensemble_result = self._get_ensemble_predictions(dummy_features)
-                predictions.append(
-                    1 if ensemble_result["weighted_prediction"] > 0.5 else 0
-                )
-
-            return accuracy_score(y_test, predictions)
+            weighted, _, _ = self._predict_matrix(X_test)
+            return accuracy_score(y_test, (weighted > 0.5).astype(int))
 
         except Exception as e:
             logger.error(f"Error calculating ensemble accuracy: {e}")
@@ -613,7 +699,6 @@ class CollaborationScorer:
             return 0.7  # Moderate confidence for single model
 
         # Measure consensus - higher consensus = higher confidence
-        mean_pred = np.mean(predictions)
         std_pred = np.std(predictions)
 
         # High consensus (low std) = high confidence
@@ -625,6 +710,24 @@ class CollaborationScorer:
         # Combined confidence
         return min(0.95, (consensus_confidence + feature_confidence) / 2)
 
+    def _batch_prediction_confidence(
+        self,
+        individual_predictions: Dict[str, np.ndarray],
+        features_list: List[FeatureVector],
+    ) -> np.ndarray:
+        """Row-wise _calculate_prediction_confidence over batch predictions."""
+        n_rows = len(features_list)
+        if not individual_predictions or len(individual_predictions) == 1:
+            default = 0.5 if not individual_predictions else 0.7
+            return np.array([default] * n_rows)
+
+        stacked = np.vstack(list(individual_predictions.values()))
+        consensus_confidence = np.maximum(0.5, 1.0 - stacked.std(axis=0) * 2)
+        feature_confidence = np.array(
+            [self._assess_feature_quality(features) for features in features_list]
+        )
+        return np.minimum(0.95, (consensus_confidence + feature_confidence) / 2)
+
     def _assess_feature_quality(self, features: FeatureVector) -> float:
         """Assess quality of features for prediction confidence."""
         try:
@@ -658,7 +761,7 @@ class CollaborationScorer:
         try:
             # Use Random Forest feature importance if available
             if "random_forest" in self.ensemble_models:
-                model = self.ensemble_models["random_forest"]
+                model = self._base_estimator(self.ensemble_models["random_forest"])
                 if hasattr(model, "feature_importances_"):
                     importances = model.feature_importances_
                     feature_names = [
@@ -777,6 +880,7 @@ class CollaborationScorer:
                 self.last_training_time.isoformat() if self.last_training_time else None
             ),
             "accuracy_history": self.accuracy_history,
+            "model_version": self.model_version,
             "config": {
                 "min_accuracy_threshold": self.config.min_accuracy_threshold,
                 "confidence_threshold": self.config.confidence_threshold,
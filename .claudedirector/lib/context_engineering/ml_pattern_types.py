@@ -161,6 +161,19 @@ class FeatureVector:
         features.extend(self.contextual_features.values())
         return np.array(features)
 
+    def feature_names(self) -> List[str]:
+        """Column names for to_array(), as "<category>.<feature>"."""
+        return [
+            f"{category}.{name}"
+            for category, features in (
+                ("communication", self.communication_features),
+                ("temporal", self.temporal_features),
+                ("network", self.network_features),
+                ("contextual", self.contextual_features),
+            )
+            for name in features
+        ]
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert feature vector to dictionary representation."""
         return {
@@ -264,6 +277,23 @@ class TeamCollaborationOutcome:
         }
 
 
+# (feature category, feature name) model input columns for ensemble scoring
+ENSEMBLE_FEATURE_COLUMNS = (
+    ("communication_features", "communication_frequency"),
+    ("communication_features", "response_time"),
+    ("communication_features", "message_clarity"),
+    ("temporal_features", "time_alignment"),
+    ("temporal_features", "deadline_pressure"),
+    ("temporal_features", "schedule_coordination"),
+    ("network_features", "network_connectivity"),
+    ("network_features", "centrality_score"),
+    ("network_features", "collaboration_depth"),
+    ("contextual_features", "project_complexity"),
+    ("contextual_features", "resource_availability"),
+    ("contextual_features", "stakeholder_alignment"),
+)
+
+
 # =============================================================================
 # CONFIGURATION CLASSES - SINGLE RESPONSIBILITY PRINCIPLE
 # =============================================================================
@@ -294,6 +324,16 @@ class EnsembleModelConfig:
     confidence_threshold: float = 0.7
     min_training_samples: int = 10
 
+    # Probability calibration of each ensemble model at training time
+    # ("sigmoid", "isotonic" or None for raw predict_proba outputs), fitted
+    # on calibration_folds out-of-fold predictions of the training split
+    calibration_method: Optional[str] = "sigmoid"
+    calibration_folds: int = 3
+
+    # Persistence: warm-load the latest compatible ensemble from this
+    # ModelRegistry root at startup and save each successful training run
+    model_registry_path: Optional[str] = None
+
 
 # =============================================================================
 # ADVANCED PREDICTION TYPES - LISKOV SUBSTITUTION PRINCIPLE
@@ -331,6 +371,57 @@ class AdvancedCollaborationPrediction(CollaborationPrediction):
     model_confidence: Dict[str, float] = field(default_factory=dict)
 
 
+@dataclass
+class BatchCollaborationPrediction:
+    """Ensemble scores for many teams, one array element per team.
+
+    Single Responsibility: Holds row-aligned batch scoring results; every
+    array is indexed like team_ids.
+    """
+
+    team_ids: List[str]
+    success_probability: np.ndarray
+    confidence_score: np.ndarray
+    ensemble_predictions: Dict[str, np.ndarray] = field(default_factory=dict)
+    model_confidence: Dict[str, np.ndarray] = field(default_factory=dict)
+    timestamp: datetime = field(default_factory=datetime.now)
+
+    def __len__(self) -> int:
+        return len(self.team_ids)
+
+    def outcome_predictions(self) -> List[CollaborationOutcome]:
+        """Outcome per team, using the single-prediction thresholds."""
+        return [
+            (
+                CollaborationOutcome.SUCCESS
+                if score > 0.7
+                else (
+                    CollaborationOutcome.PARTIAL_SUCCESS
+                    if score > 0.5
+                    else CollaborationOutcome.FAILURE
+                )
+            )
+            for score in self.success_probability
+        ]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert batch prediction to dictionary representation."""
+        return {
+            "team_ids": list(self.team_ids),
+            "success_probability": [float(v) for v in self.success_probability],
+            "confidence_score": [float(v) for v in self.confidence_score],
+            "ensemble_predictions": {
+                name: [float(v) for v in values]
+                for name, values in self.ensemble_predictions.items()
+            },
+            "model_confidence": {
+                name: [float(v) for v in values]
+                for name, values in self.model_confidence.items()
+            },
+            "timestamp": self.timestamp.isoformat(),
+        }
+
+
 # =============================================================================
 # TYPE ALIASES AND COMPATIBILITY
 # =============================================================================
@@ -360,9 +451,11 @@ __all__ = [
     "TeamCollaborationOutcome",
     # Configuration
     "EnsembleModelConfig",
+    "ENSEMBLE_FEATURE_COLUMNS",
     # Advanced types
     "RiskAssessment",
     "AdvancedCollaborationPrediction",
+    "BatchCollaborationPrediction",
     # Type aliases
     "FeatureDict",
     "PredictionDict",
@@ -18,10 +18,23 @@ import asyncio
 import json
 import logging
 import time
+from collections import deque
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List, Optional, Set, Any, Callable, Union
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 from pathlib import Path
 import threading
 from queue import Queue, Empty
@@ -134,16 +147,200 @@ class Alert:
         }
 
 
+def _insert_by_time(events: Deque[TeamEvent], event: TeamEvent) -> None:
+    """Insert keeping timestamp order; equal timestamps keep arrival order."""
+    if not events or events[-1].timestamp <= event.timestamp:
+        events.append(event)  # In-order arrival, the common case
+        return
+    position = len(events)
+    while position > 0 and events[position - 1].timestamp > event.timestamp:
+        position -= 1
+    events.insert(position, event)
+
+
+def _remove_event(events: Deque[TeamEvent], event: TeamEvent) -> None:
+    """Remove an event by identity, O(1) when it is the oldest."""
+    if events[0] is event:
+        events.popleft()
+        return
+    for position, candidate in enumerate(events):
+        if candidate is event:
+            del events[position]
+            return
+
+
+class EventWindow:
+    """
+    Sliding window of team events with running per-key aggregates.
+
+    Events are kept in timestamp order in one deque overall and in one deque
+    per event type, per (event type, team) and per (event type, team,
+    severity). Expiry pops from the head of each, and counts and severity
+    histograms are deque lengths, so adding, expiring and querying an
+    aggregate are O(1) however many events the window holds.
+
+    Args:
+        window: Events at or before now - window are expired (None keeps all)
+        max_events: Optional ring-buffer bound; the oldest event is evicted
+    """
+
+    def __init__(
+        self, window: Optional[timedelta] = None, max_events: Optional[int] = None
+    ):
+        self.window = window
+        self.max_events = max_events
+        self._events: Deque[TeamEvent] = deque()
+        self._by_type: Dict[EventType, Deque[TeamEvent]] = {}
+        self._by_team: Dict[Tuple[EventType, str], Deque[TeamEvent]] = {}
+        self._by_severity: Dict[
+            Tuple[EventType, str, Optional[str]], Deque[TeamEvent]
+        ] = {}
+
+    @classmethod
+    def from_events(cls, events: List[TeamEvent]) -> "EventWindow":
+        """Unbounded window over a list of events."""
+        window = cls()
+        for event in events:
+            window.add(event)
+        return window
+
+    @staticmethod
+    def _keys(event: TeamEvent):
+        severity = event.context.get("severity")
+        return (
+            event.event_type,
+            (event.event_type, event.team_id),
+            (event.event_type, event.team_id, severity),
+        )
+
+    def add(self, event: TeamEvent) -> None:
+        """Add an event, evicting the oldest if over max_events."""
+        _insert_by_time(self._events, event)
+        type_key, team_key, severity_key = self._keys(event)
+        _insert_by_time(self._by_type.setdefault(type_key, deque()), event)
+        _insert_by_time(self._by_team.setdefault(team_key, deque()), event)
+        _insert_by_time(self._by_severity.setdefault(severity_key, deque()), event)
+
+        if self.max_events is not None:
+            while len(self._events) > self.max_events:
+                self._evict(self._events[0])
+
+    def expire(self, now: Optional[datetime] = None) -> int:
+        """Drop events outside the window; returns the number dropped."""
+        if self.window is None:
+            return 0
+        cutoff = (now or datetime.now()) - self.window
+        expired = 0
+        while self._events and self._events[0].timestamp <= cutoff:
+            self._evict(self._events[0])
+            expired += 1
+        return expired
+
+    def _evict(self, event: TeamEvent) -> None:
+        _remove_event(self._events, event)
+        for index, key in zip(
+            (self._by_type, self._by_team, self._by_severity), self._keys(event)
+        ):
+            events = index[key]
+            _remove_event(events, event)
+            if not events:
+                del index[key]
+
+    def _bucket(
+        self,
+        event_type: EventType,
+        team_id: Optional[str] = None,
+        severity: Optional[str] = None,
+    ) -> Deque[TeamEvent]:
+        if team_id is None:
+            return self._by_type.get(event_type, deque())
+        if severity is None:
+            return self._by_team.get((event_type, team_id), deque())
+        return self._by_severity.get((event_type, team_id, severity), deque())
+
+    def count(
+        self,
+        event_type: EventType,
+        team_id: Optional[str] = None,
+        severity: Optional[str] = None,
+    ) -> int:
+        """Events of a type, optionally for one team and severity."""
+        return len(self._bucket(event_type, team_id, severity))
+
+    def events(
+        self,
+        event_type: EventType,
+        team_id: Optional[str] = None,
+        severity: Optional[str] = None,
+    ) -> List[TeamEvent]:
+        """Matching events, oldest first."""
+        return list(self._bucket(event_type, team_id, severity))
+
+    def latest(
+        self,
+        event_type: EventType,
+        team_id: Optional[str] = None,
+        severity: Optional[str] = None,
+        limit: int = 1,
+    ) -> List[TeamEvent]:
+        """Up to limit most recent matching events, oldest first."""
+        bucket = self._bucket(event_type, team_id, severity)
+        newest = [bucket[-i] for i in range(1, min(limit, len(bucket)) + 1)]
+        return newest[::-1]
+
+    def teams(self, event_type: EventType, severity: Optional[str] = None) -> List[str]:
+        """Teams with events of a type (and severity) in the window."""
+        if severity is None:
+            return [team for kind, team in self._by_team if kind == event_type]
+        return [
+            team
+            for kind, team, level in self._by_severity
+            if kind == event_type and level == severity
+        ]
+
+    def severity_histogram(
+        self, event_type: EventType, team_id: str
+    ) -> Dict[Optional[str], int]:
+        """Event count per context severity for one team and type."""
+        return {
+            level: len(events)
+            for (kind, team, level), events in self._by_severity.items()
+            if kind == event_type and team == team_id
+        }
+
+    def recent(self, limit: int) -> List[TeamEvent]:
+        """Up to limit most recent events of any type, oldest first."""
+        if limit <= 0:
+            return []
+        return list(self._events)[-limit:]
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def __iter__(self) -> Iterator[TeamEvent]:
+        return iter(self._events)
+
+
 class EventProcessor:
     """Processes team events and identifies patterns requiring alerts."""
 
     def __init__(self, config: Dict[str, Any]):
         self.config = config
-        self.event_history: List[TeamEvent] = []
         self.pattern_thresholds = config.get("pattern_thresholds", {})
         self.analysis_window = timedelta(
             minutes=config.get("analysis_window_minutes", 30)
         )
+        self.window = EventWindow(self.analysis_window)
+        # Most recent events for bottleneck detection
+        self.recent_events = EventWindow(
+            self.analysis_window,
+            max_events=config.get("bottleneck_event_limit", 10),
+        )
+
+    @property
+    def event_history(self) -> List[TeamEvent]:
+        """Events inside the analysis window, oldest first."""
+        return list(self.window)
 
     def process_event(self, event: TeamEvent) -> List[Alert]:
         """
@@ -156,7 +353,8 @@ class EventProcessor:
             List of alerts generated from event analysis
         """
         # Store event in history
-        self.event_history.append(event)
+        self.window.add(event)
+        self.recent_events.add(event)
         self._cleanup_old_events()
 
         # Analyze patterns and generate alerts
@@ -190,10 +388,9 @@ class EventProcessor:
 
     def _cleanup_old_events(self) -> None:
         """Remove events older than the analysis window."""
-        cutoff = datetime.now() - self.analysis_window
-        self.event_history = [
-            event for event in self.event_history if event.timestamp > cutoff
-        ]
+        now = datetime.now()
+        self.window.expire(now)
+        self.recent_events.expire(now)
 
     def _check_communication_pattern(self, event: TeamEvent) -> Optional[Alert]:
         """Check for communication delay patterns requiring alerts."""
@@ -202,18 +399,15 @@ class EventProcessor:
             return None  # Don't alert for low severity events
 
         # Count HIGH severity events in history
-        team_events = [
-            e
-            for e in self.event_history
-            if e.team_id == event.team_id
-            and e.event_type == EventType.COMMUNICATION_DELAY
-            and e.context.get("severity") == "high"  # Only high severity events
-        ]
+        high_delays = self.window.count(
+            EventType.COMMUNICATION_DELAY, event.team_id, "high"
+        )
 
         # Alert if multiple HIGH SEVERITY communication delays in short period
-        if len(team_events) >= self.pattern_thresholds.get(
-            "communication_threshold", 3
-        ):
+        if high_delays >= self.pattern_thresholds.get("communication_threshold", 3):
+            team_events = self.window.latest(
+                EventType.COMMUNICATION_DELAY, event.team_id, "high", limit=3
+            )
             return Alert(
                 alert_id=f"comm_delay_{event.team_id}_{int(time.time())}",
                 severity=AlertSeverity.HIGH,
@@ -221,7 +415,7 @@ class EventProcessor:
                 team_id=event.team_id,
                 message=f"Multiple communication delays detected for team {event.team_id}",
                 timestamp=datetime.now(),
-                source_events=[e.event_id for e in team_events[-3:]],
+                source_events=[e.event_id for e in team_events],
                 recommended_actions=[
                     "Review team communication channels",
                     "Check for stakeholder availability issues",
@@ -232,14 +426,13 @@ class EventProcessor:
 
     def _check_dependency_pattern(self, event: TeamEvent) -> Optional[Alert]:
         """Check for dependency block patterns requiring alerts."""
-        team_events = [
-            e
-            for e in self.event_history
-            if e.team_id == event.team_id and e.event_type == EventType.DEPENDENCY_BLOCK
-        ]
+        blocks = self.window.count(EventType.DEPENDENCY_BLOCK, event.team_id)
 
         # Alert if critical dependency blocks
-        if len(team_events) >= self.pattern_thresholds.get("dependency_threshold", 2):
+        if blocks >= self.pattern_thresholds.get("dependency_threshold", 2):
+            team_events = self.window.latest(
+                EventType.DEPENDENCY_BLOCK, event.team_id, limit=2
+            )
             return Alert(
                 alert_id=f"dep_block_{event.team_id}_{int(time.time())}",
                 severity=AlertSeverity.CRITICAL,
@@ -247,7 +440,7 @@ class EventProcessor:
                 team_id=event.team_id,
                 message=f"Critical dependency blocks detected for team {event.team_id}",
                 timestamp=datetime.now(),
-                source_events=[e.event_id for e in team_events[-2:]],
+                source_events=[e.event_id for e in team_events],
                 recommended_actions=[
                     "Escalate dependency resolution",
                     "Identify alternative solutions",
@@ -258,15 +451,13 @@ class EventProcessor:
 
     def _check_workflow_pattern(self, event: TeamEvent) -> Optional[Alert]:
         """Check for workflow bottleneck patterns requiring alerts."""
-        team_events = [
-            e
-            for e in self.event_history
-            if e.team_id == event.team_id
-            and e.event_type == EventType.WORKFLOW_BOTTLENECK
-        ]
+        bottlenecks = self.window.count(EventType.WORKFLOW_BOTTLENECK, event.team_id)
 
         # Alert if persistent workflow issues
-        if len(team_events) >= self.pattern_thresholds.get("workflow_threshold", 2):
+        if bottlenecks >= self.pattern_thresholds.get("workflow_threshold", 2):
+            team_events = self.window.latest(
+                EventType.WORKFLOW_BOTTLENECK, event.team_id, limit=2
+            )
             return Alert(
                 alert_id=f"workflow_block_{event.team_id}_{int(time.time())}",
                 severity=AlertSeverity.HIGH,
@@ -274,7 +465,7 @@ class EventProcessor:
                 team_id=event.team_id,
                 message=f"Persistent workflow bottlenecks detected for team {event.team_id}",
                 timestamp=datetime.now(),
-                source_events=[e.event_id for e in team_events[-2:]],
+                source_events=[e.event_id for e in team_events],
                 recommended_actions=[
                     "Review workflow process efficiency",
                     "Identify bottleneck root causes",
@@ -285,15 +476,8 @@ class EventProcessor:
 
     def _check_stakeholder_pattern(self, event: TeamEvent) -> Optional[Alert]:
         """Check for stakeholder conflict patterns requiring alerts."""
-        team_events = [
-            e
-            for e in self.event_history
-            if e.team_id == event.team_id
-            and e.event_type == EventType.STAKEHOLDER_CONFLICT
-        ]
-
         # Alert on any stakeholder conflict (immediate attention needed)
-        if team_events:
+        if self.window.count(EventType.STAKEHOLDER_CONFLICT, event.team_id):
             return Alert(
                 alert_id=f"stakeholder_conflict_{event.team_id}_{int(time.time())}",
                 severity=AlertSeverity.CRITICAL,
@@ -412,11 +596,13 @@ class TeamDataCollector:
         self.collection_interval = config.get("collection_interval", 60)  # seconds
         self.running = False
         self._collection_thread: Optional[threading.Thread] = None
+        self._stop_requested = threading.Event()
 
     def start_collection(self) -> None:
         """Start background data collection."""
         if not self.running:
             self.running = True
+            self._stop_requested.clear()
             self._collection_thread = threading.Thread(
                 target=self._collection_loop, daemon=True
             )
@@ -426,6 +612,7 @@ class TeamDataCollector:
     def stop_collection(self) -> None:
         """Stop background data collection."""
         self.running = False
+        self._stop_requested.set()
         if self._collection_thread:
             self._collection_thread.join(timeout=5)
         logger.info("Team data collection stopped")
@@ -437,10 +624,28 @@ class TeamDataCollector:
                 # Simulate data collection from various sources
                 # In production, this would integrate with actual data sources
                 self._collect_from_sources()
-                time.sleep(self.collection_interval)
             except Exception as e:
                 logger.error(f"Data collection error: {e}")
-                time.sleep(self.collection_interval)
+            # Wakes immediately on stop instead of sleeping out the interval
+            self._stop_requested.wait(self.collection_interval)
+
+    async def collect_async(
+        self, sink: Callable[[List[TeamEvent]], Awaitable[None]]
+    ) -> None:
+        """
+        Collect on the event loop, handing each non-empty batch to sink.
+
+        Runs until cancelled; used by RealTimeMonitor's async ingestion in
+        place of the polling thread.
+        """
+        while True:
+            try:
+                events = self._collect_from_sources()
+                if events:
+                    await sink(events)
+            except Exception as e:
+                logger.error(f"Data collection error: {e}")
+            await asyncio.sleep(self.collection_interval)
 
     def _collect_from_sources(self) -> List[TeamEvent]:
         """Collect team events from configured data sources."""
@@ -472,52 +677,52 @@ class RealTimeBottleneckDetector:
         )
         self.detection_thresholds = config.get("detection_thresholds", {})
 
-    def analyze_bottleneck(self, events: List[TeamEvent]) -> List[Alert]:
+    def analyze_bottleneck(
+        self, events: Union[List[TeamEvent], EventWindow]
+    ) -> List[Alert]:
         """
         Analyze events for bottleneck patterns and generate alerts.
 
         Args:
-            events: List of team events to analyze
+            events: Team events to analyze, as a list or an EventWindow
+                whose running aggregates are read directly
 
         Returns:
             List of alerts for detected bottlenecks
         """
+        window = (
+            events
+            if isinstance(events, EventWindow)
+            else EventWindow.from_events(events)
+        )
         alerts = []
 
         for algorithm in self.detection_algorithms:
             if algorithm == "communication_lag":
-                alerts.extend(self._detect_communication_lag(events))
+                alerts.extend(self._detect_communication_lag(window))
             elif algorithm == "dependency_chain":
-                alerts.extend(self._detect_dependency_chains(events))
+                alerts.extend(self._detect_dependency_chains(window))
             elif algorithm == "resource_contention":
-                alerts.extend(self._detect_resource_contention(events))
+                alerts.extend(self._detect_resource_contention(window))
             elif algorithm == "process_deviation":
-                alerts.extend(self._detect_process_deviation(events))
+                alerts.extend(self._detect_process_deviation(window))
 
         return alerts
 
-    def _detect_communication_lag(self, events: List[TeamEvent]) -> List[Alert]:
+    def _detect_communication_lag(self, window: EventWindow) -> List[Alert]:
         """Detect communication lag patterns."""
         # 🎯 P0 FIX: Only detect patterns for HIGH severity events to prevent false positives
-        comm_events = [
-            e
-            for e in events
-            if e.event_type == EventType.COMMUNICATION_DELAY
-            and e.context.get("severity") == "high"  # Only high severity events
-        ]
-
-        # Group by team and check for patterns
-        team_groups = {}
-        for event in comm_events:
-            if event.team_id not in team_groups:
-                team_groups[event.team_id] = []
-            team_groups[event.team_id].append(event)
-
         alerts = []
         threshold = self.detection_thresholds.get("communication_lag_count", 3)
 
-        for team_id, team_events in team_groups.items():
-            if len(team_events) >= threshold:
+        for team_id in window.teams(EventType.COMMUNICATION_DELAY, "high"):
+            if (
+                window.count(EventType.COMMUNICATION_DELAY, team_id, "high")
+                >= threshold
+            ):
+                team_events = window.events(
+                    EventType.COMMUNICATION_DELAY, team_id, "high"
+                )
                 alerts.append(
                     Alert(
                         alert_id=f"comm_lag_{team_id}_{int(time.time())}",
@@ -537,17 +742,16 @@ class RealTimeBottleneckDetector:
 
         return alerts
 
-    def _detect_dependency_chains(self, events: List[TeamEvent]) -> List[Alert]:
+    def _detect_dependency_chains(self, window: EventWindow) -> List[Alert]:
         """Detect dependency chain bottlenecks."""
-        dep_events = [e for e in events if e.event_type == EventType.DEPENDENCY_BLOCK]
-
         alerts = []
         threshold = self.detection_thresholds.get("dependency_chain_length", 2)
 
         # Check for dependency chains affecting multiple teams
-        if len(dep_events) >= threshold:
-            affected_teams = list(set(e.team_id for e in dep_events))
+        if window.count(EventType.DEPENDENCY_BLOCK) >= threshold:
+            affected_teams = window.teams(EventType.DEPENDENCY_BLOCK)
             if len(affected_teams) > 1:
+                dep_events = window.events(EventType.DEPENDENCY_BLOCK)
                 alerts.append(
                     Alert(
                         alert_id=f"dep_chain_{int(time.time())}",
@@ -567,16 +771,13 @@ class RealTimeBottleneckDetector:
 
         return alerts
 
-    def _detect_resource_contention(self, events: List[TeamEvent]) -> List[Alert]:
+    def _detect_resource_contention(self, window: EventWindow) -> List[Alert]:
         """Detect resource contention patterns."""
-        resource_events = [
-            e for e in events if e.event_type == EventType.RESOURCE_CONTENTION
-        ]
-
         # Resource contention analysis implementation
         # Analyzes resource usage patterns and identifies conflicts
         alerts = []
-        if len(resource_events) >= 2:  # Multiple resource conflicts
+        if window.count(EventType.RESOURCE_CONTENTION) >= 2:  # Multiple conflicts
+            resource_events = window.events(EventType.RESOURCE_CONTENTION)
             alerts.append(
                 Alert(
                     alert_id=f"resource_contention_{int(time.time())}",
@@ -595,25 +796,23 @@ class RealTimeBottleneckDetector:
             )
         return alerts
 
-    def _detect_process_deviation(self, events: List[TeamEvent]) -> List[Alert]:
+    def _detect_process_deviation(self, window: EventWindow) -> List[Alert]:
         """Detect process deviation patterns."""
-        process_events = [
-            e for e in events if e.event_type == EventType.PROCESS_DEVIATION
-        ]
-
         # Process deviation analysis implementation
         # Analyzes adherence to established processes and identifies deviations
         alerts = []
-        if len(process_events) >= 1:  # Any process deviation warrants attention
+        if window.count(EventType.PROCESS_DEVIATION) >= 1:  # Any deviation matters
+            first_event = window.events(EventType.PROCESS_DEVIATION)[0]
+            last_event = window.latest(EventType.PROCESS_DEVIATION)[0]
             alerts.append(
                 Alert(
                     alert_id=f"process_deviation_{int(time.time())}",
                     severity=AlertSeverity.MEDIUM,
                     event_type=EventType.PROCESS_DEVIATION,
-                    team_id=process_events[0].team_id,
+                    team_id=first_event.team_id,
                     message="Process deviation detected",
                     timestamp=datetime.now(),
-                    source_events=[e.event_id for e in process_events[-1:]],
+                    source_events=[last_event.event_id],
                     recommended_actions=[
                         "Review process adherence",
                         "Provide process training if needed",
@@ -624,6 +823,50 @@ class RealTimeBottleneckDetector:
         return alerts
 
 
+class StageLatencyTracker:
+    """
+    Per-stage latency samples with nearest-rank percentiles.
+
+    Keeps the most recent max_samples durations per stage so percentiles
+    reflect current behaviour and memory stays bounded.
+    """
+
+    PERCENTILES = (50, 95, 99)
+
+    def __init__(self, max_samples: int = 2048):
+        self.max_samples = max_samples
+        self._samples: Dict[str, Deque[float]] = {}
+        self._counts: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def record(self, stage: str, seconds: float) -> None:
+        """Record one duration for a stage."""
+        with self._lock:
+            samples = self._samples.get(stage)
+            if samples is None:
+                samples = self._samples[stage] = deque(maxlen=self.max_samples)
+            samples.append(seconds)
+            self._counts[stage] = self._counts.get(stage, 0) + 1
+
+    def percentiles(self) -> Dict[str, Dict[str, float]]:
+        """Count, p50/p95/p99 and max per stage, in milliseconds."""
+        with self._lock:
+            snapshot = {stage: sorted(s) for stage, s in self._samples.items()}
+            counts = dict(self._counts)
+
+        report = {}
+        for stage, ordered in snapshot.items():
+            if not ordered:
+                continue
+            stats = {"count": counts[stage]}
+            for pct in self.PERCENTILES:
+                rank = max(0, -(-pct * len(ordered) // 100) - 1)
+                stats[f"p{pct}_ms"] = ordered[rank] * 1000
+            stats["max_ms"] = ordered[-1] * 1000
+            report[stage] = stats
+        return report
+
+
 class RealTimeMonitor(BaseProcessor):
     """
     🏗️ PHASE 9.1: Real-time monitoring system with BaseProcessor inheritance
@@ -681,6 +924,16 @@ class RealTimeMonitor(BaseProcessor):
         self.running = False
         self.monitoring_thread: Optional[threading.Thread] = None
 
+        # Batched async ingestion: a micro-batch is processed once it holds
+        # ingest_batch_size events or its first event has waited
+        # ingest_batch_delay_ms, whichever comes first
+        self.ingest_batch_size = self.get_config("ingest_batch_size", 100)
+        self.ingest_batch_delay = self.get_config("ingest_batch_delay_ms", 50) / 1000
+        self._ingest_queue: Optional[asyncio.Queue] = None
+        self._ingest_tasks: List[asyncio.Task] = []
+        self.batches_processed = 0
+        self.stage_latency = StageLatencyTracker()
+
         # Phase 9.1: Enhanced performance tracking with latency metrics
         self.start_time = datetime.now()
         self.events_processed = 0
@@ -746,7 +999,11 @@ class RealTimeMonitor(BaseProcessor):
                 return cached_result
 
             # Process event through bottleneck detector
-            alerts = self.bottleneck_detector.detect_bottlenecks([event])
+            detect_start = time.perf_counter()
+            alerts = self.bottleneck_detector.analyze_bottleneck([event])
+            self.stage_latency.record(
+                "bottleneck_detection", time.perf_counter() - detect_start
+            )
 
             # Cache result for performance (BaseProcessor pattern)
             if self.cache:
@@ -825,6 +1082,8 @@ class RealTimeMonitor(BaseProcessor):
             "latency_violations": self.latency_violations,
             "events_processed": self.events_processed,
             "alerts_generated": self.alerts_generated,
+            "batches_processed": self.batches_processed,
+            "stage_latency_ms": self.stage_latency.percentiles(),
             "uptime_seconds": (datetime.now() - self.start_time).total_seconds(),
         }
 
@@ -880,27 +1139,158 @@ class RealTimeMonitor(BaseProcessor):
         self.event_queue.put(event)
 
         # Process immediately and return results
+        return self.process_event_batch([event])
+
+    def process_event_batch(
+        self,
+        events: List[TeamEvent],
+        enqueued_at: Optional[List[float]] = None,
+    ) -> List[Alert]:
+        """
+        Process a micro-batch of team events.
+
+        Pattern checks run per event, bottleneck detection runs once over
+        the recent events (at least the whole batch), then alerts are routed.
+        Per-stage latencies are recorded for percentile reporting
+        (pattern_analysis per event, the other stages per batch).
+
+        Args:
+            events: Team events to process, in arrival order
+            enqueued_at: Optional perf_counter() submit times, one per event,
+                used to report queue wait and end-to-end detection latency
+
+        Returns:
+            List of alerts generated from the batch
+        """
+        if not events:
+            return []
+
+        batch_start = time.perf_counter()
         alerts = []
 
         # Event pattern analysis
-        pattern_alerts = self.event_processor.process_event(event)
-        alerts.extend(pattern_alerts)
-
-        # Bottleneck detection
-        recent_events = self.event_processor.event_history[-10:]  # Last 10 events
-        bottleneck_alerts = self.bottleneck_detector.analyze_bottleneck(recent_events)
+        for event in events:
+            alerts.extend(self.event_processor.process_event(event))
+        patterns_done = time.perf_counter()
+
+        # Bottleneck detection: the bounded recent-event window only keeps
+        # the tail of a large batch, so widen it to cover every batch event
+        recent = self.event_processor.recent_events
+        if recent.max_events is not None and len(events) > recent.max_events:
+            recent = EventWindow.from_events(
+                self.event_processor.window.recent(len(events))
+            )
+        bottleneck_alerts = self.bottleneck_detector.analyze_bottleneck(recent)
         alerts.extend(bottleneck_alerts)
+        detection_done = time.perf_counter()
 
         # Process all generated alerts
         for alert in alerts:
             self.alert_engine.process_alert(alert)
+        batch_done = time.perf_counter()
 
         # Update performance metrics
-        self.events_processed += 1
         self.alerts_generated += len(alerts)
+        self.batches_processed += 1
+
+        record = self.stage_latency.record
+        record("pattern_analysis", (patterns_done - batch_start) / len(events))
+        record("bottleneck_detection", detection_done - patterns_done)
+        record("alert_dispatch", batch_done - detection_done)
+        record("batch_total", batch_done - batch_start)
+        for submitted in enqueued_at or [batch_start] * len(events):
+            if enqueued_at:
+                record("queue_wait", batch_start - submitted)
+            record("detection_latency", batch_done - submitted)
+            self.events_processed += 1
+            self._update_latency_metrics(batch_done - submitted)
 
         return alerts
 
+    async def start_async_ingestion(self) -> None:
+        """
+        Start the asyncio micro-batch consumer on the running event loop.
+
+        Events submitted with submit_event/submit_events are processed in
+        batches bounded by ingest_batch_size and ingest_batch_delay_ms.
+        Configured data sources are collected on the same loop.
+        """
+        if self._ingest_queue is not None:
+            self.logger.warning("Async ingestion already running")
+            return
+
+        self._ingest_queue = asyncio.Queue()
+        self._ingest_tasks = [asyncio.create_task(self._ingestion_consumer())]
+        if self.data_collector.data_sources:
+            self._ingest_tasks.append(
+                asyncio.create_task(
+                    self.data_collector.collect_async(self.submit_events)
+                )
+            )
+
+    async def submit_event(self, event: TeamEvent) -> None:
+        """Queue one event for batched processing."""
+        await self.submit_events([event])
+
+    async def submit_events(self, events: List[TeamEvent]) -> None:
+        """Queue events for batched processing."""
+        if self._ingest_queue is None:
+            raise RuntimeError("Async ingestion is not running")
+        submitted = time.perf_counter()
+        for event in events:
+            self._ingest_queue.put_nowait((submitted, event))
+
+    async def stop_async_ingestion(self) -> None:
+        """Process everything already submitted, then stop the consumer."""
+        if self._ingest_queue is None:
+            return
+
+        consumer, *others = self._ingest_tasks
+        for task in others:
+            task.cancel()
+        self._ingest_queue.put_nowait(None)  # Sentinel after pending events
+        await asyncio.gather(consumer, *others, return_exceptions=True)
+        self._ingest_queue = None
+        self._ingest_tasks = []
+
+    async def _ingestion_consumer(self) -> None:
+        """Gather micro-batches from the ingest queue and process them."""
+        queue = self._ingest_queue
+        loop = asyncio.get_running_loop()
+        stopping = False
+
+        while not stopping:
+            item = await queue.get()
+            if item is None:
+                break
+            batch = [item]
+            deadline = loop.time() + self.ingest_batch_delay
+
+            while len(batch) < self.ingest_batch_size:
+                try:
+                    item = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        item = await asyncio.wait_for(queue.get(), remaining)
+                    except asyncio.TimeoutError:
+                        break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            try:
+                self.process_event_batch(
+                    [event for _, event in batch],
+                    enqueued_at=[submitted for submitted, _ in batch],
+                )
+            except Exception as e:
+                self.record_error(e)
+                self.logger.error(f"Failed to process batch of {len(batch)}: {e}")
+
     def get_monitoring_status(self) -> Dict[str, Any]:
         """
         Get current monitoring status and performance metrics.
@@ -955,15 +1345,18 @@ class RealTimeMonitor(BaseProcessor):
 
         while self.running:
             try:
-                # Process queued events
-                self._process_event_queue()
-
-                # Brief sleep to prevent excessive CPU usage
-                time.sleep(0.1)
+                # Block until an event arrives instead of sleep-polling; the
+                # timeout only bounds how long stop_monitoring waits
+                event = self.event_queue.get(timeout=0.5)
+            except Empty:
+                continue
 
+            try:
+                logger.debug(f"Processing queued event: {event.event_id}")
+                self.event_queue.task_done()
+                self._process_event_queue()
             except Exception as e:
                 logger.error(f"Monitoring loop error: {e}")
-                time.sleep(1)
 
         logger.info("Monitoring loop stopped")
 
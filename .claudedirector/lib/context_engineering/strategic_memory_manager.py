@@ -16,7 +16,7 @@ import os
 import sqlite3
 import time
 import uuid
-from datetime import date, datetime, timedelta
+from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -33,6 +33,21 @@ except ImportError:
 # Removed circular dependency - StrategicMemoryManager IS the unified database solution
 UNIFIED_DB_AVAILABLE = False
 
+# Shared per-file SQLite connection pool (stdlib only)
+try:
+    from ..core.connection_pool import get_connection_pool
+except ImportError:
+    from core.connection_pool import get_connection_pool
+
+# Write-behind buffering for per-turn context updates
+try:
+    from .context_write_behind import ContextWriteBehindBuffer, PendingContextUpdate
+except ImportError:
+    from context_engineering.context_write_behind import (
+        ContextWriteBehindBuffer,
+        PendingContextUpdate,
+    )
+
 # Legacy import compatibility during migration
 try:
     from ..memory.optimized_db_manager import get_db_manager, OptimizedSQLiteManager
@@ -41,6 +56,24 @@ try:
 except ImportError:
     LEGACY_DB_AVAILABLE = False
 
+# Snapshot/read retries before recover_session_context accepts a racing flush
+MAX_RECOVERY_ATTEMPTS = 3
+
+
+def _json_snapshot(value: Any) -> Any:
+    """Deep copy of a JSON-serializable value, as it will be persisted"""
+    return None if value is None else json.loads(json.dumps(value))
+
+
+def _row_timestamp(timestamp: datetime) -> str:
+    """
+    session_context.updated_at for a write: UTC like CURRENT_TIMESTAMP, but
+    with microseconds so writes within one second still order correctly
+    """
+    return datetime.fromtimestamp(timestamp.timestamp(), timezone.utc).strftime(
+        "%Y-%m-%d %H:%M:%S.%f"
+    )
+
 
 class StrategicMemoryManager:
     """
@@ -64,8 +97,18 @@ class StrategicMemoryManager:
         db_path: Optional[str] = None,
         enable_performance: bool = True,
         session_backup_interval: int = 300,
+        write_behind: bool = True,
+        write_behind_max_pending: int = 32,
+        write_behind_max_delay_seconds: float = 1.0,
     ):
-        """Initialize unified strategic memory manager"""
+        """
+        Initialize unified strategic memory manager
+
+        With write_behind enabled, preserve_context() queues updates that are
+        coalesced per session and committed together once
+        write_behind_max_pending updates are queued or the oldest is
+        write_behind_max_delay_seconds old (and on close/interpreter exit).
+        """
         if db_path is None:
             # Default to ClaudeDirector data directory
             base_path = Path(__file__).parent.parent.parent.parent
@@ -97,8 +140,19 @@ class StrategicMemoryManager:
 
         # Initialize database
         self.ensure_db_exists()
+        self._connection_pool = get_connection_pool(self.db_path)
         self._ensure_session_schema()
 
+        self._write_behind = (
+            ContextWriteBehindBuffer(
+                self._flush_context_updates,
+                max_pending_updates=write_behind_max_pending,
+                max_delay_seconds=write_behind_max_delay_seconds,
+            )
+            if write_behind
+            else None
+        )
+
     def ensure_db_exists(self):
         """Ensure database and directory exist"""
         os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
@@ -106,8 +160,13 @@ class StrategicMemoryManager:
         if not os.path.exists(self.db_path):
             print(f"Database {self.db_path} will be created on first use")
 
-    def get_connection(self) -> sqlite3.Connection:
-        """Get database connection via UnifiedDatabaseCoordinator with intelligent fallback"""
+    def get_connection(self):
+        """
+        Get a pooled database connection (use as a context manager)
+
+        Leases a connection from the shared per-file pool; it is committed on
+        success, rolled back on error and returned to the pool on exit.
+        """
         # StrategicMemoryManager IS the unified database solution
 
         # Fallback to legacy optimized manager
@@ -116,13 +175,9 @@ class StrategicMemoryManager:
                 db_manager = get_db_manager(self.db_path)
                 return db_manager.get_connection()
             except Exception as e:
-                print(f"⚠️  Legacy DB manager fallback to direct: {e}")
+                print(f"⚠️  Legacy DB manager fallback to pool: {e}")
 
-        # Final fallback to direct connection
-        print(f"📊 Using direct SQLite connection: {self.db_path}")
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        return conn
+        return self._connection_pool.connection(row_factory=sqlite3.Row)
 
     def _ensure_session_schema(self):
         """Ensure session context tables exist"""
@@ -241,9 +296,55 @@ class StrategicMemoryManager:
         if not session_id:
             return False
 
-        backup_id = f"backup_{int(datetime.now().timestamp())}_{uuid.uuid4().hex[:8]}"
+        if self._write_behind is not None:
+            # Snapshot now: the caller may keep mutating its dict after we
+            # return, and the flush only runs later
+            try:
+                self._write_behind.put(
+                    PendingContextUpdate(
+                        session_id,
+                        _json_snapshot(context_data),
+                        _json_snapshot(critical_indicators),
+                    )
+                )
+                return True
+            except RuntimeError:
+                pass  # Buffer closed (shutdown): write through
+
+        with self.get_connection() as conn:
+            self._write_context(conn, session_id, context_data, critical_indicators)
+
+        return True
+
+    def flush_pending_writes(self) -> int:
+        """Commit queued context updates now; returns sessions flushed"""
+        if self._write_behind is None:
+            return 0
+        return self._write_behind.flush()
+
+    def close(self):
+        """Flush queued context updates and stop write-behind buffering"""
+        if self._write_behind is not None:
+            self._write_behind.close()
+
+    def _flush_context_updates(self, updates: List[PendingContextUpdate]):
+        """Write-behind flush: persist coalesced updates in one transaction"""
+        with self.get_connection() as conn:
+            for update in updates:
+                self._write_context(
+                    conn,
+                    update.session_id,
+                    update.context_data,
+                    update.critical_indicators,
+                    timestamp=datetime.fromtimestamp(update.queued_at),
+                )
 
-        # Identify critical context elements
+    def _critical_context(
+        self,
+        context_data: Optional[Dict[str, Any]],
+        critical_indicators: Optional[List[str]],
+    ) -> Dict[str, Any]:
+        """Identify critical context elements of a context update"""
         critical_context = {}
         if context_data:
             for pattern in self.critical_context_patterns:
@@ -254,100 +355,170 @@ class StrategicMemoryManager:
         if critical_indicators:
             critical_context["critical_indicators"] = critical_indicators
 
-        with self.get_connection() as conn:
-            # Update session context
-            conn.execute(
-                """
-                UPDATE session_context
-                SET context_data = ?, critical_context = ?, updated_at = CURRENT_TIMESTAMP
-                WHERE session_id = ?
-            """,
-                (
-                    json.dumps(context_data or {}),
-                    json.dumps(critical_context),
-                    session_id,
-                ),
-            )
-
-            # Create backup for recovery
-            conn.execute(
-                """
-                INSERT INTO session_continuity
-                (backup_id, session_id, context_snapshot, critical_flags)
-                VALUES (?, ?, ?, ?)
-            """,
-                (
-                    backup_id,
-                    session_id,
-                    json.dumps(
-                        {
-                            "full_context": context_data or {},
-                            "critical_context": critical_context,
-                            "timestamp": datetime.now().isoformat(),
-                        }
-                    ),
-                    json.dumps(
-                        {
-                            "requires_recovery": any(
-                                indicator in str(context_data)
-                                for indicator in [
-                                    "executive",
-                                    "stakeholder",
-                                    "strategic",
-                                ]
-                            ),
-                            "critical_patterns_present": len(critical_context) > 0,
-                        }
-                    ),
-                ),
-            )
+        return critical_context
 
-            conn.commit()
+    def _write_context(
+        self,
+        conn: sqlite3.Connection,
+        session_id: str,
+        context_data: Optional[Dict[str, Any]],
+        critical_indicators: Optional[List[str]],
+        timestamp: Optional[datetime] = None,
+    ) -> bool:
+        """
+        Write a context update and its recovery backup on an open connection
+
+        timestamp is when the update was made (defaults to now). An update
+        older than the session's stored context is skipped, so a delayed
+        write-behind flush cannot overwrite a newer direct write; returns
+        whether the update was written.
+        """
+        timestamp = timestamp or datetime.now()
+        backup_id = f"backup_{int(timestamp.timestamp())}_{uuid.uuid4().hex[:8]}"
+        critical_context = self._critical_context(context_data, critical_indicators)
+        updated_at = _row_timestamp(timestamp)
+
+        # Update session context unless a newer update already landed
+        cursor = conn.execute(
+            """
+            UPDATE session_context
+            SET context_data = ?, critical_context = ?, updated_at = ?
+            WHERE session_id = ? AND (updated_at IS NULL OR updated_at <= ?)
+        """,
+            (
+                json.dumps(context_data or {}),
+                json.dumps(critical_context),
+                updated_at,
+                session_id,
+                updated_at,
+            ),
+        )
+        if (
+            cursor.rowcount == 0
+            and conn.execute(
+                "SELECT 1 FROM session_context WHERE session_id = ?", (session_id,)
+            ).fetchone()
+        ):
+            # Superseded: its backup would shadow the newer context on recovery
+            return False
 
+        # Create backup for recovery
+        conn.execute(
+            """
+            INSERT INTO session_continuity
+            (backup_id, session_id, context_snapshot, critical_flags)
+            VALUES (?, ?, ?, ?)
+        """,
+            (
+                backup_id,
+                session_id,
+                json.dumps(
+                    {
+                        "full_context": context_data or {},
+                        "critical_context": critical_context,
+                        "timestamp": timestamp.isoformat(),
+                    }
+                ),
+                json.dumps(
+                    {
+                        "requires_recovery": any(
+                            indicator in str(context_data)
+                            for indicator in [
+                                "executive",
+                                "stakeholder",
+                                "strategic",
+                            ]
+                        ),
+                        "critical_patterns_present": len(critical_context) > 0,
+                    }
+                ),
+            ),
+        )
         return True
 
     def recover_session_context(self, session_id: str) -> Optional[Dict[str, Any]]:
         """Recover session context after interruption"""
-        with self.get_connection() as conn:
-            # Get latest session context
-            result = conn.execute(
-                """
-                SELECT context_data, critical_context, last_activity
-                FROM session_context
-                WHERE session_id = ?
-            """,
-                (session_id,),
-            ).fetchone()
+        if self._write_behind is None:
+            with self.get_connection() as conn:
+                return self._read_session_context(conn, session_id)
 
-            if not result:
-                return None
+        # Read-your-writes: snapshot the queued/in-flight update BEFORE
+        # reading the database, so a flush committing between the two reads
+        # cannot hide it; retry if a put or commit raced with the read
+        for _ in range(MAX_RECOVERY_ATTEMPTS):
+            pending, sequence = self._write_behind.snapshot(session_id)
+            with self.get_connection() as conn:
+                recovery_context = self._read_session_context(conn, session_id)
+            if self._write_behind.sequence() == sequence:
+                break
+
+        if recovery_context is not None and pending is not None:
+            # Hand out copies so callers cannot mutate the queued snapshot
+            context_data = _json_snapshot(pending.context_data) or {}
+            critical_context = self._critical_context(
+                context_data, _json_snapshot(pending.critical_indicators)
+            )
+            recovery_context.update(
+                {
+                    "context_data": context_data,
+                    "critical_context": critical_context,
+                    "recovery_available": True,
+                    "backup_context": {
+                        "full_context": _json_snapshot(context_data),
+                        "critical_context": critical_context,
+                        "timestamp": datetime.fromtimestamp(
+                            pending.queued_at
+                        ).isoformat(),
+                    },
+                    "backup_timestamp": pending.queued_timestamp,
+                }
+            )
 
-            # Get latest backup
-            backup_result = conn.execute(
-                """
-                SELECT context_snapshot, backup_timestamp
-                FROM session_continuity
-                WHERE session_id = ?
-                ORDER BY backup_timestamp DESC
-                LIMIT 1
-            """,
-                (session_id,),
-            ).fetchone()
+        return recovery_context
 
-            recovery_context = {
-                "session_id": session_id,
-                "context_data": json.loads(result["context_data"] or "{}"),
-                "critical_context": json.loads(result["critical_context"] or "{}"),
-                "last_activity": result["last_activity"],
-                "recovery_available": backup_result is not None,
-            }
+    def _read_session_context(
+        self, conn: sqlite3.Connection, session_id: str
+    ) -> Optional[Dict[str, Any]]:
+        """Read a session's context and latest backup on an open connection"""
+        # Get latest session context
+        result = conn.execute(
+            """
+            SELECT context_data, critical_context, last_activity
+            FROM session_context
+            WHERE session_id = ?
+        """,
+            (session_id,),
+        ).fetchone()
+
+        if not result:
+            return None
+
+        # Get latest backup
+        backup_result = conn.execute(
+            """
+            SELECT context_snapshot, backup_timestamp
+            FROM session_continuity
+            WHERE session_id = ?
+            ORDER BY backup_timestamp DESC
+            LIMIT 1
+        """,
+            (session_id,),
+        ).fetchone()
+
+        recovery_context = {
+            "session_id": session_id,
+            "context_data": json.loads(result["context_data"] or "{}"),
+            "critical_context": json.loads(result["critical_context"] or "{}"),
+            "last_activity": result["last_activity"],
+            "recovery_available": backup_result is not None,
+        }
 
-            if backup_result:
-                backup_data = json.loads(backup_result["context_snapshot"])
-                recovery_context["backup_context"] = backup_data
-                recovery_context["backup_timestamp"] = backup_result["backup_timestamp"]
+        if backup_result:
+            backup_data = json.loads(backup_result["context_snapshot"])
+            recovery_context["backup_context"] = backup_data
+            recovery_context["backup_timestamp"] = backup_result["backup_timestamp"]
 
-            return recovery_context
+        return recovery_context
 
     def get_recent_sessions(self, hours: int = 24) -> List[Dict[str, Any]]:
         """Get recent sessions within specified hours"""
@@ -385,6 +556,7 @@ class StrategicMemoryManager:
 
     def get_active_sessions(self) -> List[Dict[str, Any]]:
         """Get all active sessions for context restoration"""
+        self.flush_pending_writes()
         with self.get_connection() as conn:
             results = conn.execute(
                 """
@@ -589,6 +761,8 @@ class StrategicMemoryManager:
             "current_session": self.current_session_id,
         }
 
+        self.flush_pending_writes()
+
         with self.get_connection() as conn:
             # Session statistics
             session_stats = conn.execute(
@@ -649,6 +823,7 @@ class StrategicMemoryManager:
 
     def cleanup_old_sessions(self, days_old: int = 90) -> int:
         """Cleanup old inactive sessions"""
+        self.flush_pending_writes()
         cutoff_date = (datetime.now() - timedelta(days=days_old)).isoformat()
 
         with self.get_connection() as conn:
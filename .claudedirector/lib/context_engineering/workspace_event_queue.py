@@ -0,0 +1,179 @@
+"""
+Debounced File Event Queue for Workspace Monitoring
+
+Coalesces watchdog events per path and hands them to the workspace
+manager as one batch once the workspace has been quiet for a debounce
+window (or a burst has been pending for max_delay_seconds), so editor save
+storms and branch switches cost one re-index and one context update
+instead of one per event.
+
+Per-path coalescing keeps the net effect of an event sequence:
+- created -> modified            => created
+- created -> deleted             => dropped (transient file)
+- deleted -> created / modified  => modified (atomic save / rewrite)
+- modified -> deleted            => deleted
+
+Author: Martin | Platform Architecture
+"""
+
+import logging
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+EVENT_CREATED = "created"
+EVENT_MODIFIED = "modified"
+EVENT_DELETED = "deleted"
+
+FileEventCallback = Callable[[Dict[str, str]], None]
+
+
+def coalesce_file_event(previous: Optional[str], event_type: str) -> Optional[str]:
+    """Net event for a path given its pending event and a new one"""
+    if previous is None:
+        return event_type
+    if event_type == EVENT_DELETED:
+        return None if previous == EVENT_CREATED else EVENT_DELETED
+    if previous == EVENT_DELETED:
+        return EVENT_MODIFIED
+    if previous == EVENT_CREATED:
+        return EVENT_CREATED
+    return event_type
+
+
+class FileEventQueue:
+    """
+    Per-path coalescing event queue with a debouncing background flusher
+
+    process_callback receives {path: event_type} for every path whose net
+    effect is non-empty, in first-seen order. Failures are logged and the
+    batch is dropped; the next scan reconciles the index with disk.
+    """
+
+    def __init__(
+        self,
+        process_callback: FileEventCallback,
+        debounce_seconds: float = 0.5,
+        max_delay_seconds: float = 5.0,
+    ):
+        self.process_callback = process_callback
+        self.debounce_seconds = debounce_seconds
+        self.max_delay_seconds = max_delay_seconds
+
+        self._pending: Dict[str, Optional[str]] = {}
+        self._first_event_at: Optional[float] = None
+        self._last_event_at: Optional[float] = None
+
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._flush_lock = threading.Lock()
+        self._closed = False
+
+        # Queue statistics
+        self.events_received = 0
+        self.events_coalesced = 0
+        self.batches_processed = 0
+        self.paths_processed = 0
+
+        # Started on demand and exits once idle, so idle queues hold no thread
+        self._flusher: Optional[threading.Thread] = None
+
+    def put(self, path: str, event_type: str):
+        """Queue an event, coalescing with any pending event for the path"""
+        with self._lock:
+            if self._closed:
+                return
+
+            self.events_received += 1
+            if path in self._pending:
+                self.events_coalesced += 1
+            # A dropped (None) entry keeps its slot so ordering stays stable
+            self._pending[path] = coalesce_file_event(
+                self._pending.get(path), event_type
+            )
+
+            now = time.monotonic()
+            if self._first_event_at is None:
+                self._first_event_at = now
+            self._last_event_at = now
+
+            if self._flusher is None:
+                self._flusher = threading.Thread(
+                    target=self._run, name="workspace-event-queue", daemon=True
+                )
+                self._flusher.start()
+            else:
+                self._wakeup.notify()
+
+    def pending_count(self) -> int:
+        """Number of paths with a non-empty pending event"""
+        with self._lock:
+            return sum(1 for event in self._pending.values() if event is not None)
+
+    def flush(self) -> int:
+        """Process all pending events now; returns the number of paths"""
+        with self._flush_lock:
+            with self._lock:
+                batch = {
+                    path: event
+                    for path, event in self._pending.items()
+                    if event is not None
+                }
+                self._pending = {}
+                self._first_event_at = None
+                self._last_event_at = None
+            if not batch:
+                return 0
+
+            try:
+                self.process_callback(batch)
+            except Exception as e:
+                logger.error(f"Failed to process {len(batch)} file events: {e}")
+                return 0
+
+            self.batches_processed += 1
+            self.paths_processed += len(batch)
+            return len(batch)
+
+    def close(self):
+        """Stop accepting events and process whatever is pending"""
+        with self._lock:
+            self._closed = True
+            self._wakeup.notify()
+            flusher = self._flusher
+        if flusher is not None and flusher is not threading.current_thread():
+            flusher.join(timeout=self.max_delay_seconds + 1.0)
+        self.flush()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Queue statistics"""
+        return {
+            "events_received": self.events_received,
+            "events_coalesced": self.events_coalesced,
+            "batches_processed": self.batches_processed,
+            "paths_processed": self.paths_processed,
+            "pending_paths": self.pending_count(),
+        }
+
+    def _due_in(self, now: float) -> float:
+        """Seconds until the pending burst should be processed"""
+        quiet_at = self._last_event_at + self.debounce_seconds
+        deadline = self._first_event_at + self.max_delay_seconds
+        return min(quiet_at, deadline) - now
+
+    def _run(self):
+        """Wait for the burst to settle, process it, exit when idle"""
+        while True:
+            with self._lock:
+                while self._pending and not self._closed:
+                    remaining = self._due_in(time.monotonic())
+                    if remaining <= 0:
+                        break
+                    self._wakeup.wait(remaining)
+                if not self._pending or self._closed:
+                    self._flusher = None
+                    return
+
+            self.flush()
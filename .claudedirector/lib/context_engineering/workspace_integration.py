@@ -15,17 +15,23 @@ Original capabilities maintained:
 """
 
 import os
+import re
 import json
 import logging
-import sqlite3
 import hashlib
+import threading
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Set
-from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional, Any, Set, Tuple
+from dataclasses import dataclass, asdict, replace
 
 # PHASE 8.4: BaseManager consolidation imports
 from core.base_manager import BaseManager, BaseManagerConfig, ManagerType
+from core.connection_pool import get_connection_pool
+from utils.parallel import ParallelProcessor
+from utils.text_matching import KeywordMatcher
+
+from .workspace_event_queue import FileEventQueue
 
 # TS-4: Import strategic analysis capabilities
 try:
@@ -105,6 +111,37 @@ FILE_TYPES = {
     "GENERAL": "general",
 }
 
+# Bulk indexing: process-pool analysis once this many files need re-reading
+BULK_ANALYSIS_MIN_FILES = 64
+BULK_ANALYSIS_CHUNK_FILES = 16
+# Streaming reads: line-aligned chunks, re-scanning a short tail of the
+# previous chunk so multi-line initiative references are not split
+STREAM_CHUNK_CHARS = 1 << 20
+STREAM_CARRY_CHARS = 256
+# Rows per SQLite transaction when persisting index changes
+INDEX_WRITE_BATCH = 500
+
+# Strategic topics, reported in this order
+STRATEGIC_TOPIC_KEYWORDS = [
+    "platform strategy",
+    "organizational design",
+    "team topology",
+    "stakeholder management",
+    "resource allocation",
+    "technical debt",
+    "architecture decision",
+    "engineering efficiency",
+    "cross-team coordination",
+    "strategic initiative",
+    "roadmap planning",
+    "capacity planning",
+    "vendor evaluation",
+    "technology assessment",
+    "roi analysis",
+]
+
+_TOPIC_MATCHER = KeywordMatcher({"topics": STRATEGIC_TOPIC_KEYWORDS})
+
 
 # TS-4: Enhanced Strategic Analysis Data Models
 @dataclass
@@ -420,6 +457,177 @@ class WorkspaceContext:
     last_updated: datetime
 
 
+@dataclass
+class FileFingerprint:
+    """Cheap change-detection key for an indexed workspace file"""
+
+    mtime_ns: int
+    size: int
+    content_hash: str
+
+
+class _WorkspaceAggregate:
+    """
+    WorkspaceContext aggregates maintained with per-file deltas
+
+    Each strategic file contributes reference counts for its initiatives and
+    themes plus membership in the stakeholder, meeting and priority sets, so
+    adding, replacing or removing one file never re-walks the workspace.
+    """
+
+    def __init__(self):
+        self.initiative_counts: Dict[str, int] = {}
+        self.theme_counts: Dict[str, int] = {}
+        # Insertion-ordered path sets (dict keys)
+        self.stakeholder_activity: Dict[str, Dict[str, None]] = {}
+        self.meeting_files: Dict[str, datetime] = {}
+        self.priority_files: Dict[str, None] = {}
+
+    def add(self, strategy_file: StrategyFile):
+        path = strategy_file.path
+        for initiative in set(strategy_file.initiatives_referenced):
+            self.initiative_counts[initiative] = (
+                self.initiative_counts.get(initiative, 0) + 1
+            )
+        for theme in set(strategy_file.strategic_topics):
+            self.theme_counts[theme] = self.theme_counts.get(theme, 0) + 1
+        for stakeholder in strategy_file.stakeholders_mentioned:
+            self.stakeholder_activity.setdefault(stakeholder, {})[path] = None
+        if strategy_file.file_type == FILE_TYPES["MEETING_PREP"]:
+            self.meeting_files[path] = strategy_file.last_modified
+        if strategy_file.priority_level == PRIORITY_LEVELS["HIGH"]:
+            self.priority_files[path] = None
+
+    def remove(self, strategy_file: StrategyFile):
+        path = strategy_file.path
+        for initiative in set(strategy_file.initiatives_referenced):
+            self._decrement(self.initiative_counts, initiative)
+        for theme in set(strategy_file.strategic_topics):
+            self._decrement(self.theme_counts, theme)
+        for stakeholder in strategy_file.stakeholders_mentioned:
+            paths = self.stakeholder_activity.get(stakeholder)
+            if paths is not None:
+                paths.pop(path, None)
+                if not paths:
+                    del self.stakeholder_activity[stakeholder]
+        self.meeting_files.pop(path, None)
+        self.priority_files.pop(path, None)
+
+    @staticmethod
+    def _decrement(counts: Dict[str, int], key: str):
+        remaining = counts.get(key, 0) - 1
+        if remaining > 0:
+            counts[key] = remaining
+        else:
+            counts.pop(key, None)
+
+    def build(self) -> WorkspaceContext:
+        recent_cutoff = datetime.now() - timedelta(days=30)
+        return WorkspaceContext(
+            active_initiatives=list(self.initiative_counts)[:10],
+            recent_meetings=[
+                path
+                for path, modified in self.meeting_files.items()
+                if modified > recent_cutoff
+            ],
+            stakeholder_activity={
+                stakeholder: list(paths)
+                for stakeholder, paths in self.stakeholder_activity.items()
+            },
+            strategic_themes=list(self.theme_counts)[:15],
+            priority_files=list(self.priority_files)[:10],
+            last_updated=datetime.now(),
+        )
+
+
+def analyze_strategic_file_streaming(
+    file_path: str, chunk_chars: int = STREAM_CHUNK_CHARS
+) -> Optional[Tuple[StrategyFile, FileFingerprint]]:
+    """
+    Analyze a strategic file in chunks without loading it whole
+
+    Module-level (and free of manager state) so bulk indexing can run it in
+    a process pool. Returns the StrategyFile and its fingerprint, or None if
+    the file cannot be read.
+    """
+    extractors = WorkspaceIntegrationManager
+    try:
+        stat = os.stat(file_path)
+        content_md5 = hashlib.md5()
+        topics: Set[str] = set()
+        stakeholders: Set[str] = set()
+        initiatives: Set[str] = set()
+        high_indicators: Set[str] = set()
+        medium_indicators: Set[str] = set()
+        carry = ""
+
+        with open(file_path, "r", encoding="utf-8") as f:
+            while True:
+                chunk = f.read(chunk_chars)
+                if not chunk:
+                    break
+                chunk += f.readline()  # End on a line boundary
+                content_md5.update(chunk.encode("utf-8"))
+
+                text = carry + chunk
+                topics.update(extractors._extract_strategic_topics(text))
+                stakeholders.update(extractors._find_stakeholders(text))
+                initiatives.update(extractors._find_initiatives(text))
+                found_high, found_medium = extractors._find_priority_indicators(text)
+                high_indicators |= found_high
+                medium_indicators |= found_medium
+
+                cut = text.rfind("\n", 0, max(len(text) - STREAM_CARRY_CHARS, 0))
+                carry = text[cut + 1 :]
+
+        file_type = extractors._classify_file_type(file_path)
+        strategy_file = StrategyFile(
+            path=file_path,
+            file_type=file_type,
+            last_modified=datetime.fromtimestamp(stat.st_mtime),
+            content_hash=content_md5.hexdigest(),
+            strategic_topics=[t for t in STRATEGIC_TOPIC_KEYWORDS if t in topics],
+            stakeholders_mentioned=list(stakeholders)[:10],
+            initiatives_referenced=list(initiatives)[:5],
+            priority_level=extractors._priority_level(
+                len(high_indicators), len(medium_indicators), file_type
+            ),
+        )
+        fingerprint = FileFingerprint(
+            stat.st_mtime_ns, stat.st_size, strategy_file.content_hash
+        )
+        return strategy_file, fingerprint
+
+    except (OSError, UnicodeDecodeError) as e:
+        logger.warning(f"Could not analyze strategic file {file_path}: {e}")
+        return None
+
+
+class _WorkspaceEventHandler(FileSystemEventHandler):
+    """Forwards watchdog events to WorkspaceIntegrationManager"""
+
+    def __init__(self, manager: "WorkspaceIntegrationManager"):
+        super().__init__()
+        self.manager = manager
+
+    def on_modified(self, event):
+        if not getattr(event, "is_directory", False):
+            self.manager._handle_file_event(event.src_path, "modified")
+
+    def on_created(self, event):
+        if not getattr(event, "is_directory", False):
+            self.manager._handle_file_event(event.src_path, "created")
+
+    def on_deleted(self, event):
+        if not getattr(event, "is_directory", False):
+            self.manager._handle_file_event(event.src_path, "deleted")
+
+    def on_moved(self, event):
+        if not getattr(event, "is_directory", False):
+            self.manager._handle_file_event(event.src_path, "deleted")
+            self.manager._handle_file_event(event.dest_path, "created")
+
+
 # PHASE 8.4: MASSIVE CONSOLIDATION - StrategicFileHandler ELIMINATED (54 lines)
 # Handler pattern functionality consolidated into WorkspaceIntegrationManager methods
 
@@ -434,7 +642,7 @@ class WorkspaceIntegrationManager(BaseManager):
         # PHASE 8.4: BaseManager initialization eliminates duplicate infrastructure
         config = BaseManagerConfig(
             manager_name="workspace_integration_manager",
-            manager_type=ManagerType.CONTEXT_ENGINEERING,
+            manager_type=ManagerType.WORKSPACE,
             enable_metrics=True,
             enable_caching=True,
             enable_logging=True,
@@ -454,6 +662,7 @@ class WorkspaceIntegrationManager(BaseManager):
 
         # Ensure cache directory exists
         Path(self.context_cache_path).mkdir(parents=True, exist_ok=True)
+        self._connection_pool = get_connection_pool(self.cache_db_path)
 
         # Initialize database
         self._init_database()
@@ -471,16 +680,33 @@ class WorkspaceIntegrationManager(BaseManager):
 
         # File system monitoring (direct integration replaces Handler pattern)
         self.observer = Observer()
+        self.file_handler = _WorkspaceEventHandler(self)
 
         # Context state
         self.current_context: Optional[WorkspaceContext] = None
         self.strategic_files: Dict[str, StrategyFile] = {}
 
+        # Incremental index: unchanged files are skipped on rescan
+        self._file_index: Dict[str, FileFingerprint] = {}
+        self._aggregate = _WorkspaceAggregate()
+        self.scan_stats: Dict[str, int] = {}
+
+        # Bulk re-indexing fans analysis out to a process pool
+        self.bulk_analysis_min_files = BULK_ANALYSIS_MIN_FILES
+        self._parallel_processor: Optional[ParallelProcessor] = None
+
+        # Watcher events are debounced and processed in coalesced batches;
+        # the lock serializes batches with scans
+        self._index_lock = threading.RLock()
+        self.event_queue = FileEventQueue(self._process_file_events)
+
         # TS-4: Enhanced strategic analysis capabilities
         self.ts4_analyzer = TS4StrategicAnalyzer()
         self.ts4_insights: Dict[str, TS4StrategicInsight] = {}
         self.ts4_metrics: Optional[TS4WorkflowMetrics] = None
 
+        self._load_file_index()
+
         self.logger.info(
             f"WorkspaceIntegrationManager initialized for {workspace_path} with TS-4 enhancements"
         )
@@ -539,12 +765,12 @@ class WorkspaceIntegrationManager(BaseManager):
         PHASE 8.4: Direct file event handling (replaces StrategicFileHandler methods)
         """
         if self._is_strategic_file(file_path):
-            self.logger.info(f"Strategic file {event_type}: {file_path}")
-            self.process_file_change(file_path, event_type)
+            self.logger.debug(f"Strategic file {event_type}: {file_path}")
+            self.event_queue.put(file_path, event_type)
 
     def _init_database(self):
         """Initialize SQLite database for context cache"""
-        with sqlite3.connect(self.cache_db_path) as conn:
+        with self._connection_pool.connection() as conn:
             conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS strategic_files (
@@ -577,6 +803,27 @@ class WorkspaceIntegrationManager(BaseManager):
             """
             )
 
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS file_index (
+                    path TEXT PRIMARY KEY,
+                    mtime_ns INTEGER NOT NULL,
+                    size INTEGER NOT NULL,
+                    content_hash TEXT NOT NULL
+                )
+            """
+            )
+
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS ts4_insights (
+                    path TEXT PRIMARY KEY,
+                    content_hash TEXT NOT NULL,
+                    insight TEXT NOT NULL  -- JSON
+                )
+            """
+            )
+
             conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS context_sessions (
@@ -614,6 +861,7 @@ class WorkspaceIntegrationManager(BaseManager):
             self.observer.stop()
             self.observer.join()
             logger.info("Workspace monitoring stopped")
+        self.event_queue.close()
 
     def _initial_workspace_scan(self):
         """Perform initial scan of workspace for strategic files"""
@@ -628,54 +876,232 @@ class WorkspaceIntegrationManager(BaseManager):
             self.workspace_path / "reports",
         ]
 
-        for strategic_dir in strategic_paths:
-            if strategic_dir.exists():
-                for file_path in strategic_dir.rglob("*"):
-                    if file_path.is_file() and self.file_handler._is_strategic_file(
-                        str(file_path)
-                    ):
-                        self.process_file_change(str(file_path), "discovered")
-
-        # Update workspace context after initial scan
-        self._update_workspace_context()
+        seen: Set[str] = set()
+        stale: List[str] = []
+        unchanged = 0
+
+        with self._index_lock:
+            for strategic_dir in strategic_paths:
+                if strategic_dir.exists():
+                    for file_path in strategic_dir.rglob("*"):
+                        if file_path.is_file() and self._is_strategic_file(
+                            str(file_path)
+                        ):
+                            seen.add(str(file_path))
+                            try:
+                                if self._is_indexed_unchanged(str(file_path)):
+                                    unchanged += 1
+                                else:
+                                    stale.append(str(file_path))
+                            except OSError as e:
+                                logger.error(f"Error indexing {file_path}: {e}")
+
+            changed = self._index_files(stale)
+
+            # Files indexed by a previous run that no longer exist
+            removed = [
+                path
+                for path in list(self._file_index)
+                if path not in seen and not Path(path).exists()
+            ]
+            for path in removed:
+                self._forget_file(path)
+
+            # Persist and update workspace context once, not per file
+            indexed = self._commit_index_changes(changed, removed)
+
+        self.scan_stats = {
+            "indexed": indexed,
+            "unchanged": unchanged,
+            "failed": len(changed) - indexed,
+            "removed": len(removed),
+        }
         logger.info(
-            f"Initial scan complete. Found {len(self.strategic_files)} strategic files"
+            f"Initial scan complete. Found {len(self.strategic_files)} strategic files "
+            f"({indexed} indexed, {unchanged} unchanged, {len(removed)} removed)"
         )
 
     def process_file_change(self, file_path: str, change_type: str):
-        """Process a strategic file change"""
+        """Process a strategic file change immediately (bypasses the event queue)"""
         try:
-            path = Path(file_path)
-            if not path.exists():
-                # File deleted
-                self._remove_strategic_file(file_path)
-                return
+            self._process_file_events({file_path: change_type})
+        except Exception as e:
+            logger.error(f"Error processing file change {file_path}: {e}")
 
-            # Analyze file content
-            strategy_file = self._analyze_strategic_file(file_path)
-            if strategy_file:
-                self.strategic_files[file_path] = strategy_file
-                self._save_strategic_file(strategy_file)
+    def _process_file_events(self, events: Dict[str, str]):
+        """
+        Apply a coalesced batch of file events
 
-                # TS-4: Enhanced strategic analysis
-                self._perform_ts4_analysis(file_path, strategy_file)
+        Disk state at processing time is authoritative: missing paths are
+        removed and existing ones re-indexed (unchanged fingerprints are
+        skipped), followed by a single persist and context update.
+        """
+        with self._index_lock:
+            removed = []
+            stale = []
+            for file_path in events:
+                if Path(file_path).exists():
+                    stale.append(file_path)
+                elif file_path in self._file_index or file_path in self.strategic_files:
+                    removed.append(file_path)
+
+            changed = self._index_files(stale)
+            for file_path in removed:
+                self._forget_file(file_path)
+
+            indexed = self._commit_index_changes(changed, removed)
+
+        if indexed or removed:
+            logger.info(
+                f"Processed {len(events)} strategic file events "
+                f"({indexed} indexed, {len(removed)} removed)"
+            )
 
-                # Update workspace context
-                self._update_workspace_context()
+    def _index_files(
+        self, file_paths: List[str]
+    ) -> Dict[str, Tuple[Optional[StrategyFile], FileFingerprint]]:
+        """Index stale files, in a process pool for large batches"""
+        if len(file_paths) >= self.bulk_analysis_min_files:
+            return self._bulk_index_files(file_paths)
+
+        changed = {}
+        for file_path in file_paths:
+            try:
+                result = self._index_file(file_path)
+            except Exception as e:
+                logger.error(f"Error indexing {file_path}: {e}")
+                continue
+            if result is not None:
+                changed[file_path] = result
+        return changed
+
+    def _commit_index_changes(
+        self,
+        changed: Dict[str, Tuple[Optional[StrategyFile], FileFingerprint]],
+        removed: List[str],
+    ) -> int:
+        """Persist a batch of index changes and refresh derived context"""
+        self._persist_index_changes(changed, removed)
+
+        indexed = sum(1 for sf, _ in changed.values() if sf is not None)
+        if indexed or removed or self.ts4_metrics is None:
+            self.ts4_metrics = self.ts4_analyzer.calculate_workflow_metrics(
+                self.strategic_files
+            )
+        if indexed or removed or self.current_context is None:
+            self._update_workspace_context()
+        return indexed
 
-                logger.info(f"Processed strategic file: {file_path} ({change_type})")
+    def _index_file(
+        self, file_path: str
+    ) -> Optional[Tuple[Optional[StrategyFile], FileFingerprint]]:
+        """
+        Re-analyze a file only if its fingerprint changed
 
-        except Exception as e:
-            logger.error(f"Error processing file change {file_path}: {e}")
+        Returns None when the file is unchanged. Otherwise returns the new
+        StrategyFile (None if analysis failed) and its fingerprint; in-memory
+        state and aggregates are updated, persistence is left to the caller
+        so scans can batch writes.
+        """
+        if self._is_indexed_unchanged(file_path):
+            return None
 
-    def _analyze_strategic_file(self, file_path: str) -> Optional[StrategyFile]:
+        stat = os.stat(file_path)
+        with open(file_path, "r", encoding="utf-8") as f:
+            content = f.read()
+        content_hash = hashlib.md5(content.encode("utf-8")).hexdigest()
+        fingerprint = FileFingerprint(stat.st_mtime_ns, stat.st_size, content_hash)
+
+        existing = self.strategic_files.get(file_path)
+        if existing is not None and existing.content_hash == content_hash:
+            # Touched but not edited: keep the analysis, refresh the timestamp
+            strategy_file = replace(
+                existing, last_modified=datetime.fromtimestamp(stat.st_mtime)
+            )
+        else:
+            strategy_file = self._analyze_strategic_file(file_path, content)
+            if strategy_file is None:
+                return None, fingerprint
+            # TS-4: Enhanced strategic analysis (never keep the old content's)
+            self._forget_ts4_insight(file_path)
+            self._perform_ts4_analysis(file_path, content)
+
+        self._apply_index_update(strategy_file, fingerprint)
+        return strategy_file, fingerprint
+
+    def _is_indexed_unchanged(self, file_path: str) -> bool:
+        """True if the file's mtime and size match its index entry"""
+        previous = self._file_index.get(file_path)
+        if previous is None or file_path not in self.strategic_files:
+            return False
+        stat = os.stat(file_path)
+        return previous.mtime_ns == stat.st_mtime_ns and previous.size == stat.st_size
+
+    def _apply_index_update(
+        self, strategy_file: StrategyFile, fingerprint: FileFingerprint
+    ):
+        """Swap a file's analysis into memory state and aggregates"""
+        existing = self.strategic_files.get(strategy_file.path)
+        if existing is not None:
+            self._aggregate.remove(existing)
+        self.strategic_files[strategy_file.path] = strategy_file
+        self._aggregate.add(strategy_file)
+        self._file_index[strategy_file.path] = fingerprint
+
+    def _bulk_index_files(
+        self, file_paths: List[str]
+    ) -> Dict[str, Tuple[Optional[StrategyFile], FileFingerprint]]:
+        """
+        Analyze many files in a process pool with streaming reads
+
+        Results are applied in discovery order so aggregates are
+        deterministic. Files whose content hash is unchanged keep their
+        existing analysis.
+        """
+        if self._parallel_processor is None:
+            self._parallel_processor = ParallelProcessor(
+                validation_mode=False, max_workers=os.cpu_count() or 1
+            )
+        outcome = self._parallel_processor.process_files_parallel(
+            file_paths,
+            analyze_strategic_file_streaming,
+            chunk_size=BULK_ANALYSIS_CHUNK_FILES,
+            use_processes=True,
+        )
+        analyzed = {sf.path: (sf, fp) for sf, fp in outcome["results"]}
+
+        changed: Dict[str, Tuple[Optional[StrategyFile], FileFingerprint]] = {}
+        for file_path in file_paths:
+            if file_path not in analyzed:
+                continue  # Unreadable; retried on the next scan
+            strategy_file, fingerprint = analyzed[file_path]
+            existing = self.strategic_files.get(file_path)
+            if existing is not None and existing.content_hash == (
+                fingerprint.content_hash
+            ):
+                strategy_file = replace(
+                    existing, last_modified=strategy_file.last_modified
+                )
+            elif self.ts4_analyzer.strategic_mapper is not None:
+                # TS-4 needs the whole document; only read it when enabled
+                self._forget_ts4_insight(file_path)
+                with open(file_path, "r", encoding="utf-8") as f:
+                    self._perform_ts4_analysis(file_path, f.read())
+            self._apply_index_update(strategy_file, fingerprint)
+            changed[file_path] = (strategy_file, fingerprint)
+        return changed
+
+    def _analyze_strategic_file(
+        self, file_path: str, content: Optional[str] = None
+    ) -> Optional[StrategyFile]:
         """Analyze a file for strategic content"""
         try:
             path = Path(file_path)
 
             # Read file content
-            with open(path, "r", encoding="utf-8") as f:
-                content = f.read()
+            if content is None:
+                with open(path, "r", encoding="utf-8") as f:
+                    content = f.read()
 
             # Calculate content hash
             content_hash = hashlib.md5(content.encode("utf-8")).hexdigest()
@@ -704,7 +1130,8 @@ class WorkspaceIntegrationManager(BaseManager):
             logger.error(f"Error analyzing strategic file {file_path}: {e}")
             return None
 
-    def _classify_file_type(self, file_path: str) -> str:
+    @staticmethod
+    def _classify_file_type(file_path: str) -> str:
         """Classify the type of strategic file"""
         path_lower = file_path.lower()
 
@@ -723,45 +1150,26 @@ class WorkspaceIntegrationManager(BaseManager):
         else:
             return FILE_TYPES["GENERAL"]
 
-    def _extract_strategic_topics(self, content: str) -> List[str]:
+    @staticmethod
+    def _extract_strategic_topics(content: str) -> List[str]:
         """Extract strategic topics from content"""
-        strategic_keywords = {
-            "platform strategy",
-            "organizational design",
-            "team topology",
-            "stakeholder management",
-            "resource allocation",
-            "technical debt",
-            "architecture decision",
-            "engineering efficiency",
-            "cross-team coordination",
-            "strategic initiative",
-            "roadmap planning",
-            "capacity planning",
-            "vendor evaluation",
-            "technology assessment",
-            "roi analysis",
-        }
-
-        content_lower = content.lower()
-        found_topics = []
-
-        for topic in strategic_keywords:
-            if topic in content_lower:
-                found_topics.append(topic)
+        return _TOPIC_MATCHER.match(content).get("topics", [])
 
-        return found_topics
-
-    def _extract_stakeholders(self, content: str) -> List[str]:
+    @staticmethod
+    def _extract_stakeholders(content: str) -> List[str]:
         """Extract mentioned stakeholders from content"""
+        stakeholders = WorkspaceIntegrationManager._find_stakeholders(content)
+        return list(stakeholders)[:10]  # Limit to top 10
+
+    @staticmethod
+    def _find_stakeholders(content: str) -> Set[str]:
+        """All stakeholder mentions in content"""
         # Common stakeholder patterns
         stakeholder_patterns = [
             r"\b[A-Z][a-z]+ [A-Z][a-z]+\b",  # Name patterns
             r"\b(VP|CTO|Director|Manager|Principal|Staff) [A-Z][a-z]+\b",  # Title patterns
         ]
 
-        import re
-
         stakeholders = set()
 
         for pattern in stakeholder_patterns:
@@ -775,14 +1183,17 @@ class WorkspaceIntegrationManager(BaseManager):
             "Design System",
             "User Interface",
         }
-        stakeholders = {s for s in stakeholders if s not in false_positives}
+        return {s for s in stakeholders if s not in false_positives}
 
-        return list(stakeholders)[:10]  # Limit to top 10
-
-    def _extract_initiatives(self, content: str) -> List[str]:
+    @staticmethod
+    def _extract_initiatives(content: str) -> List[str]:
         """Extract initiative references from content"""
-        import re
+        initiatives = WorkspaceIntegrationManager._find_initiatives(content)
+        return list(initiatives)[:5]  # Limit to top 5
 
+    @staticmethod
+    def _find_initiatives(content: str) -> Set[str]:
+        """All initiative references in content"""
         # Look for initiative patterns
         initiative_patterns = [
             r"Initiative[:\s]+([A-Z][^.\n]*)",
@@ -798,10 +1209,19 @@ class WorkspaceIntegrationManager(BaseManager):
                 match.strip() for match in matches if len(match.strip()) > 5
             )
 
-        return list(initiatives)[:5]  # Limit to top 5
+        return initiatives
 
-    def _assess_priority(self, content: str, file_type: str) -> str:
+    @staticmethod
+    def _assess_priority(content: str, file_type: str) -> str:
         """Assess the priority level of the strategic file"""
+        high, medium = WorkspaceIntegrationManager._find_priority_indicators(content)
+        return WorkspaceIntegrationManager._priority_level(
+            len(high), len(medium), file_type
+        )
+
+    @staticmethod
+    def _find_priority_indicators(content: str) -> Tuple[Set[str], Set[str]]:
+        """High and medium priority indicators present in content"""
         content_lower = content.lower()
 
         # High priority indicators
@@ -827,14 +1247,14 @@ class WorkspaceIntegrationManager(BaseManager):
             "roadmap",
         }
 
-        # Count indicators
-        high_count = sum(
-            1 for indicator in high_priority_indicators if indicator in content_lower
-        )
-        medium_count = sum(
-            1 for indicator in medium_priority_indicators if indicator in content_lower
+        return (
+            {i for i in high_priority_indicators if i in content_lower},
+            {i for i in medium_priority_indicators if i in content_lower},
         )
 
+    @staticmethod
+    def _priority_level(high_count: int, medium_count: int, file_type: str) -> str:
+        """Priority level from indicator counts and file type"""
         # File type priority boost
         if file_type in ["meeting_prep", "initiative"]:
             high_count += 1
@@ -848,19 +1268,19 @@ class WorkspaceIntegrationManager(BaseManager):
         else:
             return PRIORITY_LEVELS["LOW"]
 
-    def _save_strategic_file(self, strategy_file: StrategyFile):
-        """Save strategic file to database"""
+    @staticmethod
+    def _write_strategic_files(conn, strategy_files: List[StrategyFile]):
+        """Upsert strategic file rows on an open connection"""
         now = datetime.now().isoformat()
-
-        with sqlite3.connect(self.cache_db_path) as conn:
-            conn.execute(
-                """
-                INSERT OR REPLACE INTO strategic_files (
-                    path, file_type, last_modified, content_hash,
-                    strategic_topics, stakeholders_mentioned, initiatives_referenced,
-                    priority_level, created_at, updated_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
+        conn.executemany(
+            """
+            INSERT OR REPLACE INTO strategic_files (
+                path, file_type, last_modified, content_hash,
+                strategic_topics, stakeholders_mentioned, initiatives_referenced,
+                priority_level, created_at, updated_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+            [
                 (
                     strategy_file.path,
                     strategy_file.file_type,
@@ -872,68 +1292,158 @@ class WorkspaceIntegrationManager(BaseManager):
                     strategy_file.priority_level,
                     now,
                     now,
-                ),
+                )
+                for strategy_file in strategy_files
+            ],
+        )
+
+    def _persist_index_changes(
+        self,
+        changed: Dict[str, Tuple[Optional[StrategyFile], FileFingerprint]],
+        removed: List[str],
+    ):
+        """Write analyzed files, fingerprints and removals in batched transactions"""
+        # Files that failed analysis are not indexed and get retried next scan
+        fingerprints = [
+            (path, fp.mtime_ns, fp.size, fp.content_hash)
+            for path, (_, fp) in changed.items()
+            if self._file_index.get(path) is fp
+        ]
+        if not (fingerprints or removed):
+            return
+
+        strategy_files = [sf for sf, _ in changed.values() if sf is not None]
+        removed_rows = [(path,) for path in removed]
+        # Insights follow their file's analysis; files without one drop theirs
+        insight_rows = [
+            (sf.path, sf.content_hash, self._encode_ts4_insight(insight))
+            for sf in strategy_files
+            if (insight := self.ts4_insights.get(sf.path)) is not None
+        ]
+        stale_insight_rows = removed_rows + [
+            (sf.path,) for sf in strategy_files if sf.path not in self.ts4_insights
+        ]
+
+        # Batched transactions keep the write lock short on large re-indexes
+        total = max(len(strategy_files), len(fingerprints), len(stale_insight_rows))
+        with self._connection_pool.connection() as conn:
+            for start in range(0, total, INDEX_WRITE_BATCH):
+                end = start + INDEX_WRITE_BATCH
+                self._write_strategic_files(conn, strategy_files[start:end])
+                conn.executemany(
+                    "INSERT OR REPLACE INTO file_index "
+                    "(path, mtime_ns, size, content_hash) VALUES (?, ?, ?, ?)",
+                    fingerprints[start:end],
+                )
+                conn.executemany(
+                    "DELETE FROM strategic_files WHERE path = ?",
+                    removed_rows[start:end],
+                )
+                conn.executemany(
+                    "DELETE FROM file_index WHERE path = ?", removed_rows[start:end]
+                )
+                conn.executemany(
+                    "DELETE FROM ts4_insights WHERE path = ?",
+                    stale_insight_rows[start:end],
+                )
+                conn.executemany(
+                    "INSERT OR REPLACE INTO ts4_insights "
+                    "(path, content_hash, insight) VALUES (?, ?, ?)",
+                    insight_rows[start:end],
+                )
+                conn.commit()
+
+    @staticmethod
+    def _encode_ts4_insight(insight: TS4StrategicInsight) -> str:
+        data = asdict(insight)
+        data["timestamp"] = insight.timestamp.isoformat()
+        return json.dumps(data)
+
+    @staticmethod
+    def _decode_ts4_insight(insight_json: str) -> TS4StrategicInsight:
+        data = json.loads(insight_json)
+        data["timestamp"] = datetime.fromisoformat(data["timestamp"])
+        return TS4StrategicInsight(**data)
+
+    def _load_file_index(self):
+        """Restore indexed files and aggregates from the context cache"""
+        try:
+            with self._connection_pool.connection() as conn:
+                rows = conn.execute(
+                    """
+                    SELECT s.path, s.file_type, s.last_modified, s.content_hash,
+                           s.strategic_topics, s.stakeholders_mentioned,
+                           s.initiatives_referenced, s.priority_level,
+                           f.mtime_ns, f.size
+                    FROM strategic_files s
+                    JOIN file_index f ON f.path = s.path
+                    WHERE f.content_hash = s.content_hash
+                """
+                ).fetchall()
+                # Insights of unchanged files, so warm restarts skip TS-4
+                insight_rows = conn.execute(
+                    """
+                    SELECT t.path, t.insight
+                    FROM ts4_insights t
+                    JOIN strategic_files s ON s.path = t.path
+                    WHERE t.content_hash = s.content_hash
+                """
+                ).fetchall()
+        except Exception as e:
+            logger.warning(f"Could not load workspace file index: {e}")
+            return
+
+        for row in rows:
+            strategy_file = StrategyFile(
+                path=row[0],
+                file_type=row[1],
+                last_modified=datetime.fromisoformat(row[2]),
+                content_hash=row[3],
+                strategic_topics=json.loads(row[4] or "[]"),
+                stakeholders_mentioned=json.loads(row[5] or "[]"),
+                initiatives_referenced=json.loads(row[6] or "[]"),
+                priority_level=row[7],
+            )
+            self.strategic_files[strategy_file.path] = strategy_file
+            self._aggregate.add(strategy_file)
+            self._file_index[strategy_file.path] = FileFingerprint(
+                row[8], row[9], row[3]
+            )
+
+        for path, insight_json in insight_rows:
+            if path not in self.strategic_files:
+                continue
+            try:
+                insight = self._decode_ts4_insight(insight_json)
+            except (ValueError, TypeError) as e:
+                logger.warning(f"Could not load TS-4 insight for {path}: {e}")
+                continue
+            self.ts4_insights[path] = insight
+            self.ts4_analyzer.insights_cache[path] = insight
+
+        # Derived metrics are not persisted; rebuild them for the loaded files
+        if self.strategic_files:
+            self.ts4_metrics = self.ts4_analyzer.calculate_workflow_metrics(
+                self.strategic_files
             )
-            conn.commit()
 
-    def _remove_strategic_file(self, file_path: str):
-        """Remove strategic file from tracking"""
-        if file_path in self.strategic_files:
-            del self.strategic_files[file_path]
+    def _forget_file(self, file_path: str):
+        """Drop a file from in-memory state and aggregates"""
+        strategy_file = self.strategic_files.pop(file_path, None)
+        if strategy_file is not None:
+            self._aggregate.remove(strategy_file)
+        self._file_index.pop(file_path, None)
+        self._forget_ts4_insight(file_path)
 
-        with sqlite3.connect(self.cache_db_path) as conn:
-            conn.execute("DELETE FROM strategic_files WHERE path = ?", (file_path,))
-            conn.commit()
+    def _forget_ts4_insight(self, file_path: str):
+        """Drop a file's TS-4 insight from the manager and the analyzer"""
+        self.ts4_insights.pop(file_path, None)
+        self.ts4_analyzer.insights_cache.pop(file_path, None)
 
     def _update_workspace_context(self):
-        """Update overall workspace context based on current files"""
+        """Update overall workspace context from the incremental aggregates"""
         try:
-            # Aggregate information from all strategic files
-            active_initiatives = []
-            recent_meetings = []
-            stakeholder_activity = {}
-            strategic_themes = []
-            priority_files = []
-
-            for file_path, strategy_file in self.strategic_files.items():
-                # Collect initiatives
-                active_initiatives.extend(strategy_file.initiatives_referenced)
-
-                # Collect recent meetings (within last 30 days)
-                if (
-                    strategy_file.file_type == "meeting_prep"
-                    and strategy_file.last_modified
-                    > datetime.now() - timedelta(days=30)
-                ):
-                    recent_meetings.append(file_path)
-
-                # Collect stakeholder activity
-                for stakeholder in strategy_file.stakeholders_mentioned:
-                    if stakeholder not in stakeholder_activity:
-                        stakeholder_activity[stakeholder] = []
-                    stakeholder_activity[stakeholder].append(file_path)
-
-                # Collect strategic themes
-                strategic_themes.extend(strategy_file.strategic_topics)
-
-                # Collect priority files
-                if strategy_file.priority_level == PRIORITY_LEVELS["HIGH"]:
-                    priority_files.append(file_path)
-
-            # Deduplicate and limit
-            active_initiatives = list(set(active_initiatives))[:10]
-            strategic_themes = list(set(strategic_themes))[:15]
-            priority_files = priority_files[:10]
-
-            # Create workspace context
-            self.current_context = WorkspaceContext(
-                active_initiatives=active_initiatives,
-                recent_meetings=recent_meetings,
-                stakeholder_activity=stakeholder_activity,
-                strategic_themes=strategic_themes,
-                priority_files=priority_files,
-                last_updated=datetime.now(),
-            )
+            self.current_context = self._aggregate.build()
 
             # Save to database
             self._save_workspace_context()
@@ -948,7 +1458,7 @@ class WorkspaceIntegrationManager(BaseManager):
 
         now = datetime.now().isoformat()
 
-        with sqlite3.connect(self.cache_db_path) as conn:
+        with self._connection_pool.connection() as conn:
             # Remove old context entries (keep only latest)
             conn.execute("DELETE FROM workspace_context")
 
@@ -995,7 +1505,7 @@ class WorkspaceIntegrationManager(BaseManager):
 
         now = datetime.now().isoformat()
 
-        with sqlite3.connect(self.cache_db_path) as conn:
+        with self._connection_pool.connection() as conn:
             conn.execute(
                 """
                 INSERT OR REPLACE INTO context_sessions (
@@ -1015,7 +1525,7 @@ class WorkspaceIntegrationManager(BaseManager):
 
     def load_session_context(self, session_id: str) -> Optional[WorkspaceContext]:
         """Load context from a previous session"""
-        with sqlite3.connect(self.cache_db_path) as conn:
+        with self._connection_pool.connection() as conn:
             cursor = conn.execute(
                 """
                 SELECT workspace_context_snapshot FROM context_sessions
@@ -1036,13 +1546,9 @@ class WorkspaceIntegrationManager(BaseManager):
         return None
 
     # TS-4: Enhanced Strategic Analysis Methods
-    def _perform_ts4_analysis(self, file_path: str, strategy_file: StrategyFile):
-        """Perform TS-4 enhanced strategic analysis on a file"""
+    def _perform_ts4_analysis(self, file_path: str, content: str):
+        """Perform TS-4 enhanced strategic analysis on a file's content"""
         try:
-            # Read file content for analysis
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
-
             # Generate strategic insights
             insight = self.ts4_analyzer.analyze_strategic_document(file_path, content)
             if insight:
@@ -1051,11 +1557,6 @@ class WorkspaceIntegrationManager(BaseManager):
                     f"TS-4 strategic insight generated for {file_path}: {insight.insight_type}"
                 )
 
-            # Update workflow metrics
-            self.ts4_metrics = self.ts4_analyzer.calculate_workflow_metrics(
-                self.strategic_files
-            )
-
         except Exception as e:
             logger.warning(f"TS-4 analysis failed for {file_path}: {e}")
 
@@ -9,7 +9,11 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
-import sqlite3
+
+try:
+    from .connection_pool import get_connection_pool
+except ImportError:
+    from core.connection_pool import get_connection_pool
 
 
 @dataclass
@@ -65,8 +69,9 @@ class AdvancedArchivingSystem:
     def _init_archive_database(self):
         """Initialize SQLite database for archive search"""
         self.index_db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection_pool = get_connection_pool(self.index_db_path)
 
-        with sqlite3.connect(str(self.index_db_path)) as conn:
+        with self._connection_pool.connection() as conn:
             conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS archived_files (
@@ -418,7 +423,7 @@ class AdvancedArchivingSystem:
     ):
         """Index archived file in search database"""
 
-        with sqlite3.connect(str(self.index_db_path)) as conn:
+        with self._connection_pool.connection() as conn:
             # Insert into main table
             conn.execute(
                 """
@@ -461,7 +466,7 @@ class AdvancedArchivingSystem:
 
         results = []
 
-        with sqlite3.connect(str(self.index_db_path)) as conn:
+        with self._connection_pool.connection() as conn:
             # Build FTS query
             fts_query = self._build_fts_query(query)
 
@@ -583,7 +588,7 @@ class AdvancedArchivingSystem:
         """Get statistics about archived files"""
         stats = {}
 
-        with sqlite3.connect(str(self.index_db_path)) as conn:
+        with self._connection_pool.connection() as conn:
             # Total archived files
             cursor = conn.execute("SELECT COUNT(*) FROM archived_files")
             stats["total_files"] = cursor.fetchone()[0]
@@ -0,0 +1,404 @@
+"""
+Shared SQLite Connection Pool
+
+Bounded, health-checked connection pool shared per database file. Used by
+DatabaseManager and the context engineering memory stores so all SQLite
+users in a process share a fixed set of tuned connections instead of
+opening (and leaking) their own. Pools are keyed by the file and by the
+PRAGMAs that change query semantics (foreign_keys, extra_pragmas), so a
+connection never carries settings another caller chose.
+
+Features:
+- Bounded pool with blocking acquire and timeout
+- Per-connection PRAGMA tuning (WAL, mmap_size, cache_size, temp_store)
+- Prepared-statement cache via sqlite3's per-connection statement cache
+- Health check of idle connections and recycling after a max lifetime
+- Thread-pinned connections outside the bound, closed when the thread exits
+
+Author: Martin | Platform Architecture
+"""
+
+import sqlite3
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterator, Optional, Tuple, Union
+
+try:
+    from .exceptions import DatabaseError
+except ImportError:
+    # Fallback for test environments
+    import sys
+
+    sys.path.insert(0, str(Path(__file__).parent))
+    from exceptions import DatabaseError
+
+
+@dataclass
+class ConnectionPoolConfig:
+    """Connection pool sizing and per-connection tuning"""
+
+    max_connections: int = 16
+    acquire_timeout_seconds: float = 30.0
+    busy_timeout_seconds: float = 30.0
+    statement_cache_size: int = 256
+    max_lifetime_seconds: float = 3600.0
+    health_check_after_idle_seconds: float = 30.0
+    enable_wal: bool = True
+    enable_foreign_keys: bool = False  # SQLite default; DatabaseManager opts in
+    mmap_size_bytes: int = 64 * 1024 * 1024
+    cache_size_kib: int = 8 * 1024
+    temp_store_memory: bool = True
+    extra_pragmas: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class _PooledConnection:
+    """Connection plus bookkeeping for health checks and recycling"""
+
+    connection: sqlite3.Connection
+    created_at: float
+    last_used: float
+
+
+class SQLiteConnectionPool:
+    """
+    Bounded SQLite connection pool for a single database file
+
+    Usage:
+        pool = get_connection_pool("data/strategic/strategic_memory.db")
+        with pool.connection() as conn:
+            conn.execute("INSERT ...")
+        # committed on success, rolled back on error, returned to the pool
+    """
+
+    def __init__(
+        self,
+        db_path: Union[str, Path],
+        config: Optional[ConnectionPoolConfig] = None,
+    ):
+        self.db_path = Path(db_path)
+        self.config = config or ConnectionPoolConfig()
+
+        self._idle: Deque[_PooledConnection] = deque()
+        self._leased: Dict[int, _PooledConnection] = {}
+        self._pinned: Dict[int, _PooledConnection] = {}
+        self._condition = threading.Condition(threading.Lock())
+        self._thread_leases = threading.local()
+        self._closed = False
+
+        # Pool statistics
+        self.connections_created = 0
+        self.connections_recycled = 0
+        self.health_check_failures = 0
+        self.acquire_waits = 0
+
+    # === Acquire / release ===
+
+    def acquire(self, timeout: Optional[float] = None) -> sqlite3.Connection:
+        """Lease a connection, waiting up to timeout if the pool is exhausted"""
+        timeout = self.config.acquire_timeout_seconds if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise DatabaseError(
+                        "Connection pool is closed", db_path=str(self.db_path)
+                    )
+
+                while self._idle:
+                    pooled = self._idle.pop()  # LIFO keeps hot connections hot
+                    if self._is_healthy(pooled):
+                        return self._lease(pooled)
+                    self._discard(pooled)
+
+                if self._total_connections() < self.config.max_connections:
+                    # Reserve the slot before connecting outside the lock
+                    placeholder = _PooledConnection(None, 0.0, 0.0)
+                    self._leased[id(placeholder)] = placeholder
+                    break
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise DatabaseError(
+                        f"Connection pool exhausted "
+                        f"({self.config.max_connections} connections in use)",
+                        db_path=str(self.db_path),
+                    )
+                self.acquire_waits += 1
+                self._condition.wait(remaining)
+
+        try:
+            pooled = self._create_connection()
+        except Exception:
+            with self._condition:
+                del self._leased[id(placeholder)]
+                self._condition.notify()
+            raise
+
+        with self._condition:
+            del self._leased[id(placeholder)]
+            return self._lease(pooled)
+
+    def release(self, connection: sqlite3.Connection):
+        """Return a leased connection to the pool"""
+        with self._condition:
+            pooled = self._leased.pop(id(connection), None)
+            if pooled is None:
+                return
+
+            try:
+                if connection.in_transaction:
+                    connection.rollback()
+                connection.row_factory = None
+            except sqlite3.Error:
+                self._discard(pooled)
+                self._condition.notify()
+                return
+
+            now = time.monotonic()
+            if (
+                self._closed
+                or now - pooled.created_at > self.config.max_lifetime_seconds
+            ):
+                self.connections_recycled += 1
+                self._discard(pooled)
+            else:
+                pooled.last_used = now
+                self._idle.append(pooled)
+            self._condition.notify()
+
+    @contextmanager
+    def connection(
+        self, row_factory: Optional[Callable] = None
+    ) -> Iterator[sqlite3.Connection]:
+        """Scoped lease: commit on success, rollback on error, always release"""
+        conn = self.acquire()
+        conn.row_factory = row_factory
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            self.release(conn)
+
+    def thread_connection(self) -> sqlite3.Connection:
+        """
+        Connection pinned to the calling thread
+
+        Kept for APIs that hand out a bare connection. A pin lives as long
+        as its thread, so pinned connections are opened outside the
+        max_connections bound (long-lived threads never starve scoped
+        leases or each other) and closed when the thread exits or
+        release_thread_connection() is called.
+        """
+        lease = getattr(self._thread_leases, "lease", None)
+        if lease is None or lease.connection is None:
+            lease = _ThreadLease(self, self._pin())
+            self._thread_leases.lease = lease
+        return lease.connection
+
+    def current_thread_connection(self) -> Optional[sqlite3.Connection]:
+        """Calling thread's pinned connection, if it holds one"""
+        lease = getattr(self._thread_leases, "lease", None)
+        return lease.connection if lease is not None else None
+
+    def release_thread_connection(self):
+        """Return the calling thread's pinned connection to the pool"""
+        lease = getattr(self._thread_leases, "lease", None)
+        if lease is not None:
+            lease.release()
+            self._thread_leases.lease = None
+
+    # === Lifecycle ===
+
+    def close(self):
+        """Close idle connections; leased ones are closed on release"""
+        with self._condition:
+            self._closed = True
+            while self._idle:
+                self._discard(self._idle.pop())
+            self._condition.notify_all()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Pool statistics"""
+        with self._condition:
+            return {
+                "db_path": str(self.db_path),
+                "max_connections": self.config.max_connections,
+                "idle_connections": len(self._idle),
+                "leased_connections": len(self._leased),
+                "pinned_connections": len(self._pinned),
+                "connections_created": self.connections_created,
+                "connections_recycled": self.connections_recycled,
+                "health_check_failures": self.health_check_failures,
+                "acquire_waits": self.acquire_waits,
+            }
+
+    # === Internals ===
+
+    def _total_connections(self) -> int:
+        return len(self._idle) + len(self._leased)
+
+    def _pin(self) -> sqlite3.Connection:
+        """Open a connection for one thread, outside the pool bound"""
+        with self._condition:
+            if self._closed:
+                raise DatabaseError(
+                    "Connection pool is closed", db_path=str(self.db_path)
+                )
+        pooled = self._create_connection()
+        with self._condition:
+            self._pinned[id(pooled.connection)] = pooled
+        return pooled.connection
+
+    def _unpin(self, connection: sqlite3.Connection):
+        """Close a thread's pinned connection"""
+        with self._condition:
+            pooled = self._pinned.pop(id(connection), None)
+        if pooled is not None:
+            self._discard(pooled)
+
+    def _lease(self, pooled: _PooledConnection) -> sqlite3.Connection:
+        self._leased[id(pooled.connection)] = pooled
+        return pooled.connection
+
+    def _discard(self, pooled: _PooledConnection):
+        try:
+            pooled.connection.close()
+        except sqlite3.Error:
+            pass
+
+    def _is_healthy(self, pooled: _PooledConnection) -> bool:
+        """Recycle old connections and ping ones that sat idle"""
+        now = time.monotonic()
+        if now - pooled.created_at > self.config.max_lifetime_seconds:
+            self.connections_recycled += 1
+            return False
+        if now - pooled.last_used < self.config.health_check_after_idle_seconds:
+            return True
+        try:
+            pooled.connection.execute("SELECT 1").fetchone()
+            return True
+        except sqlite3.Error:
+            self.health_check_failures += 1
+            return False
+
+    def _create_connection(self) -> _PooledConnection:
+        """Open and tune a new connection"""
+        try:
+            connection = sqlite3.connect(
+                str(self.db_path),
+                timeout=self.config.busy_timeout_seconds,
+                check_same_thread=False,
+                cached_statements=self.config.statement_cache_size,
+            )
+            self._apply_pragmas(connection)
+        except sqlite3.Error as e:
+            raise DatabaseError(
+                f"Failed to connect to database: {e}", db_path=str(self.db_path)
+            )
+
+        now = time.monotonic()
+        with self._condition:
+            self.connections_created += 1
+        return _PooledConnection(connection, created_at=now, last_used=now)
+
+    def _apply_pragmas(self, connection: sqlite3.Connection):
+        """Per-connection PRAGMA tuning"""
+        pragmas: Dict[str, Any] = {}
+        if self.config.enable_foreign_keys:
+            pragmas["foreign_keys"] = "ON"
+        if self.config.enable_wal:
+            pragmas["journal_mode"] = "WAL"
+            pragmas["synchronous"] = "NORMAL"
+        pragmas["mmap_size"] = int(self.config.mmap_size_bytes)
+        # Negative cache_size is in KiB rather than pages
+        pragmas["cache_size"] = -int(self.config.cache_size_kib)
+        if self.config.temp_store_memory:
+            pragmas["temp_store"] = "MEMORY"
+        pragmas.update(self.config.extra_pragmas)
+
+        for name, value in pragmas.items():
+            connection.execute(f"PRAGMA {name} = {value}")
+
+
+class _ThreadLease:
+    """Thread-local holder that returns its connection when the thread exits"""
+
+    def __init__(self, pool: SQLiteConnectionPool, connection: sqlite3.Connection):
+        self.pool = pool
+        self.connection = connection
+
+    def release(self):
+        if self.connection is not None:
+            self.pool._unpin(self.connection)
+            self.connection = None
+
+    def __del__(self):
+        try:
+            self.release()
+        except Exception:
+            pass
+
+
+# One pool per database file and semantic PRAGMA set
+_PoolKey = Tuple[str, bool, Tuple[Tuple[str, str], ...]]
+_pools: Dict[_PoolKey, SQLiteConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def _pool_key(path: str, config: ConnectionPoolConfig) -> _PoolKey:
+    """Database file plus the PRAGMAs that change query results"""
+    extra = tuple(
+        sorted(
+            (name.lower(), str(value)) for name, value in config.extra_pragmas.items()
+        )
+    )
+    return path, config.enable_foreign_keys, extra
+
+
+def get_connection_pool(
+    db_path: Union[str, Path], config: Optional[ConnectionPoolConfig] = None
+) -> SQLiteConnectionPool:
+    """
+    Get the shared pool for a database file
+
+    Callers asking for the same semantic PRAGMAs (foreign_keys and
+    extra_pragmas) share one pool whatever order they start in; the first
+    of them sizes and tunes it.
+    """
+    config = config or ConnectionPoolConfig()
+    path = str(Path(db_path).expanduser().resolve())
+    key = _pool_key(path, config)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None or pool._closed:
+            pool = SQLiteConnectionPool(path, config)
+            _pools[key] = pool
+        return pool
+
+
+def close_connection_pool(db_path: Union[str, Path]):
+    """Close and forget the shared pools for a database file"""
+    path = str(Path(db_path).expanduser().resolve())
+    with _pools_lock:
+        keys = [key for key in _pools if key[0] == path]
+        pools = [_pools.pop(key) for key in keys]
+    for pool in pools:
+        pool.close()
+
+
+def close_all_connection_pools():
+    """Close every shared pool (process shutdown, test teardown)"""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
@@ -20,6 +20,7 @@ try:
     from .manager_factory import register_manager_type
     from .config import get_config
     from .exceptions import DatabaseError
+    from .connection_pool import ConnectionPoolConfig, get_connection_pool
 except ImportError:
     # Fallback for test environments
     import sys
@@ -29,6 +30,7 @@ except ImportError:
     from manager_factory import register_manager_type
     from config import get_config
     from exceptions import DatabaseError
+    from connection_pool import ConnectionPoolConfig, get_connection_pool
 
 
 class DatabaseManager(BaseManager):
@@ -37,6 +39,10 @@ class DatabaseManager(BaseManager):
 
     Refactored to inherit from BaseManager for DRY compliance.
     Eliminates duplicate logging, configuration, and initialization patterns.
+
+    Connections come from the shared per-file SQLiteConnectionPool, so every
+    SQLite user of the same database with the same foreign_keys setting
+    shares one bounded, tuned pool.
     """
 
     # Class-level singleton pattern (preserved for backward compatibility)
@@ -86,6 +92,10 @@ class DatabaseManager(BaseManager):
                     "connection_timeout": 30.0,
                     "enable_wal": True,
                     "enable_foreign_keys": True,
+                    "max_connections": 16,
+                    "mmap_size_mb": 64,
+                    "cache_size_mb": 8,
+                    "statement_cache_size": 256,
                 },
             )
 
@@ -112,13 +122,15 @@ class DatabaseManager(BaseManager):
         self.system_config = system_config
 
         # Database-specific attributes
-        self._local = threading.local()
         self._schema_versions = {}
         self._manager_initialized = True
 
         # Ensure database directory exists
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
+        # Shared connection pool for this database file
+        self.pool = get_connection_pool(self.db_path, self._build_pool_config())
+
         # Initialize database with basic structure
         self._initialize_database()
 
@@ -138,6 +150,7 @@ class DatabaseManager(BaseManager):
         - 'ensure_schema': Ensure schema is applied
         - 'get_table_info': Get table information
         - 'get_stats': Get database statistics
+        - 'get_pool_stats': Get connection pool statistics
         - 'close': Close connections
 
         Args:
@@ -160,6 +173,8 @@ class DatabaseManager(BaseManager):
                 result = self.get_table_info(*args, **kwargs)
             elif operation == "get_stats":
                 result = self.get_database_stats()
+            elif operation == "get_pool_stats":
+                result = self.pool.get_stats()
             elif operation == "close":
                 result = self.close()
             elif operation == "health_check":
@@ -188,65 +203,80 @@ class DatabaseManager(BaseManager):
             )
             raise
 
+    def _build_pool_config(self) -> ConnectionPoolConfig:
+        """Translate manager config into connection pool settings"""
+        # Get timeout from config (FIX: use default= keyword argument)
+        timeout = self.config.get_nested("connection_timeout", default=30.0)
+        mmap_size_mb = self.config.get_nested("mmap_size_mb", default=64)
+        cache_size_mb = self.config.get_nested("cache_size_mb", default=8)
+
+        return ConnectionPoolConfig(
+            max_connections=self.config.get_nested("max_connections", default=16),
+            acquire_timeout_seconds=timeout,
+            busy_timeout_seconds=timeout,
+            statement_cache_size=self.config.get_nested(
+                "statement_cache_size", default=256
+            ),
+            enable_wal=self.config.get_nested("enable_wal", default=True),
+            enable_foreign_keys=self.config.get_nested(
+                "enable_foreign_keys", default=True
+            ),
+            mmap_size_bytes=mmap_size_mb * 1024 * 1024,
+            cache_size_kib=cache_size_mb * 1024,
+        )
+
     def get_connection(self) -> sqlite3.Connection:
         """
-        Get thread-local database connection
-        Each thread gets its own connection for thread safety
-        """
-        if not hasattr(self._local, "connection") or self._local.connection is None:
-            try:
-                # Get timeout from config (FIX: use default= keyword argument)
-                timeout = self.config.get_nested("connection_timeout", default=30.0)
-
-                self._local.connection = sqlite3.connect(
-                    self.db_path,
-                    check_same_thread=False,
-                    timeout=timeout,
-                )
-
-                # Configure database based on config settings
-                if self.config.get_nested("enable_foreign_keys", default=True):
-                    self._local.connection.execute("PRAGMA foreign_keys = ON")
-
-                if self.config.get_nested("enable_wal", default=True):
-                    self._local.connection.execute("PRAGMA journal_mode = WAL")
-                    self._local.connection.execute("PRAGMA synchronous = NORMAL")
+        Get the calling thread's pooled database connection
 
-                # Use BaseManager logging
-                self.logger.debug(
-                    "Database connection established",
-                    db_path=str(self.db_path),
-                    timeout=timeout,
-                )
+        The connection is pinned to the thread until close() is called or the
+        thread exits, then closed. Pins do not count against max_connections,
+        so long-lived threads never exhaust the pool for scoped leases.
+        """
+        try:
+            return self.pool.thread_connection()
+        except Exception as e:
+            # Use BaseManager error handling
+            self.logger.error(
+                "Failed to connect to database",
+                db_path=str(self.db_path),
+                error=str(e),
+            )
+            if isinstance(e, DatabaseError):
+                raise
+            raise DatabaseError(
+                f"Failed to connect to database: {e}", db_path=str(self.db_path)
+            )
 
-            except Exception as e:
-                # Use BaseManager error handling
-                self.logger.error(
-                    "Failed to connect to database",
-                    db_path=str(self.db_path),
-                    error=str(e),
-                )
-                raise DatabaseError(
-                    f"Failed to connect to database: {e}", db_path=str(self.db_path)
-                )
+    @contextmanager
+    def _connection_scope(self):
+        """Reuse the thread's pinned connection, else lease one for the scope"""
+        pinned = self.pool.current_thread_connection()
+        if pinned is not None:
+            yield pinned
+            return
 
-        return self._local.connection
+        conn = self.pool.acquire()
+        try:
+            yield conn
+        finally:
+            self.pool.release(conn)
 
     @contextmanager
     def get_cursor(self):
         """Context manager for database cursor with automatic commit/rollback"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        try:
-            yield cursor
-            conn.commit()
-        except Exception as e:
-            conn.rollback()
-            raise DatabaseError(
-                f"Database operation failed: {e}", db_path=str(self.db_path)
-            )
-        finally:
-            cursor.close()
+        with self._connection_scope() as conn:
+            cursor = conn.cursor()
+            try:
+                yield cursor
+                conn.commit()
+            except Exception as e:
+                conn.rollback()
+                raise DatabaseError(
+                    f"Database operation failed: {e}", db_path=str(self.db_path)
+                )
+            finally:
+                cursor.close()
 
     def _initialize_database(self):
         """Initialize database with basic structure"""
@@ -425,11 +455,10 @@ class DatabaseManager(BaseManager):
             raise DatabaseError(f"Failed to get database stats: {e}")
 
     def close(self):
-        """Close database connections"""
+        """Close this thread's pinned connection"""
         try:
-            if hasattr(self._local, "connection") and self._local.connection:
-                self._local.connection.close()
-                self._local.connection = None
+            if getattr(self, "pool", None) is not None:
+                self.pool.release_thread_connection()
             self.logger.info("Database connections closed")
         except Exception as e:
             self.logger.error("Error closing database connections", error=str(e))
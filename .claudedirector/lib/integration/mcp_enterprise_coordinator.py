@@ -335,6 +335,13 @@ class MCPEnterpriseCoordinator:
 
                 # Update coordination metrics
                 self.coordination_metrics["successful_coordinations"] += 1
+                if self.performance_monitor:
+                    self.performance_monitor.record_metric(
+                        "mcp_coordination_ms",
+                        response_time,
+                        labels={"server": selected_server},
+                        histogram=True,
+                    )
 
                 # Reset circuit breaker on success
                 self._reset_circuit_breaker(selected_server)
@@ -644,13 +651,13 @@ class MCPEnterpriseCoordinator:
 
         # Update performance monitor if available
         if self.performance_monitor:
-            await self.performance_monitor.record_metric(
-                "mcp_coordination_success_rate", success_rate, "percentage"
+            self.performance_monitor.record_metric(
+                "mcp_coordination_success_rate", success_rate, unit="percentage"
             )
-            await self.performance_monitor.record_metric(
+            self.performance_monitor.record_metric(
                 "mcp_average_coordination_time",
                 self.coordination_metrics["average_coordination_time_ms"],
-                "ms",
+                unit="ms",
             )
 
     def get_server_status_summary(self) -> Dict[str, Any]:
@@ -1,27 +1,96 @@
 # MCP Server Infrastructure
 # Strategic Python MCP Server and Executive Visualization System
 
-from .constants import MCPServerConstants
-from .strategic_python_server import StrategicPythonMCPServer, ExecutionResult
-from .mcp_integration import (
-    StrategicPythonMCPIntegration,
-    MCPRequest,
-    MCPResponse,
-    create_strategic_python_integration,
-    StrategicPythonMCPContext,
-)
-
-# 🚀 ENHANCEMENT FIX: Make executive visualization optional due to plotly dependency
 try:
-    from .executive_visualization_server import (
-        ExecutiveVisualizationEngine,
-        ExecutiveVisualizationMCPServer,
-        VisualizationResult,
-        create_executive_visualization_server,
-    )
-
-    EXECUTIVE_VISUALIZATION_AVAILABLE = True
+    from ..utils.lazy_imports import lazy_exports
 except ImportError:
+    from utils.lazy_imports import lazy_exports
+
+# Exports load on first access: the visualization and analytics submodules
+# pull in plotly/pandas, which most callers (hooks, routing) never need
+_SUBMODULE_ATTRS = {
+    "constants": ["MCPServerConstants"],
+    "strategic_python_server": ["StrategicPythonMCPServer", "ExecutionResult"],
+    "mcp_integration": [
+        "StrategicPythonMCPIntegration",
+        "MCPRequest",
+        "MCPResponse",
+        "create_strategic_python_integration",
+        "StrategicPythonMCPContext",
+    ],
+    "executive_visualization_server": [
+        "ExecutiveVisualizationEngine",
+        "ExecutiveVisualizationMCPServer",
+        "VisualizationResult",
+        "create_executive_visualization_server",
+    ],
+    "integrated_visualization_workflow": [
+        "IntegratedVisualizationWorkflow",
+        "IntegratedWorkflowResult",
+        "create_integrated_visualization_workflow",
+    ],
+    # Phase 7 Week 2: Conversational Analytics
+    "conversational_data_manager": [
+        "ConversationalDataManager",
+        "ConversationalQuery",
+        "DataResponse",
+        "QueryType",
+        "create_conversational_data_manager",
+    ],
+    "conversational_analytics_workflow": [
+        "ConversationalAnalyticsWorkflow",
+        "ConversationalAnalyticsResult",
+        "create_conversational_analytics_workflow",
+    ],
+    # Phase 7 Week 3: MCP Integration
+    "mcp_integration_manager": [
+        "MCPIntegrationManager",
+        "MCPServerType",
+        "MCPServerStatus",
+        "MCPIntegrationResult",
+        "create_mcp_integration_manager",
+    ],
+    # Phase 7 Week 4: Interactive Enhancement System (DRY Compliant)
+    "interactive_enhancement_addon": [
+        "InteractiveEnhancementAddon",
+        "InteractiveEnhancementResult",
+        "create_interactive_enhancement_addon",
+    ],
+    # Phase 7B: Chat Integration (Configuration-Driven, DRY Compliant)
+    "conversational_interaction_manager": [
+        "ConversationalInteractionManager",
+        "create_conversational_interaction_manager",
+        "InteractionIntent",
+        "QueryIntent",
+        "InteractionResponse",
+    ],
+    "chat_context_manager": [
+        "ChatContextManager",
+        "create_chat_context_manager",
+        "ChartContextState",
+        "ConversationContext",
+        "ContextScope",
+    ],
+    # Phase 7C: Advanced Features (Configuration-Driven, DRY & SOLID Compliant)
+    "cross_chart_linking_engine": [
+        "CrossChartLinkingEngine",
+        "create_cross_chart_linking_engine",
+        "LinkType",
+        "LinkageConfig",
+        "ChartUpdate",
+    ],
+    "drilldown_navigation_engine": [
+        "DrillDownNavigationEngine",
+        "create_drilldown_navigation_engine",
+        "NavigationType",
+        "HierarchyMap",
+        "NavigationResult",
+    ],
+}
+
+
+# 🚀 ENHANCEMENT FIX: Make executive visualization optional due to plotly dependency
+def _executive_visualization_fallbacks():
     # Create fallback classes if plotly not available
     class ExecutiveVisualizationEngine:
         def __init__(self):
@@ -38,17 +107,11 @@ except ImportError:
     def create_executive_visualization_server():
         return ExecutiveVisualizationMCPServer()
 
-    EXECUTIVE_VISUALIZATION_AVAILABLE = False
-# 🚀 ENHANCEMENT FIX: Make integrated visualization optional due to dependency chain
-try:
-    from .integrated_visualization_workflow import (
-        IntegratedVisualizationWorkflow,
-        IntegratedWorkflowResult,
-        create_integrated_visualization_workflow,
-    )
+    return locals()
 
-    INTEGRATED_VISUALIZATION_AVAILABLE = True
-except ImportError:
+
+# 🚀 ENHANCEMENT FIX: Make integrated visualization optional due to dependency chain
+def _integrated_visualization_fallbacks():
     # Create fallback classes if dependencies not available
     class IntegratedVisualizationWorkflow:
         def __init__(self):
@@ -61,21 +124,11 @@ except ImportError:
     def create_integrated_visualization_workflow():
         return IntegratedVisualizationWorkflow()
 
-    INTEGRATED_VISUALIZATION_AVAILABLE = False
+    return locals()
+
 
 # Phase 7 Week 2: Conversational Analytics - Make optional
-try:
-    from .conversational_data_manager import (
-        ConversationalDataManager,
-        ConversationalQuery,
-        DataResponse,
-        QueryType,
-        create_conversational_data_manager,
-    )
-
-    CONVERSATIONAL_DATA_AVAILABLE = True
-except ImportError:
-    # Create fallback classes
+def _conversational_data_fallbacks():
     class ConversationalDataManager:
         pass
 
@@ -91,18 +144,10 @@ except ImportError:
     def create_conversational_data_manager():
         return ConversationalDataManager()
 
-    CONVERSATIONAL_DATA_AVAILABLE = False
+    return locals()
 
-try:
-    from .conversational_analytics_workflow import (
-        ConversationalAnalyticsWorkflow,
-        ConversationalAnalyticsResult,
-        create_conversational_analytics_workflow,
-    )
 
-    CONVERSATIONAL_ANALYTICS_AVAILABLE = True
-except ImportError:
-    # Create fallback classes
+def _conversational_analytics_fallbacks():
     class ConversationalAnalyticsWorkflow:
         pass
 
@@ -112,28 +157,11 @@ except ImportError:
     def create_conversational_analytics_workflow():
         return ConversationalAnalyticsWorkflow()
 
-    CONVERSATIONAL_ANALYTICS_AVAILABLE = False
+    return locals()
 
-# Phase 7 Week 3: MCP Integration
-from .mcp_integration_manager import (
-    MCPIntegrationManager,
-    MCPServerType,
-    MCPServerStatus,
-    MCPIntegrationResult,
-    create_mcp_integration_manager,
-)
 
 # Phase 7 Week 4: Interactive Enhancement System (DRY Compliant) - Make optional
-try:
-    from .interactive_enhancement_addon import (
-        InteractiveEnhancementAddon,
-        InteractiveEnhancementResult,
-        create_interactive_enhancement_addon,
-    )
-
-    INTERACTIVE_ENHANCEMENT_AVAILABLE = True
-except ImportError:
-    # Create fallback classes
+def _interactive_enhancement_fallbacks():
     class InteractiveEnhancementAddon:
         pass
 
@@ -143,21 +171,11 @@ except ImportError:
     def create_interactive_enhancement_addon():
         return InteractiveEnhancementAddon()
 
-    INTERACTIVE_ENHANCEMENT_AVAILABLE = False
+    return locals()
+
 
 # Phase 7B: Chat Integration (Configuration-Driven, DRY Compliant) - Make optional
-try:
-    from .conversational_interaction_manager import (
-        ConversationalInteractionManager,
-        create_conversational_interaction_manager,
-        InteractionIntent,
-        QueryIntent,
-        InteractionResponse,
-    )
-
-    CONVERSATIONAL_INTERACTION_AVAILABLE = True
-except ImportError:
-    # Create fallback classes
+def _conversational_interaction_fallbacks():
     class ConversationalInteractionManager:
         pass
 
@@ -173,20 +191,10 @@ except ImportError:
     def create_conversational_interaction_manager():
         return ConversationalInteractionManager()
 
-    CONVERSATIONAL_INTERACTION_AVAILABLE = False
+    return locals()
 
-try:
-    from .chat_context_manager import (
-        ChatContextManager,
-        create_chat_context_manager,
-        ChartContextState,
-        ConversationContext,
-        ContextScope,
-    )
-
-    CHAT_CONTEXT_AVAILABLE = True
-except ImportError:
-    # Create fallback classes
+
+def _chat_context_fallbacks():
     class ChatContextManager:
         pass
 
@@ -202,21 +210,11 @@ except ImportError:
     def create_chat_context_manager():
         return ChatContextManager()
 
-    CHAT_CONTEXT_AVAILABLE = False
+    return locals()
+
 
 # Phase 7C: Advanced Features (Configuration-Driven, DRY & SOLID Compliant) - Make optional
-try:
-    from .cross_chart_linking_engine import (
-        CrossChartLinkingEngine,
-        create_cross_chart_linking_engine,
-        LinkType,
-        LinkageConfig,
-        ChartUpdate,
-    )
-
-    CROSS_CHART_LINKING_AVAILABLE = True
-except ImportError:
-    # Create fallback classes
+def _cross_chart_linking_fallbacks():
     class CrossChartLinkingEngine:
         pass
 
@@ -232,20 +230,10 @@ except ImportError:
     def create_cross_chart_linking_engine():
         return CrossChartLinkingEngine()
 
-    CROSS_CHART_LINKING_AVAILABLE = False
+    return locals()
 
-try:
-    from .drilldown_navigation_engine import (
-        DrillDownNavigationEngine,
-        create_drilldown_navigation_engine,
-        NavigationType,
-        HierarchyMap,
-        NavigationResult,
-    )
-
-    DRILLDOWN_NAVIGATION_AVAILABLE = True
-except ImportError:
-    # Create fallback classes
+
+def _drilldown_navigation_fallbacks():
     class DrillDownNavigationEngine:
         pass
 
@@ -261,7 +249,36 @@ except ImportError:
     def create_drilldown_navigation_engine():
         return DrillDownNavigationEngine()
 
-    DRILLDOWN_NAVIGATION_AVAILABLE = False
+    return locals()
+
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    globals(),
+    _SUBMODULE_ATTRS,
+    fallbacks={
+        "executive_visualization_server": _executive_visualization_fallbacks,
+        "integrated_visualization_workflow": _integrated_visualization_fallbacks,
+        "conversational_data_manager": _conversational_data_fallbacks,
+        "conversational_analytics_workflow": _conversational_analytics_fallbacks,
+        "interactive_enhancement_addon": _interactive_enhancement_fallbacks,
+        "conversational_interaction_manager": _conversational_interaction_fallbacks,
+        "chat_context_manager": _chat_context_fallbacks,
+        "cross_chart_linking_engine": _cross_chart_linking_fallbacks,
+        "drilldown_navigation_engine": _drilldown_navigation_fallbacks,
+    },
+    flags={
+        "EXECUTIVE_VISUALIZATION_AVAILABLE": ["executive_visualization_server"],
+        "INTEGRATED_VISUALIZATION_AVAILABLE": ["integrated_visualization_workflow"],
+        "CONVERSATIONAL_DATA_AVAILABLE": ["conversational_data_manager"],
+        "CONVERSATIONAL_ANALYTICS_AVAILABLE": ["conversational_analytics_workflow"],
+        "INTERACTIVE_ENHANCEMENT_AVAILABLE": ["interactive_enhancement_addon"],
+        "CONVERSATIONAL_INTERACTION_AVAILABLE": ["conversational_interaction_manager"],
+        "CHAT_CONTEXT_AVAILABLE": ["chat_context_manager"],
+        "CROSS_CHART_LINKING_AVAILABLE": ["cross_chart_linking_engine"],
+        "DRILLDOWN_NAVIGATION_AVAILABLE": ["drilldown_navigation_engine"],
+    },
+)
 
 # Phase 7 Week 4: Deprecated components removed due to DRY violations
 # Use InteractiveEnhancementAddon which extends existing systems without duplication
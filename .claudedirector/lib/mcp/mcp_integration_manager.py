@@ -34,6 +34,15 @@ from datetime import datetime
 
 from .constants import MCPServerConstants
 
+try:
+    from ..utils.text_matching import KeywordMatcher
+    from ..performance.metrics_registry import get_metrics_registry
+    from ..performance.tracing import set_span_attributes, traced
+except ImportError:
+    from utils.text_matching import KeywordMatcher
+    from performance.metrics_registry import get_metrics_registry
+    from performance.tracing import set_span_attributes, traced
+
 # 🚀 ENHANCEMENT: Import for Claude Code MCP server integration
 try:
     # Try relative imports first (for package context)
@@ -95,6 +104,56 @@ class QueryPattern(Enum):
     GENERAL_QUERY = "general_query"  # → Sequential primary
 
 
+# Routing keywords, checked in priority order; whole words only (avoids
+# substring matches like 'ui' in 'guide')
+_QUERY_PATTERN_MATCHER = KeywordMatcher(
+    {
+        QueryPattern.STRATEGIC_ANALYSIS.value: [
+            "strategy",
+            "roadmap",
+            "planning",
+            "decision",
+            "business",
+            "roi",
+            "investment",
+            "team",
+            "organization",
+        ],
+        QueryPattern.UI_COMPONENT.value: [
+            "component",
+            "design",
+            "ui",
+            "interface",
+            "button",
+            "form",
+            "layout",
+            "style",
+            "css",
+        ],
+        QueryPattern.TECHNICAL_QUESTION.value: [
+            "documentation",
+            "docs",
+            "api",
+            "library",
+            "framework",
+            "guide",
+            "tutorial",
+            "reference",
+        ],
+        QueryPattern.TESTING_AUTOMATION.value: [
+            "test",
+            "testing",
+            "automation",
+            "e2e",
+            "playwright",
+            "browser",
+            "visual",
+        ],
+    },
+    whole_words=True,
+)
+
+
 @dataclass
 class MCPServerConfig:
     """Configuration for an MCP server"""
@@ -162,6 +221,13 @@ class MCPIntegrationManager:
         # 🚀 ENHANCEMENT: Session-scoped performance tracking for optimization
         self.session_performance = {}
 
+        # Per-server latency, exported via the metrics registry
+        self.server_latency = get_metrics_registry().histogram(
+            "claudedirector_mcp_request_ms",
+            "MCP server request latency in milliseconds",
+            ("server",),
+        )
+
         logger.info(
             f"MCP Integration Manager {self.version} initialized with intelligent routing"
         )
@@ -726,6 +792,7 @@ class MCPIntegrationManager:
 
     # 🚀 ENHANCEMENT: Intelligent Query Routing Methods
 
+    @traced("mcp.route")
     async def route_query_intelligently(
         self, query: str, context: Optional[Dict] = None
     ) -> MCPIntegrationResult:
@@ -811,75 +878,11 @@ class MCPIntegrationManager:
 
     def _classify_query_pattern(self, query: str) -> QueryPattern:
         """Simple rule-based query pattern classification - no ML dependencies."""
-        import re
-
-        query_lower = query.lower()
-
-        # Helper function for word boundary matching
-        def contains_word(text: str, word: str) -> bool:
-            """Check if word exists with word boundaries (avoids substring matches like 'ui' in 'guide')"""
-            pattern = r"\b" + re.escape(word) + r"\b"
-            return bool(re.search(pattern, text))
-
-        # Strategic analysis patterns
-        strategic_keywords = [
-            "strategy",
-            "roadmap",
-            "planning",
-            "decision",
-            "business",
-            "roi",
-            "investment",
-            "team",
-            "organization",
-        ]
-        if any(contains_word(query_lower, keyword) for keyword in strategic_keywords):
-            return QueryPattern.STRATEGIC_ANALYSIS
-
-        # UI component patterns
-        ui_keywords = [
-            "component",
-            "design",
-            "ui",
-            "interface",
-            "button",
-            "form",
-            "layout",
-            "style",
-            "css",
-        ]
-        if any(contains_word(query_lower, keyword) for keyword in ui_keywords):
-            return QueryPattern.UI_COMPONENT
-
-        # Technical documentation patterns
-        tech_keywords = [
-            "documentation",
-            "docs",
-            "api",
-            "library",
-            "framework",
-            "guide",
-            "tutorial",
-            "reference",
-        ]
-        if any(contains_word(query_lower, keyword) for keyword in tech_keywords):
-            return QueryPattern.TECHNICAL_QUESTION
-
-        # Testing automation patterns
-        test_keywords = [
-            "test",
-            "testing",
-            "automation",
-            "e2e",
-            "playwright",
-            "browser",
-            "visual",
-        ]
-        if any(contains_word(query_lower, keyword) for keyword in test_keywords):
-            return QueryPattern.TESTING_AUTOMATION
-
-        # Default to general query (Sequential server)
-        return QueryPattern.GENERAL_QUERY
+        pattern = _QUERY_PATTERN_MATCHER.first_match(query)
+        if pattern is None:
+            # Default to general query (Sequential server)
+            return QueryPattern.GENERAL_QUERY
+        return QueryPattern(pattern)
 
     def _select_optimal_server(self, pattern: QueryPattern) -> Optional[MCPServerType]:
         """Select best Claude Code MCP server for query pattern."""
@@ -902,10 +905,12 @@ class MCPIntegrationManager:
         }
         return fallback_mapping.get(primary)
 
+    @traced("mcp.server_query")
     async def _query_claude_code_mcp_server(
         self, server_type: MCPServerType, query: str, context: Optional[Dict] = None
     ) -> Dict[str, Any]:
         """Query Claude Code MCP server using existing integration patterns."""
+        set_span_attributes(server=server_type.value)
         if not self.claude_code_mcp_helper:
             raise Exception("Claude Code MCP helper not initialized")
 
@@ -949,6 +954,8 @@ class MCPIntegrationManager:
         perf["total_time"] += response_time
         perf["avg_response_time"] = perf["total_time"] / perf["total_calls"]
 
+        self.server_latency.labels(server_key).observe(response_time * 1000)
+
     def _update_metrics(self, method: str, latency_seconds: float, success: bool):
         """Update integration performance metrics"""
 
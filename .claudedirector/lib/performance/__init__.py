@@ -8,6 +8,8 @@ Implements <500ms response times with <50MB memory usage.
 from .cache_manager import CacheManager
 from .memory_optimizer import MemoryOptimizer
 from .performance_monitor import PerformanceMonitor
+from .metrics_registry import MetricsRegistry, get_metrics_registry
+from .tracing import configure_tracing, get_tracer, span, traced
 
 # Use existing performance systems instead of deleted unified bloat
 # Define response types locally to avoid dependency on deleted unified manager
@@ -184,6 +186,12 @@ __all__ = [
     "ResponseOptimizer",
     "ResponsePriority",
     "PerformanceMonitor",
+    "MetricsRegistry",
+    "get_metrics_registry",
+    "configure_tracing",
+    "get_tracer",
+    "span",
+    "traced",
     # PHASE 8.4: Unified Response functionality (consolidated from unified_response_handler.py)
     "UnifiedResponseHandler",
     "UnifiedResponse",
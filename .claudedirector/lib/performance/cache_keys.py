@@ -0,0 +1,189 @@
+"""
+Cache Key Generation for Performance Optimization
+
+Structural, process-stable cache keys for CacheManager. Arguments are fed
+into a BLAKE2b hasher through a canonical, type-tagged and length-prefixed
+encoding, so:
+- dicts and sets hash the same regardless of insertion order
+- "1" and 1, or ("a", "b") and ("ab",), never collide
+- keys are identical across processes (no reliance on hash())
+
+Types without a built-in encoding can register a serializer that maps them
+to encodable values (dicts, lists, scalars).
+
+Author: Martin | Platform Architecture
+"""
+
+import hashlib
+from dataclasses import fields, is_dataclass
+from datetime import date, datetime, time as dt_time
+from enum import Enum
+from pathlib import PurePath
+from typing import Any, Callable, Dict, Optional, Tuple, Type
+
+KeySerializer = Callable[[Any], Any]
+
+# Digest size in bytes (32 hex characters)
+CACHE_KEY_DIGEST_SIZE = 16
+NAMESPACE_SEPARATOR = ":"
+
+_default_serializers: Dict[type, KeySerializer] = {}
+
+
+def register_key_serializer(value_type: Type, serializer: KeySerializer):
+    """Register a process-wide key serializer for a custom type"""
+    _default_serializers[value_type] = serializer
+
+
+class CacheKeyBuilder:
+    """
+    Canonical structural hasher for cache keys
+
+    Keys have the form "<namespace>:<blake2b hex digest>" so the namespace
+    can be recovered from a key without a lookup table.
+    """
+
+    def __init__(self, serializers: Optional[Dict[type, KeySerializer]] = None):
+        self._serializers: Dict[type, KeySerializer] = dict(_default_serializers)
+        if serializers:
+            self._serializers.update(serializers)
+        self._resolved: Dict[type, Optional[KeySerializer]] = {}
+
+    def register(self, value_type: Type, serializer: KeySerializer):
+        """Register a serializer for this builder only"""
+        self._serializers[value_type] = serializer
+        self._resolved.clear()
+
+    def build(self, namespace: str, args: Tuple, kwargs: Dict[str, Any]) -> str:
+        """Build a namespaced key from call arguments"""
+        hasher = hashlib.blake2b(digest_size=CACHE_KEY_DIGEST_SIZE)
+        self._feed(hasher, args, set())
+        self._feed(hasher, kwargs, set())
+        return f"{namespace}{NAMESPACE_SEPARATOR}{hasher.hexdigest()}"
+
+    def digest(self, value: Any) -> str:
+        """Hex digest of a single value's canonical encoding"""
+        hasher = hashlib.blake2b(digest_size=CACHE_KEY_DIGEST_SIZE)
+        self._feed(hasher, value, set())
+        return hasher.hexdigest()
+
+    def _serializer_for(self, value_type: type) -> Optional[KeySerializer]:
+        """Resolve a registered serializer through the type's MRO"""
+        if value_type not in self._resolved:
+            self._resolved[value_type] = next(
+                (
+                    self._serializers[base]
+                    for base in value_type.__mro__
+                    if base in self._serializers
+                ),
+                None,
+            )
+        return self._resolved[value_type]
+
+    def _feed(self, hasher, value: Any, active: set):
+        """Feed the canonical encoding of value into hasher"""
+        value_type = type(value)
+
+        # Fast paths for common scalars (exact types; bool before int)
+        if value_type is str:
+            encoded = value.encode("utf-8")
+            hasher.update(b"s%d:" % len(encoded))
+            hasher.update(encoded)
+            return
+        if value_type is bool:
+            hasher.update(b"b1" if value else b"b0")
+            return
+        if value_type is int:
+            hasher.update(b"i%d;" % value)
+            return
+        if value_type is float:
+            hasher.update(b"f" + value.hex().encode() + b";")
+            return
+        if value is None:
+            hasher.update(b"n")
+            return
+        if value_type in (bytes, bytearray):
+            hasher.update(b"y%d:" % len(value))
+            hasher.update(value)
+            return
+
+        serializer = self._serializer_for(value_type)
+        if serializer is not None:
+            hasher.update(b"c" + self._type_name(value_type))
+            self._feed(hasher, serializer(value), active)
+            return
+
+        # Containers: guard against self-references
+        value_id = id(value)
+        if value_id in active:
+            hasher.update(b"r")
+            return
+        active.add(value_id)
+        try:
+            self._feed_structure(hasher, value, value_type, active)
+        finally:
+            active.discard(value_id)
+
+    def _feed_structure(self, hasher, value: Any, value_type: type, active: set):
+        """Encode containers, dataclasses and other structured values"""
+        if isinstance(value, Enum):
+            hasher.update(b"E" + self._type_name(value_type))
+            self._feed(hasher, value.value, active)
+        elif isinstance(value, dict):
+            items = sorted(
+                ((self._digest_with(k, active), v) for k, v in value.items()),
+                key=lambda item: item[0],
+            )
+            hasher.update(b"d%d:" % len(items))
+            for key_digest, item in items:
+                hasher.update(key_digest)
+                self._feed(hasher, item, active)
+        elif isinstance(value, (list, tuple)):
+            hasher.update(
+                (b"l" if isinstance(value, list) else b"t") + b"%d:" % len(value)
+            )
+            for item in value:
+                self._feed(hasher, item, active)
+        elif isinstance(value, (set, frozenset)):
+            digests = sorted(self._digest_with(item, active) for item in value)
+            hasher.update(b"e%d:" % len(digests))
+            for item_digest in digests:
+                hasher.update(item_digest)
+        elif is_dataclass(value) and not isinstance(value, type):
+            hasher.update(b"D" + self._type_name(value_type))
+            self._feed(
+                hasher, {f.name: getattr(value, f.name) for f in fields(value)}, active
+            )
+        elif isinstance(value, (datetime, date, dt_time)):
+            hasher.update(b"T" + value.isoformat().encode() + b";")
+        elif isinstance(value, PurePath):
+            hasher.update(b"P")
+            self._feed(hasher, str(value), active)
+        elif isinstance(value, (int, float, str)):
+            # Subclasses of scalars (e.g. IntEnum handled above, str subclasses)
+            hasher.update(b"S" + self._type_name(value_type))
+            self._feed(hasher, value_type.__mro__[-2](value), active)
+        elif hasattr(value, "__dict__"):
+            hasher.update(b"o" + self._type_name(value_type))
+            self._feed(hasher, vars(value), active)
+        else:
+            # Last resort: repr is stable for most value-like objects
+            hasher.update(b"R" + self._type_name(value_type))
+            self._feed(hasher, repr(value), active)
+
+    def _digest_with(self, value: Any, active: set) -> bytes:
+        """Raw digest of value, sharing the caller's cycle guard"""
+        hasher = hashlib.blake2b(digest_size=CACHE_KEY_DIGEST_SIZE)
+        self._feed(hasher, value, active)
+        return hasher.digest()
+
+    @staticmethod
+    def _type_name(value_type: type) -> bytes:
+        name = f"{value_type.__module__}.{value_type.__qualname__}".encode()
+        return b"%d:" % len(name) + name
+
+
+def namespace_of(key: str) -> Optional[str]:
+    """Namespace prefix of a "<namespace>:<...>" key, if any"""
+    namespace, separator, _ = key.partition(NAMESPACE_SEPARATOR)
+    return namespace if separator else None
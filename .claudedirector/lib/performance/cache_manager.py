@@ -12,12 +12,17 @@ Phase: 8.1.3 - Core Infrastructure Manager Refactoring
 """
 
 import asyncio
+import functools
+import logging
 import time
-import hashlib
+import heapq
 import sys
+import types
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, Optional, Union, List
-from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Set, Union, List, Tuple
+from dataclasses import dataclass, fields, is_dataclass
 from enum import Enum
 import json
 
@@ -25,11 +30,24 @@ import json
 try:
     from ..core.base_manager import BaseManager, BaseManagerConfig, ManagerType
     from ..core.manager_factory import register_manager_type
+    from .cache_keys import CacheKeyBuilder, namespace_of, NAMESPACE_SEPARATOR
+    from .metrics_registry import get_metrics_registry
+    from .persistent_cache import PersistentCacheStore, encode_value
 except ImportError:
     # Fallback for test environments
     sys.path.insert(0, str(Path(__file__).parent.parent))
     from core.base_manager import BaseManager, BaseManagerConfig, ManagerType
     from core.manager_factory import register_manager_type
+    from performance.cache_keys import (
+        CacheKeyBuilder,
+        namespace_of,
+        NAMESPACE_SEPARATOR,
+    )
+    from performance.metrics_registry import get_metrics_registry
+    from performance.persistent_cache import PersistentCacheStore, encode_value
+
+# Histogram buckets for in-memory cache operations, in milliseconds
+CACHE_LATENCY_BUCKETS_MS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 50)
 
 
 class CacheLevel(Enum):
@@ -47,6 +65,79 @@ class CacheLevel(Enum):
     MCP_PLAYWRIGHT = "mcp_playwright"  # 5 minutes TTL - Testing results
 
 
+# Fixed bookkeeping cost per entry (CacheEntry object, OrderedDict link, heap slot)
+CACHE_ENTRY_OVERHEAD_BYTES = 200
+
+# Nesting depth below which container contents are no longer walked
+MAX_SIZE_ESTIMATE_DEPTH = 16
+
+# Shared objects a cached value may reference but does not own
+_UNOWNED_TYPES = (
+    type,
+    types.ModuleType,
+    types.FunctionType,
+    types.BuiltinFunctionType,
+    types.MethodType,
+    logging.Logger,
+)
+_ATOMIC_TYPES = (str, bytes, bytearray, int, float, bool, type(None))
+
+
+def _shallow_size(obj: Any) -> int:
+    try:
+        return sys.getsizeof(obj)
+    except TypeError:
+        return 64  # Conservative size for objects without __sizeof__
+
+
+def estimate_size_bytes(value: Any) -> int:
+    """
+    Estimate the deep in-memory size of a cached value
+
+    Walks containers and dataclasses iteratively (up to
+    MAX_SIZE_ESTIMATE_DEPTH levels), counting each object once so shared and
+    self-referencing structures are handled safely. Other objects are sized
+    shallowly (the object, its __dict__ and its attribute values), so a value
+    holding a manager, logger or connection is not charged for that object's
+    whole graph. Modules, classes, functions and loggers are not charged.
+    """
+    seen = set()
+    stack = [(value, 0)]
+    total = 0
+
+    while stack:
+        obj, depth = stack.pop()
+        obj_id = id(obj)
+        if obj_id in seen or isinstance(obj, _UNOWNED_TYPES):
+            continue
+        seen.add(obj_id)
+        total += _shallow_size(obj)
+
+        if isinstance(obj, _ATOMIC_TYPES) or depth >= MAX_SIZE_ESTIMATE_DEPTH:
+            continue
+        depth += 1
+        if isinstance(obj, dict):
+            stack.extend((item, depth) for item in obj.keys())
+            stack.extend((item, depth) for item in obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend((item, depth) for item in obj)
+        elif is_dataclass(obj):
+            stack.extend((getattr(obj, f.name, None), depth) for f in fields(obj))
+        elif hasattr(obj, "__dict__"):
+            attributes = vars(obj)
+            if id(attributes) not in seen:
+                seen.add(id(attributes))
+                total += _shallow_size(attributes)
+                for attribute in attributes.values():
+                    if id(attribute) not in seen and not isinstance(
+                        attribute, _UNOWNED_TYPES
+                    ):
+                        seen.add(id(attribute))
+                        total += _shallow_size(attribute)
+
+    return total
+
+
 @dataclass
 class CacheEntry:
     """Cache entry with metadata"""
@@ -57,10 +148,26 @@ class CacheEntry:
     access_count: int = 0
     last_accessed: float = 0
     cache_level: CacheLevel = CacheLevel.CONTEXT_ANALYSIS
+    size_bytes: int = 0
+    stale_seconds: int = 0
+
+    @property
+    def expires_at(self) -> float:
+        """Absolute expiry timestamp"""
+        return self.created_at + self.ttl_seconds
+
+    @property
+    def evict_at(self) -> float:
+        """Timestamp after which even a stale value can no longer be served"""
+        return self.expires_at + self.stale_seconds
 
     def is_expired(self) -> bool:
         """Check if cache entry has expired"""
-        return time.time() - self.created_at > self.ttl_seconds
+        return time.time() > self.expires_at
+
+    def is_servable_stale(self) -> bool:
+        """Check if an expired entry is still inside its stale grace window"""
+        return self.expires_at < time.time() <= self.evict_at
 
     def access(self) -> Any:
         """Record access and return value"""
@@ -79,7 +186,12 @@ class CacheManager(BaseManager):
     Features:
     - Redis-compatible interface with async support
     - Intelligent TTL based on cache levels
-    - Memory-efficient LRU eviction
+    - O(1) LRU touch/eviction (OrderedDict) with a TTL expiry heap
+    - Memory limit enforced from per-entry size accounting
+    - Single-flight cached_call: concurrent misses share one in-flight call
+    - Optional per-level stale-while-revalidate
+    - Optional persistent L2 tier (SQLite) for selected cache levels
+    - Process-stable structural cache keys with a namespace index
     - Performance metrics and monitoring (via BaseManager)
     - <50ms cache operations for 95% of requests
     """
@@ -89,6 +201,10 @@ class CacheManager(BaseManager):
         config: Optional[BaseManagerConfig] = None,
         max_memory_mb: int = 20,
         max_entries: int = 10000,
+        stale_while_revalidate: Optional[Dict[str, int]] = None,
+        persistent_cache_path: Optional[Union[str, Path]] = None,
+        persistent_levels: Optional[List[str]] = None,
+        key_serializers: Optional[Dict[type, Callable[[Any], Any]]] = None,
         cache: Optional[Dict[str, Any]] = None,
         metrics: Optional[Dict[str, Any]] = None,
         **kwargs,
@@ -121,6 +237,16 @@ class CacheManager(BaseManager):
                         "mcp_magic": 900,  # 15 minutes
                         "mcp_playwright": 300,  # 5 minutes
                     },
+                    # Seconds an expired value may still be served while one
+                    # background refresh runs (per cache level, 0 = disabled)
+                    "stale_while_revalidate": stale_while_revalidate or {},
+                    # Optional L2 tier: levels written through to a local
+                    # SQLite store and promoted back to L1 on miss
+                    "persistent_cache": {
+                        "path": persistent_cache_path,
+                        "levels": persistent_levels
+                        or ["strategic_memory", "framework_patterns"],
+                    },
                 },
             )
 
@@ -140,12 +266,37 @@ class CacheManager(BaseManager):
         self.performance_threshold_ms = config_threshold
 
         # Cache storage (separate from BaseManager's cache to avoid confusion)
-        self.cache_storage: Dict[str, CacheEntry] = {}
+        # Ordered least -> most recently used so touch and eviction are O(1)
+        self.cache_storage: "OrderedDict[str, CacheEntry]" = OrderedDict()
+
+        # TTL expiry heap of (evict_at, sequence, key); stale slots are
+        # skipped lazily when the key was overwritten or removed
+        self._expiry_heap: List[Tuple[float, int, str]] = []
+        self._expiry_sequence = 0
+        self.memory_usage_bytes = 0
+
+        # Structural key builder and namespace -> keys index
+        self.key_builder = CacheKeyBuilder(key_serializers)
+        self._namespace_index: Dict[str, Set[str]] = {}
 
         # Cache-specific metrics (in addition to BaseManager metrics)
         self.cache_hits = 0
         self.cache_misses = 0
         self.cache_evictions = 0
+        self.coalesced_calls = 0
+        self.stale_hits = 0
+        self.l2_hits = 0
+
+        # Per-CacheLevel operation latency, exported via the metrics registry
+        self.operation_latency = get_metrics_registry().histogram(
+            "claudedirector_cache_operation_ms",
+            "Cache operation latency in milliseconds",
+            ("operation", "level"),
+            buckets=CACHE_LATENCY_BUCKETS_MS,
+        )
+
+        # Single-flight registry: cache key -> task computing that key
+        self._inflight: Dict[str, "asyncio.Future[Any]"] = {}
 
         # TTL configuration from config (no hard-coded values)
         ttl_defaults = {
@@ -170,6 +321,20 @@ class CacheManager(BaseManager):
                 config_key, ttl_defaults[level]
             )
 
+        swr_config_data = self.config.custom_config.get("stale_while_revalidate", {})
+        self.stale_while_revalidate_config = {
+            level: int(swr_config_data.get(level.value, 0)) for level in CacheLevel
+        }
+
+        # Persistent L2 tier (disabled unless a path is configured)
+        self.l2_store = None
+        self.persistent_levels = set()
+        self._l2_executor = None
+        # Bumped on every L2 write so an in-flight read never promotes a
+        # record that was overwritten or invalidated while it was running
+        self._l2_generation = 0
+        self._initialize_persistent_cache()
+
         # Cleanup task
         self._cleanup_task = None
         self._start_cleanup_task()
@@ -186,6 +351,7 @@ class CacheManager(BaseManager):
             max_entries=self.max_entries,
             ttl_config={level.value: ttl for level, ttl in self.ttl_config.items()},
             prompt_optimizer_enabled=self.prompt_optimizer is not None,
+            l2_enabled=self.l2_store is not None,
         )
 
     def manage(self, operation: str, *args, **kwargs) -> Any:
@@ -197,6 +363,7 @@ class CacheManager(BaseManager):
         - 'set': Set value in cache
         - 'cached_call': Execute cached function call
         - 'invalidate_pattern': Invalidate keys matching pattern
+        - 'invalidate_namespace': Invalidate all keys in a namespace
         - 'get_stats': Get cache statistics
         - 'warm_cache': Pre-populate cache
         - 'cleanup': Cleanup resources
@@ -221,6 +388,8 @@ class CacheManager(BaseManager):
                 result = self.cached_call(*args, **kwargs)
             elif operation == "invalidate_pattern":
                 result = self.invalidate_pattern(*args, **kwargs)
+            elif operation == "invalidate_namespace":
+                result = self.invalidate_namespace(*args, **kwargs)
             elif operation == "get_stats":
                 result = self.get_stats()
             elif operation == "warm_cache":
@@ -269,6 +438,74 @@ class CacheManager(BaseManager):
             self.logger.warning(f"Failed to initialize prompt optimizer: {e}")
             self.prompt_optimizer = None
 
+    def _initialize_persistent_cache(self):
+        """Initialize optional SQLite-backed L2 tier (graceful degradation)"""
+        l2_config = self.config.custom_config.get("persistent_cache") or {}
+        l2_path = l2_config.get("path")
+        if not l2_path:
+            return
+
+        try:
+            self.l2_store = PersistentCacheStore(l2_path)
+            # One worker keeps L2 operations in submission order
+            self._l2_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="cache-l2"
+            )
+            self.persistent_levels = {
+                CacheLevel(level) for level in l2_config.get("levels", [])
+            }
+            self.logger.info(
+                "Persistent L2 cache initialized",
+                path=str(l2_path),
+                levels=sorted(level.value for level in self.persistent_levels),
+            )
+        except Exception as e:
+            self.logger.warning(f"Failed to initialize persistent L2 cache: {e}")
+            self.l2_store = None
+            self.persistent_levels = set()
+
+    async def _run_l2(self, method: Callable[..., Any], *args) -> Any:
+        """Run a blocking L2 store call on the L2 worker thread"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._l2_executor, functools.partial(method, *args)
+        )
+
+    async def _promote_from_l2(self, key: str) -> Optional[CacheEntry]:
+        """Load an unexpired L2 record into L1 with its original TTL"""
+        if self.l2_store is None:
+            return None
+
+        generation = self._l2_generation
+        record = await self._run_l2(self.l2_store.get, key)
+        if record is None or generation != self._l2_generation:
+            return None
+        if key in self.cache_storage:
+            # Set concurrently while the read was running; L1 is newer
+            current = self.cache_storage[key]
+            return None if current.is_expired() else current
+
+        cache_level = CacheLevel(record.cache_level)
+        entry = self._entry_from_record(record, cache_level)
+        if entry.size_bytes > self.max_memory_bytes:
+            return None
+
+        self._store_entry(key, entry)
+        self._evict_to_limits()
+        self.l2_hits += 1
+        return entry
+
+    def _entry_from_record(self, record, cache_level: CacheLevel) -> CacheEntry:
+        """Build an L1 entry from a persisted record"""
+        return CacheEntry(
+            value=record.value,
+            created_at=record.created_at,
+            ttl_seconds=record.ttl_seconds,
+            cache_level=cache_level,
+            size_bytes=estimate_size_bytes(record.value) + CACHE_ENTRY_OVERHEAD_BYTES,
+            stale_seconds=self.stale_while_revalidate_config[cache_level],
+        )
+
     def _start_cleanup_task(self):
         """Start background cleanup task"""
 
@@ -289,91 +526,147 @@ class CacheManager(BaseManager):
 
     async def _cleanup_expired_entries(self):
         """Remove expired entries and perform LRU eviction if needed"""
-        expired_keys = []
-        current_time = time.time()
+        expired_count = self._expire_entries()
 
-        # Find expired entries
-        for key, entry in self.cache_storage.items():
-            if entry.is_expired():
-                expired_keys.append(key)
+        if expired_count:
+            self.logger.debug(f"Evicted {expired_count} expired cache entries")
 
-        # Remove expired entries
-        for key in expired_keys:
-            del self.cache_storage[key]
-            self.cache_evictions += 1
-
-        if expired_keys:
-            self.logger.debug(f"Evicted {len(expired_keys)} expired cache entries")
+        if self.l2_store is not None:
+            await self._run_l2(self.l2_store.purge_expired)
 
         # LRU eviction if over memory/entry limits
-        if len(self.cache_storage) > self.max_entries:
+        if self._over_limits():
             await self._lru_eviction()
 
+    def _expire_entries(self, now: Optional[float] = None) -> int:
+        """Pop expired entries from the head of the expiry heap"""
+        now = time.time() if now is None else now
+        expired_count = 0
+
+        while self._expiry_heap and self._expiry_heap[0][0] < now:
+            evict_at, _, key = heapq.heappop(self._expiry_heap)
+            entry = self.cache_storage.get(key)
+            if entry is not None and entry.evict_at == evict_at:
+                self._remove_entry(key)
+                self.cache_evictions += 1
+                expired_count += 1
+
+        return expired_count
+
+    def _over_limits(self) -> bool:
+        """Check entry count and memory budget"""
+        return (
+            len(self.cache_storage) > self.max_entries
+            or self.memory_usage_bytes > self.max_memory_bytes
+        )
+
     async def _lru_eviction(self):
         """Perform LRU eviction to stay within limits"""
-        # Sort by last_accessed time (least recently used first)
-        sorted_entries = sorted(
-            self.cache_storage.items(),
-            key=lambda x: x[1].last_accessed or x[1].created_at,
-        )
+        self._evict_to_limits()
 
-        # Remove oldest 20% when limit exceeded
-        evict_count = len(self.cache_storage) - int(self.max_entries * 0.8)
+    def _evict_to_limits(self) -> int:
+        """Evict least recently used entries until within limits"""
+        evict_count = 0
 
-        for i in range(evict_count):
-            key = sorted_entries[i][0]
-            del self.cache_storage[key]
+        while self.cache_storage and self._over_limits():
+            key = next(iter(self.cache_storage))
+            self._remove_entry(key)
             self.cache_evictions += 1
+            evict_count += 1
 
         if evict_count > 0:
             self.logger.debug(f"LRU evicted {evict_count} cache entries")
 
-    def _generate_cache_key(self, namespace: str, *args, **kwargs) -> str:
-        """Generate deterministic cache key from arguments"""
-        key_parts = [namespace]
+        return evict_count
+
+    def _remove_entry(self, key: str) -> Optional[CacheEntry]:
+        """Remove entry and release its accounted memory"""
+        entry = self.cache_storage.pop(key, None)
+        if entry is not None:
+            self.memory_usage_bytes -= entry.size_bytes
+            namespace = namespace_of(key)
+            if namespace is not None:
+                namespace_keys = self._namespace_index.get(namespace)
+                if namespace_keys is not None:
+                    namespace_keys.discard(key)
+                    if not namespace_keys:
+                        del self._namespace_index[namespace]
+        return entry
+
+    def _store_entry(self, key: str, entry: CacheEntry):
+        """Insert entry as most recently used and schedule its expiry"""
+        self._remove_entry(key)
+        self.cache_storage[key] = entry
+        self.memory_usage_bytes += entry.size_bytes
+
+        namespace = namespace_of(key)
+        if namespace is not None:
+            self._namespace_index.setdefault(namespace, set()).add(key)
+
+        self._expiry_sequence += 1
+        heapq.heappush(self._expiry_heap, (entry.evict_at, self._expiry_sequence, key))
+
+        # Drop stale heap slots left behind by overwrites and evictions
+        if len(self._expiry_heap) > 2 * len(self.cache_storage) + 64:
+            self._expiry_heap = [
+                slot
+                for slot in self._expiry_heap
+                if slot[2] in self.cache_storage
+                and self.cache_storage[slot[2]].evict_at == slot[0]
+            ]
+            heapq.heapify(self._expiry_heap)
 
-        # Add positional arguments
-        for arg in args:
-            if isinstance(arg, (str, int, float, bool)):
-                key_parts.append(str(arg))
-            else:
-                key_parts.append(str(hash(str(arg))))
-
-        # Add keyword arguments (sorted for consistency)
-        for k, v in sorted(kwargs.items()):
-            key_parts.append(f"{k}={v}")
+    def _generate_cache_key(self, namespace: str, *args, **kwargs) -> str:
+        """
+        Generate deterministic cache key from arguments
 
-        key_string = ":".join(key_parts)
-        return hashlib.md5(key_string.encode()).hexdigest()[:16]
+        Keys are "<namespace>:<blake2b digest>" over a canonical structural
+        encoding, so they are stable across processes and independent of
+        dict/set ordering.
+        """
+        return self.key_builder.build(namespace, args, kwargs)
 
     async def get(self, key: str) -> Optional[Any]:
         """Get value from cache with performance tracking"""
         start_time = time.time()
 
         try:
-            if key in self.cache_storage:
-                entry = self.cache_storage[key]
-                if not entry.is_expired():
-                    self.cache_hits += 1
-                    value = entry.access()
-
-                    # Performance tracking using BaseManager config
-                    operation_time = (time.time() - start_time) * 1000
-                    if operation_time > self.performance_threshold_ms:
-                        self.logger.warning(
-                            "Slow cache get operation",
-                            operation_time_ms=f"{operation_time:.1f}",
-                            key_prefix=key[:8],
-                            threshold_ms=self.performance_threshold_ms,
-                        )
-
-                    return value
-                else:
-                    # Remove expired entry
-                    del self.cache_storage[key]
+            entry = self.cache_storage.get(key)
+            if entry is not None and entry.is_expired():
+                if not entry.is_servable_stale():
+                    # Remove expired entry (stale-servable entries are kept
+                    # for cached_call's stale-while-revalidate path)
+                    self._remove_entry(key)
                     self.cache_evictions += 1
+                entry = None
+            elif entry is None:
+                # L1 miss: promote from the persistent tier if present
+                entry = await self._promote_from_l2(key)
+
+            if entry is not None:
+                self.cache_hits += 1
+                self.cache_storage.move_to_end(key)
+                value = entry.access()
+
+                # Performance tracking using BaseManager config
+                operation_time = (time.time() - start_time) * 1000
+                self.operation_latency.labels("get", entry.cache_level.value).observe(
+                    operation_time
+                )
+                if operation_time > self.performance_threshold_ms:
+                    self.logger.warning(
+                        "Slow cache get operation",
+                        operation_time_ms=f"{operation_time:.1f}",
+                        key_prefix=key[:8],
+                        threshold_ms=self.performance_threshold_ms,
+                    )
+
+                return value
 
             self.cache_misses += 1
+            self.operation_latency.labels("get", "miss").observe(
+                (time.time() - start_time) * 1000
+            )
             return None
 
         except Exception as e:
@@ -401,12 +694,50 @@ class CacheManager(BaseManager):
                 created_at=time.time(),
                 ttl_seconds=ttl,
                 cache_level=cache_level,
+                size_bytes=estimate_size_bytes(value) + CACHE_ENTRY_OVERHEAD_BYTES,
+                stale_seconds=self.stale_while_revalidate_config[cache_level],
             )
 
-            self.cache_storage[key] = entry
+            if entry.size_bytes > self.max_memory_bytes:
+                self.logger.warning(
+                    "Cache entry exceeds memory budget",
+                    key_prefix=key[:8],
+                    size_bytes=entry.size_bytes,
+                    max_memory_bytes=self.max_memory_bytes,
+                )
+                self._remove_entry(key)
+                return False
+
+            self._store_entry(key, entry)
+            self._expire_entries(entry.created_at)
+            self._evict_to_limits()
+
+            # Write-through to the persistent tier for durable levels. The
+            # value is encoded now, so later mutation by the caller cannot
+            # change what lands on disk; only the SQLite write leaves the loop
+            if self.l2_store is not None and cache_level in self.persistent_levels:
+                self._l2_generation += 1
+                try:
+                    value_json = encode_value(value)
+                except (TypeError, ValueError, RecursionError):
+                    # Not exactly round-trippable: stay L1-only and never
+                    # leave an older value on disk for this key
+                    await self._run_l2(self.l2_store.delete, key)
+                else:
+                    await self._run_l2(
+                        self.l2_store.set_encoded,
+                        key,
+                        value_json,
+                        cache_level.value,
+                        entry.created_at,
+                        ttl,
+                    )
 
             # Performance tracking using BaseManager config
             operation_time = (time.time() - start_time) * 1000
+            self.operation_latency.labels("set", cache_level.value).observe(
+                operation_time
+            )
             if operation_time > self.performance_threshold_ms:
                 self.logger.warning(
                     "Slow cache set operation",
@@ -435,6 +766,10 @@ class CacheManager(BaseManager):
         """
         Decorator-style cached function call
 
+        Concurrent misses on the same key share a single in-flight call
+        (single-flight). If the cache level has a stale-while-revalidate
+        window, an expired value is served while one background refresh runs.
+
         Usage:
             result = await cache_manager.cached_call(
                 expensive_function, arg1, arg2,
@@ -450,29 +785,96 @@ class CacheManager(BaseManager):
         if cached_result is not None:
             return cached_result
 
-        # Execute function and cache result
-        if asyncio.iscoroutinefunction(func):
-            result = await func(*args, **kwargs)
-        else:
-            result = func(*args, **kwargs)
+        # Serve stale value and refresh in the background
+        stale_entry = self.cache_storage.get(cache_key)
+        if stale_entry is not None and stale_entry.is_servable_stale():
+            self.stale_hits += 1
+            self._start_flight(cache_key, func, args, kwargs, cache_level, ttl_override)
+            return stale_entry.access()
+
+        # Join (or start) the in-flight call for this key; shield so one
+        # cancelled caller does not cancel the work other callers await
+        flight = self._start_flight(
+            cache_key, func, args, kwargs, cache_level, ttl_override
+        )
+        return await asyncio.shield(flight)
 
-        # Cache the result
-        await self.set(cache_key, result, cache_level, ttl_override)
+    def _start_flight(
+        self,
+        cache_key: str,
+        func,
+        args: tuple,
+        kwargs: Dict[str, Any],
+        cache_level: CacheLevel,
+        ttl_override: Optional[int],
+    ) -> "asyncio.Future[Any]":
+        """Return the in-flight task for a key, starting one if needed"""
+        flight = self._inflight.get(cache_key)
+        if flight is not None:
+            self.coalesced_calls += 1
+            return flight
+
+        flight = asyncio.ensure_future(
+            self._run_flight(cache_key, func, args, kwargs, cache_level, ttl_override)
+        )
+        flight.add_done_callback(self._on_flight_done)
+        self._inflight[cache_key] = flight
+        return flight
 
-        return result
+    async def _run_flight(
+        self,
+        cache_key: str,
+        func,
+        args: tuple,
+        kwargs: Dict[str, Any],
+        cache_level: CacheLevel,
+        ttl_override: Optional[int],
+    ) -> Any:
+        """Execute function and cache result, releasing the single-flight slot"""
+        try:
+            if asyncio.iscoroutinefunction(func):
+                result = await func(*args, **kwargs)
+            else:
+                result = func(*args, **kwargs)
+
+            # Cache the result
+            await self.set(cache_key, result, cache_level, ttl_override)
+            return result
+        finally:
+            self._inflight.pop(cache_key, None)
+
+    def _on_flight_done(self, flight: "asyncio.Future[Any]"):
+        """Log failed flights (also marks background refresh errors as retrieved)"""
+        if not flight.cancelled() and flight.exception() is not None:
+            self.logger.warning("Cached call failed", error=str(flight.exception()))
 
     async def invalidate_pattern(self, pattern: str):
-        """Invalidate all cache keys matching pattern"""
-        keys_to_remove = []
+        """
+        Invalidate all cache keys matching pattern
 
-        for key in self.cache_storage.keys():
-            if pattern in key:
-                keys_to_remove.append(key)
+        A pattern of the form "<namespace>:" drops that namespace through the
+        namespace index; any other pattern is matched as a substring.
+        """
+        namespace = namespace_of(pattern)
+        is_namespace = (
+            pattern.endswith(NAMESPACE_SEPARATOR) and namespace == pattern[:-1]
+        )
+        if is_namespace:
+            keys_to_remove = list(self._namespace_index.get(namespace, ()))
+        else:
+            keys_to_remove = [key for key in self.cache_storage if pattern in key]
 
         for key in keys_to_remove:
-            del self.cache_storage[key]
+            self._remove_entry(key)
             self.cache_evictions += 1
 
+        if self.l2_store is not None:
+            self._l2_generation += 1
+            if is_namespace:
+                await self._run_l2(self.l2_store.delete_prefix, pattern)
+            else:
+                await self._run_l2(self.l2_store.delete_matching, pattern)
+
         if keys_to_remove:
             self.logger.debug(
                 f"Invalidated {len(keys_to_remove)} cache entries matching pattern: {pattern}"
@@ -483,15 +885,8 @@ class CacheManager(BaseManager):
         total_requests = self.cache_hits + self.cache_misses
         hit_rate = (self.cache_hits / total_requests) if total_requests > 0 else 0
 
-        # Memory usage estimation
-        memory_estimate = 0
-        for entry in self.cache_storage.values():
-            try:
-                memory_estimate += (
-                    len(str(entry.value).encode()) + 200
-                )  # Entry overhead
-            except:
-                memory_estimate += 1000  # Conservative estimate for complex objects
+        # Memory usage from per-entry size accounting
+        memory_estimate = self.memory_usage_bytes
 
         # Combine cache-specific stats with BaseManager metrics
         base_stats = self.get_metrics()
@@ -502,6 +897,12 @@ class CacheManager(BaseManager):
             "cache_misses": self.cache_misses,
             "cache_hit_rate": hit_rate,
             "cache_evictions": self.cache_evictions,
+            "coalesced_calls": self.coalesced_calls,
+            "stale_hits": self.stale_hits,
+            "inflight_calls": len(self._inflight),
+            "l2_enabled": self.l2_store is not None,
+            "l2_hits": self.l2_hits,
+            "l2_entries": self.l2_store.count() if self.l2_store is not None else 0,
             "memory_usage_bytes": memory_estimate,
             "memory_usage_mb": memory_estimate / (1024 * 1024),
             "max_memory_mb": self.max_memory_bytes / (1024 * 1024),
@@ -519,8 +920,34 @@ class CacheManager(BaseManager):
         # Merge BaseManager metrics with cache-specific metrics
         return {**base_stats, **cache_specific_stats}
 
-    async def warm_cache(self, warm_data: Dict[str, Any]):
-        """Pre-populate cache with frequently accessed data"""
+    async def invalidate_namespace(self, namespace: str):
+        """Invalidate every key generated for a namespace"""
+        await self.invalidate_pattern(f"{namespace}{NAMESPACE_SEPARATOR}")
+
+    async def warm_cache(self, warm_data: Optional[Dict[str, Any]] = None):
+        """
+        Pre-populate cache with frequently accessed data
+
+        Unexpired entries of the persistent levels are loaded from the L2
+        tier first, then any explicit warm_data is applied on top.
+        """
+        if self.l2_store is not None:
+            promoted = 0
+            records = await self._run_l2(
+                self.l2_store.load_levels,
+                [level.value for level in self.persistent_levels],
+            )
+            for record in records:
+                if record.key in self.cache_storage:
+                    continue
+                entry = self._entry_from_record(record, CacheLevel(record.cache_level))
+                if entry.size_bytes <= self.max_memory_bytes:
+                    self._store_entry(record.key, entry)
+                    self._evict_to_limits()
+                    promoted += 1
+            self.logger.info(f"Cache warmed with {promoted} entries from L2")
+
+        warm_data = warm_data or {}
         for key, data in warm_data.items():
             cache_level = data.get("cache_level", CacheLevel.CONTEXT_ANALYSIS)
             value = data.get("value")
@@ -540,6 +967,17 @@ class CacheManager(BaseManager):
                 pass
 
         self.cache_storage.clear()
+        self._expiry_heap.clear()
+        self._namespace_index.clear()
+        self.memory_usage_bytes = 0
+
+        # L2 contents are kept on disk for the next process
+        if self.l2_store is not None:
+            await self._run_l2(self.l2_store.close)
+            self._l2_executor.shutdown(wait=False)
+            self.l2_store = None
+            self._l2_executor = None
+
         self.logger.info("Cache cleaned up")
 
     # 🚀 ENHANCEMENT: MCP-specific intelligent caching methods
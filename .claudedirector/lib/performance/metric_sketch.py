@@ -0,0 +1,272 @@
+"""
+Streaming Metric Sketches for Performance Monitoring
+
+Fixed-memory, mergeable histograms behind PerformanceMonitor percentiles.
+
+StreamingHistogram is an HDR-style log-bucketed histogram: a value v > 0
+lands in bucket ceil(log_gamma(v)) with gamma = (1 + a) / (1 - a), so every
+quantile it reports is within relative accuracy a of a true sample value.
+Count, sum, min and max are tracked exactly. Histograms with the same
+accuracy merge by adding bucket counts, so label sets and time slices can
+be combined after the fact.
+
+RollingHistogram keeps a ring of per-slice histograms covering a retention
+window. A window query merges only the slices it overlaps; windows are
+rounded out to whole slices, so a query may include up to one slice of
+slightly older points.
+
+Author: Martin | Platform Architecture
+"""
+
+import math
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, Iterable, Iterator, Optional, Tuple
+
+DEFAULT_RELATIVE_ACCURACY = 0.01
+DEFAULT_MAX_BUCKETS = 2048
+
+# Magnitudes below this are counted in the zero bucket
+MIN_INDEXABLE_VALUE = 1e-9
+
+
+class StreamingHistogram:
+    """
+    Mergeable log-bucketed histogram with bounded relative error
+
+    Memory is bounded by max_buckets per sign: when a store outgrows it, its
+    smallest-magnitude buckets are folded together, trading accuracy at the
+    low end (rarely queried for latencies) for a hard size limit.
+    """
+
+    def __init__(
+        self,
+        relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+        max_buckets: int = DEFAULT_MAX_BUCKETS,
+    ):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        if max_buckets < 1:
+            raise ValueError("max_buckets must be positive")
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+
+        self._positive: Dict[int, int] = {}
+        self._negative: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.sum / self.count if self.count else None
+
+    @property
+    def bucket_count(self) -> int:
+        """Number of populated buckets (the sketch's memory footprint)"""
+        return len(self._positive) + len(self._negative) + (1 if self.zero_count else 0)
+
+    def add(self, value: float, count: int = 1):
+        """Record value count times; NaN and infinities are ignored"""
+        if not math.isfinite(value):
+            return
+        if value > MIN_INDEXABLE_VALUE:
+            store = self._positive
+            key = self._key(value)
+        elif value < -MIN_INDEXABLE_VALUE:
+            store = self._negative
+            key = self._key(-value)
+        else:
+            store = None
+            self.zero_count += count
+
+        if store is not None:
+            store[key] = store.get(key, 0) + count
+            if len(store) > self.max_buckets:
+                self._collapse(store)
+
+        self.count += count
+        self.sum += value * count
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other: "StreamingHistogram"):
+        """Add other's observations into this histogram"""
+        if other._gamma != self._gamma:
+            raise ValueError("Cannot merge histograms with different accuracy")
+        if not other.count:
+            return
+        for store, other_store in (
+            (self._positive, other._positive),
+            (self._negative, other._negative),
+        ):
+            for key, bucket_count in other_store.items():
+                store[key] = store.get(key, 0) + bucket_count
+            if len(store) > self.max_buckets:
+                self._collapse(store)
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def copy(self) -> "StreamingHistogram":
+        clone = StreamingHistogram(self.relative_accuracy, self.max_buckets)
+        clone.merge(self)
+        return clone
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Value at fraction q (0-1) of the distribution, None when empty"""
+        return self.quantiles([q]).get(q)
+
+    def quantiles(self, qs: Iterable[float]) -> Dict[float, float]:
+        """
+        Several quantiles in one pass over the buckets
+
+        Uses the same rank as indexing a sorted list at int(count * q),
+        so results match the exact calculation within relative_accuracy.
+        The lowest and highest ranks return the exact min and max.
+        """
+        if not self.count:
+            return {}
+        last = self.count - 1
+        results: Dict[float, float] = {}
+        ranks = []
+        for q in qs:
+            rank = min(int(self.count * q), last)
+            if rank == 0 or rank == last:
+                results[q] = self.min if rank == 0 else self.max
+            else:
+                ranks.append((rank, q))
+        ranks.sort()
+        position = 0
+        cumulative = 0
+        for value, bucket_count in self._ordered_buckets():
+            cumulative += bucket_count
+            while position < len(ranks) and ranks[position][0] < cumulative:
+                clamped = min(max(value, self.min), self.max)
+                results[ranks[position][1]] = clamped
+                position += 1
+            if position == len(ranks):
+                break
+        return results
+
+    def _key(self, magnitude: float) -> int:
+        return math.ceil(math.log(magnitude) / self._log_gamma)
+
+    def _value(self, key: int) -> float:
+        # Midpoint (in relative terms) of (gamma^(key-1), gamma^key]
+        return 2 * self._gamma**key / (self._gamma + 1)
+
+    def _ordered_buckets(self) -> Iterator[Tuple[float, int]]:
+        for key in sorted(self._negative, reverse=True):
+            yield -self._value(key), self._negative[key]
+        if self.zero_count:
+            yield 0.0, self.zero_count
+        for key in sorted(self._positive):
+            yield self._value(key), self._positive[key]
+
+    def _collapse(self, store: Dict[int, int]):
+        keys = sorted(store)
+        excess = len(keys) - self.max_buckets
+        folded = sum(store.pop(key) for key in keys[:excess])
+        store[keys[excess]] += folded
+
+
+class RollingHistogram:
+    """
+    Time-sliced StreamingHistogram over a rolling retention window
+
+    Memory is bounded by window_seconds / slice_seconds histograms, each of
+    at most max_buckets buckets, regardless of how many points are added.
+    """
+
+    def __init__(
+        self,
+        window_seconds: float = 3600,
+        slice_seconds: float = 10,
+        relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+        max_buckets: int = DEFAULT_MAX_BUCKETS,
+    ):
+        if slice_seconds <= 0 or window_seconds < slice_seconds:
+            raise ValueError("window_seconds must be at least one positive slice")
+        self.window_seconds = window_seconds
+        self.slice_seconds = slice_seconds
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self.max_slices = math.ceil(window_seconds / slice_seconds)
+
+        self._slices: Deque[Tuple[int, StreamingHistogram]] = deque()
+        self._lock = threading.Lock()
+
+    def add(self, value: float, timestamp: Optional[float] = None):
+        """Record value in the slice covering timestamp (default: now)"""
+        slice_id = self._slice_id(time.time() if timestamp is None else timestamp)
+        with self._lock:
+            self._histogram_for(slice_id).add(value)
+
+    def snapshot(
+        self, window_seconds: Optional[float] = None, now: Optional[float] = None
+    ) -> StreamingHistogram:
+        """Merged histogram of the slices overlapping the last window_seconds"""
+        now = time.time() if now is None else now
+        window = self.window_seconds if window_seconds is None else window_seconds
+        first_slice = self._slice_id(now - min(window, self.window_seconds))
+        merged = StreamingHistogram(self.relative_accuracy, self.max_buckets)
+        with self._lock:
+            self._expire(self._slice_id(now))
+            for slice_id, histogram in reversed(self._slices):
+                if slice_id < first_slice:
+                    break
+                merged.merge(histogram)
+        return merged
+
+    def expire(self, now: Optional[float] = None):
+        """Drop slices that have aged out of the retention window"""
+        with self._lock:
+            self._expire(self._slice_id(time.time() if now is None else now))
+
+    def __len__(self) -> int:
+        """Number of live time slices"""
+        return len(self._slices)
+
+    def _slice_id(self, timestamp: float) -> int:
+        return int(timestamp // self.slice_seconds)
+
+    def _histogram_for(self, slice_id: int) -> StreamingHistogram:
+        if self._slices and self._slices[-1][0] >= slice_id:
+            # Current or (clock skew / late point) an earlier slice
+            for existing_id, histogram in reversed(self._slices):
+                if existing_id <= slice_id:
+                    return histogram
+            return self._slices[0][1]
+
+        histogram = StreamingHistogram(self.relative_accuracy, self.max_buckets)
+        self._slices.append((slice_id, histogram))
+        self._expire(slice_id)
+        return histogram
+
+    def _expire(self, current_slice: int):
+        oldest = current_slice - self.max_slices
+        while self._slices and self._slices[0][0] <= oldest:
+            self._slices.popleft()
+
+
+def merge_histograms(
+    histograms: Iterable[StreamingHistogram],
+) -> Optional[StreamingHistogram]:
+    """Merge histograms into a new one; None when there are none"""
+    merged: Optional[StreamingHistogram] = None
+    for histogram in histograms:
+        if merged is None:
+            merged = histogram.copy()
+        else:
+            merged.merge(histogram)
+    return merged
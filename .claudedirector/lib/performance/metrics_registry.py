@@ -0,0 +1,423 @@
+"""
+Metrics Registry with Prometheus Exposition
+
+Label-keyed counters, gauges and histograms shared by the performance
+components (PerformanceMonitor, CacheManager, persona and MCP layers).
+
+Recording is built for the hot path:
+- every labelled series is resolved once and can be cached by the caller
+- counters and histograms record into a per-thread shard, so concurrent
+  threads never contend on a lock or lose updates; a scrape sums the shards,
+  and a thread's shard is folded into a retired total when the thread exits
+- gauges hold a single value (last write wins)
+
+Exposition renders the Prometheus text format (histograms with cumulative
+_bucket, _sum and _count lines). Label strings and bucket prefixes are
+formatted once per series, and the rendered text is cached until something
+is recorded again, so back-to-back scrapes cost a string copy.
+
+Author: Martin | Platform Architecture
+"""
+
+import bisect
+import math
+import re
+import threading
+import weakref
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# Latency buckets for request-level timings, in milliseconds
+DEFAULT_LATENCY_BUCKETS_MS = (
+    1,
+    2.5,
+    5,
+    10,
+    25,
+    50,
+    100,
+    250,
+    500,
+    1000,
+    2500,
+    5000,
+    10000,
+)
+
+_METRIC_NAME = re.compile(r"^[a-zA-Z_:][a-zA-Z0-9_:]*$")
+_LABEL_NAME = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
+_INVALID_NAME_CHARS = re.compile(r"[^a-zA-Z0-9_:]")
+
+
+def sanitize_metric_name(name: str) -> str:
+    """Map an arbitrary name (e.g. "module.func") onto a valid metric name"""
+    sanitized = _INVALID_NAME_CHARS.sub("_", name)
+    return sanitized if _METRIC_NAME.match(sanitized) else f"_{sanitized}"
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if value == -math.inf:
+        return "-Inf"
+    if value != value:
+        return "NaN"
+    if float(value).is_integer() and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _label_string(pairs: Sequence[Tuple[str, str]]) -> str:
+    return ",".join(f'{name}="{_escape_label_value(value)}"' for name, value in pairs)
+
+
+class _ShardHolder:
+    """Thread-local owner of a shard; collected when its thread exits"""
+
+    __slots__ = ("shard", "__weakref__")
+
+    def __init__(self, shard: List[float]):
+        self.shard = shard
+
+
+class _ShardedSeries:
+    """
+    Series whose state lives in one list per live recording thread
+
+    When a thread exits, its thread-local holder is collected and the shard
+    is folded into _retired, so shards track live threads rather than every
+    thread that ever recorded.
+    """
+
+    shard_size = 1
+
+    def __init__(self, family: "MetricFamily", label_values: Tuple[str, ...]):
+        self._registry = family.registry
+        self.label_values = label_values
+        self.label_string = _label_string(tuple(zip(family.labelnames, label_values)))
+        self._local = threading.local()
+        self._shards: List[List[float]] = []
+        self._retired = [0.0] * self.shard_size
+        # Reentrant: a retiring thread's finalizer may run during a scrape
+        self._shards_lock = threading.RLock()
+
+    def _shard(self) -> List[float]:
+        try:
+            return self._local.holder.shard
+        except AttributeError:
+            shard = [0.0] * self.shard_size
+            holder = _ShardHolder(shard)
+            with self._shards_lock:
+                self._shards.append(shard)
+            weakref.finalize(holder, self._retire, shard)
+            self._local.holder = holder
+            return shard
+
+    def _retire(self, shard: List[float]) -> None:
+        """Fold an exited thread's shard into the retired totals"""
+        with self._shards_lock:
+            for index, value in enumerate(shard):
+                self._retired[index] += value
+            self._shards = [s for s in self._shards if s is not shard]
+
+    def _totals(self) -> List[float]:
+        with self._shards_lock:
+            shards = list(self._shards)
+            totals = list(self._retired)
+        for shard in shards:
+            for index, value in enumerate(shard):
+                totals[index] += value
+        return totals
+
+
+class Counter(_ShardedSeries):
+    """Monotonically increasing count"""
+
+    def inc(self, amount: float = 1) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        self._shard()[0] += amount
+        self._registry._dirty = True
+
+    @property
+    def value(self) -> float:
+        return self._totals()[0]
+
+    def _samples(self, name: str) -> List[str]:
+        labels = f"{{{self.label_string}}}" if self.label_string else ""
+        return [f"{name}{labels} {_format_value(self.value)}"]
+
+
+class Histogram(_ShardedSeries):
+    """
+    Bucketed distribution of observations
+
+    Shard layout: one count per bucket (the last is +Inf), then the sum.
+    Non-finite observations are ignored.
+    """
+
+    def __init__(self, family: "MetricFamily", label_values: Tuple[str, ...]):
+        self.upper_bounds = family.buckets
+        self.shard_size = len(self.upper_bounds) + 2
+        super().__init__(family, label_values)
+        prefix = f"{self.label_string}," if self.label_string else ""
+        self._bucket_labels = [
+            f'{{{prefix}le="{_format_value(bound)}"}}' for bound in self.upper_bounds
+        ] + [f'{{{prefix}le="+Inf"}}']
+
+    def observe(self, value: float) -> None:
+        if not math.isfinite(value):
+            return
+        shard = self._shard()
+        shard[bisect.bisect_left(self.upper_bounds, value)] += 1
+        shard[-1] += value
+        self._registry._dirty = True
+
+    @property
+    def count(self) -> float:
+        return sum(self._totals()[:-1])
+
+    @property
+    def sum(self) -> float:
+        return self._totals()[-1]
+
+    def bucket_counts(self) -> List[Tuple[float, float]]:
+        """Cumulative (upper bound, count) pairs ending with +Inf"""
+        totals = self._totals()
+        cumulative = 0.0
+        buckets = []
+        for bound, bucket_count in zip(self.upper_bounds + (math.inf,), totals):
+            cumulative += bucket_count
+            buckets.append((bound, cumulative))
+        return buckets
+
+    def _samples(self, name: str) -> List[str]:
+        totals = self._totals()
+        lines = []
+        cumulative = 0.0
+        for bucket_label, bucket_count in zip(self._bucket_labels, totals):
+            cumulative += bucket_count
+            lines.append(f"{name}_bucket{bucket_label} {_format_value(cumulative)}")
+        labels = f"{{{self.label_string}}}" if self.label_string else ""
+        lines.append(f"{name}_sum{labels} {_format_value(totals[-1])}")
+        lines.append(f"{name}_count{labels} {_format_value(cumulative)}")
+        return lines
+
+
+class Gauge:
+    """Value that can go up and down; set() is last-write-wins"""
+
+    def __init__(self, family: "MetricFamily", label_values: Tuple[str, ...]):
+        self._registry = family.registry
+        self.label_values = label_values
+        self.label_string = _label_string(tuple(zip(family.labelnames, label_values)))
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def set(self, value: float) -> None:
+        self.value = value
+        self._registry._dirty = True
+
+    def inc(self, amount: float = 1) -> None:
+        with self._lock:
+            self.value += amount
+        self._registry._dirty = True
+
+    def dec(self, amount: float = 1) -> None:
+        self.inc(-amount)
+
+    def _samples(self, name: str) -> List[str]:
+        labels = f"{{{self.label_string}}}" if self.label_string else ""
+        return [f"{name}{labels} {_format_value(self.value)}"]
+
+
+_SERIES_TYPES = {"counter": Counter, "gauge": Gauge, "histogram": Histogram}
+
+
+class MetricFamily:
+    """A named metric and its series, one per combination of label values"""
+
+    def __init__(
+        self,
+        registry: "MetricsRegistry",
+        name: str,
+        documentation: str,
+        metric_type: str,
+        labelnames: Sequence[str] = (),
+        buckets: Optional[Sequence[float]] = None,
+    ):
+        if not _METRIC_NAME.match(name):
+            raise ValueError(f"Invalid metric name: {name}")
+        for label in labelnames:
+            if not _LABEL_NAME.match(label) or label.startswith("__"):
+                raise ValueError(f"Invalid label name for {name}: {label}")
+        if metric_type == "histogram":
+            if "le" in labelnames:
+                raise ValueError(f"Histogram {name} cannot use the label 'le'")
+            # +Inf is implicit; it is always rendered as the last bucket
+            bounds = tuple(sorted(float(b) for b in buckets or () if b != math.inf))
+            if not bounds:
+                raise ValueError(f"Histogram {name} needs at least one bucket")
+            self.buckets: Optional[Tuple[float, ...]] = bounds
+        else:
+            self.buckets = None
+
+        self.registry = registry
+        self.name = name
+        self.documentation = documentation
+        self.metric_type = metric_type
+        self.labelnames = tuple(labelnames)
+        self._series: Dict[Tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values, **labels):
+        """Series for the given label values (positional or by name)"""
+        if labels:
+            if values:
+                raise ValueError("Pass label values positionally or by name")
+            try:
+                values = tuple(str(labels[name]) for name in self.labelnames)
+            except KeyError as e:
+                raise ValueError(f"Missing label {e} for {self.name}") from None
+            if len(labels) != len(self.labelnames):
+                raise ValueError(f"Unexpected labels for {self.name}: {labels}")
+        else:
+            values = tuple(str(value) for value in values)
+            if len(values) != len(self.labelnames):
+                raise ValueError(
+                    f"{self.name} expects labels {list(self.labelnames)}, "
+                    f"got {len(values)} values"
+                )
+
+        series = self._series.get(values)
+        if series is None:
+            with self._lock:
+                series = self._series.get(values)
+                if series is None:
+                    series = _SERIES_TYPES[self.metric_type](self, values)
+                    self._series[values] = series
+                    self.registry._dirty = True
+        return series
+
+    # Unlabelled families record through their single series
+    def inc(self, amount: float = 1) -> None:
+        self.labels().inc(amount)
+
+    def set(self, value: float) -> None:
+        self.labels().set(value)
+
+    def observe(self, value: float) -> None:
+        self.labels().observe(value)
+
+    def _render(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.metric_type}",
+        ]
+        for series in list(self._series.values()):
+            lines.extend(series._samples(self.name))
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Collection of metric families with a cached text exposition
+
+    Family constructors are get-or-create: asking again for an existing name
+    returns the same family, and a request that disagrees on type, labels or
+    buckets raises ValueError.
+    """
+
+    def __init__(self):
+        self._families: Dict[str, MetricFamily] = {}
+        self._lock = threading.Lock()
+        self._dirty = True
+        self._rendered = ""
+
+    def counter(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> MetricFamily:
+        return self._get_or_create(name, documentation, "counter", labelnames)
+
+    def gauge(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> MetricFamily:
+        return self._get_or_create(name, documentation, "gauge", labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS_MS,
+    ) -> MetricFamily:
+        return self._get_or_create(
+            name, documentation, "histogram", labelnames, buckets
+        )
+
+    def get(self, name: str) -> Optional[MetricFamily]:
+        return self._families.get(name)
+
+    def render(self) -> str:
+        """Prometheus text exposition of every family"""
+        if not self._dirty:
+            return self._rendered
+        # Clear first: a write racing with rendering marks the cache dirty again
+        self._dirty = False
+        lines = []
+        for family in list(self._families.values()):
+            lines.extend(family._render())
+        self._rendered = "\n".join(lines) + "\n" if lines else ""
+        return self._rendered
+
+    def _get_or_create(
+        self,
+        name: str,
+        documentation: str,
+        metric_type: str,
+        labelnames: Sequence[str],
+        buckets: Optional[Sequence[float]] = None,
+    ) -> MetricFamily:
+        family = self._families.get(name)
+        if family is None:
+            with self._lock:
+                family = self._families.get(name)
+                if family is None:
+                    family = MetricFamily(
+                        self, name, documentation, metric_type, labelnames, buckets
+                    )
+                    self._families[name] = family
+                    self._dirty = True
+                    return family
+
+        requested = MetricFamily(
+            self, name, documentation, metric_type, labelnames, buckets
+        )
+        if (
+            family.metric_type != requested.metric_type
+            or family.labelnames != requested.labelnames
+            or family.buckets != requested.buckets
+        ):
+            raise ValueError(
+                f"Metric {name} already registered as {family.metric_type} "
+                f"with labels {list(family.labelnames)}"
+            )
+        return family
+
+
+# Process-wide registry
+_metrics_registry: Optional[MetricsRegistry] = None
+_metrics_registry_lock = threading.Lock()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """Get the process-wide metrics registry"""
+    global _metrics_registry
+    if _metrics_registry is None:
+        with _metrics_registry_lock:
+            if _metrics_registry is None:
+                _metrics_registry = MetricsRegistry()
+    return _metrics_registry
@@ -8,7 +8,7 @@ Refactored to inherit from BaseManager for DRY compliance.
 import time
 import asyncio
 import json
-from typing import Dict, Any, List, Optional, Callable
+from typing import Dict, Any, List, Optional, Callable, Sequence, Tuple
 from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
 from collections import defaultdict, deque
@@ -26,6 +26,32 @@ except ImportError:
     from core.base_manager import BaseManager, BaseManagerConfig, ManagerType
     from core.manager_factory import register_manager_type
 
+try:
+    from .metric_sketch import RollingHistogram, StreamingHistogram
+    from .metrics_registry import (
+        MetricsRegistry,
+        get_metrics_registry,
+        sanitize_metric_name,
+    )
+except ImportError:
+    from performance.metric_sketch import RollingHistogram, StreamingHistogram
+    from performance.metrics_registry import (
+        MetricsRegistry,
+        get_metrics_registry,
+        sanitize_metric_name,
+    )
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+METRIC_PREFIX = "claudedirector_"
+
+# Latency metrics exported as Prometheus histograms without an explicit
+# record_metric(histogram=True); every other metric is exported as a gauge
+DEFAULT_HISTOGRAM_METRICS = frozenset({"response_time_ms", "gc_time_ms"})
+
+# Sentinel for label sets that could not be exported (conflicting labels)
+_NOT_EXPORTED = object()
+
 
 @dataclass
 class PerformanceAlert:
@@ -63,6 +89,11 @@ class PerformanceMonitor(BaseManager):
     - Health check endpoints
     - <5 minute issue detection
 
+    Prometheus series live in the process-wide metrics registry unless a
+    registry is passed in, so monitors sharing it add into the same counter
+    and histogram series; give a monitor its own MetricsRegistry to keep
+    its exposition separate.
+
     Refactored to inherit from BaseManager for DRY compliance.
     Eliminates duplicate logging, metrics, and configuration patterns.
     """
@@ -74,6 +105,7 @@ class PerformanceMonitor(BaseManager):
         alert_cooldown_seconds: int = 300,
         cache: Optional[Dict[str, Any]] = None,
         metrics: Optional[Dict[str, Any]] = None,
+        registry: Optional[MetricsRegistry] = None,
         **kwargs,
     ):
         if config is None:
@@ -103,6 +135,18 @@ class PerformanceMonitor(BaseManager):
         # Metrics storage (time-series data) - renamed to avoid conflict with BaseManager.metrics
         self.metric_storage: Dict[str, deque] = defaultdict(lambda: deque(maxlen=10000))
 
+        # Streaming histograms per metric and label set: averages and
+        # percentiles are answered from these in O(buckets), not by scanning
+        self.sketch_window_seconds = self.config.custom_config.get(
+            "sketch_window_seconds", 3600
+        )
+        self.sketch_slice_seconds = self.config.custom_config.get(
+            "sketch_slice_seconds", 10
+        )
+        self.metric_sketches: Dict[str, Dict[LabelKey, RollingHistogram]] = defaultdict(
+            dict
+        )
+
         # Performance thresholds
         self.thresholds = {
             "response_time_ms": {"warning": 400, "critical": 800},
@@ -128,6 +172,19 @@ class PerformanceMonitor(BaseManager):
             "gc_collections": 0,
         }
 
+        # Prometheus exposition: label-keyed series in a (by default
+        # process-wide, shared with other monitors) registry, resolved once
+        # per metric and label set
+        self.registry = registry or get_metrics_registry()
+        self.histogram_metrics = set(
+            self.config.custom_config.get(
+                "histogram_metrics", DEFAULT_HISTOGRAM_METRICS
+            )
+        )
+        self._exported_series: Dict[Tuple[str, str, LabelKey], Any] = {}
+        for counter_name in self.counters:
+            self._export_series("counter", counter_name, ())
+
         # System health status
         self.health_status = "healthy"  # healthy, degraded, critical
 
@@ -228,11 +285,15 @@ class PerformanceMonitor(BaseManager):
 
                 cutoff_time = time.time() - (self.retention_hours * 3600)
 
-                for metric_name, points in self.metrics.items():
+                for metric_name, points in list(self.metric_storage.items()):
                     # Remove old points
                     while points and points[0].timestamp < cutoff_time:
                         points.popleft()
 
+                for sketches in list(self.metric_sketches.values()):
+                    for sketch in list(sketches.values()):
+                        sketch.expire()
+
                 # Cleanup old alerts
                 self.alert_history = [
                     alert
@@ -299,8 +360,15 @@ class PerformanceMonitor(BaseManager):
         value: float,
         labels: Optional[Dict[str, str]] = None,
         unit: str = "ms",
+        histogram: Optional[bool] = None,
     ):
-        """Record a metric data point"""
+        """
+        Record a metric data point
+
+        histogram=True exports the metric as a latency histogram (and
+        registers it as one for later calls); by default only metrics in
+        histogram_metrics are histograms and everything else is a gauge.
+        """
         if labels is None:
             labels = {}
 
@@ -310,13 +378,80 @@ class PerformanceMonitor(BaseManager):
 
         self.metric_storage[name].append(metric_point)
 
+        label_key = tuple(sorted(labels.items()))
+        sketches = self.metric_sketches[name]
+        sketch = sketches.get(label_key)
+        if sketch is None:
+            sketch = sketches.setdefault(
+                label_key,
+                RollingHistogram(
+                    window_seconds=self.sketch_window_seconds,
+                    slice_seconds=self.sketch_slice_seconds,
+                ),
+            )
+        sketch.add(value, metric_point.timestamp)
+
+        if histogram:
+            self.histogram_metrics.add(name)
+        elif histogram is None:
+            histogram = name in self.histogram_metrics
+        kind = "histogram" if histogram else "gauge"
+        series = self._exported_series.get((kind, name, label_key))
+        if series is None:
+            series = self._export_series(kind, name, label_key)
+        if series is not _NOT_EXPORTED:
+            if kind == "histogram":
+                series.observe(value)
+            else:
+                series.set(value)
+
         # Check for alerts
         self._check_metric_thresholds(name, value)
 
-    def increment_counter(self, counter_name: str, amount: int = 1):
+    def increment_counter(
+        self,
+        counter_name: str,
+        amount: int = 1,
+        labels: Optional[Dict[str, str]] = None,
+    ):
         """Increment a performance counter"""
         self.counters[counter_name] = self.counters.get(counter_name, 0) + amount
 
+        label_key = tuple(sorted(labels.items())) if labels else ()
+        series = self._exported_series.get(("counter", counter_name, label_key))
+        if series is None:
+            series = self._export_series("counter", counter_name, label_key)
+        if series is not _NOT_EXPORTED:
+            series.inc(amount)
+
+    def _export_series(self, kind: str, name: str, label_key: LabelKey) -> Any:
+        """
+        Resolve and cache the registry series for a metric and label set
+
+        Opted-in latencies become histograms, other metrics gauges. A
+        Prometheus family has one fixed set of label names, so a label set
+        that conflicts with an earlier one is kept out of the exposition
+        (it is still recorded for percentiles and averages).
+        """
+        family_name = METRIC_PREFIX + sanitize_metric_name(name)
+        labelnames = [label for label, _ in label_key]
+        try:
+            if kind == "histogram":
+                family = self.registry.histogram(
+                    family_name, f"{name} in milliseconds", labelnames
+                )
+            elif kind == "gauge":
+                family = self.registry.gauge(family_name, f"Current {name}", labelnames)
+            else:
+                family = self.registry.counter(family_name, "Total count", labelnames)
+            series = family.labels(*(value for _, value in label_key))
+        except ValueError as e:
+            self.logger.warning(f"Metric {name} not exported: {e}")
+            series = _NOT_EXPORTED
+
+        self._exported_series[(kind, name, label_key)] = series
+        return series
+
     def _check_metric_thresholds(self, metric_name: str, value: float):
         """Check if metric exceeds thresholds and trigger alerts"""
         if metric_name not in self.thresholds:
@@ -386,43 +521,71 @@ class PerformanceMonitor(BaseManager):
             return self.metric_storage[metric_name][-1].value
         return None
 
-    def get_average_metric(
-        self, metric_name: str, window_seconds: int = 300
-    ) -> Optional[float]:
-        """Get average metric value over time window"""
-        if metric_name not in self.metric_storage:
+    def get_metric_histogram(
+        self,
+        metric_name: str,
+        window_seconds: int = 300,
+        labels: Optional[Dict[str, str]] = None,
+    ) -> Optional[StreamingHistogram]:
+        """
+        Merged histogram of a metric over a time window
+
+        With labels, only label sets containing all of the given pairs are
+        merged; without, every label set of the metric is. Windows longer
+        than sketch_window_seconds are capped to it.
+        """
+        sketches = self.metric_sketches.get(metric_name)
+        if not sketches:
             return None
 
-        cutoff_time = time.time() - window_seconds
-        recent_points = [
-            point.value
-            for point in self.metric_storage[metric_name]
-            if point.timestamp >= cutoff_time
-        ]
+        wanted = set(labels.items()) if labels else None
+        now = time.time()
+        merged = None
+        for label_key, sketch in list(sketches.items()):
+            if wanted and not wanted.issubset(label_key):
+                continue
+            snapshot = sketch.snapshot(window_seconds, now)
+            if merged is None:
+                merged = snapshot
+            else:
+                merged.merge(snapshot)
 
-        if recent_points:
-            return sum(recent_points) / len(recent_points)
-        return None
+        if merged is None or not merged.count:
+            return None
+        return merged
+
+    def get_average_metric(
+        self,
+        metric_name: str,
+        window_seconds: int = 300,
+        labels: Optional[Dict[str, str]] = None,
+    ) -> Optional[float]:
+        """Get average metric value over time window"""
+        histogram = self.get_metric_histogram(metric_name, window_seconds, labels)
+        return histogram.mean if histogram else None
 
     def get_metric_percentile(
-        self, metric_name: str, percentile: float, window_seconds: int = 300
+        self,
+        metric_name: str,
+        percentile: float,
+        window_seconds: int = 300,
+        labels: Optional[Dict[str, str]] = None,
     ) -> Optional[float]:
-        """Get percentile value for a metric over time window"""
-        if metric_name not in self.metric_storage:
-            return None
+        """Get percentile value (0-1) for a metric over time window"""
+        return self.get_metric_percentiles(
+            metric_name, [percentile], window_seconds, labels
+        ).get(percentile)
 
-        cutoff_time = time.time() - window_seconds
-        recent_values = [
-            point.value
-            for point in self.metric_storage[metric_name]
-            if point.timestamp >= cutoff_time
-        ]
-
-        if recent_values:
-            sorted_values = sorted(recent_values)
-            index = int(len(sorted_values) * percentile)
-            return sorted_values[min(index, len(sorted_values) - 1)]
-        return None
+    def get_metric_percentiles(
+        self,
+        metric_name: str,
+        percentiles: Sequence[float] = (0.5, 0.95, 0.99),
+        window_seconds: int = 300,
+        labels: Optional[Dict[str, str]] = None,
+    ) -> Dict[float, float]:
+        """Get several percentiles (0-1) from one merged histogram"""
+        histogram = self.get_metric_histogram(metric_name, window_seconds, labels)
+        return histogram.quantiles(percentiles) if histogram else {}
 
     def calculate_error_rate(self, window_seconds: int = 300) -> float:
         """Calculate error rate over time window"""
@@ -436,39 +599,19 @@ class PerformanceMonitor(BaseManager):
 
     def get_prometheus_metrics(self) -> str:
         """Generate Prometheus-compatible metrics format"""
-        lines = []
-
-        # Add help and type information
-        lines.append(
-            "# HELP claudedirector_response_time_ms Response time in milliseconds"
-        )
-        lines.append("# TYPE claudedirector_response_time_ms histogram")
-
-        # Add counter metrics
-        for counter_name, value in self.counters.items():
-            lines.append(f"# HELP claudedirector_{counter_name} Total count")
-            lines.append(f"# TYPE claudedirector_{counter_name} counter")
-            lines.append(f"claudedirector_{counter_name} {value}")
-
-        # Add gauge metrics
-        for metric_name in ["response_time_ms", "memory_usage_mb", "cache_hit_rate"]:
-            latest_value = self.get_latest_metric(metric_name)
-            if latest_value is not None:
-                lines.append(
-                    f"# HELP claudedirector_{metric_name} Current {metric_name}"
-                )
-                lines.append(f"# TYPE claudedirector_{metric_name} gauge")
-                lines.append(f"claudedirector_{metric_name} {latest_value}")
+        # Counters, gauges and histograms (cached between recordings)
+        lines = [self.registry.render().rstrip("\n")]
 
-        # Add percentile metrics
+        # Sliding-window percentiles from the streaming sketches
         for metric_name in ["response_time_ms"]:
-            for percentile in [0.5, 0.95, 0.99]:
-                value = self.get_metric_percentile(metric_name, percentile)
-                if value is not None:
-                    p_label = str(int(percentile * 100))
-                    lines.append(f"claudedirector_{metric_name}_p{p_label} {value}")
+            percentiles = self.get_metric_percentiles(metric_name, [0.5, 0.95, 0.99])
+            for percentile, value in percentiles.items():
+                p_name = f"{METRIC_PREFIX}{metric_name}_p{int(percentile * 100)}"
+                lines.append(f"# HELP {p_name} {metric_name} percentile over 5m")
+                lines.append(f"# TYPE {p_name} gauge")
+                lines.append(f"{p_name} {value}")
 
-        return "\n".join(lines) + "\n"
+        return "\n".join(line for line in lines if line) + "\n"
 
     def get_health_check(self) -> Dict[str, Any]:
         """Get health check status for load balancers"""
@@ -483,9 +626,11 @@ class PerformanceMonitor(BaseManager):
     def get_performance_dashboard(self) -> Dict[str, Any]:
         """Get comprehensive performance dashboard data"""
         # Calculate key metrics
-        avg_response_time = self.get_average_metric("response_time_ms", 300)
-        p95_response_time = self.get_metric_percentile("response_time_ms", 0.95, 300)
-        p99_response_time = self.get_metric_percentile("response_time_ms", 0.99, 300)
+        response_times = self.get_metric_histogram("response_time_ms", 300)
+        avg_response_time = response_times.mean if response_times else None
+        percentiles = response_times.quantiles([0.95, 0.99]) if response_times else {}
+        p95_response_time = percentiles.get(0.95)
+        p99_response_time = percentiles.get(0.99)
 
         current_memory = self.get_latest_metric("memory_usage_mb")
         cache_hit_rate = self.get_latest_metric("cache_hit_rate")
@@ -727,7 +872,9 @@ def monitor_performance(metric_name: str = None):
                     raise
                 finally:
                     response_time = (time.time() - start_time) * 1000
-                    monitor.record_metric(actual_metric_name, response_time)
+                    monitor.record_metric(
+                        actual_metric_name, response_time, histogram=True
+                    )
 
                     if response_time > 500:
                         monitor.increment_counter("requests_slow")
@@ -748,7 +895,9 @@ def monitor_performance(metric_name: str = None):
                     raise
                 finally:
                     response_time = (time.time() - start_time) * 1000
-                    monitor.record_metric(actual_metric_name, response_time)
+                    monitor.record_metric(
+                        actual_metric_name, response_time, histogram=True
+                    )
 
                     if response_time > 500:
                         monitor.increment_counter("requests_slow")
@@ -0,0 +1,283 @@
+"""
+Persistent Cache Store for Performance Optimization
+
+SQLite-backed second-tier (L2) store behind CacheManager. Selected cache
+levels are written through to disk so a restarted process can promote
+entries from L2 instead of rebuilding them with slow MCP round trips.
+
+Values are stored as tagged JSON so they round-trip exactly: tuples, sets
+and dicts with non-string keys keep their types. Values holding anything
+else (custom objects, str/int subclasses such as enums) stay L1-only.
+
+Author: Martin | Platform Architecture
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+_JSON_SCALARS = (str, int, float, bool, type(None))
+_TUPLE_TAG = "__tuple__"
+_SET_TAG = "__set__"
+_FROZENSET_TAG = "__frozenset__"
+_ITEMS_TAG = "__items__"
+_TAGS = (_TUPLE_TAG, _SET_TAG, _FROZENSET_TAG, _ITEMS_TAG)
+
+
+def _to_json_safe(value: Any) -> Any:
+    """Convert value to a JSON-safe structure, tagging non-JSON containers"""
+    value_type = type(value)
+    if value_type in _JSON_SCALARS:
+        return value
+    if value_type is list:
+        return [_to_json_safe(item) for item in value]
+    if value_type is tuple:
+        return {_TUPLE_TAG: [_to_json_safe(item) for item in value]}
+    if value_type is set or value_type is frozenset:
+        tag = _SET_TAG if value_type is set else _FROZENSET_TAG
+        return {tag: [_to_json_safe(item) for item in value]}
+    if value_type is dict:
+        if all(type(key) is str for key in value) and not (
+            len(value) == 1 and next(iter(value)) in _TAGS
+        ):
+            return {key: _to_json_safe(item) for key, item in value.items()}
+        return {
+            _ITEMS_TAG: [
+                [_to_json_safe(key), _to_json_safe(item)] for key, item in value.items()
+            ]
+        }
+    raise TypeError(f"{value_type.__name__} values are not persisted")
+
+
+def _from_json_object(obj: Dict[str, Any]) -> Any:
+    """json.loads object_hook reversing the tags written by _to_json_safe"""
+    if len(obj) != 1:
+        return obj
+    tag, items = next(iter(obj.items()))
+    if tag == _TUPLE_TAG:
+        return tuple(items)
+    if tag == _SET_TAG:
+        return set(items)
+    if tag == _FROZENSET_TAG:
+        return frozenset(items)
+    if tag == _ITEMS_TAG:
+        return {key: item for key, item in items}
+    return obj
+
+
+def encode_value(value: Any) -> str:
+    """
+    Encode a cache value for the persistent store
+
+    Raises TypeError or ValueError for values that would not decode back
+    to an equal value of the same types.
+    """
+    return json.dumps(_to_json_safe(value))
+
+
+def decode_value(value_json: str) -> Any:
+    """Decode a value written by encode_value"""
+    return json.loads(value_json, object_hook=_from_json_object)
+
+
+@dataclass
+class PersistentCacheRecord:
+    """Cache entry loaded from the persistent store"""
+
+    key: str
+    value: Any
+    cache_level: str
+    created_at: float
+    ttl_seconds: int
+
+    @property
+    def expires_at(self) -> float:
+        """Absolute expiry timestamp"""
+        return self.created_at + self.ttl_seconds
+
+
+class PersistentCacheStore:
+    """
+    SQLite-backed L2 cache store
+
+    Features:
+    - Same TTL semantics as the in-memory tier (created_at + ttl_seconds)
+    - Indexed expiry and cache-level lookups for warm loading and purging
+    - Single shared connection guarded by a lock (safe across threads)
+    """
+
+    def __init__(self, db_path: Union[str, Path]):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            str(self.db_path), check_same_thread=False, isolation_level=None
+        )
+        self._connection.execute("PRAGMA journal_mode = WAL")
+        self._connection.execute("PRAGMA synchronous = NORMAL")
+        self._ensure_schema()
+
+    def _ensure_schema(self):
+        """Create cache table and indexes"""
+        with self._lock:
+            self._connection.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS cache_entries (
+                    cache_key TEXT PRIMARY KEY,
+                    cache_level TEXT NOT NULL,
+                    value_json TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    ttl_seconds INTEGER NOT NULL,
+                    expires_at REAL NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_cache_entries_expires_at
+                    ON cache_entries(expires_at);
+                CREATE INDEX IF NOT EXISTS idx_cache_entries_level
+                    ON cache_entries(cache_level, expires_at);
+                """
+            )
+
+    def get(
+        self, key: str, now: Optional[float] = None
+    ) -> Optional[PersistentCacheRecord]:
+        """Get an unexpired record by key"""
+        now = time.time() if now is None else now
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT cache_key, value_json, cache_level, created_at, ttl_seconds "
+                "FROM cache_entries WHERE cache_key = ? AND expires_at >= ?",
+                (key, now),
+            ).fetchone()
+        return self._to_record(row) if row else None
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        cache_level: str,
+        created_at: float,
+        ttl_seconds: int,
+    ) -> bool:
+        """Write a record through to disk (False if value does not round-trip)"""
+        try:
+            value_json = encode_value(value)
+        except (TypeError, ValueError, RecursionError):
+            return False
+
+        self.set_encoded(key, value_json, cache_level, created_at, ttl_seconds)
+        return True
+
+    def set_encoded(
+        self,
+        key: str,
+        value_json: str,
+        cache_level: str,
+        created_at: float,
+        ttl_seconds: int,
+    ):
+        """Write a record already encoded with encode_value"""
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO cache_entries "
+                "(cache_key, cache_level, value_json, created_at, ttl_seconds, expires_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    cache_level,
+                    value_json,
+                    created_at,
+                    ttl_seconds,
+                    created_at + ttl_seconds,
+                ),
+            )
+
+    def delete(self, key: str):
+        """Delete a record by key"""
+        with self._lock:
+            self._connection.execute(
+                "DELETE FROM cache_entries WHERE cache_key = ?", (key,)
+            )
+
+    def delete_matching(self, pattern: str) -> int:
+        """Delete records whose key contains pattern"""
+        with self._lock:
+            cursor = self._connection.execute(
+                "DELETE FROM cache_entries WHERE instr(cache_key, ?) > 0", (pattern,)
+            )
+        return cursor.rowcount
+
+    def delete_prefix(self, prefix: str) -> int:
+        """Delete records whose key starts with prefix"""
+        with self._lock:
+            cursor = self._connection.execute(
+                "DELETE FROM cache_entries WHERE substr(cache_key, 1, ?) = ?",
+                (len(prefix), prefix),
+            )
+        return cursor.rowcount
+
+    def load_levels(
+        self, cache_levels: Iterable[str], now: Optional[float] = None
+    ) -> List[PersistentCacheRecord]:
+        """Load unexpired records for the given levels, oldest first"""
+        levels = list(cache_levels)
+        if not levels:
+            return []
+
+        now = time.time() if now is None else now
+        placeholders = ",".join("?" for _ in levels)
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT cache_key, value_json, cache_level, created_at, ttl_seconds "
+                f"FROM cache_entries WHERE cache_level IN ({placeholders}) "
+                "AND expires_at >= ? ORDER BY created_at ASC",
+                (*levels, now),
+            ).fetchall()
+        return [self._to_record(row) for row in rows]
+
+    def purge_expired(self, now: Optional[float] = None) -> int:
+        """Delete expired records"""
+        now = time.time() if now is None else now
+        with self._lock:
+            cursor = self._connection.execute(
+                "DELETE FROM cache_entries WHERE expires_at < ?", (now,)
+            )
+        return cursor.rowcount
+
+    def count(self) -> int:
+        """Number of stored records (including not-yet-purged expired ones)"""
+        with self._lock:
+            return self._connection.execute(
+                "SELECT COUNT(*) FROM cache_entries"
+            ).fetchone()[0]
+
+    def clear(self):
+        """Delete all records"""
+        with self._lock:
+            self._connection.execute("DELETE FROM cache_entries")
+
+    def close(self):
+        """Close the underlying connection"""
+        with self._lock:
+            try:
+                self._connection.close()
+            except sqlite3.Error as e:
+                logger.debug(f"Persistent cache close failed: {e}")
+
+    @staticmethod
+    def _to_record(row) -> PersistentCacheRecord:
+        key, value_json, cache_level, created_at, ttl_seconds = row
+        return PersistentCacheRecord(
+            key=key,
+            value=decode_value(value_json),
+            cache_level=cache_level,
+            created_at=created_at,
+            ttl_seconds=ttl_seconds,
+        )
@@ -21,15 +21,22 @@ NOT cached (always fresh):
 - User queries (always unique)
 - Stakeholder context (dynamic)
 
+The static prefix (system instructions + persona + framework) is rendered
+once per persona/framework pair into an immutable PromptPrefix with its
+hash and token count precomputed; each request only renders the dynamic
+tail. Prefixes are shared by every session using the same pair and are
+invalidated when one of their segments is re-cached.
+
 Author: Martin | Platform Architecture
 Phase: Quick Wins (Task 001 - Agent SDK Integration)
 Date: 2025-10-01
 """
 
+import functools
 import hashlib
 import time
 import logging
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -67,6 +74,15 @@ except ImportError:
     )
 
 
+# Rough size of a token for segments without a cached estimate
+CHARS_PER_TOKEN = 4
+
+# Persona/framework pairs whose rendered prefix is kept
+MAX_PREFIX_CACHE_SIZE = 256
+
+SEGMENT_SEPARATOR = "\n\n"
+
+
 class PromptSegmentType(Enum):
     """Types of prompt segments with different caching strategies"""
 
@@ -98,6 +114,41 @@ class PromptCacheEntry:
         self.last_accessed = time.time()
 
 
+@dataclass(frozen=True)
+class PromptSegment:
+    """Rendered static prompt segment"""
+
+    segment_type: PromptSegmentType
+    text: str
+    estimated_tokens: int
+
+
+@dataclass(frozen=True)
+class PromptPrefix:
+    """
+    Pre-rendered static prompt prefix for one persona/framework pair
+
+    Cache accounting is resolved when the prefix is built: cached_entries
+    are the cache entries it was rendered from (a hit per request) and
+    cache_misses counts the segments that fell back to defaults.
+    """
+
+    persona: str
+    framework: Optional[str]
+    segments: Tuple[PromptSegment, ...]
+    text: str
+    prefix_hash: str
+    estimated_tokens: int
+    cached_entries: Tuple[PromptCacheEntry, ...]
+    cache_misses: int
+    tokens_saved: int
+
+
+@functools.lru_cache(maxsize=1024)
+def _cache_key(identifier: str) -> str:
+    return hashlib.sha256(identifier.encode()).hexdigest()[:16]
+
+
 class SDKInspiredPromptCacheOptimizer:
     """
     SDK-inspired prompt caching optimizer for ClaudeDirector
@@ -148,6 +199,9 @@ class SDKInspiredPromptCacheOptimizer:
         self.framework_contexts_cache: Dict[str, PromptCacheEntry] = {}
         self.system_instructions_cache: Dict[str, PromptCacheEntry] = {}
 
+        # Rendered static prefixes, shared across sessions
+        self.prefix_cache: Dict[Tuple[str, Optional[str]], PromptPrefix] = {}
+
         # Performance metrics
         self.metrics = {
             "total_assembly_requests": 0,
@@ -160,6 +214,7 @@ class SDKInspiredPromptCacheOptimizer:
         # Cache effectiveness tracking (configuration-driven)
         self.baseline_assembly_time_ms = config.baseline_assembly_time_ms
         self.cached_assembly_time_ms = config.target_assembly_time_ms
+        self.latency_saved_per_cache_hit_ms = config.latency_saved_per_cache_hit_ms
 
         self.logger = logging.getLogger(__name__)
         self.logger.info(
@@ -201,6 +256,7 @@ class SDKInspiredPromptCacheOptimizer:
         )
 
         self.persona_templates_cache[cache_key] = entry
+        self._invalidate_prefixes(persona=persona)
 
         self.logger.debug(
             f"Cached persona template: {persona} (~{estimated_tokens} tokens)"
@@ -247,6 +303,7 @@ class SDKInspiredPromptCacheOptimizer:
         )
 
         self.framework_contexts_cache[cache_key] = entry
+        self._invalidate_prefixes(framework=framework)
 
         self.logger.debug(
             f"Cached framework context: {framework} (~{estimated_tokens} tokens)"
@@ -284,6 +341,7 @@ class SDKInspiredPromptCacheOptimizer:
         )
 
         self.system_instructions_cache[cache_key] = entry
+        self.prefix_cache.clear()
 
         self.logger.debug(f"Cached system instructions (~{estimated_tokens} tokens)")
 
@@ -330,72 +388,24 @@ class SDKInspiredPromptCacheOptimizer:
         start_time = time.time()
         self.metrics["total_assembly_requests"] += 1
 
-        cache_hits = 0
-        cache_misses = 0
-        tokens_saved = 0
-
-        # System instructions (highest cache hit rate - 99%)
-        system_instructions = ""
-        system_key = self._generate_cache_key("system_instructions")
-        if system_key in self.system_instructions_cache:
-            entry = self.system_instructions_cache[system_key]
-            system_instructions = entry.prompt_segment
-            entry.record_hit()
-            cache_hits += 1
-            tokens_saved += entry.estimated_tokens
-            self.metrics["cache_hits"] += 1
-            self.logger.debug("Cache HIT: system instructions")
-        else:
-            self.metrics["cache_misses"] += 1
-            cache_misses += 1
-            self.logger.debug("Cache MISS: system instructions (will use default)")
-            # In production, would fetch and cache
-            system_instructions = "# ClaudeDirector Strategic Intelligence System\n"
-
-        # Persona template (high cache hit rate - 95%)
-        persona_template = ""
-        persona_key = self._generate_cache_key(f"persona_{persona}")
-        if persona_key in self.persona_templates_cache:
-            entry = self.persona_templates_cache[persona_key]
-            persona_template = entry.prompt_segment
-            entry.record_hit()
-            cache_hits += 1
-            tokens_saved += entry.estimated_tokens
-            self.metrics["cache_hits"] += 1
-            self.logger.debug(f"Cache HIT: persona template for {persona}")
-        else:
-            self.metrics["cache_misses"] += 1
-            cache_misses += 1
-            self.logger.debug(f"Cache MISS: persona template for {persona}")
-            # In production, would fetch from database and cache
-            persona_template = f"🎯 {persona} | Strategic Leadership\n"
-
-        # Framework context (moderate cache hit rate - 60%)
-        framework_context = ""
-        if framework:
-            framework_key = self._generate_cache_key(f"framework_{framework}")
-            if framework_key in self.framework_contexts_cache:
-                entry = self.framework_contexts_cache[framework_key]
-                framework_context = entry.prompt_segment
-                entry.record_hit()
-                cache_hits += 1
-                tokens_saved += entry.estimated_tokens
-                self.metrics["cache_hits"] += 1
-                self.logger.debug(f"Cache HIT: framework context for {framework}")
-            else:
-                self.metrics["cache_misses"] += 1
-                cache_misses += 1
-                self.logger.debug(f"Cache MISS: framework context for {framework}")
-                # In production, would fetch and cache
-                framework_context = f"Framework: {framework}\n"
+        # Static prefix: rendered once per persona/framework pair
+        prefix = self.prefix_cache.get((persona, framework or None))
+        if prefix is None:
+            prefix = self._build_prefix(persona, framework or None)
 
-        # Assemble final prompt (SDK pattern: static → dynamic)
-        assembled_prompt = self._assemble_prompt_segments(
-            system_instructions=system_instructions,
-            persona_template=persona_template,
-            framework_context=framework_context,
+        for entry in prefix.cached_entries:
+            entry.record_hit()
+        cache_hits = len(prefix.cached_entries)
+        cache_misses = prefix.cache_misses
+        tokens_saved = prefix.tokens_saved
+        self.metrics["cache_hits"] += cache_hits
+        self.metrics["cache_misses"] += cache_misses
+
+        # Only the dynamic tail is rendered per request (SDK pattern: static → dynamic)
+        assembled_prompt = self._append_dynamic_tail(
+            prefix,
             conversation_context=conversation_context,
-            strategic_memory=strategic_memory or {},
+            strategic_memory=strategic_memory,
             user_query=user_query,
         )
 
@@ -403,8 +413,7 @@ class SDKInspiredPromptCacheOptimizer:
         assembly_time_ms = (time.time() - start_time) * 1000
 
         # Estimate latency saved (cache hits reduce DB/file I/O)
-        config = get_prompt_caching_config()
-        latency_saved_ms = cache_hits * config.latency_saved_per_cache_hit_ms
+        latency_saved_ms = cache_hits * self.latency_saved_per_cache_hit_ms
 
         # Update aggregate metrics
         self.metrics["tokens_saved_estimated"] += tokens_saved
@@ -417,6 +426,8 @@ class SDKInspiredPromptCacheOptimizer:
             "tokens_saved": tokens_saved,
             "latency_saved_ms": latency_saved_ms,
             "assembly_time_ms": assembly_time_ms,
+            "prefix_hash": prefix.prefix_hash,
+            "prefix_tokens": prefix.estimated_tokens,
             "optimization_applied": "sdk_inspired_caching",
             "cache_efficiency": self._calculate_cache_efficiency(),
         }
@@ -440,6 +451,7 @@ class SDKInspiredPromptCacheOptimizer:
             "persona_cache_size": len(self.persona_templates_cache),
             "framework_cache_size": len(self.framework_contexts_cache),
             "system_cache_size": len(self.system_instructions_cache),
+            "prefix_cache_size": len(self.prefix_cache),
         }
 
     def clear_cache(self) -> None:
@@ -447,6 +459,7 @@ class SDKInspiredPromptCacheOptimizer:
         self.persona_templates_cache.clear()
         self.framework_contexts_cache.clear()
         self.system_instructions_cache.clear()
+        self.prefix_cache.clear()
 
         # Reset metrics
         self.metrics = {
@@ -460,8 +473,90 @@ class SDKInspiredPromptCacheOptimizer:
         self.logger.info("Prompt cache cleared")
 
     def _generate_cache_key(self, identifier: str) -> str:
-        """Generate stable cache key from identifier"""
-        return hashlib.sha256(identifier.encode()).hexdigest()[:16]
+        """Generate stable cache key from identifier (memoized)"""
+        return _cache_key(identifier)
+
+    def _build_prefix(self, persona: str, framework: Optional[str]) -> PromptPrefix:
+        """Render the static prefix for a persona/framework pair and cache it"""
+        lookups = [
+            (
+                self.system_instructions_cache,
+                "system_instructions",
+                PromptSegmentType.SYSTEM_INSTRUCTIONS,
+                # In production, would fetch and cache
+                "# ClaudeDirector Strategic Intelligence System\n",
+            ),
+            (
+                self.persona_templates_cache,
+                f"persona_{persona}",
+                PromptSegmentType.PERSONA_TEMPLATE,
+                # In production, would fetch from database and cache
+                f"🎯 {persona} | Strategic Leadership\n",
+            ),
+        ]
+        if framework:
+            lookups.append(
+                (
+                    self.framework_contexts_cache,
+                    f"framework_{framework}",
+                    PromptSegmentType.FRAMEWORK_CONTEXT,
+                    # In production, would fetch and cache
+                    f"Framework: {framework}\n",
+                )
+            )
+
+        segments = []
+        cached_entries = []
+        cache_misses = 0
+        for cache, identifier, segment_type, default in lookups:
+            entry = cache.get(self._generate_cache_key(identifier))
+            if entry is not None:
+                cached_entries.append(entry)
+                segment = PromptSegment(
+                    segment_type, entry.prompt_segment, entry.estimated_tokens
+                )
+                self.logger.debug(f"Cache HIT: {identifier}")
+            else:
+                cache_misses += 1
+                segment = PromptSegment(
+                    segment_type, default, len(default) // CHARS_PER_TOKEN
+                )
+                self.logger.debug(f"Cache MISS: {identifier} (will use default)")
+            segments.append(segment)
+
+        text = SEGMENT_SEPARATOR.join(
+            segment.text for segment in segments if segment.text
+        )
+        prefix = PromptPrefix(
+            persona=persona,
+            framework=framework,
+            segments=tuple(segments),
+            text=text,
+            prefix_hash=hashlib.sha256(text.encode()).hexdigest()[:16],
+            estimated_tokens=sum(segment.estimated_tokens for segment in segments),
+            cached_entries=tuple(cached_entries),
+            cache_misses=cache_misses,
+            tokens_saved=sum(entry.estimated_tokens for entry in cached_entries),
+        )
+
+        if len(self.prefix_cache) >= MAX_PREFIX_CACHE_SIZE:
+            # Evict the oldest pair (dicts keep insertion order)
+            self.prefix_cache.pop(next(iter(self.prefix_cache)), None)
+        self.prefix_cache[(persona, framework)] = prefix
+        return prefix
+
+    def _invalidate_prefixes(
+        self, persona: Optional[str] = None, framework: Optional[str] = None
+    ) -> None:
+        """Drop rendered prefixes that include a re-cached segment"""
+        stale = [
+            key
+            for key in self.prefix_cache
+            if (persona is not None and key[0] == persona)
+            or (framework is not None and key[1] == framework)
+        ]
+        for key in stale:
+            self.prefix_cache.pop(key, None)
 
     def _serialize_framework_context(self, context: Dict[str, Any]) -> str:
         """Convert framework context dict to cacheable string"""
@@ -475,17 +570,15 @@ class SDKInspiredPromptCacheOptimizer:
                 lines.append(f"{key}: {value}")
         return "\n".join(lines)
 
-    def _assemble_prompt_segments(
+    def _append_dynamic_tail(
         self,
-        system_instructions: str,
-        persona_template: str,
-        framework_context: str,
+        prefix: PromptPrefix,
         conversation_context: str,
-        strategic_memory: Dict[str, Any],
+        strategic_memory: Optional[Dict[str, Any]],
         user_query: str,
     ) -> str:
         """
-        Assemble prompt from cached and dynamic segments
+        Append per-request segments to a pre-rendered prefix
 
         SDK Pattern: Structure prompts as:
         1. System instructions (cached)
@@ -496,31 +589,23 @@ class SDKInspiredPromptCacheOptimizer:
         6. User query (dynamic)
 
         This maximizes Claude API's server-side caching effectiveness.
+        Steps 1-3 are already joined in prefix.text; the result is built
+        with a single join over the prefix and the tail.
         """
-        segments = []
-
-        # Static content first (maximizes caching)
-        if system_instructions:
-            segments.append(system_instructions)
-
-        if persona_template:
-            segments.append(persona_template)
-
-        if framework_context:
-            segments.append(framework_context)
+        parts = [prefix.text] if prefix.text else []
 
         # Dynamic content last
         if conversation_context:
-            segments.append(f"## Conversation Context\n{conversation_context}")
+            parts.append(f"## Conversation Context\n{conversation_context}")
 
         if strategic_memory:
             memory_str = self._serialize_framework_context(strategic_memory)
-            segments.append(f"## Strategic Memory\n{memory_str}")
+            parts.append(f"## Strategic Memory\n{memory_str}")
 
         if user_query:
-            segments.append(f"## User Query\n{user_query}")
+            parts.append(f"## User Query\n{user_query}")
 
-        return "\n\n".join(segments)
+        return SEGMENT_SEPARATOR.join(parts)
 
     def _calculate_cache_efficiency(self) -> float:
         """Calculate cache hit rate (cache hits / total requests)"""
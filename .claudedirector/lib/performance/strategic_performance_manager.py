@@ -870,7 +870,9 @@ class StrategicPerformanceManager(BaseManager):
         """Record performance metrics to monitoring system"""
         if self.performance_monitor:
             self.performance_monitor.record_metric(
-                f"strategic_query_{result.query_type.value}", result.execution_time_ms
+                f"strategic_query_{result.query_type.value}",
+                result.execution_time_ms,
+                histogram=True,
             )
 
             if not result.target_achieved:
@@ -0,0 +1,364 @@
+"""
+Request Tracing Spans
+
+Lightweight nested timing spans for following one strategic response
+through the pipeline (context retrieval, persona generation, MCP calls,
+transparency). The active span lives in a context variable, so nesting
+follows asyncio tasks automatically; work handed to a thread pool keeps its
+parent when submitted through propagate().
+
+Tracing is off by default. When off, span() returns a shared no-op object
+and @traced wrappers call straight through, so instrumented code pays one
+attribute check. Sampling is decided once per root span: children of an
+unsampled request are skipped just as cheaply.
+
+Finished traces are kept in a bounded in-memory buffer and can be written
+as nested JSON or as a Chrome trace (chrome://tracing, Perfetto).
+
+Usage:
+```python
+configure_tracing(enabled=True, sample_rate=0.1)
+
+@traced("persona.generate_response")
+async def generate(...):
+    set_span_attributes(persona="diego")
+    with span("persona.frameworks"):
+        ...
+
+get_tracer().export_chrome_trace("trace.json")
+```
+
+Environment: CLAUDE_DIRECTOR_TRACING=1 enables tracing at import and
+CLAUDE_DIRECTOR_TRACE_SAMPLE_RATE sets the sampling rate.
+
+Author: Martin | Platform Architecture
+"""
+
+import contextvars
+import functools
+import inspect
+import itertools
+import json
+import os
+import random
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, List, Optional, Union
+
+DEFAULT_MAX_TRACES = 100
+
+# Marks the context of a request that was not sampled
+_UNSAMPLED = object()
+
+_current_span: contextvars.ContextVar = contextvars.ContextVar(
+    "claudedirector_current_span", default=None
+)
+_span_ids = itertools.count(1)
+
+
+class Span:
+    """One timed operation and its child spans"""
+
+    __slots__ = (
+        "name",
+        "trace_id",
+        "span_id",
+        "parent_id",
+        "start_ns",
+        "end_ns",
+        "attributes",
+        "children",
+        "thread_id",
+        "thread_name",
+        "error",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        attributes: Dict[str, Any],
+        parent: Optional["Span"] = None,
+    ):
+        thread = threading.current_thread()
+        self.name = name
+        self.span_id = next(_span_ids)
+        # A trace is identified by its root span
+        self.trace_id = parent.trace_id if parent else self.span_id
+        self.parent_id = parent.span_id if parent else None
+        self.start_ns = time.perf_counter_ns()
+        self.end_ns: Optional[int] = None
+        self.attributes = attributes
+        self.children: List["Span"] = []
+        self.thread_id = thread.ident
+        self.thread_name = thread.name
+        self.error: Optional[str] = None
+
+    @property
+    def duration_ms(self) -> Optional[float]:
+        if self.end_ns is None:
+            return None
+        return (self.end_ns - self.start_ns) / 1e6
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def iter_spans(self):
+        """This span and all descendants, depth first"""
+        yield self
+        for child in list(self.children):
+            yield from child.iter_spans()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Nested timing tree (times in ms relative to this span's start)"""
+        return self._to_dict(self.start_ns)
+
+    def _to_dict(self, origin_ns: int) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "span_id": self.span_id,
+            "start_ms": (self.start_ns - origin_ns) / 1e6,
+            "duration_ms": self.duration_ms,
+            "thread": self.thread_name,
+            "attributes": dict(self.attributes),
+            "error": self.error,
+            "children": [child._to_dict(origin_ns) for child in list(self.children)],
+        }
+
+
+class _NoopSpan:
+    """Stand-in returned when tracing is off or the request is not sampled"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class _SpanScope:
+    """Context manager that opens a span under the current one"""
+
+    __slots__ = ("tracer", "name", "attributes", "span", "token")
+
+    def __init__(self, tracer: "Tracer", name: str, attributes: Dict[str, Any]):
+        self.tracer = tracer
+        self.name = name
+        self.attributes = attributes
+        self.span: Optional[Span] = None
+        self.token = None
+
+    def __enter__(self):
+        parent = _current_span.get()
+        if parent is _UNSAMPLED:
+            return NOOP_SPAN
+        if parent is None and random.random() >= self.tracer.sample_rate:
+            self.token = _current_span.set(_UNSAMPLED)
+            return NOOP_SPAN
+
+        span = Span(self.name, self.attributes, parent)
+        if parent is not None:
+            parent.children.append(span)
+        self.span = span
+        self.token = _current_span.set(span)
+        return span
+
+    def __exit__(self, exc_type, exc, tb):
+        span = self.span
+        if span is not None:
+            span.end_ns = time.perf_counter_ns()
+            if exc is not None:
+                span.error = f"{exc_type.__name__}: {exc}"
+        if self.token is not None:
+            try:
+                _current_span.reset(self.token)
+            except ValueError:
+                # Exited in another context (e.g. a generator resumed elsewhere)
+                _current_span.set(None)
+        if span is not None and span.parent_id is None:
+            self.tracer._finish(span)
+        return False
+
+
+class Tracer:
+    """
+    Span factory and buffer of finished traces
+
+    sample_rate is the fraction of root spans (requests) that are recorded.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        sample_rate: float = 1.0,
+        max_traces: int = DEFAULT_MAX_TRACES,
+    ):
+        if not 0 <= sample_rate <= 1:
+            raise ValueError("sample_rate must be between 0 and 1")
+        self.enabled = enabled
+        self.sample_rate = sample_rate
+        self.traces: Deque[Span] = deque(maxlen=max_traces)
+
+    def span(self, name: str, **attributes):
+        """Context manager timing a block as a child of the current span"""
+        if not self.enabled:
+            return NOOP_SPAN
+        return _SpanScope(self, name, attributes)
+
+    def clear(self) -> None:
+        self.traces.clear()
+
+    def export_json(
+        self, path: Union[str, Path], traces: Optional[List[Span]] = None
+    ) -> Path:
+        """Write traces as nested JSON timing trees"""
+        traces = list(self.traces) if traces is None else traces
+        path = Path(path)
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump(
+                [trace.to_dict() for trace in traces], handle, indent=2, default=str
+            )
+        return path
+
+    def export_chrome_trace(
+        self, path: Union[str, Path], traces: Optional[List[Span]] = None
+    ) -> Path:
+        """Write traces in Chrome trace event format (complete "X" events)"""
+        traces = list(self.traces) if traces is None else traces
+        pid = os.getpid()
+        events = []
+        for trace in traces:
+            for span in trace.iter_spans():
+                if span.end_ns is None:
+                    continue
+                args = dict(span.attributes, trace_id=span.trace_id)
+                if span.error:
+                    args["error"] = span.error
+                events.append(
+                    {
+                        "name": span.name,
+                        "cat": span.name.split(".", 1)[0],
+                        "ph": "X",
+                        "ts": span.start_ns / 1000,
+                        "dur": (span.end_ns - span.start_ns) / 1000,
+                        "pid": pid,
+                        "tid": span.thread_id,
+                        "args": args,
+                    }
+                )
+        path = Path(path)
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump(
+                {"traceEvents": events, "displayTimeUnit": "ms"}, handle, default=str
+            )
+        return path
+
+    def _finish(self, root: Span) -> None:
+        self.traces.append(root)
+
+
+def _env_sample_rate() -> float:
+    try:
+        rate = float(os.getenv("CLAUDE_DIRECTOR_TRACE_SAMPLE_RATE", "1.0"))
+    except ValueError:
+        return 1.0
+    return min(max(rate, 0.0), 1.0)
+
+
+_tracer = Tracer(
+    enabled=os.getenv("CLAUDE_DIRECTOR_TRACING", "").strip().lower()
+    in ("1", "true", "yes", "on"),
+    sample_rate=_env_sample_rate(),
+)
+
+
+def get_tracer() -> Tracer:
+    """Get the process-wide tracer"""
+    return _tracer
+
+
+def configure_tracing(
+    enabled: Optional[bool] = None,
+    sample_rate: Optional[float] = None,
+    max_traces: Optional[int] = None,
+) -> Tracer:
+    """Update the process-wide tracer in place"""
+    if sample_rate is not None:
+        if not 0 <= sample_rate <= 1:
+            raise ValueError("sample_rate must be between 0 and 1")
+        _tracer.sample_rate = sample_rate
+    if max_traces is not None:
+        _tracer.traces = deque(_tracer.traces, maxlen=max_traces)
+    if enabled is not None:
+        _tracer.enabled = enabled
+    return _tracer
+
+
+def span(name: str, **attributes):
+    """Open a span on the process-wide tracer"""
+    if not _tracer.enabled:
+        return NOOP_SPAN
+    return _SpanScope(_tracer, name, attributes)
+
+
+def current_span() -> Optional[Span]:
+    """The active span, or None outside a recorded trace"""
+    active = _current_span.get()
+    return None if active is _UNSAMPLED else active
+
+
+def set_span_attributes(**attributes) -> None:
+    """Annotate the active span; no-op outside a recorded trace"""
+    active = _current_span.get()
+    if active is not None and active is not _UNSAMPLED:
+        active.attributes.update(attributes)
+
+
+def propagate(func: Callable) -> Callable:
+    """
+    Bind func to the current context for running on another thread
+
+    Thread pools do not copy context variables; submit propagate(func) so
+    spans opened in the worker nest under the submitting span.
+    """
+    if not _tracer.enabled or _current_span.get() is None:
+        return func
+    return functools.partial(contextvars.copy_context().run, func)
+
+
+def traced(name: Optional[str] = None):
+    """Decorator timing each call of a sync or async function as a span"""
+
+    def decorator(func):
+        span_name = name or func.__qualname__
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if not _tracer.enabled:
+                    return await func(*args, **kwargs)
+                with _SpanScope(_tracer, span_name, {}):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def sync_wrapper(*args, **kwargs):
+            if not _tracer.enabled:
+                return func(*args, **kwargs)
+            with _SpanScope(_tracer, span_name, {}):
+                return func(*args, **kwargs)
+
+        return sync_wrapper
+
+    return decorator
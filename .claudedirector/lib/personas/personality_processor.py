@@ -79,6 +79,23 @@ except ImportError:
         MEMORY = "memory"
 
 
+try:
+    from ..performance.metrics_registry import get_metrics_registry
+    from ..performance.tracing import set_span_attributes, traced
+except ImportError:
+    try:
+        from performance.metrics_registry import get_metrics_registry
+        from performance.tracing import set_span_attributes, traced
+    except ImportError:
+        get_metrics_registry = None
+
+        def traced(name=None):
+            return lambda func: func
+
+        def set_span_attributes(**attributes):
+            pass
+
+
 # Personality model classes
 class PersonaRole(Enum):
     """Strategic persona roles with specific expertise domains"""
@@ -234,6 +251,17 @@ class PersonalityProcessor(BaseProcessor):
 
         # Personality-specific tracking (not covered by base metrics)
         self.consistency_metrics: Dict[PersonaRole, PersonaConsistencyMetrics] = {}
+
+        # Per-persona latency, exported via the metrics registry
+        self.persona_latency = (
+            get_metrics_registry().histogram(
+                "claudedirector_persona_response_ms",
+                "Strategic response generation time in milliseconds",
+                ("persona", "outcome"),
+            )
+            if get_metrics_registry
+            else None
+        )
         self.interaction_history: List[StrategicResponse] = []
 
         # Add personality-specific metrics to base metrics
@@ -508,6 +536,7 @@ class PersonalityProcessor(BaseProcessor):
 
         return result
 
+    @traced("persona.generate_response")
     async def generate_strategic_response(
         self,
         query: str,
@@ -520,6 +549,7 @@ class PersonalityProcessor(BaseProcessor):
         Single method for all strategic response creation with consistent processing patterns
         """
         start_time = time.time()
+        set_span_attributes(persona=persona_role.value, depth=target_depth.value)
 
         try:
             # Get persona behavior profile
@@ -575,13 +605,13 @@ class PersonalityProcessor(BaseProcessor):
             await self._update_consistency_metrics(persona_role, response)
 
             processing_time = (time.time() - start_time) * 1000
-            self._update_performance_metrics(processing_time, True)
+            self._update_performance_metrics(processing_time, True, persona_role)
 
             return response
 
         except Exception as e:
             processing_time = (time.time() - start_time) * 1000
-            self._update_performance_metrics(processing_time, False)
+            self._update_performance_metrics(processing_time, False, persona_role)
             logger.error(
                 "strategic_response_generation_failed",
                 persona=persona_role.value,
@@ -867,13 +897,23 @@ class PersonalityProcessor(BaseProcessor):
 
         metrics.last_updated = datetime.now()
 
-    def _update_performance_metrics(self, processing_time_ms: float, success: bool):
+    def _update_performance_metrics(
+        self,
+        processing_time_ms: float,
+        success: bool,
+        persona_role: Optional[PersonaRole] = None,
+    ):
         """
         🎯 CONSOLIDATED: Performance tracking (was scattered across 84+ lines)
         Single method for all performance metrics with consistent patterns
         """
         self.performance_metrics["total_interactions"] += 1
 
+        if self.persona_latency is not None and persona_role is not None:
+            self.persona_latency.labels(
+                persona_role.value, "success" if success else "error"
+            ).observe(processing_time_ms)
+
         if not success:
             self.performance_metrics["consistency_violations"] += 1
 
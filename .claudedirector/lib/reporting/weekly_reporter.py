@@ -18,7 +18,7 @@ import argparse
 import logging
 import requests
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Sequence, Union
 from dataclasses import dataclass, field
 from urllib.parse import quote
 import re
@@ -48,6 +48,19 @@ except ImportError:
         MCPEnhancementResult = None
         MCP_BRIDGE_AVAILABLE = False
 
+try:
+    from .monte_carlo_forecaster import (
+        EpicSizeDistribution,
+        MonteCarloForecast,
+        MonteCarloForecaster,
+    )
+except ImportError:
+    from reporting.monte_carlo_forecaster import (
+        EpicSizeDistribution,
+        MonteCarloForecast,
+        MonteCarloForecaster,
+    )
+
 # Configure logging with safe file path
 # Use project root for log file to avoid permission issues in CI
 _project_root = Path(__file__).parent.parent.parent
@@ -241,6 +254,17 @@ class EnhancedStrategicAnalyzer(BaseStrategicAnalyzer):
                 )
                 self.mcp_bridge = None
 
+        # Vectorized Monte Carlo engine (3 weeks, 3-8 tickets per epic default)
+        min_tickets, max_tickets = self.config.get("epic_size_range", (3, 8))
+        self.monte_carlo = MonteCarloForecaster(
+            simulation_runs=self.config.get("monte_carlo_runs", 10000),
+            target_timeline_days=self.config.get("target_timeline_days", 21),
+            epic_size=EpicSizeDistribution(
+                min_tickets, max_tickets, self.config.get("epic_size_weights")
+            ),
+            seed=self.config.get("monte_carlo_seed"),
+        )
+
     def calculate_strategic_impact(self, issue: JiraIssue) -> StrategicScore:
         """Calculate strategic impact score for a story"""
         score = StrategicScore()
@@ -542,9 +566,6 @@ class EnhancedStrategicAnalyzer(BaseStrategicAnalyzer):
         Context7 MCP: Industry benchmarking patterns for competitive analysis
         DRY Compliance: EXTENDS existing JiraIssue dataclass and scoring patterns
         """
-        # SEQUENTIAL STEP 1: EXTEND existing priority scoring logic (UNCHANGED)
-        base_score = self.calculate_strategic_impact(issue)  # REUSE existing method
-
         # SEQUENTIAL STEP 2: Historical cycle time analysis (UNCHANGED)
         cycle_time_data = self._sequential_analyze_historical_cycles(historical_data)
 
@@ -553,6 +574,40 @@ class EnhancedStrategicAnalyzer(BaseStrategicAnalyzer):
             issue, cycle_time_data
         )
 
+        return self._completion_analysis(issue, cycle_time_data, completion_prob)
+
+    def calculate_completion_probabilities(
+        self, issues: List[JiraIssue], historical_data: List[Dict]
+    ) -> Dict[str, Dict]:
+        """
+        calculate_completion_probability for many issues, keyed by issue key
+
+        History is parsed once and every issue is forecast in a single
+        vectorized Monte Carlo run instead of one simulation per issue.
+        """
+        cycle_time_data = self._sequential_analyze_historical_cycles(historical_data)
+        forecasts = self._forecast_cycle_times(issues, cycle_time_data)
+
+        analyses = {}
+        for issue in issues:
+            forecast = forecasts.get(issue.key)
+            completion_prob = (
+                forecast.completion_probability
+                if forecast is not None
+                else self._sequential_monte_carlo_simulation(issue, cycle_time_data)
+            )
+            analyses[issue.key] = self._completion_analysis(
+                issue, cycle_time_data, completion_prob
+            )
+        return analyses
+
+    def _completion_analysis(
+        self, issue: JiraIssue, cycle_time_data: List[float], completion_prob: float
+    ) -> Dict:
+        """Completion analysis around an already simulated probability"""
+        # SEQUENTIAL STEP 1: EXTEND existing priority scoring logic (UNCHANGED)
+        base_score = self.calculate_strategic_impact(issue)  # REUSE existing method
+
         # SEQUENTIAL STEP 4: Risk assessment (UNCHANGED)
         risk_analysis = self._sequential_risk_assessment(
             issue, base_score, cycle_time_data
@@ -574,7 +629,7 @@ class EnhancedStrategicAnalyzer(BaseStrategicAnalyzer):
             ),
             "risk_factors": risk_analysis,
             "timeline_forecast": timeline_forecast,
-            "simulation_runs": 10000,  # Monte Carlo simulation iterations
+            "simulation_runs": self.monte_carlo.simulation_runs,
             "cycle_time_percentiles": self._calculate_cycle_time_percentiles(
                 cycle_time_data
             ),
@@ -645,39 +700,62 @@ class EnhancedStrategicAnalyzer(BaseStrategicAnalyzer):
         )
         return cycle_times
 
+    def forecast_epic_completions(
+        self,
+        issues: List[JiraIssue],
+        historical_data: List[Dict],
+        target_timeline_days: Union[None, float, List[float]] = None,
+    ) -> Dict[str, MonteCarloForecast]:
+        """
+        Monte Carlo forecasts for many epics in one vectorized simulation
+
+        Historical cycle times are parsed once and shared by every epic.
+        Returns forecasts keyed by issue key, including full percentile
+        curves; empty when there is too little cycle time data.
+        """
+        cycle_time_data = self._sequential_analyze_historical_cycles(historical_data)
+        return self._forecast_cycle_times(issues, cycle_time_data, target_timeline_days)
+
+    def _forecast_cycle_times(
+        self,
+        issues: List[JiraIssue],
+        cycle_time_data: List[float],
+        target_timeline_days: Union[None, float, List[float]] = None,
+        percentiles: Optional[Sequence[int]] = None,
+    ) -> Dict[str, MonteCarloForecast]:
+        """One vectorized forecast for issues from parsed cycle times"""
+        if not issues or len(cycle_time_data) < 5:
+            logger.warning("Insufficient cycle time data for Monte Carlo simulation")
+            return {}
+
+        forecasts = self.monte_carlo.forecast(
+            cycle_time_data,
+            target_timeline_days=target_timeline_days,
+            epic_keys=[issue.key for issue in issues],
+            percentiles=percentiles,
+        )
+        return {forecast.epic_key: forecast for forecast in forecasts}
+
     def _sequential_monte_carlo_simulation(
         self, issue: JiraIssue, cycle_time_data: List[float]
     ) -> float:
         """Sequential Step 3: Monte Carlo simulation with structured approach"""
-        import random
-
         if not cycle_time_data or len(cycle_time_data) < 5:
             logger.warning("Insufficient cycle time data for Monte Carlo simulation")
             return 0.5  # Default 50% probability
 
-        # Sequential approach: simulate epic completion based on cycle time distribution
-        simulation_runs = 10000
-        completion_count = 0
-        target_timeline_days = 21  # 3 weeks default
+        # Sequential approach: simulate epic completion based on cycle time
+        # distribution; only the probability is used, so skip percentile curves
+        forecast = self.monte_carlo.forecast(
+            cycle_time_data, epic_keys=[issue.key], percentiles=()
+        )[0]
 
-        for _ in range(simulation_runs):
-            # Sample from historical cycle time distribution
-            sampled_cycle_time = random.choice(cycle_time_data)
-
-            # Simple epic simulation: assume epic = 3-8 tickets
-            epic_size = random.randint(3, 8)
-            estimated_completion_days = sampled_cycle_time * epic_size
-
-            # Check if completes within target timeline
-            if estimated_completion_days <= target_timeline_days:
-                completion_count += 1
-
-        completion_probability = completion_count / simulation_runs
         logger.info(
-            f"Sequential Monte Carlo: {completion_probability:.2%} completion probability in {target_timeline_days} days"
+            f"Sequential Monte Carlo: {forecast.completion_probability:.2%} completion "
+            f"probability in {forecast.target_timeline_days:g} days"
         )
 
-        return completion_probability
+        return forecast.completion_probability
 
     def _sequential_risk_assessment(
         self, issue: JiraIssue, base_score: StrategicScore, cycle_time_data: List[float]
@@ -785,7 +863,7 @@ class EnhancedStrategicAnalyzer(BaseStrategicAnalyzer):
         reasoning = [
             f"1. Strategic Analysis: Evaluated {issue.key} using existing proven scoring patterns",
             f"2. Historical Data: Analyzed {len(cycle_time_data)} historical cycle time samples",
-            f"3. Monte Carlo Simulation: Ran 10,000 iterations using cycle time distribution",
+            f"3. Monte Carlo Simulation: Ran {self.monte_carlo.simulation_runs:,} iterations using cycle time distribution",
             f"4. Risk Assessment: Systematic evaluation of completion risks and dependencies",
             f"5. Timeline Prediction: Percentile-based forecasting with confidence intervals",
         ]
@@ -1455,60 +1533,87 @@ class ReportGenerator:
         strategic_entries = []
         mcp_enhanced_count = 0
 
-        for issue in strategic_issues:
-            score = self.analyzer.calculate_strategic_impact(issue)
-            if score.score >= 5:  # Only show high-impact stories
-                timing = self._determine_completion_timing(issue.status)
-                jira_url = f"{self.analyzer.jira_base_url}/browse/{issue.key}"
+        scored_issues = [
+            (issue, self.analyzer.calculate_strategic_impact(issue))
+            for issue in strategic_issues
+        ]
+        high_impact_issues = [
+            (issue, score) for issue, score in scored_issues if score.score >= 5
+        ]
 
-                # Check if we can get MCP-enhanced completion probability analysis
-                mcp_indicator = ""
-                try:
-                    if (
-                        hasattr(self.analyzer, "mcp_bridge")
-                        and self.analyzer.mcp_bridge
-                    ):
-                        completion_analysis = (
-                            self.analyzer.calculate_completion_probability(issue, [])
-                        )
-                        if completion_analysis.get("mcp_enhanced", False):
-                            mcp_enhanced_count += 1
-                            mcp_indicator = "\n- **Analysis Enhancement**: 🤖 MCP Sequential Thinking Applied"
-                            if completion_analysis.get("mcp_reasoning_trail"):
-                                reasoning_preview = (
-                                    completion_analysis["mcp_reasoning_trail"][:1]
-                                    if completion_analysis["mcp_reasoning_trail"]
-                                    else []
-                                )
-                                if reasoning_preview:
-                                    mcp_indicator += f"\n- **Strategic Insight**: {reasoning_preview[0]}"
-                        elif completion_analysis.get("mcp_enhanced", False) == False:
-                            mcp_indicator = "\n- **Analysis Enhancement**: 📊 Statistical Monte Carlo (MCP: Fallback)"
-                except Exception:
-                    # Graceful fallback if completion analysis fails
-                    pass
+        # One batched Monte Carlo run for every high-impact story; if it
+        # fails, each story falls back to its own analysis below
+        mcp_available = bool(
+            hasattr(self.analyzer, "mcp_bridge") and self.analyzer.mcp_bridge
+        )
+        completion_analyses = None
+        if mcp_available and high_impact_issues:
+            try:
+                completion_analyses = self.analyzer.calculate_completion_probabilities(
+                    [issue for issue, _ in high_impact_issues], []
+                )
+            except Exception as e:
+                logger.warning(
+                    f"Batched completion analysis failed, analyzing stories "
+                    f"individually: {e}"
+                )
 
-                # Format completion date if available
-                completion_date = ""
-                if issue.resolved_date:
-                    try:
-                        resolved_dt = datetime.fromisoformat(
-                            issue.resolved_date.replace("Z", "+00:00")
-                        )
-                        completion_date = (
-                            f"- **Completed**: {resolved_dt.strftime('%Y-%m-%d')}\n"
-                        )
-                    except (ValueError, AttributeError):
-                        completion_date = ""
+        for issue, score in high_impact_issues:
+            timing = self._determine_completion_timing(issue.status)
+            jira_url = f"{self.analyzer.jira_base_url}/browse/{issue.key}"
+
+            # Check if we can get MCP-enhanced completion probability analysis
+            mcp_indicator = ""
+            try:
+                if not mcp_available:
+                    completion_analysis = None
+                elif completion_analyses is not None:
+                    completion_analysis = completion_analyses.get(issue.key)
+                else:
+                    completion_analysis = (
+                        self.analyzer.calculate_completion_probability(issue, [])
+                    )
+                if completion_analysis is not None:
+                    if completion_analysis.get("mcp_enhanced", False):
+                        mcp_enhanced_count += 1
+                        mcp_indicator = "\n- **Analysis Enhancement**: 🤖 MCP Sequential Thinking Applied"
+                        if completion_analysis.get("mcp_reasoning_trail"):
+                            reasoning_preview = (
+                                completion_analysis["mcp_reasoning_trail"][:1]
+                                if completion_analysis["mcp_reasoning_trail"]
+                                else []
+                            )
+                            if reasoning_preview:
+                                mcp_indicator += (
+                                    f"\n- **Strategic Insight**: {reasoning_preview[0]}"
+                                )
+                    elif completion_analysis.get("mcp_enhanced", False) == False:
+                        mcp_indicator = "\n- **Analysis Enhancement**: 📊 Statistical Monte Carlo (MCP: Fallback)"
+            except Exception:
+                # Graceful fallback if completion analysis fails
+                pass
+
+            # Format completion date if available
+            completion_date = ""
+            if issue.resolved_date:
+                try:
+                    resolved_dt = datetime.fromisoformat(
+                        issue.resolved_date.replace("Z", "+00:00")
+                    )
+                    completion_date = (
+                        f"- **Completed**: {resolved_dt.strftime('%Y-%m-%d')}\n"
+                    )
+                except (ValueError, AttributeError):
+                    completion_date = ""
 
-                entry = f"""#### 📋 [{issue.key}]({jira_url}) - {issue.summary}
+            entry = f"""#### 📋 [{issue.key}]({jira_url}) - {issue.summary}
 
 - **Status**: {timing} ({issue.status})
 - **Project**: {issue.project}
 - **Strategic Impact**: {score.score}/10 points{completion_date}- **Business Value**: {' '.join(score.indicators)}{mcp_indicator}
 
 ---"""
-                strategic_entries.append(entry)
+            strategic_entries.append(entry)
 
         high_impact_count = len(strategic_entries)
 
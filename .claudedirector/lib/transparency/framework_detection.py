@@ -4,7 +4,7 @@ Identifies and attributes strategic frameworks used in ClaudeDirector responses
 SOLID Compliance: Uses centralized configuration instead of hard-coded strings
 """
 
-from typing import List, Dict
+from typing import List, Dict, Tuple
 from dataclasses import dataclass
 
 # Import centralized configuration
@@ -12,11 +12,18 @@ try:
     from ..core.constants.transparency_config import (
         DEFAULT_CONFIDENCE_SCORE,
         STRATEGIC_DOMAIN,
+        STRATEGIC_KEYWORD_THRESHOLD,
     )
 except ImportError:
     # Fallback constants for import issues
     DEFAULT_CONFIDENCE_SCORE = 0.0
     STRATEGIC_DOMAIN = "strategic"
+    STRATEGIC_KEYWORD_THRESHOLD = 0.3
+
+try:
+    from ..utils.text_matching import PatternAutomaton
+except ImportError:
+    from utils.text_matching import PatternAutomaton
 
 try:
     from core.constants.framework_definitions import FRAMEWORK_REGISTRY
@@ -51,6 +58,11 @@ class FrameworkDetectionMiddleware:
             self.framework_patterns = self._get_legacy_patterns()
             self.confidence_threshold = 0.7
 
+        # Compiled lazily and rebuilt if framework_patterns is replaced
+        self._compiled_patterns = None
+        self._pattern_automaton = None
+        self._framework_pattern_pairs: Dict[str, List[Tuple[str, str]]] = {}
+
     def _get_legacy_patterns(self):
         """Legacy framework patterns for backward compatibility"""
         # All patterns now centralized in framework_definitions.py
@@ -68,15 +80,35 @@ class FrameworkDetectionMiddleware:
         # Minimum confidence threshold for framework attribution
         self.confidence_threshold = 0.6
 
+    def _compile_patterns(self):
+        """Compile every framework pattern into one automaton"""
+        self._framework_pattern_pairs = {
+            framework_name: [
+                (pattern, pattern.lower()) for pattern in framework_config["patterns"]
+            ]
+            for framework_name, framework_config in self.framework_patterns.items()
+        }
+        self._pattern_automaton = PatternAutomaton(
+            pattern_lower
+            for pairs in self._framework_pattern_pairs.values()
+            for _, pattern_lower in pairs
+        )
+        self._compiled_patterns = self.framework_patterns
+
     def detect_frameworks_used(self, response_content: str) -> List[FrameworkUsage]:
         """Detect strategic frameworks used in a response"""
         detected_frameworks = []
 
-        # Normalize content for pattern matching
+        if self._compiled_patterns is not self.framework_patterns:
+            self._compile_patterns()
+
+        # Normalize content and count every pattern in a single pass
         content_lower = response_content.lower()
+        pattern_counts = self._pattern_automaton.count(content_lower)
+        if not pattern_counts:
+            return detected_frameworks
 
         for framework_name, framework_config in self.framework_patterns.items():
-            patterns = framework_config["patterns"]
             framework_type = framework_config["type"]
             base_confidence = framework_config["confidence_weight"]
 
@@ -84,17 +116,12 @@ class FrameworkDetectionMiddleware:
             confidence_score = 0.0
 
             # Check each pattern
-            for pattern in patterns:
-                pattern_lower = pattern.lower()
-
-                # Count occurrences of this pattern
-                pattern_count = content_lower.count(pattern_lower)
+            for pattern, pattern_lower in self._framework_pattern_pairs[framework_name]:
+                pattern_count = pattern_counts.get(pattern_lower, 0)
 
                 if pattern_count > 0:
                     matched_patterns.append(pattern)
                     # Add confidence based on pattern occurrence
-                    from .config import STRATEGIC_KEYWORD_THRESHOLD
-
                     confidence_score += min(
                         pattern_count * STRATEGIC_KEYWORD_THRESHOLD, 0.8
                     )  # Cap per pattern at 0.8
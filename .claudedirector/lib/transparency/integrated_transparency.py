@@ -10,6 +10,11 @@ import time
 from .mcp_transparency import MCPTransparencyMiddleware, MCPContext
 from .framework_detection import FrameworkDetectionMiddleware, FrameworkUsage
 
+try:
+    from ..performance.tracing import traced
+except ImportError:
+    from performance.tracing import traced
+
 
 @dataclass
 class MCPDisclosure:
@@ -245,6 +250,7 @@ class IntegratedTransparencySystem:
             )
             self.performance_stats["mcp_calls_tracked"] += 1
 
+    @traced("transparency.apply")
     def apply_transparency(self, context: TransparencyContext, response: str) -> str:
         """Apply full transparency treatment to a persona response"""
         if not self.transparency_enabled:
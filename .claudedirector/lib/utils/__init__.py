@@ -3,7 +3,14 @@ Utility modules for ClaudeDirector
 Performance optimization, caching, and processing utilities
 """
 
-from .parallel import ParallelProcessor
+from .lazy_imports import lazy_exports
+from .text_matching import KeywordMatcher, PatternAutomaton
 from . import formatting
 
-__all__ = ["ParallelProcessor", "formatting"]
+# ParallelProcessor loads on first access: parallel pulls in structlog and
+# the core config, which text-matching callers never need
+__getattr__, __dir__ = lazy_exports(
+    __name__, globals(), {"parallel": ["ParallelProcessor"]}
+)
+
+__all__ = ["KeywordMatcher", "ParallelProcessor", "PatternAutomaton", "formatting"]
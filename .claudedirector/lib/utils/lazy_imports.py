@@ -0,0 +1,81 @@
+"""
+Lazy package exports
+Module-level __getattr__ that imports a package's submodules on first
+attribute access, so importing the package (or one of its light submodules)
+does not pull in heavyweight dependencies such as plotly, pandas or sklearn
+"""
+
+import importlib
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Sequence, Tuple
+
+
+def lazy_exports(
+    package: str,
+    namespace: Dict[str, Any],
+    submodule_attrs: Mapping[str, Iterable[str]],
+    fallbacks: Mapping[str, Callable[[], Dict[str, Any]]] = None,
+    flags: Mapping[str, Sequence[str]] = None,
+    fallback_errors: Tuple[type, ...] = (ImportError,),
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Build __getattr__ and __dir__ for a package with lazily loaded exports
+
+    submodule_attrs maps each submodule (relative to package) to the public
+    names it provides. The first access to any of those names imports the
+    submodule and binds all of its names in the package namespace, so later
+    lookups never reach __getattr__ again.
+
+    fallbacks maps optional submodules to a factory returning stand-ins for
+    their names, used when the import raises one of fallback_errors. flags
+    maps availability flags (e.g. "ML_PATTERN_ENGINE_AVAILABLE") to the
+    submodules that must import for the flag to be True; reading a flag
+    loads those submodules.
+    """
+    fallbacks = fallbacks or {}
+    flags = flags or {}
+    attr_to_submodule = {
+        name: submodule
+        for submodule, names in submodule_attrs.items()
+        for name in names
+    }
+    loaded: Dict[str, bool] = {}
+
+    def load(submodule: str) -> bool:
+        if submodule in loaded:
+            return loaded[submodule]
+        names = submodule_attrs[submodule]
+        try:
+            module = importlib.import_module(f".{submodule}", package)
+            try:
+                values = {name: getattr(module, name) for name in names}
+            except AttributeError as e:
+                # Same failure "from module import name" reports
+                raise ImportError(
+                    f"cannot import name from {module.__name__}: {e}"
+                ) from e
+            available = True
+        except fallback_errors:
+            if submodule not in fallbacks:
+                raise
+            stand_ins = fallbacks[submodule]()
+            values = {name: stand_ins[name] for name in names}
+            available = False
+        namespace.update(values)
+        loaded[submodule] = available
+        return available
+
+    def __getattr__(name: str) -> Any:
+        submodule = attr_to_submodule.get(name)
+        if submodule is not None:
+            load(submodule)
+            return namespace[name]
+        if name in flags:
+            available = all([load(submodule) for submodule in flags[name]])
+            namespace[name] = available
+            return available
+        raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(attr_to_submodule) | set(flags))
+
+    return __getattr__, __dir__
@@ -41,17 +41,26 @@ class ParallelProcessor:
     Maintains backward compatibility while providing performance improvements
     """
 
-    def __init__(self, config=None, validation_mode: bool = True):
+    def __init__(
+        self,
+        config=None,
+        validation_mode: bool = True,
+        max_workers: Optional[int] = None,
+    ):
         """
         Initialize with quality validation enabled by default
 
         Args:
             config: Optional configuration override
             validation_mode: Enable comprehensive validation (default: True)
+            max_workers: Optional worker count override (e.g. CPU count for
+                process pools); defaults to the configured request limit
         """
         self.config = config or get_config()
         self.validation_mode = validation_mode
-        self.max_workers = min(self.config.parallel_requests, 8)  # Safety limit
+        if max_workers is None:
+            max_workers = min(self.config.parallel_requests, 8)  # Safety limit
+        self.max_workers = max_workers
         self.memory_limit_mb = self.config.max_memory_mb
 
         # Performance tracking
@@ -76,6 +85,7 @@ class ParallelProcessor:
         processor_func: Callable,
         validation_func: Optional[Callable] = None,
         chunk_size: int = 10,
+        use_processes: bool = False,
     ) -> Dict[str, Any]:
         """
         Process files in parallel with quality validation
@@ -85,6 +95,8 @@ class ParallelProcessor:
             processor_func: Function to apply to each file
             validation_func: Optional validation function for results
             chunk_size: Files per worker batch
+            use_processes: Run chunks in a process pool for CPU-bound work;
+                processor_func and its results must be picklable
 
         Returns:
             Processing results with validation status
@@ -123,7 +135,7 @@ class ParallelProcessor:
         # Parallel processing with worker safety
         try:
             parallel_results = self._process_files_concurrent(
-                file_paths, processor_func, chunk_size
+                file_paths, processor_func, chunk_size, use_processes
             )
             parallel_time = time.time() - start_time
 
@@ -242,7 +254,11 @@ class ParallelProcessor:
         return results
 
     def _process_files_concurrent(
-        self, file_paths: List[Path], processor_func: Callable, chunk_size: int
+        self,
+        file_paths: List[Path],
+        processor_func: Callable,
+        chunk_size: int,
+        use_processes: bool = False,
     ) -> List[Any]:
         """Concurrent processing with thread safety"""
         results = []
@@ -253,12 +269,22 @@ class ParallelProcessor:
             for i in range(0, len(file_paths), chunk_size)
         ]
 
-        with concurrent.futures.ThreadPoolExecutor(
-            max_workers=self.max_workers, thread_name_prefix="claudedirector_worker"
-        ) as executor:
+        if use_processes:
+            executor_context = concurrent.futures.ProcessPoolExecutor(
+                max_workers=min(self.max_workers, len(file_chunks))
+            )
+            chunk_func = _process_chunk_in_worker
+        else:
+            executor_context = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="claudedirector_worker",
+            )
+            chunk_func = self._process_chunk
+
+        with executor_context as executor:
             # Submit chunk processing tasks
             future_to_chunk = {
-                executor.submit(self._process_chunk, chunk, processor_func): chunk
+                executor.submit(chunk_func, chunk, processor_func): chunk
                 for chunk in file_chunks
             }
 
@@ -284,22 +310,7 @@ class ParallelProcessor:
         self, file_paths: List[Path], processor_func: Callable
     ) -> List[Any]:
         """Process a chunk of files in a single thread"""
-        chunk_results = []
-
-        for file_path in file_paths:
-            try:
-                result = processor_func(file_path)
-                if result is not None:
-                    chunk_results.append(result)
-            except Exception as e:
-                logger.warning(
-                    "File processing error in parallel chunk",
-                    file=str(file_path),
-                    error=str(e),
-                )
-                continue
-
-        return chunk_results
+        return _process_chunk_in_worker(file_paths, processor_func)
 
     def _validate_parallel_results(
         self,
@@ -461,6 +472,28 @@ class ParallelProcessor:
         }
 
 
+def _process_chunk_in_worker(
+    file_paths: List[Path], processor_func: Callable
+) -> List[Any]:
+    """Process a chunk of files (module level so process pools can pickle it)"""
+    chunk_results = []
+
+    for file_path in file_paths:
+        try:
+            result = processor_func(file_path)
+            if result is not None:
+                chunk_results.append(result)
+        except Exception as e:
+            logger.warning(
+                "File processing error in parallel chunk",
+                file=str(file_path),
+                error=str(e),
+            )
+            continue
+
+    return chunk_results
+
+
 # Backward compatibility functions
 def get_parallel_processor(config=None) -> ParallelProcessor:
     """Get parallel processor instance"""
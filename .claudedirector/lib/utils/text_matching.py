@@ -0,0 +1,186 @@
+"""
+Multi-pattern text matching utilities
+Aho-Corasick automaton for counting many literal patterns in one pass, and
+a keyword classifier built on it for category/keyword lookups
+"""
+
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Set, Tuple
+
+
+class PatternAutomaton:
+    """
+    Aho-Corasick automaton over a fixed set of literal patterns
+
+    Built once, then every scan walks the text a single time regardless of
+    how many patterns are compiled in. Failure links are folded into a
+    complete transition table at build time so scanning is one dict lookup
+    per character. Matching is exact; callers normalize case beforehand.
+    Empty patterns are ignored.
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns: List[str] = list(dict.fromkeys(p for p in patterns if p))
+        self._lengths = [len(p) for p in self.patterns]
+        self._transitions: List[Dict[str, int]] = []
+        self._outputs: List[Tuple[int, ...]] = []
+        self._build()
+
+    def _build(self):
+        """Build the trie, then resolve failure links breadth-first"""
+        trie: List[Dict[str, int]] = [{}]
+        outputs: List[Tuple[int, ...]] = [()]
+        for index, pattern in enumerate(self.patterns):
+            state = 0
+            for char in pattern:
+                next_state = trie[state].get(char)
+                if next_state is None:
+                    next_state = len(trie)
+                    trie.append({})
+                    outputs.append(())
+                    trie[state][char] = next_state
+                state = next_state
+            outputs[state] += (index,)
+
+        failure = [0] * len(trie)
+        transitions: List[Dict[str, int]] = [{}] * len(trie)
+        transitions[0] = dict(trie[0])
+        # Depth-one states fail to the root; deeper ones are resolved in BFS order
+        queue = deque(trie[0].values())
+        while queue:
+            state = queue.popleft()
+            # Inherit the failure state's moves, then override with own edges
+            moves = dict(transitions[failure[state]])
+            moves.update(trie[state])
+            transitions[state] = moves
+            for char, child in trie[state].items():
+                failure[child] = transitions[failure[state]].get(char, 0)
+                outputs[child] += outputs[failure[child]]
+                queue.append(child)
+
+        self._transitions = transitions
+        self._outputs = outputs
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int, str]]:
+        """Yield (start, end, pattern) for every occurrence, ordered by end"""
+        transitions = self._transitions
+        outputs = self._outputs
+        lengths = self._lengths
+        patterns = self.patterns
+        state = 0
+        for position, char in enumerate(text):
+            state = transitions[state].get(char, 0)
+            if outputs[state]:
+                end = position + 1
+                for index in outputs[state]:
+                    yield end - lengths[index], end, patterns[index]
+
+    def count(self, text: str) -> Dict[str, int]:
+        """
+        Non-overlapping occurrence count per matched pattern
+
+        Counts agree with text.count(pattern) for every compiled pattern;
+        patterns that do not occur are omitted from the result.
+        """
+        transitions = self._transitions
+        outputs = self._outputs
+        lengths = self._lengths
+        counts = [0] * len(self.patterns)
+        # End of the last counted occurrence, so overlaps are skipped like str.count
+        last_end = [0] * len(self.patterns)
+        state = 0
+        for position, char in enumerate(text):
+            state = transitions[state].get(char, 0)
+            if outputs[state]:
+                end = position + 1
+                for index in outputs[state]:
+                    if end - lengths[index] >= last_end[index]:
+                        counts[index] += 1
+                        last_end[index] = end
+        return {
+            self.patterns[index]: total for index, total in enumerate(counts) if total
+        }
+
+
+def _is_word_char(char: str) -> bool:
+    """Word character as matched by the regex \\w class"""
+    return char.isalnum() or char == "_"
+
+
+class KeywordMatcher:
+    """
+    Precompiled category -> keyword classifier
+
+    All keywords across all categories share one PatternAutomaton, so
+    classifying a text costs a single pass no matter how many categories or
+    keywords there are. Matching is case-insensitive unless case_sensitive
+    is set; with whole_words, a keyword only counts where the regex \\b
+    would match at both ends (so "ui" does not match inside "guide").
+    Results keep category and keyword declaration order.
+    """
+
+    def __init__(
+        self,
+        categories: Mapping[str, Iterable[str]],
+        whole_words: bool = False,
+        case_sensitive: bool = False,
+    ):
+        self.whole_words = whole_words
+        self.case_sensitive = case_sensitive
+        self.categories: Dict[str, List[str]] = {
+            category: list(dict.fromkeys(keywords))
+            for category, keywords in categories.items()
+        }
+        self._normalized: Dict[str, List[Tuple[str, str]]] = {
+            category: [(keyword, self._normalize(keyword)) for keyword in keywords]
+            for category, keywords in self.categories.items()
+        }
+        self._automaton = PatternAutomaton(
+            normalized for pairs in self._normalized.values() for _, normalized in pairs
+        )
+
+    def _normalize(self, text: str) -> str:
+        return text if self.case_sensitive else text.lower()
+
+    def _at_word_boundary(self, text: str, start: int, end: int) -> bool:
+        """True when \\b holds before start and after end"""
+        before = start > 0 and _is_word_char(text[start - 1])
+        after = end < len(text) and _is_word_char(text[end])
+        starts_word = _is_word_char(text[start])
+        ends_word = _is_word_char(text[end - 1])
+        return before != starts_word and after != ends_word
+
+    def found_keywords(self, text: str) -> Set[str]:
+        """Normalized keywords present in text"""
+        normalized = self._normalize(text)
+        found: Set[str] = set()
+        for start, end, keyword in self._automaton.iter_matches(normalized):
+            if keyword in found:
+                continue
+            if self.whole_words and not self._at_word_boundary(normalized, start, end):
+                continue
+            found.add(keyword)
+        return found
+
+    def match(self, text: str) -> Dict[str, List[str]]:
+        """Matched keywords per category, omitting categories with no match"""
+        found = self.found_keywords(text)
+        if not found:
+            return {}
+        matches = {}
+        for category, pairs in self._normalized.items():
+            hits = [keyword for keyword, normalized in pairs if normalized in found]
+            if hits:
+                matches[category] = hits
+        return matches
+
+    def counts(self, text: str) -> Dict[str, int]:
+        """Number of distinct keywords matched per category (zero included)"""
+        matches = self.match(text)
+        return {
+            category: len(matches.get(category, ())) for category in self.categories
+        }
+
+    def first_match(self, text: str) -> Optional[str]:
+        """First category, in declaration order, with any keyword present"""
+        return next(iter(self.match(text)), None)
@@ -0,0 +1,183 @@
+"""
+Unit tests for the async StrategicMemoryManager facade
+
+🏗️ Martin | Platform Architecture
+"""
+
+import asyncio
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from lib.context_engineering.async_strategic_memory import (
+    AsyncStrategicMemoryManager,
+)
+from lib.context_engineering.strategic_memory_manager import StrategicMemoryManager
+from lib.core.connection_pool import close_all_connection_pools
+
+
+class TestAsyncStrategicMemoryManager(unittest.TestCase):
+    """Test non-blocking session persistence and write batching"""
+
+    def setUp(self):
+        """Create a memory manager on a temporary database"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.memory = StrategicMemoryManager(
+            db_path=str(Path(self.temp_dir.name) / "memory.db"),
+            enable_performance=False,
+        )
+        self.session_id = self.memory.start_session()
+
+    def tearDown(self):
+        """Close pools and remove temporary files"""
+        self.memory.close()
+        close_all_connection_pools()
+        self.temp_dir.cleanup()
+
+    def test_preserve_and_recover(self):
+        """Awaited writes are visible to subsequent async reads"""
+
+        async def scenario():
+            async with AsyncStrategicMemoryManager(self.memory) as memory:
+                preserved = await memory.preserve_context(
+                    self.session_id, {"stakeholder_profiles": ["vp_eng"]}
+                )
+                recovered = await memory.recover_session_context(self.session_id)
+                recent = await memory.get_recent_sessions()
+                return preserved, recovered, recent
+
+        preserved, recovered, recent = asyncio.run(scenario())
+
+        self.assertTrue(preserved)
+        self.assertEqual(
+            recovered["context_data"], {"stakeholder_profiles": ["vp_eng"]}
+        )
+        self.assertIn("stakeholder_profiles", recovered["critical_context"])
+        self.assertIsInstance(recent, list)
+
+    def test_concurrent_writes_are_batched(self):
+        """Concurrent small writes share transactions"""
+
+        async def scenario():
+            memory = AsyncStrategicMemoryManager(self.memory, batch_window_seconds=0.05)
+            results = await asyncio.gather(
+                *(
+                    memory.preserve_context(self.session_id, {"turn": turn})
+                    for turn in range(20)
+                )
+            )
+            stats = memory.get_stats()
+            await memory.aclose()
+            return results, stats
+
+        results, stats = asyncio.run(scenario())
+
+        self.assertTrue(all(results))
+        self.assertEqual(stats["writes_committed"], 20)
+        self.assertLess(stats["batches_committed"], 20)
+        with self.memory.get_connection() as conn:
+            backups = conn.execute(
+                "SELECT COUNT(*) FROM session_continuity WHERE session_id = ?",
+                (self.session_id,),
+            ).fetchone()[0]
+        self.assertEqual(backups, 20)
+
+    def test_failed_write_does_not_abort_batch(self):
+        """A failing write is reported to its caller only"""
+
+        def failing_write(conn, *args):
+            conn.execute("INSERT INTO missing_table VALUES (1)")
+
+        async def scenario():
+            memory = AsyncStrategicMemoryManager(self.memory, batch_window_seconds=0.05)
+            good = memory.preserve_context(self.session_id, {"ok": True})
+            bad = memory._writer.submit(failing_write)
+            outcomes = await asyncio.gather(good, bad, return_exceptions=True)
+            await memory.aclose()
+            return outcomes
+
+        good, bad = asyncio.run(scenario())
+
+        self.assertTrue(good)
+        self.assertIsInstance(bad, Exception)
+        recovered = self.memory.recover_session_context(self.session_id)
+        self.assertEqual(recovered["context_data"], {"ok": True})
+
+    def test_rolled_back_write_keeps_queued_update(self):
+        """A queued update is dropped only once the direct write commits"""
+        self.memory._write_behind.max_delay_seconds = 60
+        self.memory.preserve_context(self.session_id, {"turn": "queued"})
+
+        async def scenario():
+            async with AsyncStrategicMemoryManager(self.memory) as memory:
+                with mock.patch.object(
+                    self.memory,
+                    "_write_context",
+                    side_effect=sqlite3.OperationalError("disk I/O error"),
+                ):
+                    with self.assertRaises(sqlite3.OperationalError):
+                        await memory.preserve_context(self.session_id, {"turn": 2})
+
+        asyncio.run(scenario())
+
+        pending = self.memory._write_behind.get(self.session_id)
+        self.assertEqual(pending.context_data, {"turn": "queued"})
+        self.memory.flush_pending_writes()
+        recovered = self.memory.recover_session_context(self.session_id)
+        self.assertEqual(recovered["context_data"], {"turn": "queued"})
+
+    def test_stale_flush_does_not_overwrite_async_write(self):
+        """An in-flight flush committing after a newer async write is a no-op"""
+        self.memory._write_behind.max_delay_seconds = 60
+        self.memory.preserve_context(self.session_id, {"turn": "stale"})
+        stale = self.memory._write_behind.get(self.session_id)
+
+        async def scenario():
+            async with AsyncStrategicMemoryManager(self.memory) as memory:
+                await memory.preserve_context(self.session_id, {"turn": "direct"})
+
+        asyncio.run(scenario())
+        # The flusher had already taken the stale update before the write
+        self.memory._flush_context_updates([stale])
+
+        self.assertIsNone(self.memory._write_behind.get(self.session_id))
+        recovered = self.memory.recover_session_context(self.session_id)
+        self.assertEqual(recovered["context_data"], {"turn": "direct"})
+        self.assertEqual(
+            recovered["backup_context"]["full_context"], {"turn": "direct"}
+        )
+
+    def test_newer_queued_update_survives_async_write(self):
+        """An update queued after an async write started is kept and wins"""
+        self.memory._write_behind.max_delay_seconds = 60
+
+        async def scenario():
+            async with AsyncStrategicMemoryManager(self.memory) as memory:
+                write = asyncio.ensure_future(
+                    memory.preserve_context(self.session_id, {"turn": "direct"})
+                )
+                await asyncio.sleep(0)
+                self.memory.preserve_context(self.session_id, {"turn": "newer"})
+                await write
+
+        asyncio.run(scenario())
+        self.memory.flush_pending_writes()
+
+        recovered = self.memory.recover_session_context(self.session_id)
+        self.assertEqual(recovered["context_data"], {"turn": "newer"})
+
+    def test_preserve_without_session(self):
+        """Writes without a session are rejected like the sync API"""
+        self.memory.current_session_id = None
+
+        async def scenario():
+            async with AsyncStrategicMemoryManager(self.memory) as memory:
+                return await memory.preserve_context(context_data={"x": 1})
+
+        self.assertFalse(asyncio.run(scenario()))
+
+
+if __name__ == "__main__":
+    unittest.main()
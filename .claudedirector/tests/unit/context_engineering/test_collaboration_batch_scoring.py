@@ -0,0 +1,230 @@
+"""
+Unit tests for batch collaboration scoring with the ensemble
+
+🏗️ Martin | Platform Architecture
+"""
+
+import random
+import unittest
+from datetime import datetime
+
+import numpy as np
+
+from lib.context_engineering.ml_pattern_engine import ML_AVAILABLE, CollaborationScorer
+from lib.context_engineering.ml_pattern_types import (
+    BatchCollaborationPrediction,
+    CollaborationOutcome,
+    EnsembleModelConfig,
+    FeatureVector,
+    TeamCollaborationOutcome,
+)
+
+
+def make_team(n, size, outcome=CollaborationOutcome.SUCCESS):
+    return TeamCollaborationOutcome(
+        team_id=f"team_{n}",
+        participants=[f"user_{i}" for i in range(size)],
+        outcome=outcome,
+        success_score=0.5,
+        duration_days=10 + n,
+        context={},
+        features=FeatureVector(),
+        timestamp=datetime.now(),
+    )
+
+
+class ContextFeatureExtractor:
+    """Derives distinct features per team from its context"""
+
+    def extract_features(self, interactions, context):
+        size = len(context["participants"])
+        return FeatureVector(
+            communication_features={"communication_frequency": size / 10},
+            temporal_features={"time_alignment": context["duration_days"] / 100},
+            network_features={"network_connectivity": 1 / size},
+        )
+
+
+class ProbabilityModel:
+    """Scores rows with a logistic function and counts calls"""
+
+    def __init__(self, scale):
+        self.scale = scale
+        self.calls = 0
+
+    def predict_proba(self, X):
+        self.calls += 1
+        positive = 1 / (1 + np.exp(-self.scale * (X.sum(axis=1) - 1)))
+        return np.column_stack([1 - positive, positive])
+
+
+class LabelModel:
+    """Predicts labels only, without probabilities"""
+
+    def predict(self, X):
+        return (X[:, 0] > 0.4).astype(int)
+
+
+class BrokenModel:
+    def predict_proba(self, X):
+        raise ValueError("not fitted")
+
+
+class TestBatchScoring(unittest.TestCase):
+    """Test that batch scoring matches per-team predictions"""
+
+    def setUp(self):
+        """Create a scorer with a hand-built ensemble"""
+        self.scorer = CollaborationScorer()
+        self.scorer.feature_extractor = ContextFeatureExtractor()
+        self.models = {
+            "steep": ProbabilityModel(4.0),
+            "shallow": ProbabilityModel(1.0),
+            "labels": LabelModel(),
+            "broken": BrokenModel(),
+        }
+        self.scorer.ensemble_models = dict(self.models)
+        self.scorer.model_weights = {"steep": 0.4, "shallow": 0.3, "labels": 0.2}
+        self.scorer.is_trained = True
+        rng = random.Random(5)
+        self.teams = [make_team(n, rng.randint(2, 9)) for n in range(40)]
+
+    def test_batch_runs_each_model_once(self):
+        """Each model sees the whole feature matrix in one call"""
+        batch = self.scorer.predict_collaboration_success_batch(self.teams)
+
+        self.assertIsInstance(batch, BatchCollaborationPrediction)
+        self.assertEqual(len(batch), 40)
+        self.assertEqual(self.models["steep"].calls, 1)
+        self.assertEqual(self.models["shallow"].calls, 1)
+        self.assertEqual(batch.success_probability.shape, (40,))
+        self.assertEqual(self.scorer.prediction_count, 40)
+
+    def test_batch_matches_single_predictions(self):
+        """Scores, confidences and per-model outputs equal the per-team path"""
+        batch = self.scorer.predict_collaboration_success_batch(self.teams)
+
+        for row, team in enumerate(self.teams):
+            single = self.scorer.predict_collaboration_success(team)
+            self.assertEqual(batch.team_ids[row], team.team_id)
+            self.assertAlmostEqual(
+                batch.success_probability[row], single.success_probability
+            )
+            self.assertAlmostEqual(batch.confidence_score[row], single.confidence_score)
+            self.assertEqual(
+                batch.outcome_predictions()[row], single.outcome_prediction
+            )
+            for name in self.models:
+                self.assertAlmostEqual(
+                    batch.ensemble_predictions[name][row],
+                    single.ensemble_predictions[name],
+                )
+                self.assertAlmostEqual(
+                    batch.model_confidence[name][row], single.model_confidence[name]
+                )
+
+    def test_weighted_score_is_normalized(self):
+        """Weights are normalized so unlisted models count at 0.25"""
+        batch = self.scorer.predict_collaboration_success_batch(self.teams)
+
+        weights = {"steep": 0.4, "shallow": 0.3, "labels": 0.2, "broken": 0.25}
+        expected = sum(
+            batch.ensemble_predictions[name] * weight
+            for name, weight in weights.items()
+        ) / sum(weights.values())
+        np.testing.assert_allclose(batch.success_probability, expected)
+        np.testing.assert_array_equal(batch.ensemble_predictions["broken"], 0.5)
+
+    def test_untrained_batch_uses_fallback_scoring(self):
+        """Without a trained ensemble every row gets the heuristic score"""
+        self.scorer.is_trained = False
+
+        batch = self.scorer.predict_collaboration_success_batch(self.teams[:3])
+
+        self.assertEqual(
+            list(batch.success_probability),
+            [
+                self.scorer.predict_collaboration_success(team).success_probability
+                for team in self.teams[:3]
+            ],
+        )
+        self.assertEqual(list(batch.confidence_score), [0.7, 0.7, 0.7])
+        self.assertEqual(batch.to_dict()["team_ids"], ["team_0", "team_1", "team_2"])
+
+
+@unittest.skipUnless(ML_AVAILABLE, "scikit-learn not installed")
+class TestTrainedEnsembleBatchScoring(unittest.TestCase):
+    """Test batch scoring against a trained scikit-learn ensemble"""
+
+    def setUp(self):
+        """Alternate successes and failures across team sizes"""
+        self.teams = [
+            make_team(
+                n,
+                2 + n % 6,
+                (
+                    CollaborationOutcome.SUCCESS
+                    if n % 2
+                    else CollaborationOutcome.FAILURE
+                ),
+            )
+            for n in range(30)
+        ]
+
+    def test_trained_ensemble_batch_matches_single(self):
+        """Training succeeds and batch scores equal per-team scores"""
+        scorer = CollaborationScorer()
+        teams = self.teams
+
+        result = scorer.train_ensemble(teams)
+        batch = scorer.predict_collaboration_success_batch(teams[:5])
+
+        self.assertTrue(result["success"])
+        for row, team in enumerate(teams[:5]):
+            self.assertAlmostEqual(
+                batch.success_probability[row],
+                scorer.predict_collaboration_success(team).success_probability,
+            )
+
+    def test_batch_scores_use_calibrated_models(self):
+        """Each model is calibrated at training time and scored calibrated"""
+        from sklearn.calibration import CalibratedClassifierCV
+
+        scorer = CollaborationScorer()
+        scorer.train_ensemble(self.teams)
+        batch = scorer.predict_collaboration_success_batch(self.teams)
+
+        X = scorer._features_to_matrix(
+            [
+                scorer.feature_extractor.extract_features([], scorer._team_context(t))
+                for t in self.teams
+            ]
+        )
+        for name, model in scorer.ensemble_models.items():
+            self.assertIsInstance(model, CalibratedClassifierCV)
+            np.testing.assert_allclose(
+                batch.ensemble_predictions[name], model.predict_proba(X)[:, 1]
+            )
+        self.assertIn(
+            "comm_freq",
+            scorer._calculate_feature_importance(FeatureVector()),
+        )
+
+        # Retraining calibrates the underlying model again, not the wrapper
+        scorer.train_ensemble(self.teams)
+        for model in scorer.ensemble_models.values():
+            self.assertNotIsInstance(model.estimator, CalibratedClassifierCV)
+
+    def test_calibration_can_be_disabled(self):
+        """calibration_method=None keeps raw predict_proba outputs"""
+        from sklearn.calibration import CalibratedClassifierCV
+
+        scorer = CollaborationScorer(EnsembleModelConfig(calibration_method=None))
+        scorer.train_ensemble(self.teams)
+
+        for model in scorer.ensemble_models.values():
+            self.assertNotIsInstance(model, CalibratedClassifierCV)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,159 @@
+"""
+Unit tests for budget-aware context packing
+
+🏗️ Martin | Platform Architecture
+"""
+
+import json
+import unittest
+
+from lib.context_engineering.context_orchestrator import ContextOrchestrator
+from lib.context_engineering.context_packer import ContextPacker
+
+
+def _conversation(topic: str, padding: int) -> dict:
+    return {"query": f"Discussion about {topic}", "notes": "x" * padding}
+
+
+class TestContextPacker(unittest.TestCase):
+    """Test knapsack selection, budgets and size caching"""
+
+    def setUp(self):
+        """Create a packer"""
+        self.packer = ContextPacker()
+
+    def test_everything_fits(self):
+        """Small contexts are returned whole, with real layer data"""
+        strategic = {"active_initiatives": 2, "initiatives": [{"name": "Platform"}]}
+
+        result = self.packer.pack({"strategic": (strategic, 0.5)}, 10_000)
+
+        self.assertEqual(result.method, "all")
+        self.assertEqual(result.context, {"strategic": strategic})
+        self.assertEqual(result.items_included, 2)
+
+    def test_knapsack_beats_first_fit(self):
+        """Two smaller valuable items win over one large item that fits alone"""
+        layers = {
+            "stakeholder": (
+                {
+                    "relevant_stakeholders": [
+                        {"name": "big", "relevance_score": 1.0, "bio": "x" * 500},
+                        {"name": "a", "relevance_score": 0.9, "bio": "x" * 200},
+                        {"name": "b", "relevance_score": 0.9, "bio": "x" * 200},
+                    ]
+                },
+                1.0,
+            )
+        }
+
+        result = self.packer.pack(layers, 620)
+
+        names = [
+            s["name"] for s in result.context["stakeholder"]["relevant_stakeholders"]
+        ]
+        self.assertEqual(names, ["a", "b"])
+        self.assertEqual(result.method, "knapsack")
+
+    def test_budget_is_respected(self):
+        """Packed JSON never exceeds the byte budget"""
+        layers = {
+            "conversation": (
+                {
+                    "conversations": [
+                        _conversation(f"topic {i}", 40 * i) for i in range(20)
+                    ],
+                    "relevance_scores": [1.0 - i * 0.04 for i in range(20)],
+                    "overall_relevance": 0.8,
+                },
+                0.2,
+            ),
+            "strategic": (
+                {"initiatives": [{"name": f"init {i}"} for i in range(10)]},
+                0.25,
+            ),
+        }
+
+        for budget in (200, 1_000, 4_000):
+            result = self.packer.pack(layers, budget)
+            actual = len(json.dumps(result.context).encode("utf-8"))
+            self.assertLessEqual(actual, budget)
+            self.assertGreaterEqual(result.size_bytes, actual)
+
+    def test_parallel_scores_stay_aligned(self):
+        """relevance_scores follow the conversations that were kept"""
+        conversations = [_conversation(f"topic {i}", 200) for i in range(4)]
+        layers = {
+            "conversation": (
+                {
+                    "conversations": conversations,
+                    "relevance_scores": [0.1, 0.9, 0.2, 0.8],
+                },
+                1.0,
+            )
+        }
+
+        result = self.packer.pack(layers, 600)
+
+        packed = result.context["conversation"]
+        self.assertEqual(packed["conversations"], [conversations[1], conversations[3]])
+        self.assertEqual(packed["relevance_scores"], [0.9, 0.8])
+
+    def test_item_sizes_are_cached(self):
+        """Sizing and packing in one scope reuse size estimates"""
+        layers = {
+            "strategic": ({"initiatives": [{"name": f"i{i}"} for i in range(5)]}, 1.0)
+        }
+
+        with self.packer.size_scope():
+            self.packer.layer_size(layers["strategic"][0])
+            misses = self.packer.size_cache_misses
+            self.packer.pack(layers, 10_000)
+
+        self.assertEqual(self.packer.size_cache_misses, misses)
+        self.assertGreater(self.packer.size_cache_hits, 0)
+
+    def test_in_place_mutation_between_packs_is_sized_fresh(self):
+        """Sizes are not reused across packs, so mutated items are re-measured"""
+        initiative = {"name": "platform"}
+        layers = {"strategic": ({"initiatives": [initiative]}, 1.0)}
+
+        before = self.packer.pack(layers, 10_000).size_bytes
+        initiative["notes"] = "x" * 500
+        after = self.packer.pack(layers, 10_000)
+
+        self.assertEqual(after.size_bytes, before + len(', "notes": ""') + 500)
+        self.assertIsNone(getattr(self.packer._scope, "sizes", None))
+
+
+class TestOrchestratorPacking(unittest.TestCase):
+    """Test ContextOrchestrator assembly with the packer"""
+
+    def test_assembly_includes_actual_layer_data(self):
+        """Assembled layers carry real items instead of placeholders"""
+        orchestrator = ContextOrchestrator({"relevance_threshold": 0.0})
+        conversations = [_conversation("team alignment", 100) for _ in range(3)]
+
+        result = orchestrator.assemble_strategic_context(
+            query="How do we improve team alignment on the roadmap?",
+            conversation_context={
+                "conversations": conversations,
+                "relevance_scores": [0.9, 0.8, 0.7],
+                "overall_relevance": 0.8,
+            },
+            strategic_context={"active_initiatives": [{"name": "Platform"}]},
+            stakeholder_context={},
+            learning_context={},
+            organizational_context={},
+            max_size_bytes=600,
+        )
+
+        assembled = result["strategic_context"]
+        self.assertIn(conversations[0], assembled["conversation"]["conversations"])
+        self.assertNotIn("included", assembled["conversation"])
+        self.assertLessEqual(result["assembly_metrics"]["context_size_bytes"], 600)
+        self.assertGreater(result["assembly_metrics"]["items_included"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
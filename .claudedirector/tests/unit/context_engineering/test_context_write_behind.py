@@ -0,0 +1,210 @@
+"""
+Unit tests for write-behind context persistence
+
+🏗️ Martin | Platform Architecture
+"""
+
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from lib.context_engineering.context_write_behind import (
+    ContextWriteBehindBuffer,
+    PendingContextUpdate,
+)
+from lib.context_engineering.strategic_memory_manager import StrategicMemoryManager
+from lib.core.connection_pool import close_all_connection_pools
+
+
+def _wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return condition()
+
+
+class TestContextWriteBehindBuffer(unittest.TestCase):
+    """Test coalescing, thresholds and failure handling"""
+
+    def setUp(self):
+        """Record flushed batches instead of writing to SQLite"""
+        self.batches = []
+
+    def _buffer(self, **kwargs):
+        buffer = ContextWriteBehindBuffer(self.batches.append, **kwargs)
+        self.addCleanup(buffer.close)
+        return buffer
+
+    def test_updates_coalesce_per_session(self):
+        """Only the latest update per session is flushed"""
+        buffer = self._buffer(max_delay_seconds=60)
+        for turn in range(5):
+            buffer.put(PendingContextUpdate("s1", {"turn": turn}, None))
+        buffer.put(PendingContextUpdate("s2", {"turn": 0}, None))
+
+        self.assertEqual(buffer.get("s1").context_data, {"turn": 4})
+        self.assertEqual(buffer.flush(), 2)
+        self.assertEqual(len(self.batches), 1)
+        self.assertEqual(
+            {u.session_id: u.context_data["turn"] for u in self.batches[0]},
+            {"s1": 4, "s2": 0},
+        )
+        self.assertEqual(buffer.get_stats()["coalesced_updates"], 4)
+        self.assertIsNone(buffer.get("s1"))
+
+    def test_size_threshold_flushes_in_background(self):
+        """Reaching max_pending_updates triggers a flush"""
+        buffer = self._buffer(max_pending_updates=3, max_delay_seconds=60)
+        for turn in range(3):
+            buffer.put(PendingContextUpdate("s1", {"turn": turn}, None))
+
+        self.assertTrue(_wait_for(lambda: self.batches))
+        self.assertEqual(self.batches[0][0].context_data, {"turn": 2})
+
+    def test_time_threshold_flushes_in_background(self):
+        """An update older than max_delay_seconds is flushed"""
+        buffer = self._buffer(max_delay_seconds=0.05)
+        buffer.put(PendingContextUpdate("s1", {"turn": 1}, None))
+
+        self.assertTrue(_wait_for(lambda: self.batches))
+        self.assertEqual(buffer.pending_sessions, 0)
+
+    def test_failed_flush_requeues_batch(self):
+        """A failing flush keeps updates pending unless superseded"""
+        calls = []
+
+        def failing_flush(updates):
+            calls.append(updates)
+            raise OSError("disk unavailable")
+
+        buffer = ContextWriteBehindBuffer(failing_flush, max_delay_seconds=60)
+        buffer.put(PendingContextUpdate("s1", {"turn": 1}, None))
+
+        with self.assertRaises(OSError):
+            buffer.flush()
+        self.assertEqual(buffer.get("s1").context_data, {"turn": 1})
+        self.assertEqual(buffer.get_stats()["flush_failures"], 1)
+
+        buffer.flush_callback = self.batches.append
+        buffer.close()
+        self.assertEqual(self.batches[0][0].context_data, {"turn": 1})
+
+
+class TestStrategicMemoryWriteBehind(unittest.TestCase):
+    """Test write-behind integration in StrategicMemoryManager"""
+
+    def setUp(self):
+        """Create a memory manager on a temporary database"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.memory = StrategicMemoryManager(
+            db_path=str(Path(self.temp_dir.name) / "memory.db"),
+            enable_performance=False,
+            write_behind_max_delay_seconds=60,
+        )
+        self.session_id = self.memory.start_session()
+
+    def tearDown(self):
+        """Close pools and remove temporary files"""
+        self.memory.close()
+        close_all_connection_pools()
+        self.temp_dir.cleanup()
+
+    def _backup_count(self):
+        with self.memory.get_connection() as conn:
+            return conn.execute(
+                "SELECT COUNT(*) FROM session_continuity WHERE session_id = ?",
+                (self.session_id,),
+            ).fetchone()[0]
+
+    def test_recover_reads_pending_writes(self):
+        """Queued updates are visible before they are committed"""
+        self.memory.preserve_context(
+            self.session_id, {"roi_discussions": ["q3"]}, ["executive"]
+        )
+
+        self.assertEqual(self._backup_count(), 0)
+        recovered = self.memory.recover_session_context(self.session_id)
+        self.assertEqual(recovered["context_data"], {"roi_discussions": ["q3"]})
+        self.assertEqual(
+            recovered["critical_context"],
+            {"roi_discussions": ["q3"], "critical_indicators": ["executive"]},
+        )
+        self.assertTrue(recovered["recovery_available"])
+
+    def test_queued_context_is_a_snapshot(self):
+        """Mutating the caller's dict after queueing changes nothing"""
+        context = {"roi_discussions": ["q3"]}
+        indicators = ["executive"]
+        self.memory.preserve_context(self.session_id, context, indicators)
+        context["roi_discussions"].append("q4")
+        context["leaked"] = True
+        indicators.append("board")
+
+        pending = self.memory.recover_session_context(self.session_id)
+        pending["context_data"]["roi_discussions"].append("mutated by reader")
+        self.assertEqual(
+            self.memory.recover_session_context(self.session_id)["context_data"],
+            {"roi_discussions": ["q3"]},
+        )
+
+        self.memory.flush_pending_writes()
+        committed = self.memory.recover_session_context(self.session_id)
+        self.assertEqual(committed["context_data"], {"roi_discussions": ["q3"]})
+        self.assertEqual(
+            committed["critical_context"]["critical_indicators"], ["executive"]
+        )
+
+    def test_recover_sees_flush_racing_with_read(self):
+        """A flush committing right after the database read is not lost"""
+        self.memory.preserve_context(self.session_id, {"turn": 1})
+        self.memory.flush_pending_writes()
+        self.memory.preserve_context(self.session_id, {"turn": 2})
+        read = self.memory._read_session_context
+
+        def read_then_flush(conn, session_id):
+            context = read(conn, session_id)
+            self.memory.flush_pending_writes()
+            return context
+
+        with mock.patch.object(
+            self.memory, "_read_session_context", side_effect=read_then_flush
+        ):
+            recovered = self.memory.recover_session_context(self.session_id)
+
+        self.assertEqual(recovered["context_data"], {"turn": 2})
+
+    def test_turns_coalesce_into_one_commit(self):
+        """Many turns in one session produce a single flushed update"""
+        for turn in range(10):
+            self.memory.preserve_context(self.session_id, {"turn": turn})
+
+        self.assertEqual(self.memory.flush_pending_writes(), 1)
+        self.assertEqual(self._backup_count(), 1)
+        recovered = self.memory.recover_session_context(self.session_id)
+        self.assertEqual(recovered["context_data"], {"turn": 9})
+
+    def test_close_flushes_and_writes_through(self):
+        """Shutdown flushes pending updates; later writes go straight to disk"""
+        self.memory.preserve_context(self.session_id, {"turn": 1})
+        self.memory.close()
+
+        self.assertEqual(self._backup_count(), 1)
+        self.memory.preserve_context(self.session_id, {"turn": 2})
+        self.assertEqual(self._backup_count(), 2)
+
+    def test_write_behind_disabled(self):
+        """write_behind=False keeps the synchronous commit per call"""
+        memory = StrategicMemoryManager(
+            db_path=self.memory.db_path, enable_performance=False, write_behind=False
+        )
+        memory.preserve_context(self.session_id, {"turn": 1})
+
+        self.assertEqual(self._backup_count(), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+"""
+Unit tests for indexed conversation retrieval
+
+🏗️ Martin | Platform Architecture
+"""
+
+import time
+import unittest
+
+from lib.context_engineering.conversation_layer import ConversationLayerMemory
+
+QUERIES = [
+    "How should the platform team approach architecture decisions?",
+    "Stakeholder alignment on the design system initiative",
+    "Business ROI of our organization structure",
+    "Quarterly planning for leadership and scaling",
+    "Lunch options near the office",
+]
+
+
+class TestConversationIndex(unittest.TestCase):
+    """Test that indexed retrieval matches exhaustive scoring"""
+
+    def setUp(self):
+        """Create a conversation layer with a mixed history"""
+        self.memory = ConversationLayerMemory({"max_conversations": 50})
+        now = time.time()
+        for i in range(80):
+            self.memory.store_conversation_context(
+                {
+                    "session_id": "s1",
+                    "query": QUERIES[i % len(QUERIES)],
+                    "timestamp": now - i * 3600,
+                }
+            )
+
+    def _exhaustive(self, query: str, session_id: str = "s1"):
+        topics = self.memory._extract_topics(query)
+        domains = self.memory._identify_strategic_domains(query)
+        scored = []
+        for conv in self.memory.conversations[session_id]:
+            score = self.memory._calculate_conversation_relevance(topics, domains, conv)
+            if score > 0.3:
+                scored.append((conv, score))
+        scored.sort(key=lambda x: x[1], reverse=True)
+        return scored[:5]
+
+    def test_matches_exhaustive_scoring(self):
+        """Top results and scores are identical to scoring every conversation"""
+        for query in QUERIES + ["team platform design", ""]:
+            expected = self._exhaustive(query)
+            result = self.memory.retrieve_relevant_context(query, "s1")
+
+            self.assertEqual(result["conversations"], [c for c, _ in expected])
+            # Time decay is evaluated per call, so scores drift by microseconds
+            for actual, (_, score) in zip(result["relevance_scores"], expected):
+                self.assertAlmostEqual(actual, score, places=6)
+
+    def test_session_limit_keeps_index_in_sync(self):
+        """Trimmed conversations are no longer returned"""
+        self.assertEqual(len(self.memory.conversations["s1"]), 50)
+
+        result = self.memory.retrieve_relevant_context(QUERIES[0], "s1")
+
+        stored = {id(c) for c in self.memory.conversations["s1"]}
+        self.assertTrue(all(id(c) in stored for c in result["conversations"]))
+        self.assertEqual(result["total_conversations"], 50)
+
+    def test_expired_conversations_are_dropped(self):
+        """Conversations past the retention window leave the index"""
+        memory = ConversationLayerMemory({"retention_days": 1})
+        memory.store_conversation_context(
+            {
+                "session_id": "s2",
+                "query": "platform architecture",
+                "timestamp": time.time() - 3 * 24 * 3600,
+            }
+        )
+        memory.store_conversation_context(
+            {"session_id": "s2", "query": "platform strategy"}
+        )
+
+        result = memory.retrieve_relevant_context("platform architecture", "s2")
+
+        self.assertEqual(len(memory.conversations["s2"]), 1)
+        self.assertEqual(
+            [c["query"] for c in result["conversations"]], ["platform strategy"]
+        )
+
+    def test_replaced_conversation_list_is_reindexed(self):
+        """Externally assigned session history is picked up on next query"""
+        self.memory.conversations["s1"] = self.memory.conversations["s1"][:3]
+
+        result = self.memory.retrieve_relevant_context(QUERIES[0], "s1")
+
+        self.assertEqual(
+            result["conversations"], [c for c, _ in self._exhaustive(QUERIES[0])]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,255 @@
+"""
+Unit tests for versioned ML model artifacts and warm loading
+
+🏗️ Martin | Platform Architecture
+"""
+
+import random
+import shutil
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+from lib.context_engineering.ml_models import MLPatternEngine
+from lib.context_engineering.ml_models.collaboration_classifier import (
+    ML_AVAILABLE as CLASSIFIER_ML_AVAILABLE,
+)
+from lib.context_engineering.ml_models.collaboration_scorer import (
+    CollaborationScorer as ModelsCollaborationScorer,
+)
+from lib.context_engineering.ml_models.model_registry import (
+    ModelRegistry,
+    RegistryPersistenceMixin,
+    feature_schema_hash,
+)
+from lib.context_engineering.ml_pattern_engine import CollaborationScorer
+from lib.context_engineering.ml_pattern_types import (
+    CollaborationOutcome,
+    EnsembleModelConfig,
+    FeatureVector,
+    TeamCollaborationOutcome,
+)
+
+
+class ThresholdModel:
+    """Picklable stand-in estimator with a fixed decision rule"""
+
+    def __init__(self, offset):
+        self.offset = offset
+
+    def predict_proba(self, X):
+        positive = np.clip(X.sum(axis=1) + self.offset, 0, 1)
+        return np.column_stack([1 - positive, positive])
+
+
+def make_team(n, outcome=CollaborationOutcome.SUCCESS, features=None):
+    return TeamCollaborationOutcome(
+        team_id=f"team_{n}",
+        participants=[f"user_{i}" for i in range(2 + n % 5)],
+        outcome=outcome,
+        success_score=0.5,
+        duration_days=30,
+        context={},
+        features=features or FeatureVector(),
+        timestamp=datetime.now(),
+    )
+
+
+class TestModelRegistry(unittest.TestCase):
+    """Test versioning, schema checks and lazy loading"""
+
+    def setUp(self):
+        """Create an empty registry root"""
+        self.root = Path(tempfile.mkdtemp(prefix="test_model_registry_"))
+        self.addCleanup(shutil.rmtree, self.root, ignore_errors=True)
+        self.registry = ModelRegistry(self.root)
+        self.columns = [("network_features", "centrality_score"), "extra"]
+
+    def test_saves_are_new_versions(self):
+        """Every save publishes the next version; latest is the default"""
+        self.registry.save("scorer", {"a": ThresholdModel(0.1)}, self.columns)
+        second = self.registry.save(
+            "scorer", {"a": ThresholdModel(0.2)}, self.columns, {"note": "retrain"}
+        )
+
+        self.assertEqual(self.registry.versions("scorer"), [1, 2])
+        self.assertEqual(second.version, 2)
+        self.assertEqual(self.registry.get("scorer").metadata, {"note": "retrain"})
+        self.assertEqual(self.registry.load("scorer", version=1)["a"].offset, 0.1)
+        self.assertEqual(self.registry.load("scorer")["a"].offset, 0.2)
+        self.assertEqual(len(list((self.root / "scorer").iterdir())), 2)
+
+    def test_models_load_lazily(self):
+        """Loading reads the manifest; model files are read on first access"""
+        self.registry.save(
+            "scorer", {"a": ThresholdModel(0.1), "b": ThresholdModel(0.3)}, self.columns
+        )
+
+        models = self.registry.load("scorer", self.columns)
+
+        self.assertEqual(list(models), ["a", "b"])
+        self.assertEqual(models.loaded_models, [])
+        self.assertEqual(models["b"].offset, 0.3)
+        self.assertEqual(models.loaded_models, ["b"])
+
+    def test_schema_mismatch_is_rejected(self):
+        """Artifacts trained on another feature layout are not served"""
+        artifact = self.registry.save("scorer", {"a": ThresholdModel(0)}, self.columns)
+
+        self.assertEqual(artifact.schema_hash, feature_schema_hash(self.columns))
+        self.assertIsNone(self.registry.load("scorer", list(reversed(self.columns))))
+        self.assertIsNone(self.registry.load("missing", self.columns))
+
+    def test_latest_compatible_version_is_served(self):
+        """A newer save on another layout does not hide older compatible ones"""
+        other_columns = list(reversed(self.columns))
+        self.registry.save("scorer", {"a": ThresholdModel(0.1)}, self.columns)
+        self.registry.save("scorer", {"a": ThresholdModel(0.2)}, self.columns)
+        self.registry.save("scorer", {"a": ThresholdModel(0.9)}, other_columns)
+
+        models = self.registry.load("scorer", self.columns)
+
+        self.assertEqual(models.artifact.version, 2)
+        self.assertEqual(models["a"].offset, 0.2)
+        self.assertEqual(self.registry.load("scorer", other_columns)["a"].offset, 0.9)
+        self.assertIsNone(self.registry.load("scorer", self.columns, version=3))
+
+
+class TestScorerWarmLoading(unittest.TestCase):
+    """Test that a restarted scorer serves the saved ensemble"""
+
+    def setUp(self):
+        """Create a registry root and a scorer with a hand-built ensemble"""
+        self.root = tempfile.mkdtemp(prefix="test_model_registry_")
+        self.addCleanup(shutil.rmtree, self.root, ignore_errors=True)
+        self.scorer = CollaborationScorer()
+        self.scorer.ensemble_models = {
+            "low": ThresholdModel(-0.2),
+            "high": ThresholdModel(0.4),
+        }
+        self.scorer.model_weights = {"low": 0.75, "high": 0.25}
+        self.scorer.is_trained = True
+        self.scorer.training_data_count = 12
+        self.teams = [make_team(n) for n in range(8)]
+
+    def test_restarted_scorer_serves_saved_models(self):
+        """Predictions after a warm start equal those of the trained scorer"""
+        artifact = self.scorer.save_models(ModelRegistry(self.root))
+        expected = self.scorer.predict_collaboration_success_batch(self.teams)
+
+        restarted = CollaborationScorer(
+            EnsembleModelConfig(model_registry_path=self.root)
+        )
+        actual = restarted.predict_collaboration_success_batch(self.teams)
+
+        self.assertEqual(artifact.version, 1)
+        self.assertTrue(restarted.is_trained)
+        self.assertEqual(restarted.get_model_status()["model_version"], 1)
+        self.assertEqual(restarted.model_weights, self.scorer.model_weights)
+        self.assertEqual(restarted.training_data_count, 12)
+        np.testing.assert_allclose(
+            actual.success_probability, expected.success_probability
+        )
+
+    def test_untrained_scorer_is_not_saved(self):
+        """Nothing is written without a trained ensemble"""
+        self.scorer.is_trained = False
+        registry = ModelRegistry(self.root)
+
+        self.assertIsNone(self.scorer.save_models(registry))
+        self.assertEqual(registry.versions("collaboration_scorer"), [])
+
+
+class TestModelsScorerPersistence(unittest.TestCase):
+    """Test the ml_models scorer against the registry's feature schema"""
+
+    def test_vector_follows_feature_columns(self):
+        """Model input columns are the ones the schema hash is built from"""
+        scorer = ModelsCollaborationScorer()
+        features = FeatureVector()
+        for n, (category, name) in enumerate(scorer.FEATURE_COLUMNS):
+            getattr(features, category)[name] = n / 10
+
+        vector = scorer._features_to_vector(features)
+
+        np.testing.assert_allclose(
+            vector, [n / 10 for n in range(len(scorer.FEATURE_COLUMNS))]
+        )
+        self.assertIsInstance(scorer, RegistryPersistenceMixin)
+
+    def test_save_and_warm_load(self):
+        """The shared save/load round-trips the ml_models scorer's ensemble"""
+        root = tempfile.mkdtemp(prefix="test_model_registry_")
+        self.addCleanup(shutil.rmtree, root, ignore_errors=True)
+        scorer = ModelsCollaborationScorer()
+        scorer.ensemble_models = {"low": ThresholdModel(-0.2)}
+        scorer.model_weights = {"low": 1.0}
+        scorer.is_trained = True
+
+        artifact = scorer.save_models(ModelRegistry(root))
+        restarted = ModelsCollaborationScorer(
+            EnsembleModelConfig(model_registry_path=root)
+        )
+
+        self.assertEqual(artifact.version, 1)
+        self.assertTrue(restarted.is_trained)
+        self.assertEqual(restarted.model_version, 1)
+        self.assertEqual(restarted.ensemble_models["low"].offset, -0.2)
+
+
+@unittest.skipUnless(CLASSIFIER_ML_AVAILABLE, "scikit-learn not installed")
+class TestEngineWarmLoading(unittest.TestCase):
+    """Test that MLPatternEngine skips retraining after a restart"""
+
+    def test_engine_restart_loads_trained_classifier(self):
+        """A second engine on the same registry predicts like the first"""
+        root = tempfile.mkdtemp(prefix="test_model_registry_")
+        self.addCleanup(shutil.rmtree, root, ignore_errors=True)
+        rng = random.Random(2)
+        training_data = []
+        for n in range(40):
+            alignment = rng.random()
+            training_data.append(
+                make_team(
+                    n,
+                    (
+                        CollaborationOutcome.SUCCESS
+                        if alignment > 0.5
+                        else CollaborationOutcome.FAILURE
+                    ),
+                    FeatureVector(
+                        communication_features={"frequency": rng.random()},
+                        temporal_features={"alignment": alignment},
+                    ),
+                )
+            )
+        probe = FeatureVector(
+            communication_features={"frequency": 0.4},
+            temporal_features={"alignment": 0.9},
+        )
+
+        engine = MLPatternEngine({"model_registry_path": root})
+        metrics = engine.train_models(training_data)
+        restarted = MLPatternEngine({"model_registry_path": root})
+
+        self.assertEqual(metrics["model_version"], 1)
+        self.assertTrue(restarted.get_engine_status()["models_trained"])
+        self.assertEqual(
+            restarted.pattern_classifier.feature_names,
+            ["communication.frequency", "temporal.alignment"],
+        )
+        self.assertAlmostEqual(
+            restarted.pattern_classifier.predict_collaboration_success(
+                probe
+            ).success_probability,
+            engine.pattern_classifier.predict_collaboration_success(
+                probe
+            ).success_probability,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
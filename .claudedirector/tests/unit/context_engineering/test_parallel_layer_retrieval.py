@@ -0,0 +1,115 @@
+"""
+Unit tests for concurrent context layer retrieval with deadlines
+
+🏗️ Martin | Platform Architecture
+"""
+
+import time
+import unittest
+from unittest.mock import patch
+
+from lib.context_engineering.advanced_context_engine import AdvancedContextEngine
+
+QUERY = "How should we align platform strategy with stakeholder priorities?"
+
+
+class TestParallelLayerRetrieval(unittest.TestCase):
+    """Test per-layer deadlines and metrics reporting"""
+
+    def _engine(self, **retrieval):
+        retrieval.setdefault("parallel", True)
+        engine = AdvancedContextEngine(
+            {"workspace": {"enabled": False}, "retrieval": retrieval}
+        )
+        self.addCleanup(engine.cleanup)
+        return engine
+
+    def test_layers_retrieved_concurrently(self):
+        """Slow independent layers overlap instead of adding up"""
+        engine = self._engine()
+
+        def slow(layer):
+            def delayed(query, session_id):
+                time.sleep(0.2)
+                return layer(query, session_id)
+
+            return delayed
+
+        with patch.object(
+            engine, "_get_strategic_context", slow(engine._get_strategic_context)
+        ), patch.object(
+            engine, "_get_learning_context", slow(engine._get_learning_context)
+        ):
+            started = time.time()
+            result = engine.get_contextual_intelligence(QUERY)
+            elapsed = time.time() - started
+
+        self.assertLess(elapsed, 0.35)
+        self.assertIn("strategic", result["metrics"]["layers_accessed"])
+        self.assertIn("learning", result["metrics"]["layers_accessed"])
+        self.assertEqual(result["metrics"]["layers_skipped"], [])
+
+    def test_layer_missing_deadline_is_skipped(self):
+        """A layer past its deadline is dropped and reported, not awaited"""
+        engine = self._engine(layer_deadlines={"learning": 0.05})
+
+        def stuck_layer(query, session_id):
+            time.sleep(0.5)
+            return {"skills": ["late"]}
+
+        with patch.object(engine, "_get_learning_context", stuck_layer):
+            started = time.time()
+            result = engine.get_contextual_intelligence(QUERY)
+            elapsed = time.time() - started
+
+        self.assertLess(elapsed, 0.4)
+        self.assertEqual(result["metrics"]["layers_skipped"], ["learning"])
+        self.assertNotIn("learning", result["metrics"]["layers_accessed"])
+        self.assertEqual(engine.performance_metrics[-1].layers_skipped, ["learning"])
+        self.assertEqual(
+            engine.get_performance_summary()["performance_summary"][
+                "retrievals_with_skipped_layers"
+            ],
+            1,
+        )
+
+    def test_core_layer_failure_uses_fallback(self):
+        """A failing core layer still degrades to the fallback context"""
+        engine = self._engine()
+
+        with patch.object(
+            engine, "_get_strategic_context", side_effect=RuntimeError("down")
+        ):
+            result = engine.get_contextual_intelligence(QUERY)
+
+        self.assertEqual(result["metrics"]["layers_accessed"], ["fallback"])
+
+    def test_insight_extraction_failure_skips_only_that_insight(self):
+        """Context extraction errors drop one insight, not the whole request"""
+        engine = self._engine()
+
+        with patch.object(
+            engine,
+            "_extract_initiatives_from_context",
+            side_effect=RuntimeError("bad initiative"),
+        ):
+            result = engine.get_contextual_intelligence(QUERY)
+
+        self.assertIn("analytics", result["metrics"]["layers_failed"])
+        self.assertNotIn("analytics", result["metrics"]["layers_accessed"])
+        self.assertIn("strategic", result["metrics"]["layers_accessed"])
+        self.assertNotIn("fallback", result["metrics"]["layers_accessed"])
+
+    def test_serial_mode(self):
+        """parallel=False keeps in-line retrieval with per-layer timings"""
+        engine = self._engine(parallel=False)
+
+        result = engine.get_contextual_intelligence(QUERY)
+
+        self.assertIsNone(engine._layer_executor)
+        self.assertIn("conversation", result["metrics"]["layer_timings_ms"])
+        self.assertEqual(result["metrics"]["layers_skipped"], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
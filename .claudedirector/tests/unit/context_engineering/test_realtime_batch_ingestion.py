@@ -0,0 +1,140 @@
+"""
+Unit tests for batched async ingestion in the realtime monitor
+
+🏗️ Martin | Platform Architecture
+"""
+
+import asyncio
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+
+from lib.context_engineering.realtime_monitor import (
+    EventType,
+    RealTimeBottleneckDetector,
+    RealTimeMonitor,
+    StageLatencyTracker,
+    TeamEvent,
+)
+
+
+def make_events(count, event_type=EventType.DEPENDENCY_BLOCK, team_id=None, start=0):
+    return [
+        TeamEvent(
+            event_id=f"evt_{n}",
+            event_type=event_type,
+            timestamp=datetime.now(),
+            team_id=team_id or f"team_{n % 3}",
+            participants=[],
+            context={"severity": "high"},
+        )
+        for n in range(start, start + count)
+    ]
+
+
+def alert_kinds(alerts):
+    """Alert ids without their timestamp suffix"""
+    return {alert.alert_id.rsplit("_", 1)[0] for alert in alerts}
+
+
+class TestBatchIngestion(unittest.TestCase):
+    """Test micro-batch processing and the asyncio consumer"""
+
+    def setUp(self):
+        """Create a monitor with small, fast batches"""
+        self.monitor = RealTimeMonitor(
+            {"ingest_batch_size": 10, "ingest_batch_delay_ms": 20}
+        )
+
+    def test_batch_runs_bottleneck_detection_once(self):
+        """A batch costs one detector pass and matches per-event alerts"""
+        events = make_events(25)
+        sequential = RealTimeMonitor({})
+        expected = [sequential.process_team_event(e) for e in events]
+
+        with patch.object(
+            RealTimeBottleneckDetector,
+            "analyze_bottleneck",
+            wraps=self.monitor.bottleneck_detector.analyze_bottleneck,
+        ) as analyze:
+            alerts = self.monitor.process_event_batch(events)
+
+        self.assertEqual(analyze.call_count, 1)
+        self.assertEqual(self.monitor.events_processed, 25)
+        # Per-event pattern alerts are unchanged by batching
+        self.assertEqual(
+            [a.source_events for a in alerts if a.team_id != "multi_team"],
+            [
+                a.source_events
+                for batch in expected
+                for a in batch
+                if a.team_id != "multi_team"
+            ],
+        )
+
+    def test_batch_bottlenecks_match_single_events(self):
+        """Patterns early in a large batch are still detected"""
+        events = make_events(3, EventType.COMMUNICATION_DELAY, "A") + make_events(
+            20, EventType.PROCESS_DEVIATION, "B", start=3
+        )
+        sequential = RealTimeMonitor({})
+        expected = [a for e in events for a in sequential.process_team_event(e)]
+
+        alerts = self.monitor.process_event_batch(events)
+
+        self.assertIn("comm_lag_A", alert_kinds(expected))
+        self.assertEqual(alert_kinds(alerts), alert_kinds(expected))
+
+    def test_async_consumer_bounds_batches_by_size_and_time(self):
+        """Bursts split at ingest_batch_size; stragglers flush after the delay"""
+
+        async def scenario():
+            await self.monitor.start_async_ingestion()
+            await self.monitor.submit_events(make_events(25))
+            await asyncio.sleep(0.2)  # Past the batch delay
+            processed_before_stop = self.monitor.events_processed
+            await self.monitor.submit_event(make_events(1)[0])
+            await self.monitor.stop_async_ingestion()
+            return processed_before_stop
+
+        processed_before_stop = asyncio.run(scenario())
+
+        self.assertEqual(processed_before_stop, 25)
+        self.assertEqual(self.monitor.events_processed, 26)
+        self.assertEqual(self.monitor.batches_processed, 4)  # 10 + 10 + 5 + 1
+
+        metrics = self.monitor.get_performance_metrics()
+        stages = metrics["stage_latency_ms"]
+        self.assertEqual(stages["detection_latency"]["count"], 26)
+        self.assertEqual(stages["bottleneck_detection"]["count"], 4)
+        self.assertGreaterEqual(
+            stages["queue_wait"]["p99_ms"], stages["queue_wait"]["p50_ms"]
+        )
+
+    def test_submit_requires_running_consumer(self):
+        """Submitting without a consumer is an error, not a silent drop"""
+        with self.assertRaises(RuntimeError):
+            asyncio.run(self.monitor.submit_events(make_events(1)))
+
+
+class TestStageLatencyTracker(unittest.TestCase):
+    """Test percentile reporting"""
+
+    def test_nearest_rank_percentiles(self):
+        """Percentiles use nearest rank over the retained samples"""
+        tracker = StageLatencyTracker(max_samples=100)
+        for ms in range(1, 201):
+            tracker.record("stage", ms / 1000)
+
+        stats = tracker.percentiles()["stage"]
+
+        self.assertEqual(stats["count"], 200)
+        # Only the latest 100 samples (101..200 ms) are retained
+        self.assertAlmostEqual(stats["p50_ms"], 150)
+        self.assertAlmostEqual(stats["p95_ms"], 195)
+        self.assertAlmostEqual(stats["p99_ms"], 199)
+        self.assertAlmostEqual(stats["max_ms"], 200)
+
+
+if __name__ == "__main__":
+    unittest.main()
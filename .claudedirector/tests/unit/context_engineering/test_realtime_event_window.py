@@ -0,0 +1,194 @@
+"""
+Unit tests for the windowed realtime monitor event store
+
+🏗️ Martin | Platform Architecture
+"""
+
+import random
+import unittest
+from datetime import datetime, timedelta
+
+from lib.context_engineering.realtime_monitor import (
+    EventProcessor,
+    EventType,
+    EventWindow,
+    RealTimeBottleneckDetector,
+    TeamEvent,
+)
+
+
+def make_event(n, event_type, team_id, timestamp, severity="high"):
+    return TeamEvent(
+        event_id=f"evt_{n}",
+        event_type=event_type,
+        timestamp=timestamp,
+        team_id=team_id,
+        participants=[],
+        context={"severity": severity},
+    )
+
+
+def scan_alerts(history, event, thresholds):
+    """Reference pattern checks: rescan the full history list"""
+
+    def matching(event_type, severity=None):
+        return [
+            e
+            for e in history
+            if e.team_id == event.team_id
+            and e.event_type == event_type
+            and (severity is None or e.context.get("severity") == severity)
+        ]
+
+    if event.event_type == EventType.COMMUNICATION_DELAY:
+        if event.context.get("severity") != "high":
+            return []
+        found = matching(EventType.COMMUNICATION_DELAY, "high")
+        if len(found) >= thresholds.get("communication_threshold", 3):
+            return [[e.event_id for e in found[-3:]]]
+    elif event.event_type == EventType.DEPENDENCY_BLOCK:
+        found = matching(EventType.DEPENDENCY_BLOCK)
+        if len(found) >= thresholds.get("dependency_threshold", 2):
+            return [[e.event_id for e in found[-2:]]]
+    elif event.event_type == EventType.WORKFLOW_BOTTLENECK:
+        found = matching(EventType.WORKFLOW_BOTTLENECK)
+        if len(found) >= thresholds.get("workflow_threshold", 2):
+            return [[e.event_id for e in found[-2:]]]
+    elif event.event_type == EventType.STAKEHOLDER_CONFLICT:
+        if matching(EventType.STAKEHOLDER_CONFLICT):
+            return [[event.event_id]]
+    return []
+
+
+class TestEventWindow(unittest.TestCase):
+    """Test ordering, expiry and running aggregates"""
+
+    def setUp(self):
+        """Create a 30 minute window"""
+        self.now = datetime.now()
+        self.window = EventWindow(timedelta(minutes=30))
+
+    def test_expiry_drops_only_old_events(self):
+        """Events at or past the window edge are expired from the head"""
+        self.window.add(
+            make_event(
+                1, EventType.DEPENDENCY_BLOCK, "a", self.now - timedelta(hours=1)
+            )
+        )
+        self.window.add(make_event(2, EventType.DEPENDENCY_BLOCK, "a", self.now))
+
+        self.assertEqual(self.window.expire(self.now), 1)
+        self.assertEqual([e.event_id for e in self.window], ["evt_2"])
+        self.assertEqual(self.window.count(EventType.DEPENDENCY_BLOCK, "a"), 1)
+        self.assertEqual(self.window.teams(EventType.DEPENDENCY_BLOCK), ["a"])
+
+    def test_out_of_order_events_are_time_ordered(self):
+        """Late arrivals are placed by timestamp"""
+        for n, minutes in enumerate([5, 1, 3]):
+            self.window.add(
+                make_event(
+                    n,
+                    EventType.WORKFLOW_BOTTLENECK,
+                    "a",
+                    self.now - timedelta(minutes=minutes),
+                )
+            )
+
+        self.assertEqual(
+            [e.event_id for e in self.window.events(EventType.WORKFLOW_BOTTLENECK)],
+            ["evt_0", "evt_2", "evt_1"],
+        )
+        self.assertEqual(
+            [
+                e.event_id
+                for e in self.window.latest(EventType.WORKFLOW_BOTTLENECK, "a", limit=2)
+            ],
+            ["evt_2", "evt_1"],
+        )
+
+    def test_severity_histogram_and_ring_bound(self):
+        """Histograms track severities and max_events evicts the oldest"""
+        window = EventWindow(max_events=3)
+        for n, severity in enumerate(["high", "low", "high", "high"]):
+            window.add(
+                make_event(
+                    n,
+                    EventType.COMMUNICATION_DELAY,
+                    "a",
+                    self.now + timedelta(seconds=n),
+                    severity,
+                )
+            )
+
+        self.assertEqual(len(window), 3)
+        self.assertEqual(
+            window.severity_histogram(EventType.COMMUNICATION_DELAY, "a"),
+            {"low": 1, "high": 2},
+        )
+        self.assertEqual([e.event_id for e in window.recent(2)], ["evt_2", "evt_3"])
+
+
+class TestWindowedPatternDetection(unittest.TestCase):
+    """Test that aggregate-based checks match a full history scan"""
+
+    def test_process_event_matches_history_scan(self):
+        """Alerts and their source events equal the list-scanning checks"""
+        rng = random.Random(3)
+        processor = EventProcessor({"analysis_window_minutes": 30})
+        history = []
+        start = datetime.now() - timedelta(minutes=20)
+        for n in range(400):
+            event_type = rng.choice(list(EventType))
+            if rng.random() < 0.1:
+                timestamp = start - timedelta(hours=2)  # Already expired
+            else:
+                timestamp = start + timedelta(seconds=n)
+            event = make_event(
+                n,
+                event_type,
+                rng.choice(["a", "b", "c"]),
+                timestamp,
+                rng.choice(["high", "low"]),
+            )
+
+            alerts = processor.process_event(event)
+
+            history = [
+                e
+                for e in history + [event]
+                if e.timestamp > datetime.now() - timedelta(minutes=30)
+            ]
+            self.assertEqual(
+                [alert.source_events for alert in alerts],
+                scan_alerts(history, event, processor.pattern_thresholds),
+            )
+        self.assertEqual(processor.event_history, history)
+
+    def test_detector_reads_window_aggregates(self):
+        """Bottleneck alerts are derived from per-team and per-type counts"""
+        now = datetime.now()
+        events = [
+            make_event(1, EventType.COMMUNICATION_DELAY, "a", now),
+            make_event(2, EventType.COMMUNICATION_DELAY, "a", now),
+            make_event(3, EventType.COMMUNICATION_DELAY, "a", now),
+            make_event(4, EventType.DEPENDENCY_BLOCK, "a", now),
+            make_event(5, EventType.DEPENDENCY_BLOCK, "b", now),
+            make_event(6, EventType.PROCESS_DEVIATION, "c", now),
+            make_event(7, EventType.PROCESS_DEVIATION, "b", now),
+        ]
+        detector = RealTimeBottleneckDetector({})
+
+        alerts = detector.analyze_bottleneck(EventWindow.from_events(events))
+
+        self.assertEqual(
+            [(a.event_type, a.team_id, a.source_events) for a in alerts],
+            [
+                (EventType.COMMUNICATION_DELAY, "a", ["evt_1", "evt_2", "evt_3"]),
+                (EventType.DEPENDENCY_BLOCK, "multi_team", ["evt_4", "evt_5"]),
+                (EventType.PROCESS_DEVIATION, "c", ["evt_7"]),
+            ],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,143 @@
+"""
+Unit tests for the debounced workspace file-event queue
+
+🏗️ Martin | Platform Architecture
+"""
+
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from lib.context_engineering.workspace_event_queue import (
+    FileEventQueue,
+    coalesce_file_event,
+)
+from lib.context_engineering.workspace_integration import (
+    WorkspaceIntegrationManager,
+)
+
+
+class TestEventCoalescing(unittest.TestCase):
+    """Test per-path net-effect rules"""
+
+    def test_coalescing_rules(self):
+        """Event sequences collapse to their net effect"""
+        cases = [
+            (None, "modified", "modified"),
+            ("created", "modified", "created"),
+            ("created", "deleted", None),
+            ("deleted", "created", "modified"),
+            ("deleted", "modified", "modified"),
+            ("modified", "deleted", "deleted"),
+            ("modified", "modified", "modified"),
+        ]
+        for previous, event, expected in cases:
+            with self.subTest(previous=previous, event=event):
+                self.assertEqual(coalesce_file_event(previous, event), expected)
+
+
+class TestFileEventQueue(unittest.TestCase):
+    """Test debouncing and batch delivery"""
+
+    def setUp(self):
+        """Create a queue that records delivered batches"""
+        self.batches = []
+        self.delivered = threading.Event()
+
+        def record(batch):
+            self.batches.append(batch)
+            self.delivered.set()
+
+        self.queue = FileEventQueue(
+            record, debounce_seconds=0.05, max_delay_seconds=1.0
+        )
+        self.addCleanup(self.queue.close)
+
+    def test_burst_is_delivered_as_one_batch(self):
+        """Many events on few paths become one coalesced batch"""
+        for _ in range(20):
+            self.queue.put("a.md", "modified")
+            self.queue.put("b.md", "modified")
+        self.queue.put("tmp.md", "created")
+        self.queue.put("tmp.md", "deleted")
+
+        self.assertTrue(self.delivered.wait(2.0))
+        self.assertEqual(self.batches, [{"a.md": "modified", "b.md": "modified"}])
+        self.assertEqual(self.queue.events_coalesced, 39)
+
+    def test_continuous_events_flush_at_max_delay(self):
+        """A storm that never goes quiet is still processed"""
+        self.queue.max_delay_seconds = 0.2
+        start = time.monotonic()
+        while not self.delivered.is_set() and time.monotonic() - start < 2.0:
+            self.queue.put("a.md", "modified")
+            time.sleep(0.01)
+
+        self.assertTrue(self.delivered.is_set())
+        self.assertLess(time.monotonic() - start, 1.0)
+
+    def test_close_flushes_pending_events(self):
+        """Pending events are processed on close"""
+        self.queue.debounce_seconds = 10.0
+        self.queue.max_delay_seconds = 10.0
+        self.queue.put("a.md", "created")
+
+        self.queue.close()
+
+        self.assertEqual(self.batches, [{"a.md": "created"}])
+        self.queue.put("b.md", "created")
+        self.assertEqual(self.queue.pending_count(), 0)
+
+
+class TestWorkspaceEventBatching(unittest.TestCase):
+    """Test that the manager processes watcher bursts in one pass"""
+
+    def setUp(self):
+        """Create a scanned workspace"""
+        self.workspace = Path(tempfile.mkdtemp(prefix="test_workspace_"))
+        self.addCleanup(shutil.rmtree, self.workspace, ignore_errors=True)
+        (self.workspace / "strategy").mkdir()
+        self.plan = self.workspace / "strategy" / "plan.md"
+        self.plan.write_text("Project: Developer Experience Roadmap\n")
+        self.manager = WorkspaceIntegrationManager(str(self.workspace))
+        self.manager._initial_workspace_scan()
+
+    def test_save_storm_updates_context_once(self):
+        """Repeated writes and a transient file cost one context update"""
+        self.plan.write_text("Project: Observability Overhaul Program\n")
+        scratch = self.workspace / "strategy" / "scratch-strategy.md"
+
+        with patch.object(
+            self.manager,
+            "_update_workspace_context",
+            wraps=self.manager._update_workspace_context,
+        ) as update:
+            for _ in range(10):
+                self.manager._handle_file_event(str(self.plan), "modified")
+            self.manager._handle_file_event(str(scratch), "created")
+            self.manager._handle_file_event(str(scratch), "deleted")
+            self.manager.event_queue.flush()
+
+        self.assertEqual(update.call_count, 1)
+        self.assertEqual(
+            self.manager.current_context.active_initiatives,
+            ["Observability Overhaul Program"],
+        )
+
+    def test_deleted_file_is_removed(self):
+        """A delete event drops the file from the index"""
+        self.plan.unlink()
+
+        self.manager._handle_file_event(str(self.plan), "deleted")
+        self.manager.event_queue.flush()
+
+        self.assertNotIn(str(self.plan), self.manager.strategic_files)
+        self.assertEqual(self.manager.current_context.active_initiatives, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,268 @@
+"""
+Unit tests for incremental workspace indexing
+
+🏗️ Martin | Platform Architecture
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+from lib.context_engineering.workspace_integration import (
+    TS4StrategicAnalyzer,
+    TS4StrategicInsight,
+    WorkspaceIntegrationManager,
+    analyze_strategic_file_streaming,
+)
+
+MEETING = """# Meeting prep with Sarah Chen
+Initiative: Platform Consolidation Program
+Topics: platform strategy, stakeholder management. Critical deadline.
+"""
+
+STRATEGY = """# Strategy
+Project: Developer Experience Roadmap
+Covers roadmap planning and technical debt.
+"""
+
+
+class TestWorkspaceIncrementalIndex(unittest.TestCase):
+    """Test that rescans skip unchanged files and aggregates track deltas"""
+
+    def setUp(self):
+        """Create a temporary workspace with two strategic files"""
+        self.workspace = Path(tempfile.mkdtemp(prefix="test_workspace_"))
+        self.addCleanup(shutil.rmtree, self.workspace, ignore_errors=True)
+        (self.workspace / "meeting-prep").mkdir()
+        (self.workspace / "strategy").mkdir()
+        self.meeting = self.workspace / "meeting-prep" / "sync.md"
+        self.strategy = self.workspace / "strategy" / "plan.md"
+        self.meeting.write_text(MEETING)
+        self.strategy.write_text(STRATEGY)
+
+    def _manager(self):
+        return WorkspaceIntegrationManager(str(self.workspace))
+
+    def test_rescan_skips_unchanged_files(self):
+        """A second manager reuses the persisted index instead of re-analyzing"""
+        first = self._manager()
+        first._initial_workspace_scan()
+        self.assertEqual(first.scan_stats["indexed"], 2)
+
+        second = self._manager()
+        with patch.object(
+            WorkspaceIntegrationManager,
+            "_analyze_strategic_file",
+            side_effect=AssertionError("unchanged file re-analyzed"),
+        ):
+            second._initial_workspace_scan()
+
+        self.assertEqual(second.scan_stats["unchanged"], 2)
+        self.assertEqual(set(second.strategic_files), set(first.strategic_files))
+        self.assertEqual(
+            sorted(second.current_context.active_initiatives),
+            sorted(first.current_context.active_initiatives),
+        )
+
+    def test_edited_file_updates_aggregate(self):
+        """Editing one file replaces only its contribution to the context"""
+        manager = self._manager()
+        manager._initial_workspace_scan()
+        self.assertIn(
+            "Platform Consolidation Program",
+            manager.current_context.active_initiatives,
+        )
+
+        self.meeting.write_text("# Meeting prep\nInitiative: Hiring Plan Refresh\n")
+        manager.process_file_change(str(self.meeting), "modified")
+
+        initiatives = manager.current_context.active_initiatives
+        self.assertIn("Hiring Plan Refresh", initiatives)
+        self.assertNotIn("Platform Consolidation Program", initiatives)
+        self.assertIn("Developer Experience Roadmap", initiatives)
+
+    def test_touched_file_is_not_reanalyzed(self):
+        """An mtime change with identical content only refreshes the index"""
+        manager = self._manager()
+        manager._initial_workspace_scan()
+        stat = self.strategy.stat()
+        os.utime(self.strategy, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        with patch.object(
+            WorkspaceIntegrationManager,
+            "_analyze_strategic_file",
+            side_effect=AssertionError("identical content re-analyzed"),
+        ):
+            manager._initial_workspace_scan()
+
+        self.assertEqual(manager.scan_stats["indexed"], 1)
+        self.assertEqual(manager.scan_stats["unchanged"], 1)
+
+    def test_deleted_files_are_dropped_on_rescan(self):
+        """Files removed between runs leave the index and the context"""
+        self._manager()._initial_workspace_scan()
+        self.meeting.unlink()
+
+        manager = self._manager()
+        manager._initial_workspace_scan()
+
+        self.assertEqual(manager.scan_stats["removed"], 1)
+        self.assertNotIn(str(self.meeting), manager.strategic_files)
+        self.assertEqual(manager.current_context.recent_meetings, [])
+        self.assertNotIn(
+            "Platform Consolidation Program",
+            manager.current_context.active_initiatives,
+        )
+
+    def test_warm_restart_restores_ts4_state(self):
+        """Insights and workflow metrics survive a restart with no changes"""
+
+        def insight(analyzer, file_path, content):
+            result = TS4StrategicInsight(
+                file_path=file_path,
+                insight_type="strategic_pattern",
+                confidence_score=0.8,
+                recommendation=f"Review {Path(file_path).name}",
+                strategic_frameworks=(
+                    ["Team Topologies"] if "Meeting" in content else []
+                ),
+                efficiency_opportunities=[],
+                stakeholder_impact="high",
+                priority_level="high",
+                timestamp=datetime(2026, 1, 5, 9, 30),
+            )
+            analyzer.insights_cache[file_path] = result
+            return result
+
+        with patch.object(
+            TS4StrategicAnalyzer, "analyze_strategic_document", autospec=True
+        ) as analyze:
+            analyze.side_effect = insight
+            first = self._manager()
+            first._initial_workspace_scan()
+
+            second = self._manager()
+            second._initial_workspace_scan()
+            self.assertEqual(analyze.call_count, 2)
+
+        self.assertEqual(second.scan_stats["indexed"], 0)
+        self.assertEqual(second.ts4_insights, first.ts4_insights)
+        self.assertIsNotNone(second.get_ts4_workflow_metrics())
+        summary = second.get_ts4_strategic_summary()
+        self.assertEqual(summary["total_insights"], 2)
+        self.assertEqual(summary["framework_utilization"], 0.5)
+        self.assertEqual(summary["workflow_metrics"]["framework_utilization_rate"], 0.5)
+        self.assertIn(
+            "High priority: Review plan.md", second.get_ts4_efficiency_recommendations()
+        )
+
+    def test_edited_file_replaces_persisted_insight(self):
+        """Re-analysis without a new insight drops the persisted one"""
+        with patch.object(
+            TS4StrategicAnalyzer,
+            "analyze_strategic_document",
+            return_value=TS4StrategicInsight(
+                file_path=str(self.meeting),
+                insight_type="strategic_pattern",
+                confidence_score=0.8,
+                recommendation="Review",
+                strategic_frameworks=[],
+                efficiency_opportunities=[],
+                stakeholder_impact="low",
+                priority_level="low",
+                timestamp=datetime(2026, 1, 5),
+            ),
+        ):
+            self._manager()._initial_workspace_scan()
+
+        self.meeting.write_text("# Meeting prep\nInitiative: Hiring Plan Refresh\n")
+        manager = self._manager()
+        manager._initial_workspace_scan()
+
+        self.assertNotIn(str(self.meeting), manager.ts4_insights)
+        self.assertNotIn(str(self.meeting), self._manager().ts4_insights)
+
+
+class TestBulkWorkspaceAnalysis(unittest.TestCase):
+    """Test process-pool bulk indexing and streaming analysis"""
+
+    def setUp(self):
+        """Create a workspace with enough files to trigger bulk mode"""
+        self.workspace = Path(tempfile.mkdtemp(prefix="test_workspace_"))
+        self.addCleanup(shutil.rmtree, self.workspace, ignore_errors=True)
+        (self.workspace / "meeting-prep").mkdir()
+        (self.workspace / "strategy").mkdir()
+        for i in range(12):
+            (self.workspace / "meeting-prep" / f"sync_{i}.md").write_text(MEETING)
+            (self.workspace / "strategy" / f"plan_{i}.md").write_text(
+                STRATEGY + f"Initiative: Regional Expansion Wave {i}\n"
+            )
+
+    def _scan(self, bulk_min_files: int) -> WorkspaceIntegrationManager:
+        cache = tempfile.mkdtemp(prefix="test_cache_")
+        self.addCleanup(shutil.rmtree, cache, ignore_errors=True)
+        manager = WorkspaceIntegrationManager(str(self.workspace), cache)
+        manager.bulk_analysis_min_files = bulk_min_files
+        manager._initial_workspace_scan()
+        return manager
+
+    def test_bulk_scan_matches_sequential_scan(self):
+        """Process-pool indexing yields the same files and context"""
+        sequential = self._scan(bulk_min_files=10_000)
+        bulk = self._scan(bulk_min_files=1)
+
+        self.assertEqual(bulk.scan_stats["indexed"], 24)
+        self.assertEqual(bulk._parallel_processor.stats["fallback_activations"], 0)
+        for path, expected in sequential.strategic_files.items():
+            actual = bulk.strategic_files[path]
+            self.assertEqual(actual.content_hash, expected.content_hash)
+            self.assertEqual(actual.priority_level, expected.priority_level)
+            self.assertEqual(
+                sorted(actual.initiatives_referenced),
+                sorted(expected.initiatives_referenced),
+            )
+            self.assertEqual(
+                sorted(actual.strategic_topics), sorted(expected.strategic_topics)
+            )
+        self.assertEqual(
+            sorted(bulk.current_context.priority_files),
+            sorted(sequential.current_context.priority_files),
+        )
+
+    def test_streaming_chunks_match_whole_file_analysis(self):
+        """Small chunks find the same references as reading the whole file"""
+        path = self.workspace / "strategy" / "long_plan.md"
+        lines = []
+        for i in range(4):
+            lines.extend(["filler " * 12] * 3)
+            lines.extend(["Initiative:", f"Capacity Program Number {i}"])
+        lines.append("Sync with Director Alvarez on technical debt. Critical risk.")
+        path.write_text("\n".join(lines) + "\n")
+
+        strategy_file, fingerprint = analyze_strategic_file_streaming(
+            str(path), chunk_chars=64
+        )
+        expected = WorkspaceIntegrationManager(
+            str(self.workspace)
+        )._analyze_strategic_file(str(path))
+
+        self.assertEqual(fingerprint.content_hash, expected.content_hash)
+        self.assertEqual(fingerprint.size, path.stat().st_size)
+        self.assertEqual(
+            sorted(strategy_file.initiatives_referenced),
+            sorted(expected.initiatives_referenced),
+        )
+        self.assertEqual(
+            sorted(strategy_file.stakeholders_mentioned),
+            sorted(expected.stakeholders_mentioned),
+        )
+        self.assertEqual(strategy_file.strategic_topics, expected.strategic_topics)
+        self.assertEqual(strategy_file.priority_level, expected.priority_level)
+
+
+if __name__ == "__main__":
+    unittest.main()
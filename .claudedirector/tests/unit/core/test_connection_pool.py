@@ -0,0 +1,210 @@
+"""
+Unit tests for the shared SQLite connection pool
+
+🏗️ Martin | Platform Architecture
+
+ARCHITECTURE COMPLIANCE:
+- ✅ unittest.TestCase standard (per TESTING_ARCHITECTURE.md)
+"""
+
+import gc
+import sqlite3
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+from lib.core.connection_pool import (
+    ConnectionPoolConfig,
+    SQLiteConnectionPool,
+    close_all_connection_pools,
+    get_connection_pool,
+)
+from lib.core.exceptions import DatabaseError
+
+
+class TestSQLiteConnectionPool(unittest.TestCase):
+    """Test pooled connection leasing, tuning and sharing"""
+
+    def setUp(self):
+        """Create a temporary database directory"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = Path(self.temp_dir.name) / "pool_test.db"
+
+    def tearDown(self):
+        """Close pools and remove temporary files"""
+        close_all_connection_pools()
+        self.temp_dir.cleanup()
+
+    def test_connections_are_reused(self):
+        """Released connections are handed out again instead of reopened"""
+        pool = SQLiteConnectionPool(self.db_path)
+
+        with pool.connection() as first:
+            pass
+        with pool.connection() as second:
+            pass
+
+        self.assertIs(first, second)
+        self.assertEqual(pool.get_stats()["connections_created"], 1)
+        pool.close()
+
+    def test_pool_is_bounded(self):
+        """Acquire fails with DatabaseError once max_connections are leased"""
+        pool = SQLiteConnectionPool(
+            self.db_path,
+            ConnectionPoolConfig(max_connections=2, acquire_timeout_seconds=0.05),
+        )
+        leased = [pool.acquire(), pool.acquire()]
+
+        with self.assertRaises(DatabaseError):
+            pool.acquire()
+
+        pool.release(leased.pop())
+        self.assertIsInstance(pool.acquire(), sqlite3.Connection)
+        pool.close()
+
+    def test_pragmas_applied(self):
+        """Each connection is tuned with WAL, mmap, cache and temp_store"""
+        pool = SQLiteConnectionPool(
+            self.db_path,
+            ConnectionPoolConfig(mmap_size_bytes=1024 * 1024, cache_size_kib=2048),
+        )
+
+        with pool.connection() as conn:
+            self.assertEqual(conn.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+            self.assertEqual(conn.execute("PRAGMA cache_size").fetchone()[0], -2048)
+            self.assertEqual(conn.execute("PRAGMA temp_store").fetchone()[0], 2)
+            self.assertEqual(
+                conn.execute("PRAGMA mmap_size").fetchone()[0], 1024 * 1024
+            )
+        pool.close()
+
+    def test_scoped_lease_rolls_back_on_error(self):
+        """Errors inside a scoped lease roll back and still release"""
+        pool = SQLiteConnectionPool(self.db_path)
+        with pool.connection() as conn:
+            conn.execute("CREATE TABLE items (name TEXT)")
+
+        with self.assertRaises(ValueError):
+            with pool.connection() as conn:
+                conn.execute("INSERT INTO items VALUES ('lost')")
+                raise ValueError("boom")
+
+        with pool.connection() as conn:
+            count = conn.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+        self.assertEqual(count, 0)
+        self.assertEqual(pool.get_stats()["leased_connections"], 0)
+        pool.close()
+
+    def test_thread_lease_released_on_thread_exit(self):
+        """Thread-pinned connections return to the pool when the thread dies"""
+        pool = SQLiteConnectionPool(
+            self.db_path, ConnectionPoolConfig(max_connections=1)
+        )
+
+        def worker():
+            pool.thread_connection().execute("SELECT 1")
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+        gc.collect()
+
+        self.assertEqual(pool.get_stats()["leased_connections"], 0)
+        self.assertIsInstance(pool.acquire(timeout=0.1), sqlite3.Connection)
+        pool.close()
+
+    def test_thread_pins_do_not_count_against_bound(self):
+        """Long-lived pinned threads never exhaust the bounded pool"""
+        pool = SQLiteConnectionPool(
+            self.db_path,
+            ConnectionPoolConfig(max_connections=1, acquire_timeout_seconds=0.05),
+        )
+        release = threading.Event()
+        pinned = threading.Barrier(4)
+
+        def worker():
+            pool.thread_connection().execute("SELECT 1")
+            pinned.wait()
+            release.wait()
+
+        threads = [threading.Thread(target=worker) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        pinned.wait()
+
+        self.assertEqual(pool.get_stats()["pinned_connections"], 3)
+        with pool.connection() as conn:
+            conn.execute("SELECT 1")
+
+        release.set()
+        for thread in threads:
+            thread.join()
+        gc.collect()
+        self.assertEqual(pool.get_stats()["pinned_connections"], 0)
+        pool.close()
+
+    def test_one_pool_per_database_file(self):
+        """All users of a file share the same pool"""
+        first = get_connection_pool(self.db_path)
+        second = get_connection_pool(str(self.db_path))
+        other = get_connection_pool(Path(self.temp_dir.name) / "other.db")
+
+        self.assertIs(first, second)
+        self.assertIsNot(first, other)
+
+    def test_pools_keyed_by_semantic_pragmas(self):
+        """foreign_keys follows the caller's config, not construction order"""
+        enforced = ConnectionPoolConfig(enable_foreign_keys=True)
+
+        for configs in ((None, enforced), (enforced, None)):
+            pools = [get_connection_pool(self.db_path, c) for c in configs]
+            for pool, config in zip(pools, configs):
+                self.assertIs(pool, get_connection_pool(str(self.db_path), config))
+                with pool.connection() as conn:
+                    foreign_keys = conn.execute("PRAGMA foreign_keys").fetchone()[0]
+                self.assertEqual(foreign_keys, int(config is enforced))
+            self.assertIsNot(pools[0], pools[1])
+            close_all_connection_pools()
+
+    def test_memory_managers_share_pool(self):
+        """Managers share pools per file and keep their foreign_keys setting"""
+        from lib.context_engineering.strategic_memory_manager import (
+            StrategicMemoryManager,
+        )
+        from lib.core.database import DatabaseManager
+
+        DatabaseManager._instance = None
+        try:
+            memory = StrategicMemoryManager(
+                db_path=str(self.db_path), enable_performance=False
+            )
+            db_manager = DatabaseManager(db_path=str(self.db_path))
+            session_id = memory.start_session()
+            memory.preserve_context(session_id, {"strategic": "platform"})
+
+            self.assertIs(memory._connection_pool, get_connection_pool(self.db_path))
+            self.assertIs(
+                db_manager.pool,
+                get_connection_pool(self.db_path, db_manager._build_pool_config()),
+            )
+            self.assertEqual(
+                db_manager.get_connection()
+                .execute("PRAGMA foreign_keys")
+                .fetchone()[0],
+                1,
+            )
+            self.assertEqual(
+                memory.recover_session_context(session_id)["context_data"],
+                {"strategic": "platform"},
+            )
+            self.assertEqual(db_manager.pool.get_stats()["leased_connections"], 0)
+            db_manager.close()
+            memory.close()
+        finally:
+            DatabaseManager._instance = None
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,478 @@
+"""
+Unit Tests: CacheManager LRU/TTL Core
+
+Tests:
+1. LRU ordering and O(1) touch on get
+2. Entry-count and memory-budget eviction
+3. TTL expiry via the expiry heap
+4. Per-entry size accounting
+5. Single-flight coalescing and stale-while-revalidate
+6. Persistent L2 tier
+7. Structural cache keys and namespace invalidation
+
+Author: Martin | Platform Architecture
+"""
+
+import asyncio
+import logging
+import os
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from lib.performance.cache_keys import CacheKeyBuilder, namespace_of
+from lib.performance.cache_manager import (
+    CacheManager,
+    CacheLevel,
+    estimate_size_bytes,
+)
+
+
+class TestCacheManagerCore:
+    """Tests for the ordered LRU + expiry heap cache core"""
+
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.cache = CacheManager(max_memory_mb=1, max_entries=3)
+
+    def teardown_method(self):
+        """Clean up after tests"""
+        asyncio.run(self.cache.cleanup())
+
+    def test_get_set_roundtrip(self):
+        """Values round-trip and count as hits"""
+
+        async def run():
+            assert await self.cache.set("k1", {"a": 1})
+            assert await self.cache.get("k1") == {"a": 1}
+            assert await self.cache.get("missing") is None
+
+        asyncio.run(run())
+        assert self.cache.cache_hits == 1
+        assert self.cache.cache_misses == 1
+
+    def test_lru_evicts_least_recently_used(self):
+        """Touching a key protects it from the next eviction"""
+
+        async def run():
+            for key in ("k1", "k2", "k3"):
+                await self.cache.set(key, key)
+            await self.cache.get("k1")
+            await self.cache.set("k4", "k4")
+
+        asyncio.run(run())
+        assert list(self.cache.cache_storage) == ["k3", "k1", "k4"]
+        assert self.cache.cache_evictions == 1
+
+    def test_ttl_expiry_from_heap(self):
+        """Expired entries are dropped by cleanup without scanning"""
+
+        async def run():
+            await self.cache.set("short", "v", ttl_override=1)
+            await self.cache.set("long", "v", CacheLevel.STRATEGIC_MEMORY)
+            return self.cache._expire_entries(now=time.time() + 5)
+
+        assert asyncio.run(run()) == 1
+        assert "short" not in self.cache.cache_storage
+        assert "long" in self.cache.cache_storage
+
+    def test_memory_budget_enforced(self):
+        """Memory limit evicts by accounted size, not entry count"""
+        cache = CacheManager(max_memory_mb=1, max_entries=10000)
+        payload = "x" * (300 * 1024)
+
+        async def run():
+            for i in range(5):
+                await cache.set(f"big{i}", payload + str(i))
+
+        asyncio.run(run())
+        assert cache.memory_usage_bytes <= cache.max_memory_bytes
+        assert len(cache.cache_storage) == 3
+        assert cache.get_stats()["memory_usage_bytes"] == cache.memory_usage_bytes
+        asyncio.run(cache.cleanup())
+
+    def test_oversized_entry_rejected(self):
+        """A single value larger than the budget is not cached"""
+
+        async def run():
+            return await self.cache.set("huge", "x" * (2 * 1024 * 1024))
+
+        assert asyncio.run(run()) is False
+        assert self.cache.memory_usage_bytes == 0
+
+    def test_overwrite_releases_previous_size(self):
+        """Overwriting a key replaces its accounted size"""
+
+        async def run():
+            await self.cache.set("k", "x" * 10000)
+            await self.cache.set("k", "small")
+
+        asyncio.run(run())
+        entry = self.cache.cache_storage["k"]
+        assert self.cache.memory_usage_bytes == entry.size_bytes
+
+    def test_estimate_size_handles_cycles(self):
+        """Self-referencing structures are sized without recursion errors"""
+        data = {"payload": "x" * 1000}
+        data["self"] = data
+        assert estimate_size_bytes(data) > 1000
+
+    def test_estimate_size_stops_at_opaque_objects(self):
+        """Referenced managers, loggers and modules are not walked"""
+
+        class Manager:
+            def __init__(self):
+                self.storage = {i: f"{i:04d}" * 250 for i in range(1000)}
+
+        class Result:
+            def __init__(self):
+                self.summary = "ok"
+                self.manager = Manager()
+                self.logger = logging.getLogger("claudedirector.test")
+                self.module = sys
+
+        nested = current = []
+        for _ in range(1000):
+            current.append([])
+            current = current[0]
+
+        assert estimate_size_bytes(Result()) < 10_000
+        assert estimate_size_bytes(nested) < 10_000
+        assert estimate_size_bytes({"rows": [Manager().storage]}) > 1_000_000
+
+    def test_set_is_fast_at_capacity(self):
+        """Eviction at the entry limit does not re-sort storage"""
+        cache = CacheManager(max_memory_mb=50, max_entries=1000)
+
+        async def run():
+            start = time.time()
+            for i in range(5000):
+                await cache.set(f"key{i}", i)
+            return time.time() - start
+
+        assert asyncio.run(run()) < 2.0
+        assert len(cache.cache_storage) == 1000
+        asyncio.run(cache.cleanup())
+
+
+class TestCacheManagerSingleFlight:
+    """Tests for single-flight coalescing and stale-while-revalidate"""
+
+    def test_concurrent_misses_share_one_call(self):
+        """Concurrent misses on one key run the function once"""
+        cache = CacheManager()
+        calls = []
+
+        async def expensive(query):
+            calls.append(query)
+            await asyncio.sleep(0.01)
+            return f"result:{query}"
+
+        async def run():
+            return await asyncio.gather(
+                *[cache.cached_call(expensive, "q", namespace="mcp") for _ in range(10)]
+            )
+
+        results = asyncio.run(run())
+        assert results == ["result:q"] * 10
+        assert calls == ["q"]
+        assert cache.coalesced_calls == 9
+        assert cache._inflight == {}
+        asyncio.run(cache.cleanup())
+
+    def test_failure_propagates_to_all_waiters(self):
+        """An exception reaches every coalesced caller and is not cached"""
+        cache = CacheManager()
+
+        async def failing():
+            await asyncio.sleep(0.01)
+            raise ValueError("mcp down")
+
+        async def run():
+            return await asyncio.gather(
+                cache.cached_call(failing, namespace="mcp"),
+                cache.cached_call(failing, namespace="mcp"),
+                return_exceptions=True,
+            )
+
+        results = asyncio.run(run())
+        assert all(isinstance(r, ValueError) for r in results)
+        assert len(cache.cache_storage) == 0
+        asyncio.run(cache.cleanup())
+
+    def test_stale_while_revalidate_serves_old_value(self):
+        """Expired values in the grace window are served while refreshing"""
+        cache = CacheManager(stale_while_revalidate={"framework_patterns": 60})
+        versions = iter(["v1", "v2"])
+
+        def detect():
+            return next(versions)
+
+        async def run():
+            first = await cache.cached_call(
+                detect, cache_level=CacheLevel.FRAMEWORK_PATTERNS, ttl_override=1
+            )
+            entry = next(iter(cache.cache_storage.values()))
+            entry.created_at -= 2  # Expired, but within the stale window
+            stale = await cache.cached_call(
+                detect, cache_level=CacheLevel.FRAMEWORK_PATTERNS
+            )
+            await asyncio.sleep(0)  # Let the background refresh complete
+            fresh = await cache.cached_call(
+                detect, cache_level=CacheLevel.FRAMEWORK_PATTERNS
+            )
+            return first, stale, fresh
+
+        assert asyncio.run(run()) == ("v1", "v1", "v2")
+        assert cache.stale_hits == 1
+        asyncio.run(cache.cleanup())
+
+    def test_stale_disabled_by_default(self):
+        """Without a stale window expired values are recomputed inline"""
+        cache = CacheManager()
+        versions = iter(["v1", "v2"])
+
+        async def run():
+            await cache.cached_call(lambda: next(versions), ttl_override=1)
+            next(iter(cache.cache_storage.values())).created_at -= 2
+            return await cache.cached_call(lambda: next(versions))
+
+        assert asyncio.run(run()) == "v2"
+        assert cache.stale_hits == 0
+        asyncio.run(cache.cleanup())
+
+
+class TestCacheManagerPersistentTier:
+    """Tests for the SQLite-backed L2 tier"""
+
+    def test_restart_promotes_from_l2(self, tmp_path):
+        """A new process serves durable levels from disk on L1 miss"""
+        db_path = tmp_path / "l2_cache.db"
+
+        async def first_process():
+            cache = CacheManager(persistent_cache_path=db_path)
+            await cache.set(
+                "strategy", {"frameworks": ["wrap"]}, CacheLevel.STRATEGIC_MEMORY
+            )
+            await cache.set("scratch", "not durable", CacheLevel.MCP_RESPONSES)
+            await cache.cleanup()
+
+        async def second_process():
+            cache = CacheManager(persistent_cache_path=db_path)
+            result = (
+                await cache.get("strategy"),
+                await cache.get("scratch"),
+                cache.l2_hits,
+            )
+            await cache.cleanup()
+            return result
+
+        asyncio.run(first_process())
+        assert asyncio.run(second_process()) == ({"frameworks": ["wrap"]}, None, 1)
+
+    def test_warm_cache_loads_from_l2(self, tmp_path):
+        """warm_cache preloads unexpired durable entries at startup"""
+        db_path = tmp_path / "l2_cache.db"
+
+        async def run():
+            cache = CacheManager(persistent_cache_path=db_path)
+            await cache.set("fw", "patterns", CacheLevel.FRAMEWORK_PATTERNS)
+            await cache.set("old", "expired", CacheLevel.FRAMEWORK_PATTERNS, 1)
+            await cache.cleanup()
+
+            restarted = CacheManager(persistent_cache_path=db_path)
+            restarted.l2_store.purge_expired(now=time.time() + 5)
+            await restarted.warm_cache()
+            keys = list(restarted.cache_storage)
+            await restarted.cleanup()
+            return keys
+
+        assert asyncio.run(run()) == ["fw"]
+
+    def test_l2_keeps_original_ttl(self, tmp_path):
+        """Promoted entries keep the TTL they were written with"""
+        db_path = tmp_path / "l2_cache.db"
+
+        async def run():
+            cache = CacheManager(persistent_cache_path=db_path)
+            await cache.set("k", "v", CacheLevel.STRATEGIC_MEMORY, ttl_override=30)
+            created_at = cache.cache_storage["k"].created_at
+            cache.cache_storage.clear()
+            await cache.get("k")
+            entry = cache.cache_storage["k"]
+            await cache.cleanup()
+            return entry.created_at == created_at, entry.ttl_seconds
+
+        assert asyncio.run(run()) == (True, 30)
+
+    def test_invalidate_pattern_clears_l2(self, tmp_path):
+        """Invalidated keys are not resurrected from disk"""
+        db_path = tmp_path / "l2_cache.db"
+
+        async def run():
+            cache = CacheManager(persistent_cache_path=db_path)
+            await cache.set("persona:diego", "v", CacheLevel.STRATEGIC_MEMORY)
+            await cache.invalidate_pattern("persona:")
+            result = await cache.get("persona:diego")
+            await cache.cleanup()
+            return result
+
+        assert asyncio.run(run()) is None
+
+    def test_l2_round_trip_preserves_types(self, tmp_path):
+        """Tuples, sets and non-string dict keys come back unchanged"""
+        db_path = tmp_path / "l2_cache.db"
+        value = {
+            "pair": (1, "a"),
+            "tags": {"x"},
+            1: [(2, 3)],
+            (4, 5): frozenset({6}),
+            "__tuple__": "plain key",
+        }
+
+        async def run():
+            cache = CacheManager(persistent_cache_path=db_path)
+            await cache.set("k", value, CacheLevel.STRATEGIC_MEMORY)
+            await cache.cleanup()
+
+            restarted = CacheManager(persistent_cache_path=db_path)
+            result = await restarted.get("k")
+            await restarted.cleanup()
+            return result
+
+        result = asyncio.run(run())
+        assert result == value
+        assert type(result["pair"]) is tuple
+        assert type(result[1][0]) is tuple
+
+    def test_values_that_do_not_round_trip_stay_l1_only(self, tmp_path):
+        """An unencodable value is served from L1 and clears the old L2 row"""
+        db_path = tmp_path / "l2_cache.db"
+
+        async def run():
+            cache = CacheManager(persistent_cache_path=db_path)
+            await cache.set("k", "old", CacheLevel.STRATEGIC_MEMORY)
+            await cache.set(
+                "k", [CacheLevel.MCP_RESPONSES], CacheLevel.STRATEGIC_MEMORY
+            )
+            result = await cache.get("k"), cache.l2_store.count()
+            await cache.cleanup()
+            return result
+
+        assert asyncio.run(run()) == ([CacheLevel.MCP_RESPONSES], 0)
+
+    def test_l2_io_runs_off_event_loop(self, tmp_path):
+        """SQLite calls run on the L2 worker, not the event loop thread"""
+        db_path = tmp_path / "l2_cache.db"
+        threads = []
+
+        async def run():
+            cache = CacheManager(persistent_cache_path=db_path)
+            for name in ("set_encoded", "get"):
+                method = getattr(cache.l2_store, name)
+
+                def record(*args, _method=method):
+                    threads.append(threading.current_thread())
+                    return _method(*args)
+
+                setattr(cache.l2_store, name, record)
+            await cache.set("k", "v", CacheLevel.STRATEGIC_MEMORY)
+            cache.cache_storage.clear()
+            result = await cache.get("k")
+            await cache.cleanup()
+            return result
+
+        assert asyncio.run(run()) == "v"
+        assert len(threads) == 2
+        assert threading.main_thread() not in threads
+
+
+class TestCacheKeyGeneration:
+    """Tests for structural, process-stable cache keys"""
+
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.builder = CacheKeyBuilder()
+
+    def test_dict_ordering_does_not_change_key(self):
+        """Equal dicts with different insertion order share a key"""
+        first = self.builder.build("ns", ({"a": 1, "b": [1, 2]},), {})
+        second = self.builder.build("ns", ({"b": [1, 2], "a": 1},), {})
+        assert first == second
+
+    def test_type_and_boundary_collisions(self):
+        """Encoding is type-tagged and length-prefixed"""
+        keys = {
+            self.builder.build("ns", (1,), {}),
+            self.builder.build("ns", ("1",), {}),
+            self.builder.build("ns", (True,), {}),
+            self.builder.build("ns", ("a", "b"), {}),
+            self.builder.build("ns", ("ab",), {}),
+            self.builder.build("ns", (["a", "b"],), {}),
+            self.builder.build("ns", (), {"x": 1}),
+            self.builder.build("ns", ({"x": 1},), {}),
+        }
+        assert len(keys) == 8
+
+    def test_dataclass_and_enum_arguments(self):
+        """Dataclasses and enums are encoded structurally"""
+
+        @dataclass
+        class Query:
+            text: str
+            level: CacheLevel
+
+        first = self.builder.build("ns", (Query("q", CacheLevel.MCP_MAGIC),), {})
+        second = self.builder.build("ns", (Query("q", CacheLevel.MCP_MAGIC),), {})
+        other = self.builder.build("ns", (Query("q", CacheLevel.MCP_CONTEXT7),), {})
+        assert first == second != other
+
+    def test_keys_stable_across_processes(self):
+        """Keys do not depend on per-process hash randomization"""
+        script = (
+            "from lib.performance.cache_keys import CacheKeyBuilder;"
+            "print(CacheKeyBuilder().build('ns', ({'b': {1, 2}, 'a': ('x',)},), {}))"
+        )
+        keys = {
+            subprocess.run(
+                [sys.executable, "-c", script],
+                capture_output=True,
+                text=True,
+                env={**os.environ, "PYTHONHASHSEED": seed},
+                cwd=str(Path(__file__).resolve().parents[3]),
+            ).stdout.strip()
+            for seed in ("1", "2")
+        }
+        assert len(keys) == 1
+        assert keys.pop().startswith("ns:")
+
+    def test_pluggable_serializer(self):
+        """Registered serializers define the key material for custom types"""
+
+        class Handle:
+            def __init__(self, name, session):
+                self.name = name
+                self.session = session
+
+        builder = CacheKeyBuilder({Handle: lambda handle: handle.name})
+        assert builder.build("ns", (Handle("x", object()),), {}) == builder.build(
+            "ns", (Handle("x", object()),), {}
+        )
+
+    def test_namespace_invalidation_uses_index(self):
+        """invalidate_namespace drops only that namespace's keys"""
+        cache = CacheManager()
+
+        async def run():
+            await cache.cached_call(lambda q: q, "a", namespace="framework_detection")
+            await cache.cached_call(lambda q: q, "b", namespace="framework_detection")
+            await cache.cached_call(lambda q: q, "a", namespace="persona")
+            await cache.invalidate_namespace("framework_detection")
+
+        asyncio.run(run())
+        assert [namespace_of(key) for key in cache.cache_storage] == ["persona"]
+        assert "framework_detection" not in cache._namespace_index
+        asyncio.run(cache.cleanup())
@@ -0,0 +1,165 @@
+"""
+Unit tests for streaming metric histograms and PerformanceMonitor percentiles
+
+🏗️ Martin | Platform Architecture
+"""
+
+import random
+import unittest
+from unittest.mock import patch
+
+from lib.performance.metric_sketch import RollingHistogram, StreamingHistogram
+from lib.performance.performance_monitor import PerformanceMonitor
+
+QUANTILES = [0.0, 0.25, 0.5, 0.9, 0.95, 0.99, 1.0]
+
+
+def exact_quantile(values, q):
+    """Reference calculation PerformanceMonitor used before sketches"""
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * q), len(ordered) - 1)]
+
+
+class TestStreamingHistogram(unittest.TestCase):
+    """Test accuracy, merging and bounded memory"""
+
+    def setUp(self):
+        """Create a heavy-tailed latency sample"""
+        rng = random.Random(7)
+        self.values = [rng.lognormvariate(4, 1.2) for _ in range(20_000)]
+
+    def test_quantiles_within_relative_accuracy(self):
+        """Every quantile is within 1% of the exact sorted-list value"""
+        histogram = StreamingHistogram(relative_accuracy=0.01)
+        for value in self.values:
+            histogram.add(value)
+
+        results = histogram.quantiles(QUANTILES)
+
+        for q in QUANTILES:
+            expected = exact_quantile(self.values, q)
+            self.assertAlmostEqual(results[q] / expected, 1, delta=0.01)
+        self.assertEqual(histogram.count, len(self.values))
+        self.assertAlmostEqual(histogram.mean, sum(self.values) / len(self.values))
+        self.assertEqual(results[0.0], min(self.values))
+        self.assertEqual(results[1.0], max(self.values))
+
+    def test_memory_is_bounded(self):
+        """Bucket count stops growing however many points are added"""
+        histogram = StreamingHistogram(max_buckets=64)
+        for exponent in range(-6, 12):
+            for _ in range(500):
+                histogram.add(10.0**exponent)
+
+        self.assertLessEqual(histogram.bucket_count, 64)
+        self.assertAlmostEqual(histogram.quantile(1.0) / 1e11, 1, delta=0.01)
+        self.assertIsNone(StreamingHistogram().quantile(0.5))
+
+        histogram.add(float("inf"))
+        histogram.add(float("nan"))
+        self.assertEqual(histogram.count, 18 * 500)
+
+    def test_merge_equals_single_histogram(self):
+        """Merging partial histograms matches recording everything in one"""
+        whole = StreamingHistogram()
+        parts = [StreamingHistogram() for _ in range(3)]
+        signed = self.values[:3000] + [0.0, -5.0, -250.0]
+        for n, value in enumerate(signed):
+            whole.add(value)
+            parts[n % 3].add(value)
+
+        merged = parts[0].copy()
+        merged.merge(parts[1])
+        merged.merge(parts[2])
+
+        self.assertEqual(merged.quantiles(QUANTILES), whole.quantiles(QUANTILES))
+        self.assertEqual(merged.quantile(0.0), -250.0)
+        with self.assertRaises(ValueError):
+            merged.merge(StreamingHistogram(relative_accuracy=0.05))
+
+
+class TestRollingHistogram(unittest.TestCase):
+    """Test time slicing and expiry"""
+
+    def test_window_queries_merge_recent_slices(self):
+        """Only slices overlapping the window contribute"""
+        rolling = RollingHistogram(window_seconds=60, slice_seconds=10)
+        for second in range(0, 60):
+            rolling.add(float(second), timestamp=1000 + second)
+
+        recent = rolling.snapshot(window_seconds=20, now=1059)
+
+        # Slices [1030, 1040), [1040, 1050), [1050, 1060)
+        self.assertEqual(recent.count, 30)
+        self.assertEqual(recent.min, 30.0)
+        self.assertEqual(rolling.snapshot(now=1059).count, 60)
+
+    def test_old_slices_expire(self):
+        """The ring never holds more slices than the window needs"""
+        rolling = RollingHistogram(window_seconds=60, slice_seconds=10)
+        for second in range(0, 600, 5):
+            rolling.add(1.0, timestamp=second)
+
+        self.assertEqual(len(rolling), 6)
+        self.assertEqual(rolling.snapshot(now=599).count, 12)
+        rolling.expire(now=10_000)
+        self.assertEqual(len(rolling), 0)
+
+
+class TestPerformanceMonitorSketches(unittest.TestCase):
+    """Test PerformanceMonitor queries served from histograms"""
+
+    def setUp(self):
+        """Create a monitor with latencies for two personas"""
+        self.monitor = PerformanceMonitor()
+        rng = random.Random(3)
+        self.values = {"diego": [], "camille": []}
+        for n in range(4000):
+            persona = "diego" if n % 4 else "camille"
+            value = rng.uniform(10, 100) * (5 if persona == "camille" else 1)
+            self.values[persona].append(value)
+            self.monitor.record_metric(
+                "response_time_ms", value, labels={"persona": persona}
+            )
+        self.all_values = self.values["diego"] + self.values["camille"]
+
+    def test_percentiles_match_exact_values(self):
+        """p50/p95/p99 agree with sorting every point, without scanning"""
+        # Raw points are not consulted for window statistics
+        with patch.object(self.monitor, "metric_storage", {}):
+            percentiles = self.monitor.get_metric_percentiles("response_time_ms")
+            average = self.monitor.get_average_metric("response_time_ms")
+
+        for q, value in percentiles.items():
+            expected = exact_quantile(self.all_values, q)
+            self.assertAlmostEqual(value / expected, 1, delta=0.01)
+        self.assertAlmostEqual(
+            average, sum(self.all_values) / len(self.all_values), places=6
+        )
+        self.assertIsNone(self.monitor.get_metric_percentile("unknown", 0.5))
+
+    def test_label_filtered_queries(self):
+        """Label sets are kept apart and merged on demand"""
+        camille_p99 = self.monitor.get_metric_percentile(
+            "response_time_ms", 0.99, labels={"persona": "camille"}
+        )
+
+        expected = exact_quantile(self.values["camille"], 0.99)
+        self.assertAlmostEqual(camille_p99 / expected, 1, delta=0.01)
+        self.assertEqual(len(self.monitor.metric_sketches["response_time_ms"]), 2)
+        self.assertIsNone(
+            self.monitor.get_average_metric(
+                "response_time_ms", labels={"persona": "rachel"}
+            )
+        )
+
+    def test_prometheus_percentiles(self):
+        """The scrape output carries sketch percentiles"""
+        output = self.monitor.get_prometheus_metrics()
+
+        for label in ("p50", "p95", "p99"):
+            self.assertIn(f"claudedirector_response_time_ms_{label} ", output)
+
+
+if __name__ == "__main__":
+    unittest.main()
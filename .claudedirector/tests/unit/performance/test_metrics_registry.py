@@ -0,0 +1,230 @@
+"""
+Unit tests for the labelled metrics registry and Prometheus exposition
+
+🏗️ Martin | Platform Architecture
+"""
+
+import asyncio
+import threading
+import unittest
+from unittest.mock import patch
+
+from lib.performance.cache_manager import CacheLevel, CacheManager
+from lib.performance.metrics_registry import MetricsRegistry, get_metrics_registry
+from lib.performance.performance_monitor import PerformanceMonitor
+
+
+def sample_lines(text, prefix):
+    return [line for line in text.splitlines() if line.startswith(prefix)]
+
+
+class TestMetricsRegistry(unittest.TestCase):
+    """Test series recording, exposition and render caching"""
+
+    def setUp(self):
+        """Create an empty registry"""
+        self.registry = MetricsRegistry()
+
+    def test_histogram_exposition(self):
+        """Buckets are cumulative and end with +Inf, _sum and _count"""
+        latency = self.registry.histogram(
+            "persona_ms", "Persona latency", ["persona"], buckets=[10, 100]
+        )
+        for value in (5, 50, 50, 500):
+            latency.labels(persona="diego").observe(value)
+        latency.labels('say "hi"\n').observe(1)
+
+        text = self.registry.render()
+
+        self.assertEqual(
+            sample_lines(text, 'persona_ms_bucket{persona="diego"'),
+            [
+                'persona_ms_bucket{persona="diego",le="10"} 1',
+                'persona_ms_bucket{persona="diego",le="100"} 3',
+                'persona_ms_bucket{persona="diego",le="+Inf"} 4',
+            ],
+        )
+        self.assertIn('persona_ms_sum{persona="diego"} 605', text)
+        self.assertIn('persona_ms_count{persona="diego"} 4', text)
+        self.assertIn('persona_ms_count{persona="say \\"hi\\"\\n"} 1', text)
+        self.assertEqual(text.count("# TYPE persona_ms histogram"), 1)
+
+    def test_concurrent_recording_loses_no_updates(self):
+        """Per-thread shards keep counts exact under contention"""
+        requests = self.registry.counter("requests_total", "Requests", ["server"])
+        latency = self.registry.histogram("latency_ms", "Latency")
+
+        def worker():
+            series = requests.labels("sequential")
+            for _ in range(5000):
+                series.inc()
+                latency.observe(3)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(requests.labels("sequential").value, 40_000)
+        self.assertEqual(latency.labels().count, 40_000)
+        self.assertEqual(latency.labels().sum, 120_000)
+
+    def test_exited_threads_are_folded_into_one_total(self):
+        """Short-lived recording threads do not accumulate shards"""
+        latency = self.registry.histogram("latency_ms", "Latency", buckets=[10])
+        series = latency.labels()
+        series.observe(20)
+
+        for _ in range(50):
+            threads = [
+                threading.Thread(target=series.observe, args=(5,)) for _ in range(10)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertLessEqual(len(series._shards), 2)
+        self.assertEqual(series.count, 501)
+        self.assertEqual(series.sum, 2520)
+        self.assertEqual(series.bucket_counts(), [(10, 500), (float("inf"), 501)])
+
+    def test_render_is_cached_until_recording(self):
+        """Unchanged registries reuse the rendered text"""
+        gauge = self.registry.gauge("memory_mb", "Memory", ["component"])
+        gauge.labels("cache").set(12.5)
+
+        first = self.registry.render()
+        self.assertIs(self.registry.render(), first)
+
+        gauge.labels("cache").set(13)
+        self.assertIn('memory_mb{component="cache"} 13', self.registry.render())
+
+    def test_families_are_get_or_create(self):
+        """Re-registration returns the family; conflicts are rejected"""
+        family = self.registry.counter("hits_total", "Hits", ["level"])
+
+        self.assertIs(self.registry.counter("hits_total", "Hits", ["level"]), family)
+        with self.assertRaises(ValueError):
+            self.registry.gauge("hits_total", "Hits", ["level"])
+        with self.assertRaises(ValueError):
+            self.registry.counter("hits_total", "Hits", ["persona"])
+        with self.assertRaises(ValueError):
+            family.labels("a", "b")
+        with self.assertRaises(ValueError):
+            family.labels().inc(-1)
+
+
+class TestPerformanceMonitorExposition(unittest.TestCase):
+    """Test labelled breakdowns exported by PerformanceMonitor"""
+
+    def setUp(self):
+        """Create a monitor with a private registry"""
+        self.monitor = PerformanceMonitor(registry=MetricsRegistry())
+
+    def test_labelled_latency_histograms(self):
+        """Latencies become per-label histograms; other units gauges"""
+        for persona, value in (("diego", 120), ("camille", 40), ("diego", 900)):
+            self.monitor.record_metric(
+                "response_time_ms", value, labels={"persona": persona}
+            )
+        self.monitor.record_metric("memory_usage_mb", 31.5, unit="mb")
+        self.monitor.increment_counter("requests_total", 3)
+
+        text = self.monitor.get_prometheus_metrics()
+
+        self.assertIn("# TYPE claudedirector_response_time_ms histogram", text)
+        self.assertIn('claudedirector_response_time_ms_count{persona="diego"} 2', text)
+        self.assertIn(
+            'claudedirector_response_time_ms_bucket{persona="camille",le="50"} 1',
+            text,
+        )
+        self.assertIn("# TYPE claudedirector_memory_usage_mb gauge", text)
+        self.assertIn("claudedirector_memory_usage_mb 31.5", text)
+        self.assertIn("claudedirector_requests_total 3", text)
+        self.assertIn("claudedirector_errors_total 0", text)
+        self.assertIn("# TYPE claudedirector_response_time_ms_p99 gauge", text)
+
+    def test_conflicting_label_sets_are_not_exported(self):
+        """A label set that breaks the family's label names is skipped"""
+        self.monitor.record_metric(
+            "queue_ms", 5, labels={"server": "context7"}, histogram=True
+        )
+        self.monitor.record_metric("queue_ms", 7, labels={"persona": "diego"})
+
+        text = self.monitor.get_prometheus_metrics()
+
+        self.assertIn('claudedirector_queue_ms_count{server="context7"} 1', text)
+        self.assertNotIn("persona", text)
+        self.assertEqual(
+            self.monitor.get_average_metric("queue_ms", labels={"persona": "diego"}),
+            7,
+        )
+
+    def test_histograms_are_opt_in(self):
+        """Metrics recorded with the default unit stay gauges"""
+        self.monitor.record_metric("memory_usage_mb", 31.5)
+        self.monitor.record_metric("cache_hit_rate", 0.82)
+        self.monitor.record_metric("mcp_coordination_ms", 12, histogram=True)
+        self.monitor.record_metric("mcp_coordination_ms", 30)
+
+        text = self.monitor.get_prometheus_metrics()
+
+        self.assertIn("# TYPE claudedirector_memory_usage_mb gauge", text)
+        self.assertIn("claudedirector_memory_usage_mb 31.5", text)
+        self.assertIn("# TYPE claudedirector_cache_hit_rate gauge", text)
+        self.assertIn("claudedirector_cache_hit_rate 0.82", text)
+        self.assertNotIn("claudedirector_cache_hit_rate_bucket", text)
+        self.assertIn("# TYPE claudedirector_mcp_coordination_ms histogram", text)
+        self.assertIn("claudedirector_mcp_coordination_ms_count 2", text)
+
+    def test_monitors_share_the_default_registry(self):
+        """Monitors without their own registry add into the same series"""
+        registry = MetricsRegistry()
+        with patch(
+            "lib.performance.performance_monitor.get_metrics_registry",
+            return_value=registry,
+        ):
+            monitors = [PerformanceMonitor(), PerformanceMonitor()]
+        for monitor in monitors:
+            monitor.increment_counter("errors_total")
+
+        self.assertIn("claudedirector_errors_total 2", registry.render())
+        self.assertNotIn(
+            "claudedirector_errors_total 2", self.monitor.get_prometheus_metrics()
+        )
+
+
+class TestCacheLevelLatency(unittest.TestCase):
+    """Test per-CacheLevel latency from CacheManager"""
+
+    def test_operations_are_recorded_per_level(self):
+        """Sets and hits are labelled by level, misses as 'miss'"""
+        family = get_metrics_registry().get("claudedirector_cache_operation_ms")
+        before = {
+            key: (family.labels(*key).count if family else 0)
+            for key in (("set", "persona_selection"), ("get", "miss"))
+        }
+        cache = CacheManager()
+
+        async def exercise():
+            await cache.set("persona:1", "diego", CacheLevel.PERSONA_SELECTION)
+            await cache.get("persona:1")
+            await cache.get("persona:missing")
+
+        asyncio.run(exercise())
+
+        family = get_metrics_registry().get("claudedirector_cache_operation_ms")
+        self.assertEqual(
+            family.labels("set", "persona_selection").count,
+            before[("set", "persona_selection")] + 1,
+        )
+        self.assertEqual(
+            family.labels("get", "miss").count, before[("get", "miss")] + 1
+        )
+        self.assertGreaterEqual(family.labels("get", "persona_selection").count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,179 @@
+"""
+Unit tests for the multi-pattern automaton, keyword matcher and their callers
+
+🏗️ Martin | Platform Architecture
+"""
+
+import random
+import re
+import unittest
+
+from lib.transparency.framework_detection import (
+    STRATEGIC_KEYWORD_THRESHOLD,
+    FrameworkDetectionMiddleware,
+)
+from lib.context_engineering.conversation_layer import (
+    STRATEGIC_DOMAIN_KEYWORDS,
+    STRATEGIC_TOPIC_KEYWORDS,
+    ConversationLayerMemory,
+)
+from lib.utils.text_matching import KeywordMatcher, PatternAutomaton
+
+RESPONSE = """Using the OGSM framework with Team Topologies, we can set
+objectives, goals, strategies and measures for platform teams. Stream-aligned
+teams and platform teams reduce cognitive load. A Blue Ocean Strategy lens
+looks at value innovation; the OGSM plan ties back to ogsm measures.
+Good Strategy Bad Strategy asks for a diagnosis, guiding policy and coherent
+action, and capital allocation decides the platform ROI assessment."""
+
+
+def naive_detect(middleware, content):
+    """Reference implementation: one str.count scan per pattern"""
+    content_lower = content.lower()
+    detected = []
+    for name, config in middleware.framework_patterns.items():
+        matched, score = [], 0.0
+        for pattern in config["patterns"]:
+            count = content_lower.count(pattern.lower())
+            if count > 0:
+                matched.append(pattern)
+                score += min(count * STRATEGIC_KEYWORD_THRESHOLD, 0.8)
+        if matched:
+            score = min(score * config["confidence_weight"], 1.0)
+            if score >= middleware.confidence_threshold:
+                detected.append((name, score, matched))
+    detected.sort(key=lambda d: d[1], reverse=True)
+    return detected
+
+
+class TestPatternAutomaton(unittest.TestCase):
+    """Test that one automaton pass matches per-pattern str.count"""
+
+    def test_counts_match_str_count(self):
+        """Overlapping, nested and repeated patterns count like str.count"""
+        patterns = ["aa", "aba", "a", "ab", "bab", "b", "abab", "ba"]
+        automaton = PatternAutomaton(patterns)
+        rng = random.Random(7)
+        for _ in range(200):
+            text = "".join(rng.choice("abc") for _ in range(rng.randint(0, 40)))
+            expected = {p: text.count(p) for p in patterns if text.count(p)}
+            self.assertEqual(automaton.count(text), expected, text)
+
+    def test_iter_matches_reports_every_occurrence(self):
+        """Overlapping occurrences are all reported with their spans"""
+        automaton = PatternAutomaton(["he", "she", "hers"])
+
+        matches = list(automaton.iter_matches("ushers"))
+
+        self.assertEqual(matches, [(1, 4, "she"), (2, 4, "he"), (2, 6, "hers")])
+
+    def test_duplicate_and_empty_patterns(self):
+        """Duplicates compile once and empty patterns are ignored"""
+        automaton = PatternAutomaton(["ogsm", "", "ogsm"])
+
+        self.assertEqual(automaton.patterns, ["ogsm"])
+        self.assertEqual(automaton.count("ogsm ogsm"), {"ogsm": 2})
+
+
+class TestKeywordMatcher(unittest.TestCase):
+    """Test category matching, counts and word boundaries"""
+
+    CATEGORIES = {
+        "ui": ["ui", "design", "form"],
+        "docs": ["guide", "api", "docs"],
+        "ops": ["e2e", "ci/cd", "c++"],
+    }
+
+    def test_substring_matching_keeps_declaration_order(self):
+        """Categories and keywords come back in declaration order"""
+        matcher = KeywordMatcher(self.CATEGORIES)
+
+        matches = matcher.match("The API Guide covers DESIGN forms")
+
+        # Substring mode: "ui" is found inside "Guide"
+        self.assertEqual(
+            matches, {"ui": ["ui", "design", "form"], "docs": ["guide", "api"]}
+        )
+        self.assertEqual(matcher.counts("guide"), {"ui": 1, "docs": 1, "ops": 0})
+        self.assertEqual(matcher.first_match("guide"), "ui")
+        self.assertIsNone(matcher.first_match("nothing here"))
+
+    def test_whole_words_match_regex_word_boundaries(self):
+        """whole_words agrees with re.search on \\b-wrapped keywords"""
+        matcher = KeywordMatcher(self.CATEGORIES, whole_words=True)
+        rng = random.Random(11)
+        alphabet = ["ui", "guide", "api", "docs", "e2e", "ci/cd", "c++", "x", " ", "_"]
+        for _ in range(300):
+            text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 12)))
+            expected = {}
+            for category, keywords in self.CATEGORIES.items():
+                hits = [
+                    k
+                    for k in keywords
+                    if re.search(r"\b" + re.escape(k) + r"\b", text.lower())
+                ]
+                if hits:
+                    expected[category] = hits
+            self.assertEqual(matcher.match(text), expected, text)
+
+    def test_conversation_classifier_matches_keyword_scan(self):
+        """Conversation topics and domains equal the per-keyword scan"""
+        memory = ConversationLayerMemory({})
+        for query in [
+            "Platform architecture decisions for the design system team",
+            "Business ROI and market value of our UI components",
+            "Quick build question",
+            "",
+        ]:
+            lowered = query.lower()
+            topics = [k for k in STRATEGIC_TOPIC_KEYWORDS if k in lowered]
+            domains = [
+                d
+                for d, keywords in STRATEGIC_DOMAIN_KEYWORDS.items()
+                if any(k in lowered for k in keywords)
+            ]
+            self.assertEqual(memory._classify_query(query), (topics, domains))
+
+
+class TestFrameworkDetectionMatching(unittest.TestCase):
+    """Test that detection scores are unchanged by the compiled matcher"""
+
+    def setUp(self):
+        """Create the middleware with registry patterns"""
+        self.middleware = FrameworkDetectionMiddleware()
+
+    def _assert_matches_reference(self, content):
+        expected = naive_detect(self.middleware, content)
+        actual = self.middleware.detect_frameworks_used(content)
+        self.assertEqual(
+            [
+                (f.framework_name, f.confidence_score, f.matched_patterns)
+                for f in actual
+            ],
+            expected,
+        )
+
+    def test_detection_matches_reference(self):
+        """Frameworks, scores and matched patterns equal the per-pattern scan"""
+        self.assertTrue(self.middleware.detect_frameworks_used(RESPONSE))
+        self._assert_matches_reference(RESPONSE)
+        self._assert_matches_reference(RESPONSE.upper() * 3)
+        self._assert_matches_reference("Nothing strategic to see here.")
+
+    def test_replaced_patterns_are_recompiled(self):
+        """Assigning new framework patterns takes effect on the next call"""
+        self.middleware.framework_patterns = {
+            "Custom Framework": {
+                "patterns": ["Custom Lens", "lens"],
+                "type": "strategic",
+                "confidence_weight": 1.0,
+            }
+        }
+
+        self._assert_matches_reference("custom lens, CUSTOM LENS, lens")
+        detected = self.middleware.detect_frameworks_used("custom lens lens")
+        self.assertEqual(detected[0].matched_patterns, ["Custom Lens", "lens"])
+
+
+if __name__ == "__main__":
+    unittest.main()
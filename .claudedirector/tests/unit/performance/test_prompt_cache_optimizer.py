@@ -440,6 +440,60 @@ class TestSDKInspiredPromptCaching:
         assert entry.hit_count > initial_hits
         assert entry.hit_count >= 3
 
+    # ========================================================================
+    # PRE-RENDERED PREFIXES
+    # ========================================================================
+
+    def test_prefix_reused_across_sessions(self):
+        """Verify the static prefix is rendered once per persona/framework"""
+        self.optimizer.cache_system_instructions("System", estimated_tokens=1500)
+        self.optimizer.cache_persona_template("diego", "Diego", estimated_tokens=2000)
+        self.optimizer.cache_framework_context(
+            "team_topologies", {"patterns": ["platform", "enabling"]}
+        )
+
+        first = self.optimizer.assemble_cached_prompt(
+            persona="diego",
+            framework="team_topologies",
+            conversation_context="session 1",
+            strategic_memory={"initiative": "platform"},
+            user_query="Query 1",
+        )
+        prefix = self.optimizer.prefix_cache[("diego", "team_topologies")]
+        second = self.optimizer.assemble_cached_prompt(
+            persona="diego", framework="team_topologies", user_query="Query 2"
+        )
+
+        assert self.optimizer.prefix_cache[("diego", "team_topologies")] is prefix
+        assert first["prompt"] == (
+            "System\n\nDiego\n\npatterns: platform, enabling\n\n"
+            "## Conversation Context\nsession 1\n\n"
+            "## Strategic Memory\ninitiative: platform\n\n"
+            "## User Query\nQuery 1"
+        )
+        assert second["prompt"].startswith(prefix.text)
+        assert first["prefix_hash"] == second["prefix_hash"] == prefix.prefix_hash
+        assert first["prefix_tokens"] == 3800
+        assert second["cache_hits"] == 3
+        assert self.optimizer.metrics["cache_hits"] == 6
+
+    def test_recaching_segment_invalidates_prefix(self):
+        """Verify re-cached segments are picked up by later assemblies"""
+        self.optimizer.cache_persona_template("diego", "Diego v1")
+        self.optimizer.cache_persona_template("rachel", "Rachel v1")
+        before = self.optimizer.assemble_cached_prompt(persona="diego")
+        self.optimizer.assemble_cached_prompt(persona="rachel")
+
+        self.optimizer.cache_persona_template("diego", "Diego v2")
+        after = self.optimizer.assemble_cached_prompt(persona="diego")
+
+        assert "Diego v2" in after["prompt"]
+        assert after["prefix_hash"] != before["prefix_hash"]
+        assert ("rachel", None) in self.optimizer.prefix_cache
+
+        self.optimizer.cache_system_instructions("New system")
+        assert self.optimizer.prefix_cache == {}
+
 
 # ========================================================================
 # PERFORMANCE BENCHMARK TESTS
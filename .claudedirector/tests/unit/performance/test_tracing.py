@@ -0,0 +1,187 @@
+"""
+Unit tests for request tracing spans and trace export
+
+🏗️ Martin | Platform Architecture
+"""
+
+import asyncio
+import json
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from lib.context_engineering.advanced_context_engine import AdvancedContextEngine
+from lib.performance.tracing import (
+    NOOP_SPAN,
+    configure_tracing,
+    current_span,
+    get_tracer,
+    propagate,
+    set_span_attributes,
+    span,
+    traced,
+)
+
+
+def span_names(root):
+    return [s.name for s in root.iter_spans()]
+
+
+class TracingTestCase(unittest.TestCase):
+    """Enable the process-wide tracer and restore it afterwards"""
+
+    def setUp(self):
+        tracer = get_tracer()
+        self.addCleanup(
+            configure_tracing,
+            enabled=tracer.enabled,
+            sample_rate=tracer.sample_rate,
+        )
+        self.addCleanup(tracer.clear)
+        tracer.clear()
+        configure_tracing(enabled=True, sample_rate=1.0)
+
+
+class TestSpans(TracingTestCase):
+    """Test span nesting, propagation and sampling"""
+
+    def test_nested_spans_across_async_tasks(self):
+        """Concurrent tasks nest under the span that created them"""
+
+        @traced("persona.frameworks")
+        async def frameworks():
+            await asyncio.sleep(0.01)
+
+        @traced("request")
+        async def handle():
+            set_span_attributes(persona="diego")
+            with span("context.retrieve", layers=5):
+                await asyncio.sleep(0)
+            await asyncio.gather(frameworks(), frameworks())
+
+        asyncio.run(handle())
+
+        (root,) = get_tracer().traces
+        self.assertEqual(root.attributes, {"persona": "diego"})
+        self.assertEqual(
+            [child.name for child in root.children],
+            ["context.retrieve", "persona.frameworks", "persona.frameworks"],
+        )
+        self.assertEqual({s.trace_id for s in root.iter_spans()}, {root.span_id})
+        self.assertGreaterEqual(root.children[1].duration_ms, 10)
+        self.assertGreaterEqual(root.duration_ms, root.children[1].duration_ms)
+        self.assertIsNone(current_span())
+
+    def test_propagate_to_thread_pool(self):
+        """Work submitted through propagate() keeps its parent span"""
+
+        def work(n):
+            with span(f"worker.{n}"):
+                pass
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            with span("request") as root:
+                futures = [pool.submit(propagate(work), n) for n in range(2)]
+                for future in futures:
+                    future.result()
+                lost = pool.submit(lambda: current_span()).result()
+
+        self.assertIsNone(lost)
+        self.assertEqual(sorted(span_names(root)[1:]), ["worker.0", "worker.1"])
+        self.assertTrue(all(child.parent_id == root.span_id for child in root.children))
+
+    def test_errors_are_recorded(self):
+        """A span records the exception that escaped it"""
+        with self.assertRaises(KeyError):
+            with span("request"):
+                raise KeyError("persona")
+
+        (root,) = get_tracer().traces
+        self.assertEqual(root.error, "KeyError: 'persona'")
+        self.assertIsNotNone(root.end_ns)
+
+    def test_unsampled_requests_record_nothing(self):
+        """Sampling is decided once for the whole request"""
+        configure_tracing(sample_rate=0.0)
+
+        with span("request") as root:
+            with span("child") as child:
+                set_span_attributes(ignored=True)
+
+        self.assertIs(root, NOOP_SPAN)
+        self.assertIs(child, NOOP_SPAN)
+        self.assertEqual(len(get_tracer().traces), 0)
+
+    def test_disabled_tracing_is_a_no_op(self):
+        """Disabled tracing hands out the shared no-op span"""
+        configure_tracing(enabled=False)
+
+        @traced()
+        def work():
+            return current_span()
+
+        self.assertIs(span("request"), NOOP_SPAN)
+        self.assertIsNone(work())
+        self.assertEqual(work.__name__, "work")
+        self.assertEqual(len(get_tracer().traces), 0)
+        with self.assertRaises(ValueError):
+            configure_tracing(sample_rate=1.5)
+
+
+class TestTraceExport(TracingTestCase):
+    """Test JSON and Chrome trace output"""
+
+    def setUp(self):
+        super().setUp()
+        with span("request", query="q"):
+            with span("mcp.server_query", server="sequential"):
+                pass
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+
+    def test_json_timing_tree(self):
+        """Traces are written as nested timing trees"""
+        path = get_tracer().export_json(self.directory / "traces.json")
+
+        (tree,) = json.loads(path.read_text())
+        self.assertEqual(tree["name"], "request")
+        self.assertEqual(tree["start_ms"], 0)
+        self.assertEqual(tree["children"][0]["attributes"], {"server": "sequential"})
+
+    def test_chrome_trace_events(self):
+        """Chrome export emits one complete event per span"""
+        path = get_tracer().export_chrome_trace(self.directory / "chrome.json")
+
+        events = json.loads(path.read_text())["traceEvents"]
+        self.assertEqual([e["name"] for e in events], ["request", "mcp.server_query"])
+        self.assertEqual({e["ph"] for e in events}, {"X"})
+        self.assertEqual(events[1]["cat"], "mcp")
+        self.assertEqual(events[1]["args"]["trace_id"], events[0]["args"]["trace_id"])
+        self.assertLessEqual(events[0]["ts"], events[1]["ts"])
+
+
+class TestPipelineInstrumentation(TracingTestCase):
+    """Test spans emitted by instrumented pipeline components"""
+
+    def test_context_retrieval_layers_nest_under_request(self):
+        """Layer spans from the retrieval pool join the request's trace"""
+        engine = AdvancedContextEngine(
+            {"workspace": {"enabled": False}, "retrieval": {"parallel": True}}
+        )
+        self.addCleanup(engine.cleanup)
+
+        engine.get_contextual_intelligence("platform strategy", session_id="s1")
+
+        root = get_tracer().traces[-1]
+        names = span_names(root)
+        self.assertEqual(root.name, "context.retrieve")
+        self.assertEqual(root.attributes["session_id"], "s1")
+        self.assertIn("context.layer.strategic", names)
+        self.assertIn("context.assemble", names)
+        self.assertEqual({s.trace_id for s in root.iter_spans()}, {root.span_id})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,239 @@
+"""
+Unit tests for the vectorized Monte Carlo completion forecaster
+
+🏗️ Martin | Platform Architecture
+"""
+
+import random
+import unittest
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+from lib.reporting.monte_carlo_forecaster import (
+    EpicSizeDistribution,
+    MonteCarloForecaster,
+)
+from lib.reporting.weekly_reporter import (
+    JiraIssue,
+    ReportGenerator,
+    StrategicAnalyzer,
+    StrategicScore,
+)
+
+CYCLE_TIMES = [0.5, 1.0, 2.0, 3.0, 4.0, 6.0, 9.0]
+
+
+def exact_probability(cycle_times, sizes, target):
+    """P(cycle_time * size <= target) with uniform cycle times and sizes"""
+    hits = sum(1 for c in cycle_times for s in sizes if c * s <= target)
+    return hits / (len(cycle_times) * len(sizes))
+
+
+def make_issue(key):
+    return JiraIssue(
+        key=key,
+        summary="Epic",
+        status="In Progress",
+        priority="High",
+        project="Web Platform",
+        assignee=None,
+    )
+
+
+def historical_issue(cycle_days):
+    created = "2025-01-01T00:00:00+00:00"
+    resolved_day = 1 + int(cycle_days)
+    return {
+        "fields": {
+            "created": created,
+            "resolutiondate": f"2025-01-{resolved_day:02d}T00:00:00+00:00",
+        }
+    }
+
+
+class TestMonteCarloForecaster(unittest.TestCase):
+    """Test sampling, reproducibility and percentile curves"""
+
+    def test_probability_converges_to_exact_value(self):
+        """Completion probability matches the closed-form value per target"""
+        forecaster = MonteCarloForecaster(simulation_runs=200_000, seed=1)
+
+        forecasts = forecaster.forecast(CYCLE_TIMES, target_timeline_days=[10, 21])
+
+        for forecast, target in zip(forecasts, [10, 21]):
+            expected = exact_probability(CYCLE_TIMES, range(3, 9), target)
+            self.assertAlmostEqual(forecast.completion_probability, expected, 2)
+            self.assertEqual(forecast.target_timeline_days, target)
+
+    def test_seeded_forecasts_are_reproducible(self):
+        """The same seed gives the same forecast on every call"""
+        forecaster = MonteCarloForecaster(simulation_runs=5000, seed=42)
+
+        first = forecaster.forecast(CYCLE_TIMES, n_epics=3)
+        second = forecaster.forecast(CYCLE_TIMES, n_epics=3)
+
+        self.assertEqual([f.to_dict() for f in first], [f.to_dict() for f in second])
+        # Epics in one batch are independent draws
+        self.assertNotEqual(first[0].percentiles, first[1].percentiles)
+
+    def test_percentile_curve_is_monotonic(self):
+        """Full percentile curves run from the fastest to the slowest runs"""
+        forecast = MonteCarloForecaster(simulation_runs=20_000, seed=3).forecast(
+            CYCLE_TIMES
+        )[0]
+
+        curve = [forecast.days_at(pct) for pct in range(1, 100)]
+        self.assertEqual(sorted(curve), curve)
+        self.assertGreaterEqual(curve[0], min(CYCLE_TIMES) * 3)
+        self.assertLessEqual(curve[-1], max(CYCLE_TIMES) * 8)
+
+    def test_probability_only_forecast_skips_percentiles(self):
+        """percentiles=() keeps the probability and drops the curve"""
+        forecaster = MonteCarloForecaster(simulation_runs=5000, seed=8)
+
+        full = forecaster.forecast(CYCLE_TIMES)[0]
+        bare = forecaster.forecast(CYCLE_TIMES, percentiles=())[0]
+
+        self.assertEqual(bare.percentiles, {})
+        self.assertEqual(bare.completion_probability, full.completion_probability)
+        self.assertEqual(len(full.percentiles), len(forecaster.percentiles))
+
+    def test_weighted_epic_sizes(self):
+        """Empirical size weights replace the uniform size range"""
+        forecaster = MonteCarloForecaster(
+            simulation_runs=1000,
+            seed=5,
+            epic_size=EpicSizeDistribution(weights={2: 1.0, 10: 0.0}),
+        )
+
+        durations = forecaster.simulate([1.5], n_epics=4)
+
+        self.assertEqual(durations.shape, (4, 1000))
+        np.testing.assert_array_equal(durations, 3.0)
+        with self.assertRaises(ValueError):
+            EpicSizeDistribution(min_tickets=5, max_tickets=2)
+
+
+class TestAnalyzerForecasting(unittest.TestCase):
+    """Test EnhancedStrategicAnalyzer integration"""
+
+    def setUp(self):
+        """Create a seeded analyzer and historical cycle data"""
+        self.analyzer = StrategicAnalyzer(
+            {"monte_carlo_seed": 11, "monte_carlo_runs": 4000}
+        )
+        rng = random.Random(4)
+        self.history = [historical_issue(rng.randint(1, 9)) for _ in range(40)]
+
+    def test_batch_forecast_shares_one_simulation(self):
+        """All epics are forecast from one parse of the history"""
+        issues = [make_issue(f"WEB-{n}") for n in range(25)]
+
+        with patch.object(
+            self.analyzer,
+            "_sequential_analyze_historical_cycles",
+            wraps=self.analyzer._sequential_analyze_historical_cycles,
+        ) as parse:
+            forecasts = self.analyzer.forecast_epic_completions(
+                issues, self.history, target_timeline_days=30
+            )
+
+        self.assertEqual(parse.call_count, 1)
+        self.assertEqual(list(forecasts), [issue.key for issue in issues])
+        for forecast in forecasts.values():
+            self.assertEqual(forecast.simulation_runs, 4000)
+            self.assertEqual(forecast.target_timeline_days, 30)
+            self.assertGreater(forecast.completion_probability, 0)
+        self.assertEqual(
+            self.analyzer.forecast_epic_completions(issues, self.history[:3]), {}
+        )
+
+    def test_batch_completion_analysis_runs_one_simulation(self):
+        """Per-issue analyses share one vectorized forecast"""
+        issues = [make_issue(f"WEB-{n}") for n in range(10)]
+
+        with patch.object(
+            self.analyzer.monte_carlo,
+            "forecast",
+            wraps=self.analyzer.monte_carlo.forecast,
+        ) as forecast:
+            analyses = self.analyzer.calculate_completion_probabilities(
+                issues, self.history
+            )
+
+        self.assertEqual(forecast.call_count, 1)
+        expected = self.analyzer.forecast_epic_completions(issues, self.history)
+        self.assertEqual(list(analyses), [issue.key for issue in issues])
+        for key, analysis in analyses.items():
+            self.assertEqual(
+                analysis["completion_probability"],
+                expected[key].completion_probability,
+            )
+
+    def test_report_batches_completion_analysis(self):
+        """The strategic story section makes one batched analysis call"""
+        analyzer = MagicMock()
+        analyzer.jira_base_url = "https://jira.example.com"
+        analyzer.calculate_strategic_impact.return_value = StrategicScore(
+            8, ["Platform"]
+        )
+        analyzer.calculate_completion_probability.side_effect = AssertionError(
+            "per-issue simulation"
+        )
+        issues = [make_issue(f"WEB-{n}") for n in range(3)]
+        analyzer.calculate_completion_probabilities.return_value = {
+            issue.key: {"mcp_enhanced": False} for issue in issues
+        }
+
+        report = ReportGenerator(None, None, analyzer)._build_strategic_analysis(issues)
+
+        analyzer.calculate_completion_probabilities.assert_called_once_with(issues, [])
+        self.assertEqual(report.count("Statistical Monte Carlo"), 3)
+
+    def test_failed_batch_falls_back_to_per_issue_analysis(self):
+        """One failing story only loses its own completion indicator"""
+        analyzer = MagicMock()
+        analyzer.jira_base_url = "https://jira.example.com"
+        analyzer.calculate_strategic_impact.return_value = StrategicScore(
+            8, ["Platform"]
+        )
+        analyzer.calculate_completion_probabilities.side_effect = ValueError("bad")
+        issues = [make_issue(f"WEB-{n}") for n in range(3)]
+
+        def analyze(issue, history):
+            if issue.key == "WEB-1":
+                raise ValueError("bad issue")
+            return {"mcp_enhanced": False}
+
+        analyzer.calculate_completion_probability.side_effect = analyze
+
+        with self.assertLogs("lib.reporting.weekly_reporter", "WARNING"):
+            report = ReportGenerator(None, None, analyzer)._build_strategic_analysis(
+                issues
+            )
+
+        self.assertEqual(analyzer.calculate_completion_probability.call_count, 3)
+        self.assertEqual(report.count("Statistical Monte Carlo"), 2)
+
+    def test_single_issue_probability_uses_configured_engine(self):
+        """The per-issue simulation is reproducible under a seed"""
+        cycle_times = self.analyzer._sequential_analyze_historical_cycles(self.history)
+        issue = make_issue("WEB-1")
+
+        probability = self.analyzer._sequential_monte_carlo_simulation(
+            issue, cycle_times
+        )
+
+        self.assertEqual(
+            probability,
+            self.analyzer._sequential_monte_carlo_simulation(issue, cycle_times),
+        )
+        self.assertEqual(
+            self.analyzer._sequential_monte_carlo_simulation(issue, cycle_times[:4]),
+            0.5,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()